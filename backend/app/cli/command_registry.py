@@ -322,6 +322,23 @@ SYSTEM_COMMANDS: List[SystemCommandMeta] = [
         description="Start the system run (defaults to example_session.json)",
         examples=["system start", "system start session_configs/my_config.json"],
     ),
+    SystemCommandMeta(
+        name="backtest-parallel",
+        usage="system backtest-parallel [config_file] [workers=N] [shards=N]",
+        description="Run backtest days in parallel worker processes (no cross-day state)",
+        examples=[
+            "system backtest-parallel",
+            "system backtest-parallel session_configs/my_config.json workers=8",
+        ],
+    ),
+    SystemCommandMeta(
+        name="sweep",
+        usage="system sweep <config_file> <param=v1,v2,...>... [strategy=module] [workers=N]",
+        description="Backtest every combination of a strategy parameter grid on shared data",
+        examples=[
+            "system sweep session_configs/my_strategy_backtest.json fast_period=5,10 slow_period=20,30",
+        ],
+    ),
     SystemCommandMeta(
         name="pause",
         usage="system pause",
@@ -1191,6 +1191,38 @@ class InteractiveCLI:
                         config_path = args[1] if len(args) >= 2 else "session_configs/example_session.json"
                         from app.cli.system_commands import start_command
                         start_command(config_path)
+                    elif subcmd == 'backtest-parallel':
+                        config_path = "session_configs/example_session.json"
+                        workers = None
+                        shards = None
+                        
+                        for arg in args[1:]:
+                            if arg.startswith('workers='):
+                                workers = int(arg.split('=')[1])
+                            elif arg.startswith('shards='):
+                                shards = int(arg.split('=')[1])
+                            else:
+                                config_path = arg
+                        
+                        from app.cli.system_commands import backtest_parallel_command
+                        backtest_parallel_command(config_path, workers=workers, shards=shards)
+                    elif subcmd == 'sweep' and len(args) >= 3:
+                        from app.cli.system_commands import sweep_command, parse_sweep_value
+                        config_path = args[1]
+                        grid = {}
+                        strategy = None
+                        workers = None
+                        
+                        for arg in args[2:]:
+                            key, _, value = arg.partition('=')
+                            if key == 'strategy':
+                                strategy = value
+                            elif key == 'workers':
+                                workers = int(value)
+                            elif value:
+                                grid[key] = [parse_sweep_value(v) for v in value.split(',')]
+                        
+                        sweep_command(config_path, grid, strategy=strategy, workers=workers)
                     elif subcmd == 'pause':
                         from app.cli.system_commands import pause_command
                         pause_command()
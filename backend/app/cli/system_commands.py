@@ -2,6 +2,8 @@
 
 Commands for controlling the system lifecycle:
 - start: Start the system run
+- backtest-parallel: Run backtest days across worker processes
+- sweep: Backtest a strategy parameter grid
 - pause: Pause the system run
 - resume: Resume from paused state
 - stop: Stop the system run
@@ -13,6 +15,7 @@ from rich import print as rprint
 from typing import Optional, List, Dict, Any, Tuple, Union, Set
 from enum import Enum
 import asyncio
+import json
 
 from app.managers.system_manager import get_system_manager, SystemState
 from app.logger import logger
@@ -74,6 +77,177 @@ def start_command(config_file_path: str) -> None:
         logger.error(f"System start command error: {e}", exc_info=True)
 
 
+def backtest_parallel_command(
+    config_file_path: str,
+    workers: Optional[int] = None,
+    shards: Optional[int] = None
+) -> None:
+    """Run a backtest with trading days split across worker processes.
+    
+    Each shard of trading days runs an isolated system in its own process.
+    Only valid when strategies carry no state across days (flat at EOD).
+    
+    Args:
+        config_file_path: Path to backtest session configuration JSON file
+        workers: Worker processes (default: CPU count)
+        shards: Number of day shards (default: workers)
+    
+    Example:
+        system backtest-parallel
+        system backtest-parallel session_configs/my_config.json workers=8
+    """
+    system_mgr = get_system_manager()
+    
+    console.print(f"[yellow]Running parallel backtest:[/yellow] {config_file_path}")
+    
+    try:
+        report = system_mgr.run_parallel_backtest(
+            config_file_path,
+            max_workers=workers,
+            num_shards=shards
+        )
+    except FileNotFoundError as e:
+        console.print("\n[red]✗ Configuration file not found[/red]")
+        console.print(f"[dim]{str(e)}[/dim]")
+        return
+    except (ValueError, RuntimeError) as e:
+        console.print("\n[red]✗ Parallel backtest failed[/red]")
+        console.print(f"[dim]{str(e)}[/dim]")
+        return
+    except Exception as e:
+        console.print("\n[red]✗ Parallel backtest failed[/red]")
+        console.print(f"[dim]{str(e)}[/dim]")
+        logger.error(f"Parallel backtest command error: {e}", exc_info=True)
+        return
+    
+    table = Table(title="Backtest Shards", box=box.SIMPLE)
+    table.add_column("#", justify="right")
+    table.add_column("Start")
+    table.add_column("End")
+    table.add_column("Days", justify="right")
+    table.add_column("Signals", justify="right")
+    table.add_column("Time (s)", justify="right")
+    table.add_column("Status")
+    
+    for result in report.shards:
+        shard = result.shard
+        status = "[green]OK[/green]" if result.succeeded else f"[red]{result.error}[/red]"
+        table.add_row(
+            str(shard.index),
+            str(shard.start_date),
+            str(shard.end_date),
+            str(shard.trading_days),
+            str(len(result.signals)),
+            f"{result.wall_time:.2f}",
+            status
+        )
+    
+    console.print(table)
+    console.print(
+        f"[dim]Workers: {report.workers} | Trading days: {report.metrics.backtest_trading_days} | "
+        f"Signals: {len(report.signals)} | Wall time: {report.wall_time:.2f}s | "
+        f"Speedup: {report.speedup:.2f}x[/dim]"
+    )
+    console.print(report.metrics.format_report('backtest'))
+    
+    if report.failed_shards:
+        console.print(f"[red]✗ {len(report.failed_shards)} shard(s) failed[/red]")
+    else:
+        console.print("[green]✓ Parallel backtest complete[/green]")
+
+
+def parse_sweep_value(text: str) -> Any:
+    """Parse one grid value from the command line (JSON scalar, else string).
+    
+    Example:
+        parse_sweep_value("10") -> 10, parse_sweep_value("0.5") -> 0.5,
+        parse_sweep_value("true") -> True, parse_sweep_value("5m") -> "5m"
+    """
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def sweep_command(
+    config_file_path: str,
+    grid: Dict[str, List[Any]],
+    strategy: Optional[str] = None,
+    workers: Optional[int] = None
+) -> None:
+    """Backtest every combination of a strategy parameter grid.
+    
+    All variants run side by side on shared data, so each day's bars and
+    indicators are loaded once regardless of the number of variants.
+    
+    Args:
+        config_file_path: Path to backtest session configuration JSON file
+        grid: Parameter name -> candidate values
+        strategy: Module path or name of the strategy to vary
+                  (default: the only enabled strategy)
+        workers: Worker processes for day shards (default: 1)
+    
+    Example:
+        system sweep session_configs/my_strategy_backtest.json fast_period=5,10 slow_period=20,30
+    """
+    system_mgr = get_system_manager()
+    
+    variant_count = 1
+    for values in grid.values():
+        variant_count *= len(values)
+    console.print(f"[yellow]Running parameter sweep:[/yellow] {config_file_path} ({variant_count} variants)")
+    
+    try:
+        report = system_mgr.run_parameter_sweep(
+            config_file_path,
+            grid,
+            strategy=strategy,
+            max_workers=workers
+        )
+    except FileNotFoundError as e:
+        console.print("\n[red]✗ Configuration file not found[/red]")
+        console.print(f"[dim]{str(e)}[/dim]")
+        return
+    except (ValueError, RuntimeError) as e:
+        console.print("\n[red]✗ Parameter sweep failed[/red]")
+        console.print(f"[dim]{str(e)}[/dim]")
+        return
+    except Exception as e:
+        console.print("\n[red]✗ Parameter sweep failed[/red]")
+        console.print(f"[dim]{str(e)}[/dim]")
+        logger.error(f"Parameter sweep command error: {e}", exc_info=True)
+        return
+    
+    table = Table(title=f"Parameter Sweep: {report.strategy}", box=box.SIMPLE)
+    table.add_column("Variant")
+    for name in grid:
+        table.add_column(name, justify="right")
+    table.add_column("Signals", justify="right")
+    table.add_column("Trades", justify="right")
+    table.add_column("Net P&L", justify="right")
+    
+    for result in report.ranked():
+        pnl_color = "green" if result.net_pnl >= 0 else "red"
+        table.add_row(
+            result.variant.name,
+            *(str(result.variant.params[name]) for name in grid),
+            str(result.signals),
+            str(result.round_trips),
+            f"[{pnl_color}]{result.net_pnl:.2f}[/{pnl_color}]"
+        )
+    
+    console.print(table)
+    console.print(
+        f"[dim]Trading days: {report.backtest.metrics.backtest_trading_days} | "
+        f"Shards: {len(report.backtest.shards)} | Wall time: {report.backtest.wall_time:.2f}s[/dim]"
+    )
+    
+    if report.backtest.failed_shards:
+        console.print(f"[red]✗ {len(report.backtest.failed_shards)} shard(s) failed[/red]")
+    else:
+        console.print("[green]✓ Parameter sweep complete[/green]")
+
+
 def pause_command() -> None:
     """Pause the system run.
     
@@ -14,7 +14,12 @@ from .base import (
 from .registry import (
     INDICATOR_REGISTRY,
     indicator,
+    streaming_indicator,
+    vectorized_indicator,
     calculate_indicator,
+    calculate_indicator_incremental,
+    calculate_indicator_series,
+    calculate_indicator_warmup,
     list_indicators,
 )
 
@@ -24,12 +29,19 @@ from . import momentum
 from . import volatility
 from . import volume
 from . import support
+from . import streaming
+from . import vectorized
+from .streaming import StreamingIndicator, create_streaming_indicator
+from .graph import PrimitiveGraph, GraphIndicator, create_graph_indicator
+from .batched import CrossSymbolGraph, BatchedIndicator, create_batched_indicator
+from .history import IndicatorHistory
 
 # Import manager and helper functions
 from .manager import (
     IndicatorManager,
     get_indicator,
     get_indicator_value,
+    get_indicator_history,
     is_indicator_ready,
     get_all_indicators,
 )
@@ -42,11 +54,26 @@ __all__ = [
     "IndicatorData",
     "INDICATOR_REGISTRY",
     "indicator",
+    "streaming_indicator",
+    "vectorized_indicator",
     "calculate_indicator",
+    "calculate_indicator_incremental",
+    "calculate_indicator_series",
+    "calculate_indicator_warmup",
     "list_indicators",
+    "StreamingIndicator",
+    "create_streaming_indicator",
+    "PrimitiveGraph",
+    "GraphIndicator",
+    "create_graph_indicator",
+    "CrossSymbolGraph",
+    "BatchedIndicator",
+    "create_batched_indicator",
+    "IndicatorHistory",
     "IndicatorManager",
     "get_indicator",
     "get_indicator_value",
+    "get_indicator_history",
     "is_indicator_ready",
     "get_all_indicators",
 ]
@@ -3,7 +3,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Any, Union, Optional
+from typing import Dict, Any, Union, Optional, Sequence
 
 
 @dataclass
@@ -58,12 +58,30 @@ class IndicatorConfig:
         period: Lookback period (0 if not applicable)
         interval: Which bar interval to compute on (e.g., "5m", "1d")
         params: Additional parameters (e.g., {"num_std": 2.0} for Bollinger Bands)
+        incremental: Use streaming state (O(1) per bar) instead of
+            recalculating from the full bar list on every update
+        history: Keep the last N (timestamp, value) pairs in
+            IndicatorData.historical_values (0 = no history)
+        evaluation: "eager" (calculated on every bar of its interval) or
+            "lazy" (new bars are only noted, and folded in when the
+            indicator is read - see manager.refresh_indicator). Lazy
+            indicators keep no history: it would hold one value per read
+            instead of one per bar.
     """
     name: str
     type: IndicatorType
     period: int
     interval: str
     params: Dict[str, Any] = field(default_factory=dict)
+    incremental: bool = False
+    history: int = 0
+    evaluation: str = "eager"
+    
+    def __post_init__(self):
+        if self.evaluation == "lazy" and self.history > 0:
+            raise ValueError(
+                f"{self.make_key()}: lazy indicators cannot keep history (history={self.history})"
+            )
     
     def warmup_bars(self) -> int:
         """Calculate how many bars needed before valid output.
@@ -116,9 +134,11 @@ class IndicatorData:
     last_updated: datetime
     valid: bool
     
-    # Optional: Full history (for charting, analysis)
-    historical_values: Optional[list] = None
+    # Optional: Last config.history values (IndicatorHistory ring buffer)
+    historical_values: Optional[Any] = None
     
     # Self-describing metadata (makes structure self-contained)
     config: Optional['IndicatorConfig'] = None  # Configuration for calculation
     state: Optional['IndicatorResult'] = None   # Last result for stateful indicators (EMA, OBV, VWAP)
+    stream: Optional[Any] = None                # StreamingIndicator when config.incremental
+    pending: Optional[Sequence['BarData']] = None  # Bars not folded in yet (lazy evaluation)
@@ -0,0 +1,1041 @@
+"""Cross-symbol batched indicator evaluation.
+
+With hundreds of symbols on one interval, updating indicators symbol by
+symbol pays the Python overhead of a calculation call and a result object
+per symbol per indicator. A CrossSymbolGraph holds the primitive series of
+every symbol on an interval (the same EMAs, rolling windows, true range,
+... as PrimitiveGraph in graph.py) as NumPy arrays with one slot per
+symbol. At each timestamp, all symbols that received a bar are folded in
+together - one vector operation per primitive - and each indicator is
+computed for all of them at once, so the cost per timestamp barely grows
+with the number of symbols.
+
+Each slot keeps its own cursor with the semantics of
+StreamingIndicator.sync(): symbols that received several bars are caught
+up over several vector steps, and a rewritten series (gap fill, trimming,
+new session) is replayed for that symbol only.
+
+Usage:
+    graph = CrossSymbolGraph("1m")
+    streams = {s: create_batched_indicator(rsi_config, graph, s) for s in symbols}
+    graph.step({symbol: bars[symbol] for symbol in symbols})
+    values, valid = graph.evaluate(streams["AAPL"].signature, slots)
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .base import BarData, IndicatorConfig, IndicatorResult
+from .streaming import _require_positive
+
+logger = logging.getLogger(__name__)
+
+
+def _grow(array: np.ndarray, capacity: int, fill) -> np.ndarray:
+    """Copy of array with `capacity` rows, new rows set to fill."""
+    grown = np.full((capacity,) + array.shape[1:], fill, dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+
+# =============================================================================
+# Nodes
+# =============================================================================
+
+class VectorNode:
+    """One primitive series for every symbol slot (NaN where undefined).
+
+    update() folds one bar into the given slots; inputs are nodes created
+    earlier in the same graph, so creation order is a topological order.
+    """
+
+    def __init__(self, key: Hashable, inputs: Sequence["VectorNode"] = ()):
+        self.key = key
+        self.inputs = tuple(inputs)
+        self.value = np.full(0, np.nan)
+
+    def resize(self, capacity: int) -> None:
+        self.value = _grow(self.value, capacity, np.nan)
+
+    def reset(self, slots: np.ndarray) -> None:
+        self.value[slots] = np.nan
+
+    def update(self, slots: np.ndarray, fields: Dict[str, np.ndarray]) -> None:
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.key})"
+
+
+class FieldNode(VectorNode):
+    """A bar field (open/high/low/close/volume)."""
+
+    def __init__(self, key, field: str):
+        self.field = field
+        super().__init__(key)
+
+    def update(self, slots, fields):
+        self.value[slots] = fields[self.field]
+
+
+class DerivedNode(VectorNode):
+    """Element-wise function of other nodes (NaN where any input is NaN)."""
+
+    def __init__(self, key, inputs, func: Callable[..., np.ndarray]):
+        self.func = func
+        super().__init__(key, inputs)
+
+    def update(self, slots, fields):
+        args = [node.value[slots] for node in self.inputs]
+        result = self.func(*args)
+        undefined = np.isnan(args[0])
+        for arg in args[1:]:
+            undefined |= np.isnan(arg)
+        if undefined.any():
+            result = np.where(undefined, np.nan, result)
+        self.value[slots] = result
+
+
+class _SourceNode(VectorNode):
+    """Base for nodes folding in the defined values of one input."""
+
+    def __init__(self, key, source: VectorNode):
+        self.source = source
+        super().__init__(key, (source,))
+
+    def update(self, slots, fields):
+        values = self.source.value[slots]
+        defined = ~np.isnan(values)
+        if not defined.all():
+            slots, values = slots[defined], values[defined]
+            if not len(slots):
+                return
+        self._push(slots, values)
+
+    def _push(self, slots: np.ndarray, values: np.ndarray) -> None:
+        raise NotImplementedError
+
+
+class _WindowNode(_SourceNode):
+    """Ring buffer of the last `width` defined inputs per slot.
+
+    _aggregate() sets the value of slots whose window is full; the value
+    only changes on bars where the input is defined.
+    """
+
+    def __init__(self, key, source, width: int):
+        self.width = width
+        self._buffer = np.full((0, width), np.nan)
+        self._pos = np.zeros(0, dtype=np.intp)    # Next write = oldest when full
+        self._filled = np.zeros(0, dtype=np.intp)
+        super().__init__(key, source)
+
+    def resize(self, capacity):
+        super().resize(capacity)
+        self._buffer = _grow(self._buffer, capacity, np.nan)
+        self._pos = _grow(self._pos, capacity, 0)
+        self._filled = _grow(self._filled, capacity, 0)
+
+    def reset(self, slots):
+        super().reset(slots)
+        self._buffer[slots] = np.nan
+        self._pos[slots] = 0
+        self._filled[slots] = 0
+
+    def _push(self, slots, values):
+        pos = self._pos[slots]
+        self._buffer[slots, pos] = values
+        self._pos[slots] = (pos + 1) % self.width
+        filled = np.minimum(self._filled[slots] + 1, self.width)
+        self._filled[slots] = filled
+
+        full = slots[filled == self.width]
+        if len(full):
+            self._aggregate(full, self._buffer[full])
+
+    def _aggregate(self, slots: np.ndarray, windows: np.ndarray) -> None:
+        raise NotImplementedError
+
+
+class LagNode(_WindowNode):
+    """Value of the input `lag` defined updates ago."""
+
+    def __init__(self, key, source, lag: int):
+        super().__init__(key, source, lag + 1)
+
+    def _aggregate(self, slots, windows):
+        self.value[slots] = windows[np.arange(len(slots)), self._pos[slots]]
+
+
+class MeanNode(_WindowNode):
+    """Rolling mean."""
+
+    def _aggregate(self, slots, windows):
+        self.value[slots] = windows.sum(axis=1) / self.width
+
+
+class _MeanTrackingNode(_WindowNode):
+    """Window node that also exposes the rolling mean."""
+
+    def __init__(self, key, source, width):
+        self.mean = np.full(0, np.nan)
+        super().__init__(key, source, width)
+
+    def resize(self, capacity):
+        super().resize(capacity)
+        self.mean = _grow(self.mean, capacity, np.nan)
+
+    def reset(self, slots):
+        super().reset(slots)
+        self.mean[slots] = np.nan
+
+
+class VarianceNode(_MeanTrackingNode):
+    """Rolling mean and population standard deviation (value = stddev)."""
+
+    def _aggregate(self, slots, windows):
+        mean = windows.mean(axis=1)
+        self.mean[slots] = mean
+        variance = ((windows - mean[:, None]) ** 2).mean(axis=1)
+        self.value[slots] = np.sqrt(np.maximum(variance, 0.0))
+
+
+class MeanDeviationNode(_MeanTrackingNode):
+    """Rolling mean and mean absolute deviation (value = deviation)."""
+
+    def _aggregate(self, slots, windows):
+        mean = windows.mean(axis=1)
+        self.mean[slots] = mean
+        self.value[slots] = np.abs(windows - mean[:, None]).mean(axis=1)
+
+
+class ExtremeNode(_WindowNode):
+    """Rolling max or min."""
+
+    def __init__(self, key, source, width, maximum: bool):
+        self.maximum = maximum
+        super().__init__(key, source, width)
+
+    def _aggregate(self, slots, windows):
+        self.value[slots] = windows.max(axis=1) if self.maximum else windows.min(axis=1)
+
+
+class WMANode(_WindowNode):
+    """Linearly weighted moving average (weights 1..width, newest heaviest)."""
+
+    def _aggregate(self, slots, windows):
+        # Oldest entry sits at the next write position and weighs 1
+        ages = (np.arange(self.width) - self._pos[slots][:, None]) % self.width
+        weight_sum = self.width * (self.width + 1) / 2
+        self.value[slots] = (windows * (ages + 1)).sum(axis=1) / weight_sum
+
+
+class EMANode(_SourceNode):
+    """EMA seeded with the SMA of its first `period` defined inputs."""
+
+    def __init__(self, key, source, period: int):
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self._seed_sum = np.zeros(0)
+        self._seed_count = np.zeros(0, dtype=np.intp)
+        super().__init__(key, source)
+
+    def resize(self, capacity):
+        super().resize(capacity)
+        self._seed_sum = _grow(self._seed_sum, capacity, 0.0)
+        self._seed_count = _grow(self._seed_count, capacity, 0)
+
+    def reset(self, slots):
+        super().reset(slots)
+        self._seed_sum[slots] = 0.0
+        self._seed_count[slots] = 0
+
+    def _push(self, slots, values):
+        seeded = self._seed_count[slots] >= self.period
+        if seeded.any():
+            ready = slots[seeded]
+            self.value[ready] = self.alpha * values[seeded] + (1 - self.alpha) * self.value[ready]
+        if not seeded.all():
+            seeding = slots[~seeded]
+            total = self._seed_sum[seeding] + values[~seeded]
+            count = self._seed_count[seeding] + 1
+            self._seed_sum[seeding] = total
+            self._seed_count[seeding] = count
+            done = count == self.period
+            self.value[seeding[done]] = total[done] / self.period
+
+
+class CumulativeNode(_SourceNode):
+    """Running total of the defined inputs since the series start."""
+
+    def __init__(self, key, source):
+        self.count = np.zeros(0, dtype=np.intp)
+        super().__init__(key, source)
+
+    def resize(self, capacity):
+        self.value = _grow(self.value, capacity, 0.0)
+        self.count = _grow(self.count, capacity, 0)
+
+    def reset(self, slots):
+        self.value[slots] = 0.0
+        self.count[slots] = 0
+
+    def _push(self, slots, values):
+        self.value[slots] += values
+        self.count[slots] += 1
+
+
+# =============================================================================
+# Graph
+# =============================================================================
+
+# Indicator values for the given slots (NaN = not valid), or a dict of them
+Composer = Callable[[np.ndarray], Any]
+
+
+class CrossSymbolGraph:
+    """Primitive series of every symbol on one interval, one slot per symbol.
+
+    Thread-safe: symbols are registered from the coordinator while the
+    processor steps the graph.
+    """
+
+    def __init__(self, interval: str):
+        self.interval = interval
+        self._lock = threading.RLock()
+        self._nodes: Dict[Hashable, VectorNode] = {}
+        self._order: List[VectorNode] = []
+        self._fields: List[str] = []
+
+        # Slot allocation
+        self._slots: Dict[str, int] = {}
+        self._free: List[int] = []
+        self._capacity = 0
+
+        # Per-slot cursor (bars folded in, first/last folded timestamps)
+        self._count = np.zeros(0, dtype=np.int64)
+        self._first_timestamp: List[Any] = []
+        self._last_timestamp: List[Any] = []
+
+        # Indicator signature -> (composer, warmup bars)
+        self._indicators: Dict[Hashable, Tuple[Composer, int]] = {}
+        # Indicator signature -> {symbol: BatchedIndicator}
+        self._members: Dict[Hashable, Dict[str, "BatchedIndicator"]] = {}
+
+    @property
+    def node_count(self) -> int:
+        """Number of distinct primitive series."""
+        return len(self._order)
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symbols with a slot in the graph."""
+        return list(self._slots)
+
+    def slot(self, symbol: str) -> int:
+        """Slot of a symbol, allocated on first use."""
+        slot = self._slots.get(symbol)
+        if slot is not None:
+            return slot
+
+        with self._lock:
+            if symbol in self._slots:
+                return self._slots[symbol]
+            if self._free:
+                slot = self._free.pop()
+            else:
+                slot = len(self._slots)
+                if slot >= self._capacity:
+                    self._resize(max(16, self._capacity * 2))
+            self._slots[symbol] = slot
+            self._reset_slots(np.array([slot]))
+            return slot
+
+    def release(self, symbol: str) -> None:
+        """Free a symbol's slot (symbol removed from the session)."""
+        with self._lock:
+            slot = self._slots.pop(symbol, None)
+            if slot is not None:
+                self._reset_slots(np.array([slot]))
+                self._free.append(slot)
+            for members in self._members.values():
+                members.pop(symbol, None)
+
+    def reset_symbol(self, symbol: str) -> None:
+        """Drop a symbol's state; its next step replays the full series."""
+        with self._lock:
+            slot = self._slots.get(symbol)
+            if slot is not None:
+                self._reset_slots(np.array([slot]))
+
+    def bar_count(self, symbol: str) -> int:
+        """Number of bars folded in for a symbol."""
+        slot = self._slots.get(symbol)
+        return 0 if slot is None else int(self._count[slot])
+
+    def _resize(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._count = _grow(self._count, capacity, 0)
+        self._first_timestamp.extend([None] * (capacity - len(self._first_timestamp)))
+        self._last_timestamp.extend([None] * (capacity - len(self._last_timestamp)))
+        for node in self._order:
+            node.resize(capacity)
+
+    def _reset_slots(self, slots: np.ndarray) -> None:
+        self._count[slots] = 0
+        for slot in slots.tolist():
+            self._first_timestamp[slot] = None
+            self._last_timestamp[slot] = None
+        for node in self._order:
+            node.reset(slots)
+
+    def step(self, bars_by_symbol: Dict[str, Sequence[BarData]]) -> List[str]:
+        """Fold the bars each symbol has not seen yet, all symbols together.
+
+        Args:
+            bars_by_symbol: Full bar series per symbol (list or deque);
+                symbols without a slot are ignored
+
+        Returns:
+            Symbols whose state is now up to date with their series
+        """
+        with self._lock:
+            stepped = []
+            pending = []  # (slot, bars, first new index, len(bars))
+            for symbol, bars in bars_by_symbol.items():
+                slot = self._slots.get(symbol)
+                n = len(bars)
+                if slot is None or n == 0:
+                    continue
+
+                count = int(self._count[slot])
+                if count and (
+                    n < count
+                    or bars[0].timestamp != self._first_timestamp[slot]
+                    or bars[count - 1].timestamp != self._last_timestamp[slot]
+                ):
+                    # Series changed underneath us - replay this symbol
+                    self._reset_slots(np.array([slot]))
+                    count = 0
+                if count < n:
+                    pending.append((slot, bars, count, n))
+
+                self._count[slot] = n
+                self._first_timestamp[slot] = bars[0].timestamp
+                self._last_timestamp[slot] = bars[-1].timestamp
+                stepped.append(symbol)
+
+            # One vector step per bar offset; usually every symbol has one new bar
+            offset = 0
+            while pending:
+                slots = np.fromiter((entry[0] for entry in pending), dtype=np.intp, count=len(pending))
+                picked = [bars[start + offset] for _, bars, start, _ in pending]
+                fields = {
+                    name: np.fromiter((getattr(bar, name) for bar in picked), dtype=float, count=len(picked))
+                    for name in self._fields
+                }
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    for node in self._order:
+                        node.update(slots, fields)
+
+                offset += 1
+                pending = [entry for entry in pending if entry[2] + offset < entry[3]]
+
+            return stepped
+
+    def evaluate(self, signature: Hashable, slots: np.ndarray) -> Tuple[List[Any], List[bool]]:
+        """Current value of an indicator for the given slots.
+
+        Args:
+            signature: Indicator signature (BatchedIndicator.signature)
+            slots: Symbol slots to evaluate
+
+        Returns:
+            (values, valid) lists aligned with slots; values are floats or
+            dicts of floats, None where not valid
+        """
+        with self._lock:
+            compose, warmup = self._indicators[signature]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                result = compose(slots)
+            warm = self._count[slots] >= warmup
+
+            if isinstance(result, dict):
+                valid = warm.copy()
+                for values in result.values():
+                    valid &= ~np.isnan(values)
+                columns = {field: values.tolist() for field, values in result.items()}
+                valid = valid.tolist()
+                values = [
+                    {field: column[i] for field, column in columns.items()} if ok else None
+                    for i, ok in enumerate(valid)
+                ]
+                return values, valid
+
+            valid = (warm & ~np.isnan(result)).tolist()
+            values = [value if ok else None for value, ok in zip(result.tolist(), valid)]
+            return values, valid
+
+    def evaluate_members(
+        self,
+        symbols: Sequence[str]
+    ) -> List[Tuple[List["BatchedIndicator"], List[Any], List[bool], List[Any]]]:
+        """Evaluate every indicator on the graph for the given symbols.
+
+        Args:
+            symbols: Symbols to evaluate (typically those just stepped)
+
+        Returns:
+            (indicators, values, valid, timestamps) per indicator signature,
+            the lists aligned with each other
+        """
+        evaluated = []
+        with self._lock:
+            for signature, members in self._members.items():
+                indicators = [members[symbol] for symbol in symbols if symbol in members]
+                if not indicators:
+                    continue
+                slots = np.fromiter((ind.slot for ind in indicators), dtype=np.intp, count=len(indicators))
+                values, valid = self.evaluate(signature, slots)
+                timestamps = [self._last_timestamp[slot] for slot in slots.tolist()]
+                evaluated.append((indicators, values, valid, timestamps))
+        return evaluated
+
+    def result(self, signature: Hashable, symbol: str) -> IndicatorResult:
+        """Current value of an indicator for one symbol."""
+        with self._lock:
+            slot = self._slots.get(symbol)
+            if slot is None or self._count[slot] == 0:
+                return IndicatorResult(timestamp=None, value=None, valid=False)
+
+            values, valid = self.evaluate(signature, np.array([slot]))
+            return IndicatorResult(timestamp=self._last_timestamp[slot], value=values[0], valid=valid[0])
+
+    def _node(self, key: Hashable, factory: Callable[[], VectorNode]) -> VectorNode:
+        with self._lock:
+            node = self._nodes.get(key)
+            if node is None:
+                node = self._nodes[key] = factory()
+                node.resize(self._capacity)
+                self._order.append(node)
+                if isinstance(node, FieldNode):
+                    self._fields.append(node.field)
+                if self._slots:
+                    # New node has not seen the bars so far
+                    self._reset_slots(np.fromiter(self._slots.values(), dtype=np.intp))
+            return node
+
+    # -------------------------------------------------------------------------
+    # Node constructors (get or create)
+    # -------------------------------------------------------------------------
+
+    def field(self, name: str) -> VectorNode:
+        return self._node((name,), lambda: FieldNode((name,), name))
+
+    def derived(self, name: str, inputs: Sequence[VectorNode], func: Callable[..., np.ndarray]) -> VectorNode:
+        """Node computing func(*input arrays); `name` must identify func."""
+        key = (name,) + tuple(node.key for node in inputs)
+        return self._node(key, lambda: DerivedNode(key, inputs, func))
+
+    def lag(self, source: VectorNode, lag: int) -> VectorNode:
+        key = ("lag", source.key, lag)
+        return self._node(key, lambda: LagNode(key, source, lag))
+
+    def mean(self, source: VectorNode, period: int) -> VectorNode:
+        key = ("mean", source.key, period)
+        return self._node(key, lambda: MeanNode(key, source, period))
+
+    def variance(self, source: VectorNode, period: int) -> VarianceNode:
+        key = ("variance", source.key, period)
+        return self._node(key, lambda: VarianceNode(key, source, period))
+
+    def maximum(self, source: VectorNode, period: int) -> VectorNode:
+        key = ("max", source.key, period)
+        return self._node(key, lambda: ExtremeNode(key, source, period, maximum=True))
+
+    def minimum(self, source: VectorNode, period: int) -> VectorNode:
+        key = ("min", source.key, period)
+        return self._node(key, lambda: ExtremeNode(key, source, period, maximum=False))
+
+    def wma(self, source: VectorNode, period: int) -> VectorNode:
+        key = ("wma", source.key, period)
+        return self._node(key, lambda: WMANode(key, source, period))
+
+    def mean_deviation(self, source: VectorNode, period: int) -> MeanDeviationNode:
+        key = ("mean_deviation", source.key, period)
+        return self._node(key, lambda: MeanDeviationNode(key, source, period))
+
+    def ema(self, source: VectorNode, period: int) -> VectorNode:
+        key = ("ema", source.key, period)
+        return self._node(key, lambda: EMANode(key, source, period))
+
+    def cumulative(self, source: VectorNode) -> CumulativeNode:
+        key = ("cumulative", source.key)
+        return self._node(key, lambda: CumulativeNode(key, source))
+
+    # -------------------------------------------------------------------------
+    # Common derived series
+    # -------------------------------------------------------------------------
+
+    def previous_close(self) -> VectorNode:
+        return self.lag(self.field("close"), 1)
+
+    def typical_price(self) -> VectorNode:
+        return self.derived(
+            "typical_price",
+            [self.field("high"), self.field("low"), self.field("close")],
+            lambda high, low, close: (high + low + close) / 3.0
+        )
+
+    def true_range(self) -> VectorNode:
+        return self.derived(
+            "true_range",
+            [self.field("high"), self.field("low"), self.previous_close()],
+            lambda high, low, prev: np.maximum(
+                high - low, np.maximum(np.abs(high - prev), np.abs(low - prev))
+            )
+        )
+
+    def close_change(self) -> VectorNode:
+        return self.derived(
+            "change",
+            [self.field("close"), self.previous_close()],
+            lambda close, prev: close - prev
+        )
+
+
+# =============================================================================
+# Batched Indicators
+# =============================================================================
+
+_BUILDERS: Dict[str, Callable[[CrossSymbolGraph, IndicatorConfig], Composer]] = {}
+
+
+def _builder(*names: str):
+    """Register how an indicator is assembled from vector nodes."""
+    def decorator(func):
+        for name in names:
+            _BUILDERS[name] = func
+        return func
+    return decorator
+
+
+def indicator_signature(config: IndicatorConfig) -> Hashable:
+    """What determines an indicator's values (name, period, params).
+
+    Unlike make_key(), includes the params; private "_" params (warmup
+    state stored by kernels) are ignored.
+    """
+    params = tuple(sorted(
+        (name, repr(value)) for name, value in config.params.items() if not name.startswith("_")
+    ))
+    return (config.name, config.period, params)
+
+
+class BatchedIndicator:
+    """One symbol's view of an indicator evaluated in a CrossSymbolGraph.
+
+    Drop-in for a StreamingIndicator (sync/reset/bar_count): sync() steps
+    only this symbol. IndicatorManager.update_indicators_batch() steps all
+    symbols of a timestamp together instead and stores the results in
+    `owner`, the IndicatorData holding this indicator.
+    """
+
+    def __init__(self, config: IndicatorConfig, graph: CrossSymbolGraph, symbol: str, signature: Hashable):
+        self.config = config
+        self.graph = graph
+        self.symbol = symbol
+        self.signature = signature
+        self.slot = graph.slot(symbol)
+        self.owner: Optional[Any] = None
+
+    @property
+    def bar_count(self) -> int:
+        return self.graph.bar_count(self.symbol)
+
+    def reset(self) -> None:
+        self.graph.reset_symbol(self.symbol)
+
+    def sync(self, bars: Sequence[BarData]) -> IndicatorResult:
+        """Bring this symbol up to date with bars and return the latest result."""
+        self.graph.step({self.symbol: bars})
+        return self.graph.result(self.signature, self.symbol)
+
+
+def supports_batching(name: str) -> bool:
+    """True if the indicator can be evaluated across symbols."""
+    return name in _BUILDERS
+
+
+def create_batched_indicator(
+    config: IndicatorConfig,
+    graph: CrossSymbolGraph,
+    symbol: str
+) -> Optional[BatchedIndicator]:
+    """Create a symbol's batched indicator on a cross-symbol graph.
+
+    Args:
+        config: Indicator configuration (interval must match the graph)
+        graph: CrossSymbolGraph of the interval
+        symbol: Symbol the indicator belongs to
+
+    Returns:
+        BatchedIndicator, or None if the indicator has no batched form or
+        its params are unsupported
+    """
+    build = _BUILDERS.get(config.name)
+    if build is None:
+        return None
+
+    signature = indicator_signature(config)
+    with graph._lock:
+        if signature not in graph._indicators:
+            # Builders validate params before adding nodes, so a rejected
+            # config leaves the graph unchanged
+            try:
+                graph._indicators[signature] = (build(graph, config), config.warmup_bars())
+            except ValueError as e:
+                logger.debug(f"{config.make_key()}: Not batched ({e})")
+                return None
+
+        indicator = BatchedIndicator(config, graph, symbol, signature)
+        graph._members.setdefault(signature, {})[symbol] = indicator
+    return indicator
+
+
+
+# -----------------------------------------------------------------------------
+# Trend
+# -----------------------------------------------------------------------------
+
+@_builder("sma")
+def _build_sma(graph, config):
+    period = _require_positive("period", config.period)
+    mean = graph.mean(graph.field("close"), period)
+    return lambda slots: mean.value[slots]
+
+
+@_builder("ema")
+def _build_ema(graph, config):
+    period = _require_positive("period", config.period)
+    ema = graph.ema(graph.field("close"), period)
+    return lambda slots: ema.value[slots]
+
+
+@_builder("wma")
+def _build_wma(graph, config):
+    period = _require_positive("period", config.period)
+    wma = graph.wma(graph.field("close"), period)
+    return lambda slots: wma.value[slots]
+
+
+@_builder("dema")
+def _build_dema(graph, config):
+    period = _require_positive("period", config.period)
+    ema1 = graph.ema(graph.field("close"), period)
+    ema2 = graph.ema(ema1, period)
+    return lambda slots: 2 * ema1.value[slots] - ema2.value[slots]
+
+
+@_builder("tema")
+def _build_tema(graph, config):
+    period = _require_positive("period", config.period)
+    ema1 = graph.ema(graph.field("close"), period)
+    ema2 = graph.ema(ema1, period)
+    ema3 = graph.ema(ema2, period)
+    return lambda slots: 3 * ema1.value[slots] - 3 * ema2.value[slots] + ema3.value[slots]
+
+
+@_builder("hma")
+def _build_hma(graph, config):
+    period = _require_positive("period", config.period)
+    half_period = _require_positive("period // 2", period // 2)
+    close = graph.field("close")
+    half = graph.wma(close, half_period)
+    full = graph.wma(close, period)
+    return lambda slots: 2 * half.value[slots] - full.value[slots]
+
+
+@_builder("vwap")
+def _build_vwap(graph, config):
+    volume = graph.field("volume")
+    price_volume = graph.derived("price_volume", [graph.typical_price(), volume], lambda tp, v: tp * v)
+    cum_pv = graph.cumulative(price_volume)
+    cum_vol = graph.cumulative(volume)
+    close = graph.field("close")
+
+    def compose(slots):
+        total_volume = cum_vol.value[slots]
+        return np.where(total_volume == 0, close.value[slots], cum_pv.value[slots] / total_volume)
+    return compose
+
+
+@_builder("twap")
+def _build_twap(graph, config):
+    closes = graph.cumulative(graph.field("close"))
+
+    def compose(slots):
+        count = closes.count[slots]
+        return np.where(count > 0, closes.value[slots] / count, np.nan)
+    return compose
+
+
+# -----------------------------------------------------------------------------
+# Momentum
+# -----------------------------------------------------------------------------
+
+@_builder("rsi")
+def _build_rsi(graph, config):
+    period = _require_positive("period", config.period)
+    if config.params.get("smoothing", "simple") != "simple":
+        # Wilder averages are per-indicator recursions (StreamingRSI)
+        raise ValueError("only simple RSI averaging uses shared series")
+    change = graph.close_change()
+    gains = graph.mean(graph.derived("gain", [change], lambda c: np.maximum(c, 0.0)), period)
+    losses = graph.mean(graph.derived("loss", [change], lambda c: np.abs(np.minimum(c, 0.0))), period)
+
+    def compose(slots):
+        gain, loss = gains.value[slots], losses.value[slots]
+        return np.where(loss == 0, 100.0, 100.0 - (100.0 / (1.0 + gain / loss)))
+    return compose
+
+
+@_builder("macd")
+def _build_macd(graph, config):
+    params = config.params
+    fast_period = _require_positive("fast", params.get("fast", 12))
+    slow_period = _require_positive("slow", params.get("slow", 26))
+    signal_period = _require_positive("signal", params.get("signal", 9))
+    if fast_period > slow_period:
+        raise ValueError("fast period must not exceed slow period")
+
+    close = graph.field("close")
+    fast = graph.ema(close, fast_period)
+    slow = graph.ema(close, slow_period)
+    # Batch MACD line starts on the first EMA update after the slow seed
+    line = graph.derived("macd_line", [fast, slow, graph.lag(slow, 1)], lambda f, s, _: f - s)
+    signal = graph.ema(line, signal_period)
+
+    def compose(slots):
+        macd, signal_line = line.value[slots], signal.value[slots]
+        return dict(macd=macd, signal=signal_line, histogram=macd - signal_line)
+    return compose
+
+
+@_builder("stochastic")
+def _build_stochastic(graph, config):
+    period = _require_positive("period", config.period)
+    smooth = _require_positive("smooth", config.params.get("smooth", 3))
+    highest = graph.maximum(graph.field("high"), period)
+    lowest = graph.minimum(graph.field("low"), period)
+    k = graph.derived(
+        "stochastic_k",
+        [graph.field("close"), highest, lowest],
+        lambda close, high, low: np.where(high == low, 50.0, ((close - low) / (high - low)) * 100.0)
+    )
+    d = graph.mean(k, smooth)
+    return lambda slots: dict(k=k.value[slots], d=d.value[slots])
+
+
+@_builder("cci")
+def _build_cci(graph, config):
+    period = _require_positive("period", config.period)
+    typical = graph.typical_price()
+    deviation = graph.mean_deviation(typical, period)
+
+    def compose(slots):
+        dev = deviation.value[slots]
+        return np.where(dev == 0, 0.0, (typical.value[slots] - deviation.mean[slots]) / (0.015 * dev))
+    return compose
+
+
+@_builder("roc")
+def _build_roc(graph, config):
+    period = _require_positive("period", config.period)
+    close = graph.field("close")
+    past = graph.lag(close, period)
+
+    def compose(slots):
+        previous = past.value[slots]
+        return np.where(previous == 0, 0.0, ((close.value[slots] - previous) / previous) * 100.0)
+    return compose
+
+
+@_builder("mom")
+def _build_mom(graph, config):
+    period = _require_positive("period", config.period)
+    close = graph.field("close")
+    past = graph.lag(close, period)
+    return lambda slots: close.value[slots] - past.value[slots]
+
+
+@_builder("williams_r")
+def _build_williams_r(graph, config):
+    period = _require_positive("period", config.period)
+    highest = graph.maximum(graph.field("high"), period)
+    lowest = graph.minimum(graph.field("low"), period)
+    close = graph.field("close")
+
+    def compose(slots):
+        high, low = highest.value[slots], lowest.value[slots]
+        return np.where(high == low, -50.0, ((high - close.value[slots]) / (high - low)) * -100.0)
+    return compose
+
+
+@_builder("ultimate_osc")
+def _build_ultimate_osc(graph, config):
+    params = config.params
+    periods = (
+        _require_positive("period1", params.get("period1", 7)),
+        _require_positive("period2", params.get("period2", 14)),
+        _require_positive("period3", params.get("period3", 28)),
+    )
+    buying_pressure = graph.derived(
+        "buying_pressure",
+        [graph.field("close"), graph.field("low"), graph.previous_close()],
+        lambda close, low, prev: close - np.minimum(low, prev)
+    )
+    true_range = graph.true_range()
+    windows = [(graph.mean(buying_pressure, p), graph.mean(true_range, p)) for p in periods]
+
+    def compose(slots):
+        # Batch averages to 0 while a window is not full
+        raws = [
+            (np.nan_to_num(bp.value[slots]), np.nan_to_num(tr.value[slots]))
+            for bp, tr in windows
+        ]
+        (bp1, tr1), (bp2, tr2), (bp3, tr3) = raws
+        value = ((bp1 / tr1) * 4 + (bp2 / tr2) * 2 + bp3 / tr3) / 7.0 * 100.0
+        value = np.where((tr1 == 0) | (tr2 == 0) | (tr3 == 0), 50.0, value)
+        return np.where(graph._count[slots] >= periods[2] + 1, value, np.nan)
+    return compose
+
+
+# -----------------------------------------------------------------------------
+# Volatility
+# -----------------------------------------------------------------------------
+
+@_builder("atr", "atr_daily")
+def _build_atr(graph, config):
+    period = _require_positive("period", config.period)
+    atr = graph.mean(graph.true_range(), period)
+    return lambda slots: atr.value[slots]
+
+
+@_builder("bbands")
+def _build_bbands(graph, config):
+    period = _require_positive("period", config.period)
+    closes = graph.variance(graph.field("close"), period)
+    num_std = config.params.get("num_std", 2.0)
+
+    def compose(slots):
+        middle = closes.mean[slots]
+        std_dev = closes.value[slots]
+        upper = middle + (std_dev * num_std)
+        lower = middle - (std_dev * num_std)
+        bandwidth = np.where(middle != 0, (upper - lower) / middle, 0.0)
+        return dict(upper=upper, middle=middle, lower=lower, bandwidth=bandwidth)
+    return compose
+
+
+@_builder("keltner")
+def _build_keltner(graph, config):
+    period = _require_positive("period", config.period)
+    atr_period = _require_positive("atr_period", config.params.get("atr_period", 10))
+    multiplier = config.params.get("multiplier", 2.0)
+    middle = graph.ema(graph.field("close"), period)
+    atr = graph.mean(graph.true_range(), atr_period)
+
+    def compose(slots):
+        center, width = middle.value[slots], atr.value[slots] * multiplier
+        return dict(upper=center + width, middle=center, lower=center - width)
+    return compose
+
+
+@_builder("donchian")
+def _build_donchian(graph, config):
+    period = _require_positive("period", config.period)
+    highest = graph.maximum(graph.field("high"), period)
+    lowest = graph.minimum(graph.field("low"), period)
+
+    def compose(slots):
+        upper, lower = highest.value[slots], lowest.value[slots]
+        return dict(upper=upper, middle=(upper + lower) / 2.0, lower=lower)
+    return compose
+
+
+@_builder("stddev")
+def _build_stddev(graph, config):
+    period = _require_positive("period", config.period)
+    closes = graph.variance(graph.field("close"), period)
+    return lambda slots: closes.value[slots]
+
+
+@_builder("histvol")
+def _build_histvol(graph, config):
+    period = _require_positive("period", config.period)
+    log_return = graph.derived(
+        "log_return",
+        [graph.field("close"), graph.previous_close()],
+        lambda close, prev: np.where(prev > 0, np.log(close / prev), 0.0)
+    )
+    returns = graph.variance(log_return, period)
+    return lambda slots: returns.value[slots] * np.sqrt(252) * 100.0
+
+
+# -----------------------------------------------------------------------------
+# Volume
+# -----------------------------------------------------------------------------
+
+@_builder("obv")
+def _build_obv(graph, config):
+    flow = graph.derived(
+        "obv_flow",
+        [graph.field("close"), graph.previous_close(), graph.field("volume")],
+        lambda close, prev, volume: np.where(
+            close > prev, volume, np.where(close < prev, -volume, 0.0)
+        )
+    )
+    obv = graph.cumulative(flow)
+    return lambda slots: obv.value[slots]
+
+
+@_builder("pvt")
+def _build_pvt(graph, config):
+    flow = graph.derived(
+        "pvt_flow",
+        [graph.field("close"), graph.previous_close(), graph.field("volume")],
+        lambda close, prev, volume: np.where(prev != 0, volume * ((close - prev) / prev), 0.0)
+    )
+    pvt = graph.cumulative(flow)
+    return lambda slots: pvt.value[slots]
+
+
+@_builder("volume_sma", "avg_volume")
+def _build_volume_sma(graph, config):
+    period = _require_positive("period", config.period)
+    volumes = graph.mean(graph.field("volume"), period)
+    return lambda slots: volumes.value[slots]
+
+
+@_builder("volume_ratio")
+def _build_volume_ratio(graph, config):
+    volume = graph.field("volume")
+    average = graph.mean(volume, config.period if config.period > 0 else 20)
+
+    def compose(slots):
+        avg = average.value[slots]
+        return np.where(avg == 0, 1.0, volume.value[slots] / avg)
+    return compose
+
+
+__all__ = [
+    'CrossSymbolGraph',
+    'BatchedIndicator',
+    'create_batched_indicator',
+    'indicator_signature',
+    'supports_batching',
+]
@@ -0,0 +1,882 @@
+"""Shared primitive series for streaming indicators.
+
+Streaming indicators on the same symbol and interval keep overlapping
+state: ema_12, ema_26 and macd each run the same EMAs, keltner runs an EMA
+and an ATR, bbands and stddev the same rolling variance, dema/tema repeat
+the EMA chain. A PrimitiveGraph holds one node per distinct primitive
+series (EMA(close, 12), rolling variance(close, 20), true range, ...),
+keyed by what it computes. Indicators declare the nodes they need and read
+their values; every node is folded in once per bar no matter how many
+indicators use it.
+
+Nodes reuse the rolling primitives of streaming.py, so a graph-backed
+indicator returns exactly what its StreamingIndicator returns.
+
+Usage:
+    graph = PrimitiveGraph("5m")
+    macd = create_graph_indicator(macd_config, graph)
+    ema = create_graph_indicator(ema_12_config, graph)   # shares EMA(12)
+    result = macd.sync(bars)                             # feeds new bars once
+"""
+
+import logging
+import math
+from collections import deque
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence
+
+from .base import BarData, IndicatorConfig, IndicatorResult
+from .streaming import (
+    RollingExtreme,
+    RollingSum,
+    RollingVariance,
+    RollingWMA,
+    SeededEMA,
+    _require_positive,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Nodes
+# =============================================================================
+
+class SeriesNode:
+    """One primitive series: its value at the latest bar (None if undefined).
+
+    Inputs are nodes created earlier in the same graph, so updating nodes
+    in creation order is a topological order.
+    """
+
+    def __init__(self, key: Hashable, inputs: Sequence["SeriesNode"] = ()):
+        self.key = key
+        self.inputs = tuple(inputs)
+        self.reset()
+
+    def reset(self) -> None:
+        self.value: Optional[float] = None
+
+    def update(self, bar: BarData) -> None:
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.key})"
+
+
+class FieldNode(SeriesNode):
+    """A bar field (open/high/low/close/volume) as float."""
+
+    def __init__(self, key, field: str):
+        self.field = field
+        super().__init__(key)
+
+    def update(self, bar):
+        self.value = float(getattr(bar, self.field))
+
+
+class DerivedNode(SeriesNode):
+    """Function of the current values of other nodes (None if any is None)."""
+
+    def __init__(self, key, inputs, func: Callable[..., Optional[float]]):
+        self.func = func
+        super().__init__(key, inputs)
+        # Unrolled updates for the common arities (hot path)
+        if len(self.inputs) == 1:
+            self.update = self._update1
+        elif len(self.inputs) == 2:
+            self.update = self._update2
+        elif len(self.inputs) == 3:
+            self.update = self._update3
+
+    def update(self, bar):
+        values = [node.value for node in self.inputs]
+        self.value = None if None in values else self.func(*values)
+
+    def _update1(self, bar):
+        a = self.inputs[0].value
+        self.value = None if a is None else self.func(a)
+
+    def _update2(self, bar):
+        first, second = self.inputs
+        a, b = first.value, second.value
+        self.value = None if a is None or b is None else self.func(a, b)
+
+    def _update3(self, bar):
+        first, second, third = self.inputs
+        a, b, c = first.value, second.value, third.value
+        self.value = None if a is None or b is None or c is None else self.func(a, b, c)
+
+
+class LagNode(SeriesNode):
+    """Value of the input `lag` defined updates ago."""
+
+    def __init__(self, key, source: SeriesNode, lag: int):
+        self.source = source
+        self.lag = lag
+        super().__init__(key, (source,))
+
+    def reset(self):
+        super().reset()
+        self._history: deque = deque(maxlen=self.lag + 1)
+
+    def update(self, bar):
+        value = self.source.value
+        if value is not None:
+            history = self._history
+            history.append(value)
+            if len(history) == history.maxlen:
+                self.value = history[0]
+
+
+class _WindowNode(SeriesNode):
+    """Base for nodes folding each defined input value into a window.
+
+    The value only changes on bars where the input is defined.
+    """
+
+    def __init__(self, key, source: SeriesNode, period: int):
+        self.source = source
+        self.period = period
+        super().__init__(key, (source,))
+
+
+class MeanNode(_WindowNode):
+    """Rolling mean, defined once the window is full."""
+
+    def reset(self):
+        super().reset()
+        self._window = RollingSum(self.period)
+
+    def update(self, bar):
+        value = self.source.value
+        if value is not None:
+            window = self._window
+            window.push(value)
+            if len(window.values) == window.size:
+                self.value = window.total / window.size
+
+
+class VarianceNode(_WindowNode):
+    """Rolling mean and population standard deviation (value = stddev)."""
+
+    def reset(self):
+        super().reset()
+        self._window = RollingVariance(self.period)
+        self.mean: Optional[float] = None
+
+    def update(self, bar):
+        value = self.source.value
+        if value is not None:
+            window = self._window
+            window.push(value)
+            if len(window.values) == window.size:
+                self.mean = window.mean
+                self.value = window.stddev()
+
+
+class ExtremeNode(_WindowNode):
+    """Rolling max or min, defined once `period` values were seen."""
+
+    def __init__(self, key, source, period, maximum: bool):
+        self.maximum = maximum
+        super().__init__(key, source, period)
+
+    def reset(self):
+        super().reset()
+        self._window = RollingExtreme(self.period, maximum=self.maximum)
+
+    def update(self, bar):
+        value = self.source.value
+        if value is not None:
+            window = self._window
+            window.push(value)
+            if window.full():
+                self.value = window.value()
+
+
+class WMANode(_WindowNode):
+    """Linearly weighted moving average, defined once the window is full."""
+
+    def reset(self):
+        super().reset()
+        self._window = RollingWMA(self.period)
+
+    def update(self, bar):
+        value = self.source.value
+        if value is not None:
+            window = self._window
+            window.push(value)
+            if len(window.values) == window.size:
+                self.value = window.value()
+
+
+class MeanDeviationNode(_WindowNode):
+    """Rolling mean and mean absolute deviation (value = deviation).
+
+    Mean deviation has no constant-time update: O(period) per bar.
+    """
+
+    def reset(self):
+        super().reset()
+        self._window: deque = deque(maxlen=self.period)
+        self.mean: Optional[float] = None
+
+    def update(self, bar):
+        value = self.source.value
+        if value is not None:
+            window = self._window
+            window.append(value)
+            if len(window) == self.period:
+                mean = self.mean = sum(window) / self.period
+                self.value = sum(abs(v - mean) for v in window) / self.period
+
+
+class EMANode(SeriesNode):
+    """EMA seeded with the SMA of its first `period` defined inputs."""
+
+    def __init__(self, key, source: SeriesNode, period: int):
+        self.source = source
+        self.period = period
+        super().__init__(key, (source,))
+
+    def reset(self):
+        super().reset()
+        self._ema = SeededEMA(self.period)
+
+    def update(self, bar):
+        value = self.source.value
+        if value is not None:
+            self.value = self._ema.push(value)
+
+
+class CumulativeNode(SeriesNode):
+    """Running total of the defined inputs since the series start."""
+
+    def reset(self):
+        self.value = 0.0
+        self.count = 0
+
+    def update(self, bar):
+        value = self.inputs[0].value
+        if value is not None:
+            self.value += value
+            self.count += 1
+
+
+# =============================================================================
+# Graph
+# =============================================================================
+
+class PrimitiveGraph:
+    """Primitive series of one symbol/interval, shared by its indicators.
+
+    sync(bars) has the same cursor semantics as StreamingIndicator.sync():
+    only bars appended since the last call are folded in, and a rewritten
+    series (gap fill, trimming, new session) is replayed from scratch.
+    Adding a node to a graph that has already seen bars schedules a replay,
+    so the new node is as up to date as the others.
+    """
+
+    def __init__(self, interval: str):
+        self.interval = interval
+        self._nodes: Dict[Hashable, SeriesNode] = {}
+        self._order: List[SeriesNode] = []
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all state; next sync() replays the full series."""
+        self._count = 0
+        self._first_timestamp = None
+        self._last_timestamp = None
+        for node in self._order:
+            node.reset()
+
+    @property
+    def bar_count(self) -> int:
+        """Number of bars folded into the nodes."""
+        return self._count
+
+    @property
+    def node_count(self) -> int:
+        """Number of distinct primitive series."""
+        return len(self._order)
+
+    def sync(self, bars: Sequence[BarData]) -> int:
+        """Fold bars not seen yet into every node.
+
+        Args:
+            bars: Full bar series for the interval (list or deque)
+
+        Returns:
+            Number of bars in the series
+        """
+        n = len(bars)
+        if n == 0:
+            return 0
+        if (
+            n == self._count
+            and bars[-1].timestamp == self._last_timestamp
+            and bars[0].timestamp == self._first_timestamp
+        ):
+            return n  # Already folded in by another indicator on this graph
+
+        if self._count and (
+            n < self._count
+            or bars[0].timestamp != self._first_timestamp
+            or bars[self._count - 1].timestamp != self._last_timestamp
+        ):
+            # Series changed underneath us - rebuild
+            self.reset()
+
+        if self._count == 0:
+            self._first_timestamp = bars[0].timestamp
+
+        order = self._order
+        for i in range(self._count, n):
+            bar = bars[i]
+            for node in order:
+                node.update(bar)
+
+        self._count = n
+        self._last_timestamp = bars[-1].timestamp
+        return n
+
+    def _node(self, key: Hashable, factory: Callable[[], SeriesNode]) -> SeriesNode:
+        node = self._nodes.get(key)
+        if node is None:
+            node = self._nodes[key] = factory()
+            self._order.append(node)
+            if self._count:
+                self.reset()  # New node has not seen the bars so far
+        return node
+
+    # -------------------------------------------------------------------------
+    # Node constructors (get or create)
+    # -------------------------------------------------------------------------
+
+    def field(self, name: str) -> SeriesNode:
+        return self._node((name,), lambda: FieldNode((name,), name))
+
+    def derived(self, name: str, inputs: Sequence[SeriesNode], func: Callable[..., Optional[float]]) -> SeriesNode:
+        """Node computing func(*input values); `name` must identify func."""
+        key = (name,) + tuple(node.key for node in inputs)
+        return self._node(key, lambda: DerivedNode(key, inputs, func))
+
+    def lag(self, source: SeriesNode, lag: int) -> SeriesNode:
+        key = ("lag", source.key, lag)
+        return self._node(key, lambda: LagNode(key, source, lag))
+
+    def mean(self, source: SeriesNode, period: int) -> SeriesNode:
+        key = ("mean", source.key, period)
+        return self._node(key, lambda: MeanNode(key, source, period))
+
+    def variance(self, source: SeriesNode, period: int) -> VarianceNode:
+        key = ("variance", source.key, period)
+        return self._node(key, lambda: VarianceNode(key, source, period))
+
+    def maximum(self, source: SeriesNode, period: int) -> SeriesNode:
+        key = ("max", source.key, period)
+        return self._node(key, lambda: ExtremeNode(key, source, period, maximum=True))
+
+    def minimum(self, source: SeriesNode, period: int) -> SeriesNode:
+        key = ("min", source.key, period)
+        return self._node(key, lambda: ExtremeNode(key, source, period, maximum=False))
+
+    def wma(self, source: SeriesNode, period: int) -> SeriesNode:
+        key = ("wma", source.key, period)
+        return self._node(key, lambda: WMANode(key, source, period))
+
+    def mean_deviation(self, source: SeriesNode, period: int) -> MeanDeviationNode:
+        key = ("mean_deviation", source.key, period)
+        return self._node(key, lambda: MeanDeviationNode(key, source, period))
+
+    def ema(self, source: SeriesNode, period: int) -> SeriesNode:
+        key = ("ema", source.key, period)
+        return self._node(key, lambda: EMANode(key, source, period))
+
+    def cumulative(self, source: SeriesNode) -> CumulativeNode:
+        key = ("cumulative", source.key)
+        return self._node(key, lambda: CumulativeNode(key, (source,)))
+
+    # -------------------------------------------------------------------------
+    # Common derived series
+    # -------------------------------------------------------------------------
+
+    def previous_close(self) -> SeriesNode:
+        return self.lag(self.field("close"), 1)
+
+    def typical_price(self) -> SeriesNode:
+        return self.derived(
+            "typical_price",
+            [self.field("high"), self.field("low"), self.field("close")],
+            lambda high, low, close: (high + low + close) / 3.0
+        )
+
+    def true_range(self) -> SeriesNode:
+        return self.derived(
+            "true_range",
+            [self.field("high"), self.field("low"), self.previous_close()],
+            lambda high, low, prev: max(high - low, abs(high - prev), abs(low - prev))
+        )
+
+    def close_change(self) -> SeriesNode:
+        return self.derived(
+            "change",
+            [self.field("close"), self.previous_close()],
+            lambda close, prev: close - prev
+        )
+
+
+# =============================================================================
+# Graph-backed Indicators
+# =============================================================================
+
+# Indicator value from node values at the latest bar (None = not valid)
+Composer = Callable[[], Any]
+
+_BUILDERS: Dict[str, Callable[[PrimitiveGraph, IndicatorConfig], Composer]] = {}
+
+
+def _builder(*names: str):
+    """Register how an indicator is assembled from graph nodes."""
+    def decorator(func):
+        for name in names:
+            _BUILDERS[name] = func
+        return func
+    return decorator
+
+
+class GraphIndicator:
+    """Streaming indicator whose state lives in a shared PrimitiveGraph.
+
+    Drop-in for a StreamingIndicator (sync/reset/bar_count); the indicator
+    itself only combines node values at the latest bar.
+    """
+
+    def __init__(self, config: IndicatorConfig, graph: PrimitiveGraph, compose: Composer):
+        self.config = config
+        self.graph = graph
+        self._compose = compose
+        self._warmup_bars = config.warmup_bars()
+
+    @property
+    def bar_count(self) -> int:
+        return self.graph.bar_count
+
+    def reset(self) -> None:
+        self.graph.reset()
+
+    def sync(self, bars: Sequence[BarData]) -> IndicatorResult:
+        """Bring the graph up to date with bars and return the latest result."""
+        n = self.graph.sync(bars)
+        if n == 0:
+            return IndicatorResult(timestamp=None, value=None, valid=False)
+
+        timestamp = bars[-1].timestamp
+        # Same warmup gate as calculate_indicator()
+        value = self._compose() if n >= self._warmup_bars else None
+        if value is None:
+            return IndicatorResult(timestamp=timestamp, value=None, valid=False)
+        return IndicatorResult(timestamp=timestamp, value=value, valid=True)
+
+
+def supports_graph(name: str) -> bool:
+    """True if the indicator can be assembled from graph nodes."""
+    return name in _BUILDERS
+
+
+def create_graph_indicator(config: IndicatorConfig, graph: PrimitiveGraph) -> Optional[GraphIndicator]:
+    """Create a graph-backed streaming indicator.
+
+    Args:
+        config: Indicator configuration (interval must match the graph)
+        graph: PrimitiveGraph of the symbol/interval
+
+    Returns:
+        GraphIndicator, or None if the indicator has no graph form or its
+        params are unsupported (use create_streaming_indicator instead)
+    """
+    # Builders validate params before adding nodes, so a rejected config
+    # leaves the graph unchanged
+    build = _BUILDERS.get(config.name)
+    if build is None:
+        return None
+
+    try:
+        return GraphIndicator(config, graph, build(graph, config))
+    except ValueError as e:
+        logger.debug(f"{config.make_key()}: Not graph-backed ({e})")
+        return None
+
+
+def _when(*nodes: SeriesNode) -> bool:
+    return all(node.value is not None for node in nodes)
+
+
+# -----------------------------------------------------------------------------
+# Trend
+# -----------------------------------------------------------------------------
+
+@_builder("sma")
+def _build_sma(graph, config):
+    period = _require_positive("period", config.period)
+    mean = graph.mean(graph.field("close"), period)
+    return lambda: mean.value
+
+
+@_builder("ema")
+def _build_ema(graph, config):
+    period = _require_positive("period", config.period)
+    ema = graph.ema(graph.field("close"), period)
+    return lambda: ema.value
+
+
+@_builder("wma")
+def _build_wma(graph, config):
+    period = _require_positive("period", config.period)
+    wma = graph.wma(graph.field("close"), period)
+    return lambda: wma.value
+
+
+@_builder("dema")
+def _build_dema(graph, config):
+    period = _require_positive("period", config.period)
+    ema1 = graph.ema(graph.field("close"), period)
+    ema2 = graph.ema(ema1, period)
+    return lambda: 2 * ema1.value - ema2.value if _when(ema1, ema2) else None
+
+
+@_builder("tema")
+def _build_tema(graph, config):
+    period = _require_positive("period", config.period)
+    ema1 = graph.ema(graph.field("close"), period)
+    ema2 = graph.ema(ema1, period)
+    ema3 = graph.ema(ema2, period)
+    return lambda: (
+        3 * ema1.value - 3 * ema2.value + ema3.value if _when(ema1, ema2, ema3) else None
+    )
+
+
+@_builder("hma")
+def _build_hma(graph, config):
+    period = _require_positive("period", config.period)
+    half_period = _require_positive("period // 2", period // 2)
+    close = graph.field("close")
+    half = graph.wma(close, half_period)
+    full = graph.wma(close, period)
+    return lambda: 2 * half.value - full.value if _when(half, full) else None
+
+
+@_builder("vwap")
+def _build_vwap(graph, config):
+    volume = graph.field("volume")
+    price_volume = graph.derived("price_volume", [graph.typical_price(), volume], lambda tp, v: tp * v)
+    cum_pv = graph.cumulative(price_volume)
+    cum_vol = graph.cumulative(volume)
+    close = graph.field("close")
+    return lambda: close.value if cum_vol.value == 0 else cum_pv.value / cum_vol.value
+
+
+@_builder("twap")
+def _build_twap(graph, config):
+    closes = graph.cumulative(graph.field("close"))
+    return lambda: closes.value / closes.count if closes.count else None
+
+
+# -----------------------------------------------------------------------------
+# Momentum
+# -----------------------------------------------------------------------------
+
+@_builder("rsi")
+def _build_rsi(graph, config):
+    period = _require_positive("period", config.period)
+    if config.params.get("smoothing", "simple") != "simple":
+        # Wilder averages are per-indicator recursions (StreamingRSI)
+        raise ValueError("only simple RSI averaging uses shared series")
+    change = graph.close_change()
+    gains = graph.mean(graph.derived("gain", [change], lambda c: max(0, c)), period)
+    losses = graph.mean(graph.derived("loss", [change], lambda c: abs(min(0, c))), period)
+
+    def compose():
+        if not _when(gains, losses):
+            return None
+        if losses.value == 0:
+            return 100.0
+        return 100.0 - (100.0 / (1.0 + gains.value / losses.value))
+    return compose
+
+
+@_builder("macd")
+def _build_macd(graph, config):
+    params = config.params
+    fast_period = _require_positive("fast", params.get("fast", 12))
+    slow_period = _require_positive("slow", params.get("slow", 26))
+    signal_period = _require_positive("signal", params.get("signal", 9))
+    if fast_period > slow_period:
+        raise ValueError("fast period must not exceed slow period")
+
+    close = graph.field("close")
+    fast = graph.ema(close, fast_period)
+    slow = graph.ema(close, slow_period)
+    # Batch MACD line starts on the first EMA update after the slow seed
+    line = graph.derived("macd_line", [fast, slow, graph.lag(slow, 1)], lambda f, s, _: f - s)
+    signal = graph.ema(line, signal_period)
+
+    def compose():
+        if not _when(line, signal):
+            return None
+        return {
+            "macd": line.value,
+            "signal": signal.value,
+            "histogram": line.value - signal.value
+        }
+    return compose
+
+
+@_builder("stochastic")
+def _build_stochastic(graph, config):
+    period = _require_positive("period", config.period)
+    smooth = _require_positive("smooth", config.params.get("smooth", 3))
+    highest = graph.maximum(graph.field("high"), period)
+    lowest = graph.minimum(graph.field("low"), period)
+
+    def percent_k(close, high, low):
+        if high == low:
+            return 50.0
+        return ((close - low) / (high - low)) * 100.0
+
+    k = graph.derived("stochastic_k", [graph.field("close"), highest, lowest], percent_k)
+    d = graph.mean(k, smooth)
+    return lambda: {"k": k.value, "d": d.value} if _when(k, d) else None
+
+
+@_builder("cci")
+def _build_cci(graph, config):
+    period = _require_positive("period", config.period)
+    typical = graph.typical_price()
+    deviation = graph.mean_deviation(typical, period)
+
+    def compose():
+        if deviation.value is None:
+            return None
+        if deviation.value == 0:
+            return 0.0
+        return (typical.value - deviation.mean) / (0.015 * deviation.value)
+    return compose
+
+
+@_builder("roc")
+def _build_roc(graph, config):
+    period = _require_positive("period", config.period)
+    close = graph.field("close")
+    past = graph.lag(close, period)
+
+    def compose():
+        if past.value is None:
+            return None
+        if past.value == 0:
+            return 0.0
+        return ((close.value - past.value) / past.value) * 100.0
+    return compose
+
+
+@_builder("mom")
+def _build_mom(graph, config):
+    period = _require_positive("period", config.period)
+    close = graph.field("close")
+    past = graph.lag(close, period)
+    return lambda: close.value - past.value if past.value is not None else None
+
+
+@_builder("williams_r")
+def _build_williams_r(graph, config):
+    period = _require_positive("period", config.period)
+    highest = graph.maximum(graph.field("high"), period)
+    lowest = graph.minimum(graph.field("low"), period)
+    close = graph.field("close")
+
+    def compose():
+        if not _when(highest, lowest):
+            return None
+        if highest.value == lowest.value:
+            return -50.0
+        return ((highest.value - close.value) / (highest.value - lowest.value)) * -100.0
+    return compose
+
+
+@_builder("ultimate_osc")
+def _build_ultimate_osc(graph, config):
+    params = config.params
+    periods = (
+        _require_positive("period1", params.get("period1", 7)),
+        _require_positive("period2", params.get("period2", 14)),
+        _require_positive("period3", params.get("period3", 28)),
+    )
+    buying_pressure = graph.derived(
+        "buying_pressure",
+        [graph.field("close"), graph.field("low"), graph.previous_close()],
+        lambda close, low, prev: close - min(low, prev)
+    )
+    true_range = graph.true_range()
+    windows = [(graph.mean(buying_pressure, p), graph.mean(true_range, p)) for p in periods]
+
+    def compose():
+        if graph.bar_count < periods[2] + 1:
+            return None
+        # Batch averages to 0 while a window is not full
+        raws = [(bp.value or 0, tr.value or 0) for bp, tr in windows]
+        if any(tr == 0 for _, tr in raws):
+            return 50.0
+        (bp1, tr1), (bp2, tr2), (bp3, tr3) = raws
+        return ((bp1 / tr1) * 4 + (bp2 / tr2) * 2 + bp3 / tr3) / 7.0 * 100.0
+    return compose
+
+
+# -----------------------------------------------------------------------------
+# Volatility
+# -----------------------------------------------------------------------------
+
+@_builder("atr", "atr_daily")
+def _build_atr(graph, config):
+    period = _require_positive("period", config.period)
+    atr = graph.mean(graph.true_range(), period)
+    return lambda: atr.value
+
+
+@_builder("bbands")
+def _build_bbands(graph, config):
+    period = _require_positive("period", config.period)
+    closes = graph.variance(graph.field("close"), period)
+    num_std = config.params.get("num_std", 2.0)
+
+    def compose():
+        if closes.value is None:
+            return None
+        middle = closes.mean
+        upper = middle + (closes.value * num_std)
+        lower = middle - (closes.value * num_std)
+        return {
+            "upper": upper,
+            "middle": middle,
+            "lower": lower,
+            "bandwidth": (upper - lower) / middle if middle != 0 else 0.0
+        }
+    return compose
+
+
+@_builder("keltner")
+def _build_keltner(graph, config):
+    period = _require_positive("period", config.period)
+    atr_period = _require_positive("atr_period", config.params.get("atr_period", 10))
+    multiplier = config.params.get("multiplier", 2.0)
+    middle = graph.ema(graph.field("close"), period)
+    atr = graph.mean(graph.true_range(), atr_period)
+
+    def compose():
+        if not _when(middle, atr):
+            return None
+        return {
+            "upper": middle.value + (atr.value * multiplier),
+            "middle": middle.value,
+            "lower": middle.value - (atr.value * multiplier)
+        }
+    return compose
+
+
+@_builder("donchian")
+def _build_donchian(graph, config):
+    period = _require_positive("period", config.period)
+    highest = graph.maximum(graph.field("high"), period)
+    lowest = graph.minimum(graph.field("low"), period)
+
+    def compose():
+        if not _when(highest, lowest):
+            return None
+        return {
+            "upper": highest.value,
+            "middle": (highest.value + lowest.value) / 2.0,
+            "lower": lowest.value
+        }
+    return compose
+
+
+@_builder("stddev")
+def _build_stddev(graph, config):
+    period = _require_positive("period", config.period)
+    closes = graph.variance(graph.field("close"), period)
+    return lambda: closes.value
+
+
+@_builder("histvol")
+def _build_histvol(graph, config):
+    period = _require_positive("period", config.period)
+    log_return = graph.derived(
+        "log_return",
+        [graph.field("close"), graph.previous_close()],
+        lambda close, prev: math.log(close / prev) if prev > 0 else 0.0
+    )
+    returns = graph.variance(log_return, period)
+    return lambda: returns.value * math.sqrt(252) * 100.0 if returns.value is not None else None
+
+
+# -----------------------------------------------------------------------------
+# Volume
+# -----------------------------------------------------------------------------
+
+def _signed_volume(close, prev, volume):
+    if close > prev:
+        return volume
+    if close < prev:
+        return -volume
+    return 0.0
+
+
+@_builder("obv")
+def _build_obv(graph, config):
+    flow = graph.derived(
+        "obv_flow",
+        [graph.field("close"), graph.previous_close(), graph.field("volume")],
+        _signed_volume
+    )
+    obv = graph.cumulative(flow)
+    return lambda: obv.value
+
+
+@_builder("pvt")
+def _build_pvt(graph, config):
+    flow = graph.derived(
+        "pvt_flow",
+        [graph.field("close"), graph.previous_close(), graph.field("volume")],
+        lambda close, prev, volume: volume * ((close - prev) / prev) if prev != 0 else 0.0
+    )
+    pvt = graph.cumulative(flow)
+    return lambda: pvt.value
+
+
+@_builder("volume_sma", "avg_volume")
+def _build_volume_sma(graph, config):
+    period = _require_positive("period", config.period)
+    volumes = graph.mean(graph.field("volume"), period)
+    return lambda: volumes.value
+
+
+@_builder("volume_ratio")
+def _build_volume_ratio(graph, config):
+    volume = graph.field("volume")
+    average = graph.mean(volume, config.period if config.period > 0 else 20)
+
+    def compose():
+        if average.value is None:
+            return None
+        if average.value == 0:
+            return 1.0
+        return volume.value / average.value
+    return compose
+
+
+__all__ = [
+    'PrimitiveGraph',
+    'GraphIndicator',
+    'create_graph_indicator',
+    'supports_graph',
+]
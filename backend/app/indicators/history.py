@@ -0,0 +1,158 @@
+"""Bounded per-indicator value history.
+
+IndicatorHistory keeps the last N (timestamp, value) pairs of one
+indicator in preallocated NumPy ring buffers. IndicatorManager records
+every update of an indicator configured with IndicatorConfig.history > 0
+(stored in IndicatorData.historical_values), so strategies read "RSI over
+the last N bars" from it instead of recomputing it, and delta JSON exports
+send only the entries written since the previous export.
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+
+class IndicatorHistory:
+    """Fixed-capacity ring buffer of (timestamp, value) pairs.
+
+    Values are float64, NaN while the indicator is not valid. Multi-value
+    indicators (e.g. Bollinger Bands) get one column per field, fixed by
+    the first dict value recorded. Every write is numbered by an
+    increasing revision, so entries written after a given revision are
+    always the newest ones (changed_since).
+
+    Attributes:
+        capacity: Maximum number of entries kept
+        fields: Fields of a multi-value indicator (None = single value)
+        revision: Revision of the latest write (0 = nothing recorded)
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError(f"History capacity must be > 0 (got {capacity})")
+        self.capacity = capacity
+        self.fields: Optional[Tuple[str, ...]] = None
+        self.revision = 0
+        self._timestamps = np.empty(capacity, dtype=object)
+        self._values = np.full(capacity, np.nan)
+        self._revisions = np.zeros(capacity, dtype=np.int64)
+        self._end = 0  # Next write position
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def record(self, timestamp: Optional[datetime], value: Union[float, Dict[str, float], None]):
+        """Record the indicator value at a bar.
+
+        A value for the timestamp of the newest entry replaces it (the
+        indicator was recalculated on the same bar); any other timestamp is
+        appended, overwriting the oldest entry once the buffer is full.
+
+        Args:
+            timestamp: Bar timestamp of the value (None = nothing to record)
+            value: Indicator value (None while not valid)
+        """
+        if timestamp is None:
+            return
+
+        newest = (self._end - 1) % self.capacity
+        if self._size and self._timestamps[newest] == timestamp:
+            index = newest
+        else:
+            index = self._end
+            self._end = (index + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+        if isinstance(value, dict):
+            if self.fields is None:
+                self._set_fields(tuple(value))
+            self._values[index] = [
+                np.nan if value.get(name) is None else value[name] for name in self.fields
+            ]
+        else:
+            self._values[index] = np.nan if value is None else value
+
+        self._timestamps[index] = timestamp
+        self.revision += 1
+        self._revisions[index] = self.revision
+
+    def last(
+        self,
+        n: int,
+        field: Optional[str] = None,
+        until: Optional[datetime] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Newest entries, oldest first.
+
+        Args:
+            n: Number of entries (fewer if not that many are kept)
+            field: Field of a multi-value indicator (required for those)
+            until: Ignore entries newer than this timestamp
+
+        Returns:
+            (timestamps, values) arrays; values has one column per field
+            when a multi-value indicator is read without a field
+
+        Raises:
+            ValueError: Unknown field, or field given for a single value
+        """
+        column = None
+        if field is not None:
+            if self.fields is None or field not in self.fields:
+                raise ValueError(f"Indicator history has no field '{field}' (fields: {self.fields})")
+            column = self.fields.index(field)
+
+        skip = 0
+        if until is not None:
+            while skip < self._size and self._timestamps[self._newest(skip)] > until:
+                skip += 1
+
+        indices = self._indices(min(max(n, 0), self._size - skip), skip)
+        values = self._values[indices] if column is None else self._values[indices, column]
+        return self._timestamps[indices], values
+
+    def changed_since(self, revision: int) -> int:
+        """Number of newest entries written after a revision."""
+        count = 0
+        while count < self._size and self._revisions[self._newest(count)] > revision:
+            count += 1
+        return count
+
+    def to_list(self, n: Optional[int] = None) -> List[List[Any]]:
+        """Newest entries as [iso timestamp, value] rows (JSON export).
+
+        Args:
+            n: Number of entries (None = all kept)
+
+        Returns:
+            Rows oldest first; value is None while not valid and a
+            {field: value} dict for multi-value indicators
+        """
+        indices = self._indices(self._size if n is None else min(n, self._size))
+        rows = []
+        for timestamp, value in zip(self._timestamps[indices], self._values[indices]):
+            if self.fields is not None:
+                value = {
+                    name: None if np.isnan(v) else float(v) for name, v in zip(self.fields, value)
+                }
+                if all(v is None for v in value.values()):
+                    value = None
+            else:
+                value = None if np.isnan(value) else float(value)
+            rows.append([timestamp.isoformat(), value])
+        return rows
+
+    def _newest(self, k: int) -> int:
+        """Buffer position of the k-th newest entry (0 = newest)."""
+        return (self._end - 1 - k) % self.capacity
+
+    def _indices(self, n: int, skip: int = 0) -> np.ndarray:
+        """Buffer positions of n entries ending `skip` before the newest."""
+        return (self._end - skip - n + np.arange(n)) % self.capacity
+
+    def _set_fields(self, fields: Tuple[str, ...]):
+        """Switch to one column per field (rows so far were not valid)."""
+        self.fields = fields
+        self._values = np.full((self.capacity, len(fields)), np.nan)
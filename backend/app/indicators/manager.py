@@ -5,18 +5,42 @@ This manager is parameterized and reusable:
 - Works for pre-session and mid-session insertion
 - Handles warmup periods
 - Maintains state for stateful indicators (EMA, OBV, VWAP)
+- Streams per-bar updates for indicators configured as incremental
+- Shares primitive series (EMAs, rolling windows, true range) between the
+  incremental indicators of a symbol/interval via a PrimitiveGraph
+- Optionally evaluates indicators of all symbols on an interval together
+  (batched mode, one NumPy slot per symbol)
+- Keeps a bounded history of recent values for indicators configured
+  with one (IndicatorConfig.history)
+- Defers lazy indicators (IndicatorConfig.evaluation == "lazy") until
+  their value is read (refresh_indicator)
 """
 
 import logging
-from typing import Dict, List, Optional
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
 from collections import defaultdict
 
+import numpy as np
+
 from .base import BarData, IndicatorConfig, IndicatorResult, IndicatorData
-from .registry import calculate_indicator
+from .registry import (
+    calculate_indicator,
+    calculate_indicator_incremental,
+    calculate_indicator_warmup,
+)
+from .batched import BatchedIndicator, CrossSymbolGraph, create_batched_indicator
+from .graph import PrimitiveGraph, create_graph_indicator
+from .history import IndicatorHistory
+from .streaming import create_streaming_indicator
+from .utils import bar_arrays
 
 logger = logging.getLogger(__name__)
 
+# Serializes lazy catch-up: readers on any thread may evaluate an indicator
+_lazy_lock = threading.Lock()
+
 
 class IndicatorManager:
     """Manages indicator calculation for session data.
@@ -33,16 +57,24 @@ class IndicatorManager:
     - Everything stored in session_data.indicators with embedded metadata
     - Registration creates self-describing structures
     - Calculation scans structures to find what needs updating
+    
+    Batched mode is the one exception: the cross-symbol state of an
+    interval spans symbols, so its CrossSymbolGraph is kept here (each
+    symbol's IndicatorData still holds a BatchedIndicator view of it).
     """
     
-    def __init__(self, session_data):
+    def __init__(self, session_data, batched: bool = False):
         """Initialize indicator manager.
         
         Args:
             session_data: SessionData instance
+            batched: Evaluate supported indicators of all symbols on an
+                interval together (see update_indicators_batch)
         """
         self.session_data = session_data
-        # No internal state! Everything lives in session_data structures
+        self.batched = batched
+        # Everything else lives in session_data structures
+        self._batched_graphs: Dict[str, CrossSymbolGraph] = {}
     
     def register_symbol_indicators(
         self,
@@ -76,7 +108,7 @@ class IndicatorManager:
             key = config.make_key()
             
             # Registration = Create structure with embedded config
-            symbol_data.indicators[key] = IndicatorData(
+            ind_data = symbol_data.indicators[key] = IndicatorData(
                 name=config.name,
                 type="session",
                 interval=config.interval,
@@ -84,20 +116,35 @@ class IndicatorManager:
                 last_updated=None,
                 valid=False,
                 config=config,  # Store config in structure
-                state=None      # Store state in structure
+                state=None,     # Store state in structure
+                stream=self._create_stream(symbol, symbol_data, config),
+                historical_values=IndicatorHistory(config.history) if config.history > 0 else None
             )
+            if isinstance(ind_data.stream, BatchedIndicator):
+                ind_data.stream.owner = ind_data  # Batched results land here
             
             logger.debug(f"{symbol}: Registered indicator {key}")
         
         # If historical bars provided, calculate initial values (warmup)
         if historical_bars:
+            # OHLCV arrays per interval, shared by its vectorized indicators
+            arrays_by_interval = {}
             for key, ind_data in symbol_data.indicators.items():
                 if ind_data.config and ind_data.interval in historical_bars:
                     bars = historical_bars[ind_data.interval]
                     logger.debug(
                         f"{symbol}: Calculating {key} on {ind_data.interval} ({len(bars)} bars)"
                     )
-                    self._calculate_and_store(symbol, ind_data, bars)
+                    if ind_data.stream is not None and not isinstance(ind_data.stream, BatchedIndicator):
+                        # Streaming state has to see every bar (batched
+                        # state is built from the session bars instead)
+                        self._calculate_and_store(symbol, ind_data, bars)
+                        continue
+                    
+                    arrays = arrays_by_interval.get(ind_data.interval)
+                    if arrays is None and bars:
+                        arrays = arrays_by_interval[ind_data.interval] = bar_arrays(bars)
+                    self._calculate_and_store(symbol, ind_data, bars, arrays=arrays)
         
         # DEBUG: Verify indicators were added to session_data
         final_count = len(symbol_data.indicators)
@@ -111,11 +158,60 @@ class IndicatorManager:
                 f"but symbol_data.indicators has {final_count}"
             )
     
+    def _create_stream(self, symbol: str, symbol_data, config: IndicatorConfig):
+        """Create streaming state for an indicator.
+        
+        In batched mode, supported indicators get a slot in the interval's
+        CrossSymbolGraph (incremental or not - the values are the same).
+        Otherwise, incremental indicators built from primitive series share
+        the PrimitiveGraph of their symbol/interval, so an EMA or rolling
+        window used by several indicators is updated once per bar. Others
+        get their own StreamingIndicator.
+        
+        Lazy indicators always get their own StreamingIndicator: they are
+        caught up by readers (any thread, any number of pending bars), so
+        their state must not be shared with eagerly updated indicators.
+        
+        Args:
+            symbol: Stock symbol
+            symbol_data: SymbolSessionData the indicator is registered on
+            config: Indicator configuration
+            
+        Returns:
+            BatchedIndicator, GraphIndicator, StreamingIndicator, or None
+            (batch calculation)
+        """
+        if config.evaluation == "lazy":
+            return create_streaming_indicator(config)
+        
+        if self.batched:
+            graph = self._batched_graphs.get(config.interval)
+            if graph is None:
+                graph = self._batched_graphs[config.interval] = CrossSymbolGraph(config.interval)
+            stream = create_batched_indicator(config, graph, symbol)
+            if stream is not None:
+                return stream
+        
+        if not config.incremental:
+            return None
+        
+        graph = self._find_graph(symbol_data, config.interval) or PrimitiveGraph(config.interval)
+        return create_graph_indicator(config, graph) or create_streaming_indicator(config)
+    
+    def _find_graph(self, symbol_data, interval: str) -> Optional[PrimitiveGraph]:
+        """Find the PrimitiveGraph already used by indicators on an interval."""
+        # Infer from data structures: the graph lives on the streams using it
+        for ind_data in symbol_data.indicators.values():
+            graph = getattr(ind_data.stream, "graph", None)
+            if graph is not None and graph.interval == interval:
+                return graph
+        return None
+    
     def update_indicators(
         self,
         symbol: str,
         interval: str,
-        bars: List[BarData]
+        bars: Sequence[BarData]
     ):
         """Update indicators when new bar arrives.
         
@@ -129,7 +225,9 @@ class IndicatorManager:
         Args:
             symbol: Stock symbol
             interval: Bar interval (e.g., "5m")
-            bars: All bars for this interval (enough for warmup)
+            bars: All bars for this interval (enough for warmup). May be the
+                live deque from SessionData - it is only copied to a list if
+                a batch (non-incremental) indicator needs it.
         """
         symbol_data = self.session_data.get_symbol_data(symbol, internal=True)
         if not symbol_data:
@@ -147,15 +245,109 @@ class IndicatorManager:
         logger.debug(
             f"{symbol}: Updating {len(indicators_to_update)} indicators on {interval}"
         )
+        self._update_each(symbol, indicators_to_update, bars)
+    
+    def update_indicators_batch(
+        self,
+        interval: str,
+        bars_by_symbol: Dict[str, Sequence[BarData]]
+    ):
+        """Update indicators of many symbols on one interval together.
+        
+        Batched indicators of all symbols are folded in by one step of the
+        interval's CrossSymbolGraph and evaluated once per indicator for all
+        symbols; the results are then scattered back into each symbol's
+        IndicatorData. Other indicators are updated symbol by symbol as in
+        update_indicators().
+        
+        Called by DataProcessor once per timestamp batch in batched mode.
+        
+        Args:
+            interval: Bar interval (e.g., "1m")
+            bars_by_symbol: All bars of the interval per symbol that
+                received new bars (live series, as in update_indicators)
+        """
+        graph = self._batched_graphs.get(interval)
+        stepped = graph.step(bars_by_symbol) if graph is not None else []
         
-        for ind_data in indicators_to_update:
-            self._calculate_and_store(symbol, ind_data, bars)
+        # One vector evaluation per indicator, scattered to each symbol
+        stored = 0
+        for indicators, values, valid, timestamps in (graph.evaluate_members(stepped) if stepped else ()):
+            for indicator, value, is_valid, timestamp in zip(indicators, values, valid, timestamps):
+                ind_data = indicator.owner
+                if ind_data is None:
+                    continue
+                ind_data.current_value = value
+                ind_data.last_updated = timestamp
+                ind_data.valid = is_valid
+                ind_data.state = None  # No per-symbol result object in batched mode
+                if ind_data.historical_values is not None:
+                    ind_data.historical_values.record(timestamp, value if is_valid else None)
+                stored += 1
+        
+        # Indicators without a batched form, symbol by symbol
+        for symbol, bars in bars_by_symbol.items():
+            symbol_data = self.session_data.get_symbol_data(symbol, internal=True)
+            if not symbol_data:
+                continue
+            remaining = [
+                ind_data for ind_data in symbol_data.indicators.values()
+                if ind_data.interval == interval and ind_data.config is not None
+                and not isinstance(ind_data.stream, BatchedIndicator)
+            ]
+            if remaining:
+                self._update_each(symbol, remaining, bars)
+        
+        logger.debug(
+            f"Batched update on {interval}: {len(stepped)} symbols, {stored} indicators"
+        )
+    
+    def _update_each(
+        self,
+        symbol: str,
+        indicators: List[IndicatorData],
+        bars: Sequence[BarData]
+    ):
+        """Update a symbol's indicators one by one.
+        
+        Lazy indicators are not calculated: they note the series as of
+        this bar, and readers catch them up (refresh_indicator).
+        
+        Args:
+            symbol: Stock symbol
+            indicators: IndicatorData to update (all on the interval of bars)
+            bars: All bars for the interval
+        """
+        batch_bars = None
+        lazy = []
+        for ind_data in indicators:
+            if ind_data.config.evaluation == "lazy" and ind_data.stream is not None:
+                lazy.append(ind_data)
+                continue
+            
+            if ind_data.stream is not None:
+                self._calculate_and_store(symbol, ind_data, bars)
+                continue
+            
+            # Batch calculators slice the series - give them a list
+            if batch_bars is None:
+                batch_bars = bars if isinstance(bars, list) else list(bars)
+            self._calculate_and_store(symbol, ind_data, batch_bars)
+        
+        if lazy:
+            # Note the series as of this bar; readers fold it in on demand
+            from app.managers.data_manager.session_snapshot import freeze_bars
+            frozen = freeze_bars(bars)
+            with _lazy_lock:
+                for ind_data in lazy:
+                    ind_data.pending = frozen
     
     def _calculate_and_store(
         self,
         symbol: str,
         ind_data: IndicatorData,
-        bars: List[BarData]
+        bars: Sequence[BarData],
+        arrays: Optional[Dict] = None
     ):
         """Calculate indicator and update in place.
         
@@ -166,30 +358,37 @@ class IndicatorManager:
             symbol: Stock symbol
             ind_data: IndicatorData from session_data (has config and state)
             bars: Historical bars
+            arrays: OHLCV arrays of bars for a warmup pass - the value is
+                calculated by the vectorized kernel when there is one
         """
         if ind_data.config is None:
             logger.warning(f"{symbol}: Indicator missing config, skipping")
             return
         
         # Calculate indicator using embedded config and state
-        result = calculate_indicator(
-            bars=bars,
-            config=ind_data.config,
-            symbol=symbol,
-            previous_result=ind_data.state  # Use stored state
-        )
-        
-        # Update in place (no separate storage)
-        ind_data.current_value = result.value
-        ind_data.last_updated = result.timestamp
-        ind_data.valid = result.valid
-        ind_data.state = result  # Store for next iteration
-        
-        if result.valid:
-            logger.debug(
-                f"{symbol}: {ind_data.config.make_key()} = "
-                f"{result.value if not isinstance(result.value, dict) else 'dict'}"
+        if arrays is not None:
+            result = calculate_indicator_warmup(
+                bars=bars,
+                config=ind_data.config,
+                symbol=symbol,
+                arrays=arrays
             )
+        elif ind_data.stream is not None:
+            result = calculate_indicator_incremental(
+                bars=bars,
+                config=ind_data.config,
+                symbol=symbol,
+                stream=ind_data.stream  # Only new bars are folded in
+            )
+        else:
+            result = calculate_indicator(
+                bars=bars,
+                config=ind_data.config,
+                symbol=symbol,
+                previous_result=ind_data.state  # Use stored state
+            )
+        
+        _store_result(symbol, ind_data, result)
     
     
     def get_indicator_configs(
@@ -234,8 +433,10 @@ class IndicatorManager:
         Args:
             symbol: Stock symbol to remove
         """
-        # No internal state to clean up anymore!
-        logger.info(f"{symbol}: Indicator manager cleanup (no-op, managed by session_data)")
+        # Only batched mode keeps state here: free the symbol's slots
+        for graph in self._batched_graphs.values():
+            graph.release(symbol)
+        logger.info(f"{symbol}: Indicator manager cleanup (indicators managed by session_data)")
     
     def get_indicator_count(self, symbol: str) -> int:
         """Get total number of indicators for a symbol.
@@ -259,6 +460,60 @@ class IndicatorManager:
         )
 
 
+def _store_result(symbol: str, ind_data: IndicatorData, result: IndicatorResult):
+    """Store a calculation result in IndicatorData (in place)."""
+    ind_data.current_value = result.value
+    ind_data.last_updated = result.timestamp
+    ind_data.valid = result.valid
+    ind_data.state = result  # Store for next iteration
+    if ind_data.historical_values is not None:
+        ind_data.historical_values.record(result.timestamp, result.value if result.valid else None)
+    
+    if result.valid:
+        logger.debug(
+            f"{symbol}: {ind_data.config.make_key()} = "
+            f"{result.value if not isinstance(result.value, dict) else 'dict'}"
+        )
+
+
+def refresh_indicator(
+    indicator: Optional[IndicatorData],
+    symbol: str = ""
+) -> Optional[IndicatorData]:
+    """Bring a lazily evaluated indicator up to date.
+    
+    Folds the bars noted since the last read into the indicator's
+    streaming state (one sync, however many bars are pending). Eager
+    indicators and lazy ones without pending bars are returned as is.
+    
+    Snapshot copies carry the bars as of their publication and share the
+    streaming state with the live indicator; reading an older copy after
+    a newer one replays the stream, which stays correct.
+    
+    Args:
+        indicator: IndicatorData (or None if not registered)
+        symbol: Stock symbol (for logging)
+    
+    Returns:
+        The same IndicatorData, values current
+    """
+    if indicator is None or getattr(indicator, 'pending', None) is None:
+        return indicator
+    
+    with _lazy_lock:
+        bars = indicator.pending
+        if bars is not None:
+            result = calculate_indicator_incremental(
+                bars=bars,
+                config=indicator.config,
+                symbol=symbol,
+                stream=indicator.stream
+            )
+            _store_result(symbol, indicator, result)
+            indicator.pending = None
+    return indicator
+
+
 # Convenience functions for SessionData API enhancement
 
 def get_indicator(
@@ -273,6 +528,8 @@ def get_indicator(
         symbol: Stock symbol
         indicator_key: Indicator key (e.g., "sma_20_5m")
     
+    Lazy indicators are caught up first (see refresh_indicator).
+    
     Returns:
         IndicatorData or None if not found
     """
@@ -280,7 +537,7 @@ def get_indicator(
     if not symbol_data or not hasattr(symbol_data, 'indicators'):
         return None
     
-    return symbol_data.indicators.get(indicator_key)
+    return refresh_indicator(symbol_data.indicators.get(indicator_key), symbol)
 
 
 def get_indicator_value(
@@ -300,7 +557,24 @@ def get_indicator_value(
     Returns:
         Indicator value or None
     """
-    indicator = get_indicator(session_data, symbol, indicator_key)
+    return indicator_value(get_indicator(session_data, symbol, indicator_key), indicator_key, field)
+
+
+def indicator_value(
+    indicator: Optional[IndicatorData],
+    indicator_key: str,
+    field: Optional[str] = None
+):
+    """Extract the current value of an indicator.
+    
+    Args:
+        indicator: IndicatorData (or None if not registered)
+        indicator_key: Indicator key (for error messages)
+        field: Field name for multi-value indicators (e.g., "upper" for BB)
+    
+    Returns:
+        Indicator value or None if missing or not yet valid
+    """
     if not indicator or not indicator.valid:
         return None
     
@@ -324,6 +598,51 @@ def get_indicator_value(
     return value
 
 
+def get_indicator_history(
+    session_data,
+    symbol: str,
+    indicator_key: str,
+    n: int,
+    field: Optional[str] = None
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Get the last n values of an indicator from SessionData.
+    
+    Args:
+        session_data: SessionData instance
+        symbol: Stock symbol
+        indicator_key: Indicator key (e.g., "rsi_14_5m")
+        n: Number of values (fewer if not that many are kept)
+        field: Field name for multi-value indicators (e.g., "upper" for BB)
+    
+    Returns:
+        (timestamps, values) arrays oldest first (NaN where not valid), or
+        None if the indicator is missing or keeps no history
+    """
+    return indicator_history(get_indicator(session_data, symbol, indicator_key), n, field)
+
+
+def indicator_history(
+    indicator: Optional[IndicatorData],
+    n: int,
+    field: Optional[str] = None,
+    until: Optional[datetime] = None
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Extract the last n values of an indicator's history.
+    
+    Args:
+        indicator: IndicatorData (or None if not registered)
+        n: Number of values
+        field: Field name for multi-value indicators
+        until: Ignore values newer than this (snapshot reads)
+    
+    Returns:
+        (timestamps, values) arrays, or None if there is no history
+    """
+    if not indicator or indicator.historical_values is None:
+        return None
+    return indicator.historical_values.last(n, field, until)
+
+
 def is_indicator_ready(
     session_data,
     symbol: str,
@@ -356,12 +675,15 @@ def get_all_indicators(
         indicator_type: Filter by "session" or "historical" (None = all)
     
     Returns:
-        Dict of {indicator_key: IndicatorData}
+        Dict of {indicator_key: IndicatorData} (lazy indicators caught up)
     """
     symbol_data = session_data.get_symbol_data(symbol)
     if not symbol_data or not hasattr(symbol_data, 'indicators'):
         return {}
     
+    for ind in list(symbol_data.indicators.values()):
+        refresh_indicator(ind, symbol)
+    
     if indicator_type is None:
         return symbol_data.indicators
     
@@ -21,6 +21,11 @@ def calculate_rsi(
     Formula: RSI = 100 - (100 / (1 + RS))
     where RS = Average Gain / Average Loss
     
+    Averages (params["smoothing"]):
+    - "simple" (default): mean of the last `period` gains/losses
+    - "wilder": Wilder's smoothing - seeded with the mean of the first
+      `period` changes, then avg = (avg * (period - 1) + x) / period
+    
     Args:
         bars: Historical bars
         config: Indicator configuration
@@ -30,6 +35,9 @@ def calculate_rsi(
         IndicatorResult with RSI value (0-100)
     """
     period = config.period
+    smoothing = config.params.get("smoothing", "simple")
+    if smoothing not in ("simple", "wilder"):
+        raise ValueError(f"Unknown RSI smoothing '{smoothing}' (simple or wilder)")
     
     # Need period + 1 bars (need previous close for first change)
     if len(bars) < period + 1:
@@ -45,13 +53,21 @@ def calculate_rsi(
         change = bars[i].close - bars[i-1].close
         changes.append(change)
     
-    # Separate gains and losses
-    gains = [max(0, c) for c in changes[-period:]]
-    losses = [abs(min(0, c)) for c in changes[-period:]]
-    
-    # Average gain and loss
-    avg_gain = sum(gains) / period
-    avg_loss = sum(losses) / period
+    if smoothing == "wilder":
+        # Seed with the first period changes, then smooth over the rest
+        avg_gain = sum(max(0, c) for c in changes[:period]) / period
+        avg_loss = sum(abs(min(0, c)) for c in changes[:period]) / period
+        for c in changes[period:]:
+            avg_gain = (avg_gain * (period - 1) + max(0, c)) / period
+            avg_loss = (avg_loss * (period - 1) + abs(min(0, c))) / period
+    else:
+        # Separate gains and losses
+        gains = [max(0, c) for c in changes[-period:]]
+        losses = [abs(min(0, c)) for c in changes[-period:]]
+        
+        # Average gain and loss
+        avg_gain = sum(gains) / period
+        avg_loss = sum(losses) / period
     
     # Calculate RSI
     if avg_loss == 0:
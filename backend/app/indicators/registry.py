@@ -1,9 +1,12 @@
 """Indicator registry and calculation dispatcher."""
 
 import logging
-from typing import Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Type, Union
+
+import numpy as np
 
 from .base import BarData, IndicatorConfig, IndicatorResult
+from .utils import bar_arrays
 
 logger = logging.getLogger(__name__)
 
@@ -13,6 +16,13 @@ IndicatorCalculator = Callable[
     IndicatorResult
 ]
 
+# Output of a vectorized kernel: one value per bar (NaN while invalid),
+# or one such array per field for multi-value indicators
+IndicatorSeries = Union[np.ndarray, Dict[str, np.ndarray]]
+
+# Type for vectorized kernels (OHLCV arrays -> whole output series)
+IndicatorKernel = Callable[[Dict[str, np.ndarray], IndicatorConfig], IndicatorSeries]
+
 
 class IndicatorRegistry:
     """Central registry of all indicator calculators.
@@ -23,6 +33,8 @@ class IndicatorRegistry:
     def __init__(self):
         self._calculators: Dict[str, IndicatorCalculator] = {}
         self._metadata: Dict[str, Dict[str, str]] = {}
+        self._streaming: Dict[str, Type] = {}
+        self._vectorized: Dict[str, IndicatorKernel] = {}
     
     def register(
         self,
@@ -66,6 +78,48 @@ class IndicatorRegistry:
     def get_metadata(self, name: str) -> Optional[Dict[str, str]]:
         """Get metadata for an indicator."""
         return self._metadata.get(name)
+    
+    def register_streaming(self, name: str, streaming_class: Type):
+        """Register the incremental (streaming) implementation of an indicator.
+        
+        Args:
+            name: Indicator name (must match the batch calculator name)
+            streaming_class: StreamingIndicator subclass
+        """
+        if name in self._streaming:
+            logger.warning(f"Overwriting existing streaming indicator: {name}")
+        
+        self._streaming[name] = streaming_class
+        logger.debug(f"Registered streaming indicator: {name}")
+    
+    def get_streaming(self, name: str) -> Optional[Type]:
+        """Get streaming implementation class for an indicator (None if batch-only)."""
+        return self._streaming.get(name)
+    
+    def list_streaming(self) -> List[str]:
+        """List indicators with a streaming implementation."""
+        return sorted(self._streaming.keys())
+    
+    def register_vectorized(self, name: str, kernel: IndicatorKernel):
+        """Register the vectorized (whole-series) kernel of an indicator.
+        
+        Args:
+            name: Indicator name (must match the batch calculator name)
+            kernel: Function of (OHLCV arrays, config) -> output series
+        """
+        if name in self._vectorized:
+            logger.warning(f"Overwriting existing vectorized indicator: {name}")
+        
+        self._vectorized[name] = kernel
+        logger.debug(f"Registered vectorized indicator: {name}")
+    
+    def get_vectorized(self, name: str) -> Optional[IndicatorKernel]:
+        """Get vectorized kernel for an indicator (None if batch-only)."""
+        return self._vectorized.get(name)
+    
+    def list_vectorized(self) -> List[str]:
+        """List indicators with a vectorized kernel."""
+        return sorted(self._vectorized.keys())
 
 
 # Global registry instance
@@ -86,6 +140,34 @@ def indicator(name: str, description: str = ""):
     return decorator
 
 
+def streaming_indicator(name: str):
+    """Decorator to register a streaming (incremental) indicator class.
+    
+    Usage:
+        @streaming_indicator("sma")
+        class StreamingSMA(StreamingIndicator):
+            ...
+    """
+    def decorator(cls):
+        INDICATOR_REGISTRY.register_streaming(name, cls)
+        return cls
+    return decorator
+
+
+def vectorized_indicator(name: str):
+    """Decorator to register a vectorized (whole-series) indicator kernel.
+    
+    Usage:
+        @vectorized_indicator("sma")
+        def sma_kernel(arrays, config):
+            ...
+    """
+    def decorator(func: IndicatorKernel):
+        INDICATOR_REGISTRY.register_vectorized(name, func)
+        return func
+    return decorator
+
+
 def calculate_indicator(
     bars: List[BarData],
     config: IndicatorConfig,
@@ -166,6 +248,146 @@ def calculate_indicator(
         )
 
 
+def calculate_indicator_incremental(
+    bars: Sequence[BarData],
+    config: IndicatorConfig,
+    symbol: str,
+    stream
+) -> IndicatorResult:
+    """Calculate indicator value from streaming state.
+    
+    Incremental counterpart of calculate_indicator(): only bars appended
+    since the previous call are folded into the stream, so the cost per
+    new bar does not grow with the session length.
+    
+    Args:
+        bars: All bars for the indicator's interval (list or deque)
+        config: Indicator configuration
+        symbol: Symbol being processed (for logging)
+        stream: StreamingIndicator holding the state for this indicator
+    
+    Returns:
+        IndicatorResult with value and validity (same as calculate_indicator)
+    """
+    if not bars:
+        return IndicatorResult(
+            timestamp=None,
+            value=None,
+            valid=False
+        )
+    
+    try:
+        result = stream.sync(bars)
+        
+        if result.valid:
+            logger.debug(
+                f"{symbol} {config.name}: "
+                f"Updated streaming value at {result.timestamp}"
+            )
+        
+        return result
+        
+    except Exception as e:
+        logger.error(
+            f"{symbol} {config.name}: Streaming update failed: {e}",
+            exc_info=True
+        )
+        # State may be half-updated - rebuild from scratch next time
+        stream.reset()
+        return IndicatorResult(
+            timestamp=bars[-1].timestamp,
+            value=None,
+            valid=False
+        )
+
+
+def calculate_indicator_series(
+    bars: Sequence[BarData],
+    config: IndicatorConfig,
+    arrays: Optional[Dict[str, np.ndarray]] = None
+) -> Optional[IndicatorSeries]:
+    """Calculate an indicator at every bar with its vectorized kernel.
+    
+    Element i equals calculate_indicator(bars[:i + 1], config) (up to
+    floating point rounding), NaN where that result is not valid.
+    
+    Args:
+        bars: Bar series (list, deque or columnar series)
+        config: Indicator configuration
+        arrays: OHLCV arrays of bars (utils.bar_arrays), to share one
+            extraction across the indicators of an interval
+    
+    Returns:
+        Output series, or None if the indicator has no vectorized kernel
+    """
+    kernel = INDICATOR_REGISTRY.get_vectorized(config.name)
+    if kernel is None:
+        return None
+    
+    if arrays is None:
+        arrays = bar_arrays(bars)
+    series = kernel(arrays, config)
+    
+    # Same warmup gate as calculate_indicator()
+    warmup_needed = config.warmup_bars()
+    for values in (series.values() if isinstance(series, dict) else (series,)):
+        values[:warmup_needed - 1] = np.nan
+    
+    return series
+
+
+def calculate_indicator_warmup(
+    bars: Sequence[BarData],
+    config: IndicatorConfig,
+    symbol: str,
+    arrays: Optional[Dict[str, np.ndarray]] = None
+) -> IndicatorResult:
+    """Calculate the current indicator value over a long bar history.
+    
+    Used for warmup and historical passes: indicators with a vectorized
+    kernel are computed on NumPy arrays, others fall back to
+    calculate_indicator(). The result is the same either way.
+    
+    Args:
+        bars: Historical bars (includes enough for warmup)
+        config: Indicator configuration
+        symbol: Symbol being processed (for logging)
+        arrays: OHLCV arrays of bars (utils.bar_arrays), shared across
+            the indicators of an interval
+    
+    Returns:
+        IndicatorResult with value and validity (as calculate_indicator)
+    """
+    if bars and INDICATOR_REGISTRY.get_vectorized(config.name) is not None:
+        try:
+            series = calculate_indicator_series(bars, config, arrays)
+            return _last_result(series, bars[-1].timestamp)
+        except Exception as e:
+            logger.warning(
+                f"{symbol} {config.name}: Vectorized calculation failed ({e}), "
+                f"using batch calculator"
+            )
+    
+    return calculate_indicator(bars if isinstance(bars, list) else list(bars), config, symbol)
+
+
+def _last_result(series: IndicatorSeries, timestamp) -> IndicatorResult:
+    """IndicatorResult from the last element of a kernel's output."""
+    value: Any
+    if isinstance(series, dict):
+        value = {field: float(values[-1]) for field, values in series.items()}
+        valid = not any(np.isnan(v) for v in value.values())
+    else:
+        value = float(series[-1])
+        valid = not np.isnan(value)
+    
+    return IndicatorResult(
+        timestamp=timestamp,
+        value=value if valid else None,
+        valid=valid
+    )
+
+
 def list_indicators() -> List[str]:
     """List all registered indicators.
     
@@ -0,0 +1,1119 @@
+"""Streaming (incremental) indicator state.
+
+Batch calculators in trend/momentum/volatility/volume/support receive the
+full bar list on every update and rescan it. The classes here keep just
+enough state (running sums, monotonic deques, chained EMA values) to fold
+in one new bar at a time, so an update costs O(1) (amortized) instead of
+O(session length).
+
+Each class reproduces its batch calculator exactly - same warmup, same
+validity, same formula - so switching an indicator between batch and
+streaming (IndicatorConfig.incremental) never changes its values beyond
+floating point rounding.
+
+Usage:
+    stream = create_streaming_indicator(config)
+    result = stream.sync(bars)   # Feeds only bars not seen yet
+"""
+
+import logging
+import math
+from collections import deque
+from datetime import datetime
+from typing import Deque, List, Optional, Sequence, Tuple
+
+from .base import BarData, IndicatorConfig, IndicatorResult
+from .registry import INDICATOR_REGISTRY, streaming_indicator
+from .support import calculate_pivot_points
+from .utils import true_range, typical_price
+
+logger = logging.getLogger(__name__)
+
+# Running sums are re-summed from their window after this many evictions
+# to stop floating point drift from accumulating over long sessions.
+RESUM_INTERVAL = 1000
+
+
+# =============================================================================
+# Rolling Primitives
+# =============================================================================
+
+class RollingSum:
+    """Fixed-size window of values with a running sum."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values: Deque[float] = deque()
+        self.total = 0.0
+        self._evictions = 0
+
+    def push(self, value: float) -> None:
+        """Append value, evicting the oldest once the window is full."""
+        self.values.append(value)
+        self.total += value
+
+        if len(self.values) > self.size:
+            self.total -= self.values.popleft()
+            self._evictions += 1
+            if self._evictions >= RESUM_INTERVAL:
+                self.total = sum(self.values)
+                self._evictions = 0
+
+    def full(self) -> bool:
+        """True once the window holds `size` values."""
+        return len(self.values) == self.size
+
+    def mean(self) -> float:
+        """Window average (only meaningful when full)."""
+        return self.total / self.size
+
+
+class RollingVariance:
+    """Fixed-size window with running mean and population variance.
+
+    Uses the sliding-window form of Welford's update, which stays accurate
+    when the variance is small relative to the mean (e.g. prices).
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values: Deque[float] = deque()
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._evictions = 0
+
+    def push(self, value: float) -> None:
+        """Append value, evicting the oldest once the window is full."""
+        if len(self.values) < self.size:
+            self.values.append(value)
+            delta = value - self.mean
+            self.mean += delta / len(self.values)
+            self._m2 += delta * (value - self.mean)
+            return
+
+        oldest = self.values.popleft()
+        self.values.append(value)
+        old_mean = self.mean
+        self.mean = old_mean + (value - oldest) / self.size
+        self._m2 += (value - oldest) * (value - self.mean + oldest - old_mean)
+
+        self._evictions += 1
+        if self._evictions >= RESUM_INTERVAL:
+            self.mean = sum(self.values) / self.size
+            self._m2 = sum((v - self.mean) ** 2 for v in self.values)
+            self._evictions = 0
+
+    def full(self) -> bool:
+        """True once the window holds `size` values."""
+        return len(self.values) == self.size
+
+    def variance(self) -> float:
+        """Population variance of the window."""
+        return max(self._m2 / self.size, 0.0)
+
+    def stddev(self) -> float:
+        """Population standard deviation of the window."""
+        return self.variance() ** 0.5
+
+
+class RollingExtreme:
+    """Sliding-window max (or min) using a monotonic deque."""
+
+    def __init__(self, size: int, maximum: bool = True):
+        self.size = size
+        self.maximum = maximum
+        self._window: Deque[Tuple[int, float]] = deque()
+        self._index = 0
+
+    def push(self, value: float) -> None:
+        """Add value and drop entries that left the window."""
+        window = self._window
+        if self.maximum:
+            while window and window[-1][1] <= value:
+                window.pop()
+        else:
+            while window and window[-1][1] >= value:
+                window.pop()
+        window.append((self._index, value))
+
+        if window[0][0] <= self._index - self.size:
+            window.popleft()
+        self._index += 1
+
+    def full(self) -> bool:
+        """True once `size` values have been pushed."""
+        return self._index >= self.size
+
+    def value(self) -> float:
+        """Current window extreme."""
+        return self._window[0][1]
+
+
+class RollingWMA:
+    """Linearly weighted moving average (weights 1..size, newest heaviest)."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values: Deque[float] = deque()
+        self._total = 0.0
+        self._weighted = 0.0
+        self._weight_sum = size * (size + 1) / 2
+        self._evictions = 0
+
+    def push(self, value: float) -> None:
+        """Append value, shifting every weight down by one once full."""
+        if len(self.values) < self.size:
+            self.values.append(value)
+            self._total += value
+            self._weighted += len(self.values) * value
+            return
+
+        oldest = self.values.popleft()
+        self.values.append(value)
+        self._weighted += self.size * value - self._total
+        self._total += value - oldest
+
+        self._evictions += 1
+        if self._evictions >= RESUM_INTERVAL:
+            self._total = sum(self.values)
+            self._weighted = sum(v * w for w, v in enumerate(self.values, 1))
+            self._evictions = 0
+
+    def full(self) -> bool:
+        """True once the window holds `size` values."""
+        return len(self.values) == self.size
+
+    def value(self) -> float:
+        """Current WMA (only meaningful when full)."""
+        return self._weighted / self._weight_sum
+
+
+class SeededEMA:
+    """EMA seeded with the SMA of its first `period` inputs.
+
+    Matches the batch bootstrap used by ema/dema/tema/macd/keltner:
+    no output before `period` inputs, then SMA, then the EMA recurrence.
+    """
+
+    def __init__(self, period: int):
+        self.period = period
+        self.alpha = 2.0 / (period + 1)
+        self.value: Optional[float] = None
+        self._seed: List[float] = []
+
+    def push(self, x: float) -> Optional[float]:
+        """Fold in one input; returns the EMA, or None while seeding."""
+        if self.value is None:
+            self._seed.append(x)
+            if len(self._seed) == self.period:
+                self.value = sum(self._seed) / self.period
+                self._seed = []
+            return self.value
+
+        self.value = self.alpha * x + (1 - self.alpha) * self.value
+        return self.value
+
+
+def _require_positive(name: str, value: int) -> int:
+    """Validate a window length (streaming falls back to batch otherwise)."""
+    if not isinstance(value, int) or value <= 0:
+        raise ValueError(f"{name} must be a positive integer, got {value!r}")
+    return value
+
+
+# =============================================================================
+# Streaming Indicator Base
+# =============================================================================
+
+class StreamingIndicator:
+    """Incremental state for one indicator instance.
+
+    Subclasses implement _reset_state() and _update(bar). sync() handles the
+    bar cursor: it feeds only bars appended since the last call and replays
+    from scratch if the series was rewritten (gap fill, trimming, new session).
+    """
+
+    def __init__(self, config: IndicatorConfig):
+        """Initialize streaming state.
+
+        Args:
+            config: Indicator configuration
+
+        Raises:
+            ValueError: If the configuration cannot be streamed
+                (caller should use the batch calculator instead)
+        """
+        self.config = config
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all state; next sync() replays the full series."""
+        self._count = 0
+        self._first_timestamp: Optional[datetime] = None
+        self._last_timestamp: Optional[datetime] = None
+        self._result: Optional[IndicatorResult] = None
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        """Reset indicator-specific state."""
+        raise NotImplementedError
+
+    def _update(self, bar: BarData) -> IndicatorResult:
+        """Fold in the next bar and return the indicator value at that bar."""
+        raise NotImplementedError
+
+    @property
+    def bar_count(self) -> int:
+        """Number of bars folded into the current state."""
+        return self._count
+
+    def sync(self, bars: Sequence[BarData]) -> IndicatorResult:
+        """Bring state up to date with bars and return the latest result.
+
+        Args:
+            bars: Full bar series for the indicator's interval (list or deque)
+
+        Returns:
+            IndicatorResult identical to calculate_indicator(bars, ...)
+        """
+        n = len(bars)
+        if n == 0:
+            return IndicatorResult(timestamp=None, value=None, valid=False)
+
+        if self._count and (
+            n < self._count
+            or bars[0].timestamp != self._first_timestamp
+            or bars[self._count - 1].timestamp != self._last_timestamp
+        ):
+            # Series changed underneath us - rebuild
+            self.reset()
+
+        if self._count == 0:
+            self._first_timestamp = bars[0].timestamp
+
+        for i in range(self._count, n):
+            self._result = self._update(bars[i])
+
+        self._count = n
+        self._last_timestamp = bars[-1].timestamp
+
+        # Same warmup gate as calculate_indicator()
+        if n < self.config.warmup_bars():
+            return IndicatorResult(timestamp=bars[-1].timestamp, value=None, valid=False)
+
+        return self._result
+
+    @staticmethod
+    def _valid(bar: BarData, value) -> IndicatorResult:
+        return IndicatorResult(timestamp=bar.timestamp, value=value, valid=True)
+
+    @staticmethod
+    def _invalid(bar: BarData) -> IndicatorResult:
+        return IndicatorResult(timestamp=bar.timestamp, value=None, valid=False)
+
+
+def create_streaming_indicator(config: IndicatorConfig) -> Optional[StreamingIndicator]:
+    """Create streaming state for an indicator config.
+
+    Args:
+        config: Indicator configuration
+
+    Returns:
+        StreamingIndicator, or None if the indicator has no streaming
+        implementation or its params are unsupported (use batch)
+    """
+    streaming_class = INDICATOR_REGISTRY.get_streaming(config.name)
+    if streaming_class is None:
+        logger.warning(
+            f"{config.make_key()}: No streaming implementation, using batch calculation"
+        )
+        return None
+
+    try:
+        return streaming_class(config)
+    except ValueError as e:
+        logger.warning(
+            f"{config.make_key()}: Streaming unsupported ({e}), using batch calculation"
+        )
+        return None
+
+
+# =============================================================================
+# Trend
+# =============================================================================
+
+@streaming_indicator("sma")
+class StreamingSMA(StreamingIndicator):
+    """SMA via running sum."""
+
+    def _reset_state(self):
+        self._closes = RollingSum(_require_positive("period", self.config.period))
+
+    def _update(self, bar):
+        self._closes.push(bar.close)
+        if not self._closes.full():
+            return self._invalid(bar)
+        return self._valid(bar, self._closes.mean())
+
+
+@streaming_indicator("ema")
+class StreamingEMA(StreamingIndicator):
+    """EMA seeded with SMA (same bootstrap as batch)."""
+
+    def _reset_state(self):
+        self._ema = SeededEMA(_require_positive("period", self.config.period))
+
+    def _update(self, bar):
+        value = self._ema.push(bar.close)
+        if value is None:
+            return self._invalid(bar)
+        return self._valid(bar, value)
+
+
+@streaming_indicator("wma")
+class StreamingWMA(StreamingIndicator):
+    """WMA via running weighted sum."""
+
+    def _reset_state(self):
+        self._wma = RollingWMA(_require_positive("period", self.config.period))
+
+    def _update(self, bar):
+        self._wma.push(bar.close)
+        if not self._wma.full():
+            return self._invalid(bar)
+        return self._valid(bar, self._wma.value())
+
+
+@streaming_indicator("vwap")
+class StreamingVWAP(StreamingIndicator):
+    """Cumulative VWAP from session start."""
+
+    def _reset_state(self):
+        self._cum_pv = 0.0
+        self._cum_vol = 0.0
+
+    def _update(self, bar):
+        self._cum_pv += typical_price(bar) * bar.volume
+        self._cum_vol += bar.volume
+
+        if self._cum_vol == 0:
+            return self._valid(bar, bar.close)
+        return self._valid(bar, self._cum_pv / self._cum_vol)
+
+
+@streaming_indicator("dema")
+class StreamingDEMA(StreamingIndicator):
+    """DEMA = 2*EMA - EMA(EMA) with chained EMA state."""
+
+    def _reset_state(self):
+        period = _require_positive("period", self.config.period)
+        self._ema1 = SeededEMA(period)
+        self._ema2 = SeededEMA(period)
+
+    def _update(self, bar):
+        ema1 = self._ema1.push(bar.close)
+        if ema1 is None:
+            return self._invalid(bar)
+        ema2 = self._ema2.push(ema1)
+        if ema2 is None:
+            return self._invalid(bar)
+        return self._valid(bar, 2 * ema1 - ema2)
+
+
+@streaming_indicator("tema")
+class StreamingTEMA(StreamingIndicator):
+    """TEMA = 3*EMA - 3*EMA(EMA) + EMA(EMA(EMA)) with chained EMA state."""
+
+    def _reset_state(self):
+        period = _require_positive("period", self.config.period)
+        self._ema1 = SeededEMA(period)
+        self._ema2 = SeededEMA(period)
+        self._ema3 = SeededEMA(period)
+
+    def _update(self, bar):
+        ema1 = self._ema1.push(bar.close)
+        if ema1 is None:
+            return self._invalid(bar)
+        ema2 = self._ema2.push(ema1)
+        if ema2 is None:
+            return self._invalid(bar)
+        ema3 = self._ema3.push(ema2)
+        if ema3 is None:
+            return self._invalid(bar)
+        return self._valid(bar, 3 * ema1 - 3 * ema2 + ema3)
+
+
+@streaming_indicator("hma")
+class StreamingHMA(StreamingIndicator):
+    """HMA as computed by the batch calculator: 2*WMA(n/2) - WMA(n)."""
+
+    def _reset_state(self):
+        period = _require_positive("period", self.config.period)
+        self._wma_half = RollingWMA(_require_positive("period // 2", period // 2))
+        self._wma_full = RollingWMA(period)
+
+    def _update(self, bar):
+        self._wma_half.push(bar.close)
+        self._wma_full.push(bar.close)
+        if not self._wma_full.full():
+            return self._invalid(bar)
+        return self._valid(bar, 2 * self._wma_half.value() - self._wma_full.value())
+
+
+@streaming_indicator("twap")
+class StreamingTWAP(StreamingIndicator):
+    """Cumulative average of closes from session start."""
+
+    def _reset_state(self):
+        self._sum = 0.0
+        self._n = 0
+
+    def _update(self, bar):
+        self._sum += bar.close
+        self._n += 1
+        return self._valid(bar, self._sum / self._n)
+
+
+# =============================================================================
+# Momentum
+# =============================================================================
+
+@streaming_indicator("rsi")
+class StreamingRSI(StreamingIndicator):
+    """RSI with the batch calculator's averaging (params["smoothing"]).
+
+    "simple" (the default, as calculate_rsi) averages the last N
+    close-to-close changes with running gain/loss sums. "wilder" seeds the
+    averages with the first N changes and then applies Wilder's smoothing,
+    avg = (avg * (N - 1) + x) / N, in O(1) per bar.
+    """
+
+    def _reset_state(self):
+        period = _require_positive("period", self.config.period)
+        smoothing = self.config.params.get("smoothing", "simple")
+        if smoothing not in ("simple", "wilder"):
+            raise ValueError(f"Unknown RSI smoothing '{smoothing}' (simple or wilder)")
+        self._period = period
+        self._wilder = smoothing == "wilder"
+        self._gains = RollingSum(period)
+        self._losses = RollingSum(period)
+        self._avg_gain: Optional[float] = None
+        self._avg_loss: Optional[float] = None
+        self._prev_close: Optional[float] = None
+
+    def _update(self, bar):
+        if self._prev_close is None:
+            self._prev_close = bar.close
+            return self._invalid(bar)
+
+        change = bar.close - self._prev_close
+        self._prev_close = bar.close
+        gain, loss = max(0, change), abs(min(0, change))
+
+        if self._avg_gain is not None:
+            # Wilder smoothing after the seed
+            period = self._period
+            self._avg_gain = (self._avg_gain * (period - 1) + gain) / period
+            self._avg_loss = (self._avg_loss * (period - 1) + loss) / period
+            avg_gain, avg_loss = self._avg_gain, self._avg_loss
+        else:
+            self._gains.push(gain)
+            self._losses.push(loss)
+            if not self._gains.full():
+                return self._invalid(bar)
+
+            avg_gain = self._gains.mean()
+            avg_loss = self._losses.mean()
+            if self._wilder:
+                self._avg_gain, self._avg_loss = avg_gain, avg_loss
+        if avg_loss == 0:
+            return self._valid(bar, 100.0)
+        rs = avg_gain / avg_loss
+        return self._valid(bar, 100.0 - (100.0 / (1.0 + rs)))
+
+
+@streaming_indicator("macd")
+class StreamingMACD(StreamingIndicator):
+    """MACD with chained fast/slow/signal EMA state."""
+
+    def _reset_state(self):
+        params = self.config.params
+        self._fast_period = _require_positive("fast", params.get("fast", 12))
+        self._slow_period = _require_positive("slow", params.get("slow", 26))
+        signal_period = _require_positive("signal", params.get("signal", 9))
+        if self._fast_period > self._slow_period:
+            raise ValueError("fast period must not exceed slow period")
+
+        self._fast = SeededEMA(self._fast_period)
+        self._slow = SeededEMA(self._slow_period)
+        self._signal = SeededEMA(signal_period)
+        self._n = 0
+
+    def _update(self, bar):
+        fast = self._fast.push(bar.close)
+        slow = self._slow.push(bar.close)
+        self._n += 1
+
+        # Batch MACD line starts on the first EMA update after the slow seed
+        if self._n <= self._slow_period:
+            return self._invalid(bar)
+
+        macd = fast - slow
+        signal = self._signal.push(macd)
+        if signal is None:
+            return self._invalid(bar)
+
+        return self._valid(bar, {
+            "macd": macd,
+            "signal": signal,
+            "histogram": macd - signal
+        })
+
+
+@streaming_indicator("stochastic")
+class StreamingStochastic(StreamingIndicator):
+    """%K from monotonic high/low windows, %D from the last `smooth` %K values."""
+
+    def _reset_state(self):
+        self._period = _require_positive("period", self.config.period)
+        self._smooth = _require_positive("smooth", self.config.params.get("smooth", 3))
+        self._highs = RollingExtreme(self._period, maximum=True)
+        self._lows = RollingExtreme(self._period, maximum=False)
+        self._k_values: Deque[float] = deque(maxlen=self._smooth)
+        self._n = 0
+
+    def _update(self, bar):
+        self._highs.push(bar.high)
+        self._lows.push(bar.low)
+        self._n += 1
+
+        if not self._highs.full():
+            return self._invalid(bar)
+
+        highest = self._highs.value()
+        lowest = self._lows.value()
+        if highest == lowest:
+            k = 50.0
+        else:
+            k = ((bar.close - lowest) / (highest - lowest)) * 100.0
+        self._k_values.append(k)
+
+        if self._n < self._period + self._smooth:
+            return self._invalid(bar)
+
+        return self._valid(bar, {
+            "k": k,
+            "d": sum(self._k_values) / self._smooth
+        })
+
+
+@streaming_indicator("cci")
+class StreamingCCI(StreamingIndicator):
+    """CCI over a window of typical prices.
+
+    Mean deviation has no constant-time update, so each bar costs
+    O(period) - still independent of session length.
+    """
+
+    def _reset_state(self):
+        self._period = _require_positive("period", self.config.period)
+        self._tp: Deque[float] = deque(maxlen=self._period)
+
+    def _update(self, bar):
+        tp = typical_price(bar)
+        self._tp.append(tp)
+        if len(self._tp) < self._period:
+            return self._invalid(bar)
+
+        tp_sma = sum(self._tp) / self._period
+        mean_dev = sum(abs(v - tp_sma) for v in self._tp) / self._period
+        if mean_dev == 0:
+            return self._valid(bar, 0.0)
+        return self._valid(bar, (tp - tp_sma) / (0.015 * mean_dev))
+
+
+class _StreamingLookback(StreamingIndicator):
+    """Base for indicators comparing the close with the close N bars ago."""
+
+    def _reset_state(self):
+        period = _require_positive("period", self.config.period)
+        self._closes: Deque[float] = deque(maxlen=period + 1)
+
+    def _update(self, bar):
+        self._closes.append(bar.close)
+        if len(self._closes) < self._closes.maxlen:
+            return self._invalid(bar)
+        return self._valid(bar, self._compute(bar.close, self._closes[0]))
+
+    def _compute(self, current_close: float, past_close: float) -> float:
+        raise NotImplementedError
+
+
+@streaming_indicator("roc")
+class StreamingROC(_StreamingLookback):
+    """Rate of change vs close N bars ago."""
+
+    def _compute(self, current_close, past_close):
+        if past_close == 0:
+            return 0.0
+        return ((current_close - past_close) / past_close) * 100.0
+
+
+@streaming_indicator("mom")
+class StreamingMOM(_StreamingLookback):
+    """Momentum vs close N bars ago."""
+
+    def _compute(self, current_close, past_close):
+        return current_close - past_close
+
+
+@streaming_indicator("williams_r")
+class StreamingWilliamsR(StreamingIndicator):
+    """Williams %R from monotonic high/low windows."""
+
+    def _reset_state(self):
+        period = _require_positive("period", self.config.period)
+        self._highs = RollingExtreme(period, maximum=True)
+        self._lows = RollingExtreme(period, maximum=False)
+
+    def _update(self, bar):
+        self._highs.push(bar.high)
+        self._lows.push(bar.low)
+        if not self._highs.full():
+            return self._invalid(bar)
+
+        highest = self._highs.value()
+        lowest = self._lows.value()
+        if highest == lowest:
+            return self._valid(bar, -50.0)
+        return self._valid(bar, ((highest - bar.close) / (highest - lowest)) * -100.0)
+
+
+@streaming_indicator("ultimate_osc")
+class StreamingUltimateOsc(StreamingIndicator):
+    """Ultimate Oscillator with running buying-pressure/true-range sums."""
+
+    def _reset_state(self):
+        params = self.config.params
+        periods = (
+            _require_positive("period1", params.get("period1", 7)),
+            _require_positive("period2", params.get("period2", 14)),
+            _require_positive("period3", params.get("period3", 28)),
+        )
+        self._period3 = periods[2]
+        self._bp = [RollingSum(p) for p in periods]
+        self._tr = [RollingSum(p) for p in periods]
+        self._prev: Optional[BarData] = None
+        self._n = 0
+
+    def _update(self, bar):
+        self._n += 1
+        previous = self._prev
+        self._prev = bar
+        if previous is None:
+            return self._invalid(bar)
+
+        bp = bar.close - min(bar.low, previous.close)
+        tr = true_range(bar, previous)
+        for window in self._bp:
+            window.push(bp)
+        for window in self._tr:
+            window.push(tr)
+
+        if self._n < self._period3 + 1:
+            return self._invalid(bar)
+
+        avg_bp = [w.mean() if w.full() else 0 for w in self._bp]
+        avg_tr = [w.mean() if w.full() else 0 for w in self._tr]
+
+        if avg_tr[0] == 0 or avg_tr[1] == 0 or avg_tr[2] == 0:
+            return self._valid(bar, 50.0)
+
+        raw1 = avg_bp[0] / avg_tr[0]
+        raw2 = avg_bp[1] / avg_tr[1]
+        raw3 = avg_bp[2] / avg_tr[2]
+        return self._valid(bar, ((raw1 * 4) + (raw2 * 2) + raw3) / 7.0 * 100.0)
+
+
+# =============================================================================
+# Volatility
+# =============================================================================
+
+@streaming_indicator("atr")
+class StreamingATR(StreamingIndicator):
+    """ATR as a running average of the last N true ranges."""
+
+    def _reset_state(self):
+        self._tr = RollingSum(_require_positive("period", self.config.period))
+        self._prev: Optional[BarData] = None
+
+    def _update(self, bar):
+        previous = self._prev
+        self._prev = bar
+        if previous is None:
+            return self._invalid(bar)
+
+        self._tr.push(true_range(bar, previous))
+        if not self._tr.full():
+            return self._invalid(bar)
+        return self._valid(bar, self._tr.mean())
+
+
+@streaming_indicator("atr_daily")
+class StreamingATRDaily(StreamingATR):
+    """Same as ATR (daily context)."""
+
+
+@streaming_indicator("bbands")
+class StreamingBBands(StreamingIndicator):
+    """Bollinger Bands from running mean/variance."""
+
+    def _reset_state(self):
+        self._closes = RollingVariance(_require_positive("period", self.config.period))
+        self._num_std = self.config.params.get("num_std", 2.0)
+
+    def _update(self, bar):
+        self._closes.push(bar.close)
+        if not self._closes.full():
+            return self._invalid(bar)
+
+        middle = self._closes.mean
+        std_dev = self._closes.stddev()
+        upper = middle + (std_dev * self._num_std)
+        lower = middle - (std_dev * self._num_std)
+        bandwidth = (upper - lower) / middle if middle != 0 else 0.0
+
+        return self._valid(bar, {
+            "upper": upper,
+            "middle": middle,
+            "lower": lower,
+            "bandwidth": bandwidth
+        })
+
+
+@streaming_indicator("keltner")
+class StreamingKeltner(StreamingIndicator):
+    """Keltner Channels: EMA middle line plus running ATR."""
+
+    def _reset_state(self):
+        self._period = _require_positive("period", self.config.period)
+        atr_period = _require_positive("atr_period", self.config.params.get("atr_period", 10))
+        self._multiplier = self.config.params.get("multiplier", 2.0)
+        self._min_bars = max(self._period, atr_period + 1)
+        self._ema = SeededEMA(self._period)
+        self._tr = RollingSum(atr_period)
+        self._prev: Optional[BarData] = None
+        self._n = 0
+
+    def _update(self, bar):
+        self._n += 1
+        middle = self._ema.push(bar.close)
+        if self._prev is not None:
+            self._tr.push(true_range(bar, self._prev))
+        self._prev = bar
+
+        if self._n < self._min_bars:
+            return self._invalid(bar)
+
+        atr = self._tr.mean()
+        return self._valid(bar, {
+            "upper": middle + (atr * self._multiplier),
+            "middle": middle,
+            "lower": middle - (atr * self._multiplier)
+        })
+
+
+@streaming_indicator("donchian")
+class StreamingDonchian(StreamingIndicator):
+    """Donchian Channels from monotonic high/low windows."""
+
+    def _reset_state(self):
+        period = _require_positive("period", self.config.period)
+        self._highs = RollingExtreme(period, maximum=True)
+        self._lows = RollingExtreme(period, maximum=False)
+
+    def _update(self, bar):
+        self._highs.push(bar.high)
+        self._lows.push(bar.low)
+        if not self._highs.full():
+            return self._invalid(bar)
+
+        upper = self._highs.value()
+        lower = self._lows.value()
+        return self._valid(bar, {
+            "upper": upper,
+            "middle": (upper + lower) / 2.0,
+            "lower": lower
+        })
+
+
+@streaming_indicator("stddev")
+class StreamingStdDev(StreamingIndicator):
+    """Population standard deviation of closes from running variance."""
+
+    def _reset_state(self):
+        self._closes = RollingVariance(_require_positive("period", self.config.period))
+
+    def _update(self, bar):
+        self._closes.push(bar.close)
+        if not self._closes.full():
+            return self._invalid(bar)
+        return self._valid(bar, self._closes.stddev())
+
+
+@streaming_indicator("histvol")
+class StreamingHistVol(StreamingIndicator):
+    """Annualized volatility of log returns from running variance."""
+
+    def _reset_state(self):
+        self._returns = RollingVariance(_require_positive("period", self.config.period))
+        self._prev_close: Optional[float] = None
+
+    def _update(self, bar):
+        prev_close = self._prev_close
+        self._prev_close = bar.close
+        if prev_close is None:
+            return self._invalid(bar)
+
+        if prev_close > 0:
+            self._returns.push(math.log(bar.close / prev_close))
+        else:
+            self._returns.push(0.0)
+
+        if not self._returns.full():
+            return self._invalid(bar)
+        return self._valid(bar, self._returns.stddev() * math.sqrt(252) * 100.0)
+
+
+# =============================================================================
+# Volume
+# =============================================================================
+
+@streaming_indicator("obv")
+class StreamingOBV(StreamingIndicator):
+    """Cumulative On-Balance Volume."""
+
+    def _reset_state(self):
+        self._obv = 0.0
+        self._prev_close: Optional[float] = None
+
+    def _update(self, bar):
+        prev_close = self._prev_close
+        self._prev_close = bar.close
+        if prev_close is not None:
+            if bar.close > prev_close:
+                self._obv += bar.volume
+            elif bar.close < prev_close:
+                self._obv -= bar.volume
+        return self._valid(bar, self._obv)
+
+
+@streaming_indicator("pvt")
+class StreamingPVT(StreamingIndicator):
+    """Cumulative Price-Volume Trend."""
+
+    def _reset_state(self):
+        self._pvt = 0.0
+        self._prev_close: Optional[float] = None
+
+    def _update(self, bar):
+        prev_close = self._prev_close
+        self._prev_close = bar.close
+        if prev_close is not None and prev_close != 0:
+            self._pvt += bar.volume * ((bar.close - prev_close) / prev_close)
+        return self._valid(bar, self._pvt)
+
+
+@streaming_indicator("volume_sma")
+class StreamingVolumeSMA(StreamingIndicator):
+    """Volume SMA via running sum."""
+
+    def _reset_state(self):
+        self._volumes = RollingSum(_require_positive("period", self.config.period))
+
+    def _update(self, bar):
+        self._volumes.push(float(bar.volume))
+        if not self._volumes.full():
+            return self._invalid(bar)
+        return self._valid(bar, self._volumes.mean())
+
+
+@streaming_indicator("avg_volume")
+class StreamingAvgVolume(StreamingVolumeSMA):
+    """Same as volume SMA (daily context)."""
+
+
+@streaming_indicator("volume_ratio")
+class StreamingVolumeRatio(StreamingIndicator):
+    """Current volume over running volume SMA (period 0 -> 20)."""
+
+    def _reset_state(self):
+        period = self.config.period if self.config.period > 0 else 20
+        self._volumes = RollingSum(period)
+
+    def _update(self, bar):
+        volume = float(bar.volume)
+        self._volumes.push(volume)
+        if not self._volumes.full():
+            return self._invalid(bar)
+
+        vol_sma = self._volumes.mean()
+        if vol_sma == 0:
+            return self._valid(bar, 1.0)
+        return self._valid(bar, volume / vol_sma)
+
+
+# =============================================================================
+# Support / Resistance and Historical Context
+# =============================================================================
+
+@streaming_indicator("pivot_points")
+class StreamingPivotPoints(StreamingIndicator):
+    """Pivot points depend on the latest bar only."""
+
+    def _reset_state(self):
+        pass
+
+    def _update(self, bar):
+        return calculate_pivot_points([bar], self.config)
+
+
+@streaming_indicator("high_low")
+class StreamingHighLow(StreamingIndicator):
+    """N-period high/low from monotonic windows."""
+
+    def _reset_state(self):
+        period = _require_positive("period", self.config.period)
+        self._highs = RollingExtreme(period, maximum=True)
+        self._lows = RollingExtreme(period, maximum=False)
+
+    def _update(self, bar):
+        self._highs.push(bar.high)
+        self._lows.push(bar.low)
+        if not self._highs.full():
+            return self._invalid(bar)
+        return self._valid(bar, {
+            "high": self._highs.value(),
+            "low": self._lows.value()
+        })
+
+
+class _StreamingSwing(StreamingIndicator):
+    """Base for swing detection: center bar vs window extreme.
+
+    The center bar is a swing high (low) when its high (low) is >= (<=)
+    every other bar in the 2N+1 window, i.e. it equals the window extreme.
+    """
+
+    maximum = True
+
+    def _reset_state(self):
+        period = self.config.period
+        if not isinstance(period, int) or period < 0:
+            raise ValueError(f"period must be a non-negative integer, got {period!r}")
+        self._center = period
+        window_size = period * 2 + 1
+        self._window: Deque[float] = deque(maxlen=window_size)
+        self._extreme = RollingExtreme(window_size, maximum=self.maximum)
+
+    def _update(self, bar):
+        value = bar.high if self.maximum else bar.low
+        self._window.append(value)
+        self._extreme.push(value)
+        if not self._extreme.full():
+            return self._invalid(bar)
+
+        center_value = self._window[self._center]
+        if center_value == self._extreme.value():
+            return self._valid(bar, center_value)
+        return self._valid(bar, None)
+
+
+@streaming_indicator("swing_high")
+class StreamingSwingHigh(_StreamingSwing):
+    """Swing high detection."""
+
+    maximum = True
+
+
+@streaming_indicator("swing_low")
+class StreamingSwingLow(_StreamingSwing):
+    """Swing low detection."""
+
+    maximum = False
+
+
+class _StreamingRange(StreamingIndicator):
+    """Base for indicators on a running average of bar range (H - L)."""
+
+    def _reset_state(self):
+        self._ranges = RollingSum(_require_positive("period", self.config.period))
+
+
+@streaming_indicator("avg_range")
+class StreamingAvgRange(_StreamingRange):
+    """Average range via running sum."""
+
+    def _update(self, bar):
+        self._ranges.push(bar.high - bar.low)
+        if not self._ranges.full():
+            return self._invalid(bar)
+        return self._valid(bar, self._ranges.mean())
+
+
+@streaming_indicator("range_ratio")
+class StreamingRangeRatio(_StreamingRange):
+    """Current range over running average range."""
+
+    def _update(self, bar):
+        current_range = bar.high - bar.low
+        self._ranges.push(current_range)
+        if not self._ranges.full():
+            return self._invalid(bar)
+
+        avg_range = self._ranges.mean()
+        if avg_range == 0:
+            return self._valid(bar, 1.0)
+        return self._valid(bar, current_range / avg_range)
+
+
+@streaming_indicator("gap_stats")
+class StreamingGapStats(StreamingIndicator):
+    """Gap statistics over the last N open-vs-previous-close gaps."""
+
+    def _reset_state(self):
+        self._gaps = RollingSum(_require_positive("period", self.config.period))
+        self._prev_close: Optional[float] = None
+        self._up = 0
+        self._down = 0
+        self._significant = 0
+
+    def _tally(self, gap: float, delta: int) -> None:
+        if gap > 0:
+            self._up += delta
+        elif gap < 0:
+            self._down += delta
+        if abs(gap) > 0.01:
+            self._significant += delta
+
+    def _update(self, bar):
+        prev_close = self._prev_close
+        self._prev_close = bar.close
+        if prev_close is None:
+            return self._invalid(bar)
+
+        gap = bar.open - prev_close
+        if self._gaps.full():
+            self._tally(self._gaps.values[0], -1)
+        self._gaps.push(gap)
+        self._tally(gap, 1)
+
+        if not self._gaps.full():
+            return self._invalid(bar)
+
+        return self._valid(bar, {
+            "avg_gap": self._gaps.mean(),
+            "gap_count": self._significant,
+            "gap_up_count": self._up,
+            "gap_down_count": self._down
+        })
@@ -1,6 +1,9 @@
 """Utility functions for indicator calculations."""
 
-from typing import List
+from typing import Dict, List, Sequence
+
+import numpy as np
+
 from .base import BarData
 
 
@@ -161,3 +164,199 @@ def lowest_low(bars: List[BarData], period: int) -> float:
     
     recent = bars[-period:]
     return min(b.low for b in recent)
+
+
+# =============================================================================
+# Vectorized (NumPy) helpers
+#
+# Whole-series counterparts of the helpers above, used by the kernels in
+# vectorized.py. Every function takes a float64 array and returns an array
+# of the same length with NaN where the value is not defined yet.
+# =============================================================================
+
+BAR_FIELDS = ("open", "high", "low", "close", "volume")
+
+# Largest exponent of the decay factor used inside one EMA block, so the
+# rescaled terms stay far below float64 overflow (e^300 ~ 1e130).
+_EWM_MAX_EXPONENT = 300.0
+
+
+def bar_arrays(bars: Sequence[BarData]) -> Dict[str, np.ndarray]:
+    """OHLCV columns of a bar series as contiguous float64 arrays.
+    
+    A ColumnarBarSeries (anything with arrays()) hands out its columns
+    without materializing BarData objects.
+    
+    Args:
+        bars: Bar series (list, deque, or columnar series)
+    
+    Returns:
+        Dict of field name -> array, one entry per bar
+    """
+    if hasattr(bars, "arrays"):
+        columns = bars.arrays()
+        return {name: np.asarray(columns[name], dtype=np.float64) for name in BAR_FIELDS}
+    
+    count = len(bars)
+    return {
+        name: np.fromiter((getattr(b, name) for b in bars), dtype=np.float64, count=count)
+        for name in BAR_FIELDS
+    }
+
+
+def _windows(values: np.ndarray, period: int) -> np.ndarray:
+    return np.lib.stride_tricks.sliding_window_view(values, period)
+
+
+def _aligned(values: np.ndarray, period: int, window_values: np.ndarray) -> np.ndarray:
+    """Place per-window results at the index of each window's last value."""
+    out = np.full(len(values), np.nan)
+    out[period - 1:] = window_values
+    return out
+
+
+def _undefined(values: np.ndarray, period: int) -> bool:
+    return period <= 0 or len(values) < period
+
+
+def rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average at every index (O(n) via prefix sums).
+    
+    Prefix sums run over values minus the first value, which keeps their
+    magnitude (and rounding) at the scale of the price moves rather than
+    the price level.
+    """
+    if _undefined(values, period):
+        return np.full(len(values), np.nan)
+    
+    origin = values[0]
+    sums = np.cumsum(values - origin)
+    window_sums = sums[period - 1:].copy()
+    window_sums[1:] -= sums[:-period]
+    return _aligned(values, period, window_sums / period + origin)
+
+
+def rolling_std(values: np.ndarray, period: int) -> np.ndarray:
+    """Population standard deviation of each window (two-pass per window)."""
+    if _undefined(values, period):
+        return np.full(len(values), np.nan)
+    return _aligned(values, period, _windows(values, period).std(axis=1))
+
+
+def _rolling_extreme(values: np.ndarray, period: int, op: np.ufunc, fill: float) -> np.ndarray:
+    """Window max/min in O(n) (van Herk / Gil-Werman).
+    
+    Values are cut into blocks of `period`; a window spans the tail of one
+    block and the head of the next, so its extreme is op(suffix extreme at
+    the window start, prefix extreme at the window end).
+    """
+    if _undefined(values, period):
+        return np.full(len(values), np.nan)
+    
+    count = len(values)
+    blocks = -(-count // period)
+    padded = np.full(blocks * period, fill)
+    padded[:count] = values
+    padded = padded.reshape(blocks, period)
+    
+    prefix = op.accumulate(padded, axis=1).ravel()[:count]
+    suffix = op.accumulate(padded[:, ::-1], axis=1)[:, ::-1].ravel()[:count]
+    return _aligned(values, period, op(suffix[:count - period + 1], prefix[period - 1:]))
+
+
+def rolling_max(values: np.ndarray, period: int) -> np.ndarray:
+    """Window maximum at every index."""
+    return _rolling_extreme(values, period, np.maximum, -np.inf)
+
+
+def rolling_min(values: np.ndarray, period: int) -> np.ndarray:
+    """Window minimum at every index."""
+    return _rolling_extreme(values, period, np.minimum, np.inf)
+
+
+def rolling_wma(values: np.ndarray, period: int) -> np.ndarray:
+    """Linearly weighted moving average (newest value has weight = period)."""
+    if _undefined(values, period):
+        return np.full(len(values), np.nan)
+    weights = np.arange(1, period + 1, dtype=np.float64)
+    return _aligned(values, period, _windows(values, period) @ weights / weights.sum())
+
+
+def ewm(values: np.ndarray, alpha: float, initial: float) -> np.ndarray:
+    """EMA recursion y[i] = alpha * x[i] + (1 - alpha) * y[i-1], with y[-1] = initial.
+    
+    Solved in closed form per block: within a block,
+    y[k] = d^(k+1) * y_prev + d^k * alpha * cumsum(x[j] * d^-j)[k] with
+    d = 1 - alpha. Blocks are sized so d^-j stays representable, which
+    makes the number of Python-level steps n / block (one for typical
+    periods) instead of n.
+    """
+    count = len(values)
+    out = np.empty(count)
+    if count == 0:
+        return out
+    
+    decay = 1.0 - alpha
+    if decay <= 0.0:
+        out[:] = values
+        return out
+    
+    block = count if decay == 1.0 else max(1, min(count, int(_EWM_MAX_EXPONENT / -np.log(decay))))
+    exponents = np.arange(block, dtype=np.float64)
+    growth = decay ** -exponents          # d^-j
+    shrink = decay ** exponents           # d^k
+    
+    previous = initial
+    for start in range(0, count, block):
+        chunk = values[start:start + block]
+        size = len(chunk)
+        scaled = np.cumsum(chunk * growth[:size]) * alpha
+        out[start:start + size] = shrink[:size] * (decay * previous + scaled)
+        previous = out[start + size - 1]
+    return out
+
+
+def ema_series(values: np.ndarray, period: int, start: int = 0) -> np.ndarray:
+    """EMA seeded the way the batch calculators seed it.
+    
+    The seed is the SMA of values[start:start + period], placed at index
+    start + period - 1; later indexes follow the EMA recursion with
+    alpha = 2 / (period + 1).
+    
+    Args:
+        values: Input series
+        period: EMA period
+        start: First defined index of values (e.g. for an EMA of an EMA)
+    
+    Returns:
+        EMA series, NaN before the seed
+    """
+    out = np.full(len(values), np.nan)
+    seed_index = start + period - 1
+    if period <= 0 or seed_index >= len(values):
+        return out
+    
+    seed = values[start:start + period].mean()
+    out[seed_index] = seed
+    out[seed_index + 1:] = ewm(values[seed_index + 1:], 2.0 / (period + 1), seed)
+    return out
+
+
+def shifted(values: np.ndarray, lag: int) -> np.ndarray:
+    """values[i - lag] at index i (NaN for i < lag)."""
+    out = np.full(len(values), np.nan)
+    if lag <= 0:
+        out[:] = values
+    elif lag < len(values):
+        out[lag:] = values[:-lag]
+    return out
+
+
+def true_range_series(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """True range of each bar against the previous close (NaN at index 0)."""
+    previous_close = shifted(close, 1)
+    # np.maximum propagates the NaN of the missing previous close
+    return np.maximum(
+        high - low,
+        np.maximum(np.abs(high - previous_close), np.abs(low - previous_close))
+    )
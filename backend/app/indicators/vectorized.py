@@ -0,0 +1,420 @@
+"""Vectorized (whole-series) indicator kernels.
+
+Batch calculators in trend/momentum/volatility/volume return the value at
+the last bar and walk BarData objects in Python. The kernels here take the
+OHLCV columns as contiguous NumPy arrays (utils.bar_arrays) and return the
+indicator at every bar in one pass, which is what warmup and historical
+calculations need: the columns of an interval are extracted once and
+shared by all its indicators.
+
+Each kernel reproduces its batch calculator - same seeding, same
+validity, same guards against zero ranges - so the last element of a
+kernel's output equals calculate_indicator() on the same bars up to
+floating point rounding.
+
+Kernel contract:
+    kernel(arrays, config) -> np.ndarray | Dict[str, np.ndarray]
+    - one element per bar, NaN where the batch calculator is not valid
+    - multi-value indicators return one array per field
+The config.warmup_bars() gate is applied by calculate_indicator_series().
+
+Usage:
+    series = calculate_indicator_series(bars, config)
+    result = calculate_indicator_warmup(bars, config, symbol)
+"""
+
+import logging
+from typing import Dict
+
+import numpy as np
+
+from .base import IndicatorConfig
+from .registry import vectorized_indicator
+from .utils import (
+    ema_series,
+    ewm,
+    rolling_max,
+    rolling_mean,
+    rolling_min,
+    rolling_std,
+    rolling_wma,
+    shifted,
+    true_range_series,
+)
+
+logger = logging.getLogger(__name__)
+
+Arrays = Dict[str, np.ndarray]
+
+
+def _nan_like(values: np.ndarray) -> np.ndarray:
+    return np.full(len(values), np.nan)
+
+
+def _over_changes(rolling, values: np.ndarray, period: int) -> np.ndarray:
+    """Apply a rolling function to a series defined from bar 1 on.
+
+    values[i] belongs to bar i and values[0] is undefined (e.g. a price
+    change or true range against the previous bar), like the per-change
+    lists the batch calculators build.
+    """
+    out = np.full(len(values), np.nan)
+    if len(values) > 1:
+        out[1:] = rolling(values[1:], period)
+    return out
+
+
+def _select(condition: np.ndarray, fallback: float, values: np.ndarray) -> np.ndarray:
+    """values, with fallback where condition holds (NaN stays NaN)."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(np.isnan(values), np.nan, np.where(condition, fallback, values))
+
+
+# =============================================================================
+# Trend
+# =============================================================================
+
+@vectorized_indicator("sma")
+def sma_kernel(arrays: Arrays, config: IndicatorConfig) -> np.ndarray:
+    return rolling_mean(arrays["close"], config.period)
+
+
+@vectorized_indicator("ema")
+def ema_kernel(arrays: Arrays, config: IndicatorConfig) -> np.ndarray:
+    return ema_series(arrays["close"], config.period)
+
+
+@vectorized_indicator("wma")
+def wma_kernel(arrays: Arrays, config: IndicatorConfig) -> np.ndarray:
+    return rolling_wma(arrays["close"], config.period)
+
+
+@vectorized_indicator("dema")
+def dema_kernel(arrays: Arrays, config: IndicatorConfig) -> np.ndarray:
+    period = config.period
+    ema1 = ema_series(arrays["close"], period)
+    ema2 = ema_series(ema1, period, start=period - 1)
+    return 2 * ema1 - ema2
+
+
+@vectorized_indicator("tema")
+def tema_kernel(arrays: Arrays, config: IndicatorConfig) -> np.ndarray:
+    period = config.period
+    ema1 = ema_series(arrays["close"], period)
+    ema2 = ema_series(ema1, period, start=period - 1)
+    ema3 = ema_series(ema2, period, start=2 * (period - 1))
+    return 3 * ema1 - 3 * ema2 + ema3
+
+
+@vectorized_indicator("hma")
+def hma_kernel(arrays: Arrays, config: IndicatorConfig) -> np.ndarray:
+    # Same simplification as calculate_hma: 2*WMA(n/2) - WMA(n), no final smoothing
+    close = arrays["close"]
+    period = config.period
+    if period // 2 < 1:
+        return _nan_like(close)
+    return 2 * rolling_wma(close, period // 2) - rolling_wma(close, period)
+
+
+@vectorized_indicator("vwap")
+def vwap_kernel(arrays: Arrays, config: IndicatorConfig) -> np.ndarray:
+    close, volume = arrays["close"], arrays["volume"]
+    if len(close) == 0:
+        return _nan_like(close)
+
+    typical = (arrays["high"] + arrays["low"] + close) / 3.0
+    cum_pv = np.cumsum(typical * volume)
+    cum_vol = np.cumsum(volume)
+
+    # Same cumulative state calculate_vwap leaves for its next update
+    config.params["_cum_pv"] = float(cum_pv[-1])
+    config.params["_cum_vol"] = float(cum_vol[-1])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(cum_vol == 0, close, cum_pv / cum_vol)
+
+
+@vectorized_indicator("twap")
+def twap_kernel(arrays: Arrays, config: IndicatorConfig) -> np.ndarray:
+    close = arrays["close"]
+    return np.cumsum(close) / np.arange(1, len(close) + 1)
+
+
+# =============================================================================
+# Momentum
+# =============================================================================
+
+def _wilder_average(values: np.ndarray, period: int) -> np.ndarray:
+    """Wilder smoothing over a series defined from bar 1 on (see _over_changes).
+
+    Seeded with the mean of values[1:period + 1] at bar period, then
+    avg = (avg * (period - 1) + x) / period.
+    """
+    out = np.full(len(values), np.nan)
+    if period <= 0 or len(values) <= period:
+        return out
+    seed = values[1:period + 1].mean()
+    out[period] = seed
+    out[period + 1:] = ewm(values[period + 1:], 1.0 / period, seed)
+    return out
+
+
+@vectorized_indicator("rsi")
+def rsi_kernel(arrays: Arrays, config: IndicatorConfig) -> np.ndarray:
+    change = np.diff(arrays["close"], prepend=np.nan)
+    smoothing = config.params.get("smoothing", "simple")
+    if smoothing == "wilder":
+        avg_gain = _wilder_average(np.maximum(change, 0.0), config.period)
+        avg_loss = _wilder_average(np.maximum(-change, 0.0), config.period)
+    elif smoothing == "simple":
+        avg_gain = _over_changes(rolling_mean, np.maximum(change, 0.0), config.period)
+        avg_loss = _over_changes(rolling_mean, np.maximum(-change, 0.0), config.period)
+    else:
+        raise ValueError(f"Unknown RSI smoothing '{smoothing}' (simple or wilder)")
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return _select(avg_loss == 0, 100.0, rsi)
+
+
+@vectorized_indicator("macd")
+def macd_kernel(arrays: Arrays, config: IndicatorConfig) -> Dict[str, np.ndarray]:
+    close = arrays["close"]
+    fast_period = config.params.get("fast", 12)
+    slow_period = config.params.get("slow", 26)
+    signal_period = config.params.get("signal", 9)
+
+    # calculate_macd pairs EMA values from the bar after the slow seed on
+    macd = ema_series(close, fast_period) - ema_series(close, slow_period)
+    macd[:slow_period] = np.nan
+    signal = ema_series(macd, signal_period, start=slow_period)
+    macd[np.isnan(signal)] = np.nan
+
+    return {
+        "macd": macd,
+        "signal": signal,
+        "histogram": macd - signal,
+    }
+
+
+@vectorized_indicator("stochastic")
+def stochastic_kernel(arrays: Arrays, config: IndicatorConfig) -> Dict[str, np.ndarray]:
+    close = arrays["close"]
+    period = config.period
+    smooth = config.params.get("smooth", 3)
+
+    highest = rolling_max(arrays["high"], period)
+    lowest = rolling_min(arrays["low"], period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = _select(highest == lowest, 50.0, (close - lowest) / (highest - lowest) * 100.0)
+
+    d = _nan_like(close)
+    if period >= 1 and len(close) >= period:
+        d[period - 1:] = rolling_mean(k[period - 1:], smooth)
+
+    # calculate_stochastic needs period + smooth bars
+    k[:period + smooth - 1] = np.nan
+    d[np.isnan(k)] = np.nan
+    return {"k": k, "d": d}
+
+
+@vectorized_indicator("cci")
+def cci_kernel(arrays: Arrays, config: IndicatorConfig) -> np.ndarray:
+    period = config.period
+    typical = (arrays["high"] + arrays["low"] + arrays["close"]) / 3.0
+    if period <= 0 or len(typical) < period:
+        return _nan_like(typical)
+
+    mean = rolling_mean(typical, period)
+    windows = np.lib.stride_tricks.sliding_window_view(typical, period)
+    mean_dev = _nan_like(typical)
+    mean_dev[period - 1:] = np.abs(windows - mean[period - 1:, None]).mean(axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cci = (typical - mean) / (0.015 * mean_dev)
+    return _select(mean_dev == 0, 0.0, cci)
+
+
+@vectorized_indicator("roc")
+def roc_kernel(arrays: Arrays, config: IndicatorConfig) -> np.ndarray:
+    close = arrays["close"]
+    past = _past_close(close, config.period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        roc = (close - past) / past * 100.0
+    return _select(past == 0, 0.0, roc)
+
+
+@vectorized_indicator("mom")
+def mom_kernel(arrays: Arrays, config: IndicatorConfig) -> np.ndarray:
+    close = arrays["close"]
+    return close - _past_close(close, config.period)
+
+
+def _past_close(close: np.ndarray, period: int) -> np.ndarray:
+    """Close `period` bars back, defined once period + 1 bars exist."""
+    past = shifted(close, period)
+    past[:period] = np.nan
+    return past
+
+
+@vectorized_indicator("williams_r")
+def williams_r_kernel(arrays: Arrays, config: IndicatorConfig) -> np.ndarray:
+    period = config.period
+    highest = rolling_max(arrays["high"], period)
+    lowest = rolling_min(arrays["low"], period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        wr = (highest - arrays["close"]) / (highest - lowest) * -100.0
+    return _select(highest == lowest, -50.0, wr)
+
+
+@vectorized_indicator("ultimate_osc")
+def ultimate_osc_kernel(arrays: Arrays, config: IndicatorConfig) -> np.ndarray:
+    close, low = arrays["close"], arrays["low"]
+    periods = (
+        config.params.get("period1", 7),
+        config.params.get("period2", 14),
+        config.params.get("period3", 28),
+    )
+
+    previous_close = shifted(close, 1)
+    buying_pressure = close - np.minimum(low, previous_close)
+    true_range = true_range_series(arrays["high"], low, close)
+
+    # calculate_ultimate_osc averages to 0 while a period has too few values
+    raws = []
+    for period in periods:
+        avg_bp = np.nan_to_num(_over_changes(rolling_mean, buying_pressure, period))
+        avg_tr = np.nan_to_num(_over_changes(rolling_mean, true_range, period))
+        raws.append((avg_bp, avg_tr))
+
+    any_zero = np.zeros(len(close), dtype=bool)
+    for _, avg_tr in raws:
+        any_zero |= avg_tr == 0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        (bp1, tr1), (bp2, tr2), (bp3, tr3) = raws
+        uo = ((bp1 / tr1) * 4 + (bp2 / tr2) * 2 + bp3 / tr3) / 7.0 * 100.0
+    uo = np.where(any_zero, 50.0, uo)
+    uo[:periods[2]] = np.nan  # Needs period3 + 1 bars
+    return uo
+
+
+# =============================================================================
+# Volatility
+# =============================================================================
+
+@vectorized_indicator("atr")
+def atr_kernel(arrays: Arrays, config: IndicatorConfig) -> np.ndarray:
+    true_range = true_range_series(arrays["high"], arrays["low"], arrays["close"])
+    return _over_changes(rolling_mean, true_range, config.period)
+
+
+@vectorized_indicator("bbands")
+def bbands_kernel(arrays: Arrays, config: IndicatorConfig) -> Dict[str, np.ndarray]:
+    close = arrays["close"]
+    period = config.period
+    num_std = config.params.get("num_std", 2.0)
+
+    middle = rolling_mean(close, period)
+    std_dev = rolling_std(close, period)
+    upper = middle + std_dev * num_std
+    lower = middle - std_dev * num_std
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bandwidth = _select(middle == 0, 0.0, (upper - lower) / middle)
+
+    return {
+        "upper": upper,
+        "middle": middle,
+        "lower": lower,
+        "bandwidth": bandwidth,
+    }
+
+
+@vectorized_indicator("keltner")
+def keltner_kernel(arrays: Arrays, config: IndicatorConfig) -> Dict[str, np.ndarray]:
+    atr_period = config.params.get("atr_period", 10)
+    multiplier = config.params.get("multiplier", 2.0)
+
+    middle = ema_series(arrays["close"], config.period)
+    true_range = true_range_series(arrays["high"], arrays["low"], arrays["close"])
+    atr = _over_changes(rolling_mean, true_range, atr_period)
+    middle[np.isnan(atr)] = np.nan
+
+    return {
+        "upper": middle + atr * multiplier,
+        "middle": middle,
+        "lower": middle - atr * multiplier,
+    }
+
+
+@vectorized_indicator("donchian")
+def donchian_kernel(arrays: Arrays, config: IndicatorConfig) -> Dict[str, np.ndarray]:
+    upper = rolling_max(arrays["high"], config.period)
+    lower = rolling_min(arrays["low"], config.period)
+    return {
+        "upper": upper,
+        "middle": (upper + lower) / 2.0,
+        "lower": lower,
+    }
+
+
+@vectorized_indicator("stddev")
+def stddev_kernel(arrays: Arrays, config: IndicatorConfig) -> np.ndarray:
+    return rolling_std(arrays["close"], config.period)
+
+
+@vectorized_indicator("histvol")
+def histvol_kernel(arrays: Arrays, config: IndicatorConfig) -> np.ndarray:
+    close = arrays["close"]
+    previous_close = shifted(close, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_returns = np.where(previous_close > 0, np.log(close / previous_close), 0.0)
+
+    # Annualized as in calculate_histvol (daily bars)
+    return _over_changes(rolling_std, log_returns, config.period) * np.sqrt(252) * 100.0
+
+
+# =============================================================================
+# Volume
+# =============================================================================
+
+@vectorized_indicator("obv")
+def obv_kernel(arrays: Arrays, config: IndicatorConfig) -> np.ndarray:
+    close, volume = arrays["close"], arrays["volume"]
+    if len(close) == 0:
+        return _nan_like(close)
+
+    flow = np.zeros(len(close))
+    flow[1:] = np.sign(np.diff(close)) * volume[1:]
+    return np.cumsum(flow)
+
+
+@vectorized_indicator("pvt")
+def pvt_kernel(arrays: Arrays, config: IndicatorConfig) -> np.ndarray:
+    close, volume = arrays["close"], arrays["volume"]
+    if len(close) == 0:
+        return _nan_like(close)
+
+    flow = np.zeros(len(close))
+    previous_close = close[:-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        flow[1:] = np.where(
+            previous_close != 0,
+            volume[1:] * ((close[1:] - previous_close) / previous_close),
+            0.0
+        )
+    return np.cumsum(flow)
+
+
+@vectorized_indicator("volume_sma")
+def volume_sma_kernel(arrays: Arrays, config: IndicatorConfig) -> np.ndarray:
+    return rolling_mean(arrays["volume"], config.period)
+
+
+@vectorized_indicator("volume_ratio")
+def volume_ratio_kernel(arrays: Arrays, config: IndicatorConfig) -> np.ndarray:
+    volume = arrays["volume"]
+    period = config.period if config.period > 0 else 20
+    average = rolling_mean(volume, period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _select(average == 0, 1.0, volume / average)
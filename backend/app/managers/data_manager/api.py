@@ -6,7 +6,7 @@ All CLI and API routes must use this interface.
 from dataclasses import dataclass
 from datetime import datetime, date, time, timedelta, timezone
 from zoneinfo import ZoneInfo
-from typing import List, Optional, Iterator, Dict, Any
+from typing import List, Optional, Iterator, Dict, Any, Tuple
 from types import SimpleNamespace
 from uuid import uuid4
 from sqlalchemy.orm import Session
@@ -14,6 +14,8 @@ import threading
 
 from app.models.trading import BarData, TickData
 from app.managers.data_manager.parquet_storage import parquet_storage
+from app.managers.data_manager.bar_conversion import bars_from_frame, columnar_from_frame
+from app.managers.data_manager.columnar_bars import ColumnarBarSeries
 from app.managers.data_manager.config import DataManagerConfig
 # Holiday import and time functionality moved to time_manager
 # Old backtest_stream_coordinator removed - SessionCoordinator is used now
@@ -299,23 +301,86 @@ class DataManager:
         if df.empty:
             return []
         
-        # Convert DataFrame to BarData objects
-        bar_data_list = [
-            BarData(
-                symbol=row['symbol'],
-                timestamp=row['timestamp'],
-                interval=interval,
-                open=row['open'],
-                high=row['high'],
-                low=row['low'],
-                close=row['close'],
-                volume=row['volume']
-            )
-            for _, row in df.iterrows()
-        ]
-        
-        return bar_data_list
+        # Bulk column conversion (rows were validated on write)
+        return bars_from_frame(df, interval)
     
+    def get_bars_columnar(
+        self,
+        session: Session,
+        symbol: str,
+        start: datetime,
+        end: datetime,
+        interval: str = "1m",
+        regular_hours_only: bool = False
+    ) -> ColumnarBarSeries:
+        """
+        Get historical bar data as a columnar series (no BarData objects).
+        
+        Same query as get_bars(), but parquet columns are copied straight
+        into a ColumnarBarSeries for columnar session stores and vectorized
+        consumers.
+        
+        Args:
+            session: Database session
+            symbol: Stock symbol
+            start: Start datetime
+            end: End datetime
+            interval: Time interval (default: 1m)
+            regular_hours_only: If True, filter to regular trading hours only (default: False)
+            
+        Returns:
+            ColumnarBarSeries (empty if no data)
+        """
+        df = parquet_storage.read_bars(
+            interval,
+            symbol,
+            start_date=start,
+            end_date=end,
+            regular_hours_only=regular_hours_only
+        )
+        
+        return columnar_from_frame(df, interval, symbol.upper())
+
+    def get_bars_multi(
+        self,
+        session: Session,
+        symbols: List[str],
+        start: datetime,
+        end: datetime,
+        interval: str = "1m",
+        regular_hours_only: bool = False
+    ) -> Dict[str, List[BarData]]:
+        """
+        Get historical bar data for many symbols in one batched read.
+
+        Same query as get_bars() per symbol, but all files are read
+        concurrently (see ParquetStorage.read_bars_multi()).
+
+        Args:
+            session: Database session
+            symbols: Stock symbols
+            start: Start datetime
+            end: End datetime
+            interval: Time interval (default: 1m)
+            regular_hours_only: If True, filter to regular trading hours only (default: False)
+
+        Returns:
+            Dict of upper-case symbol -> BarData list (empty list if no data)
+        """
+        tables = parquet_storage.read_bars_multi(
+            interval,
+            symbols,
+            start_date=start,
+            end_date=end,
+            regular_hours_only=regular_hours_only,
+            by_symbol=True
+        )
+
+        return {
+            symbol: bars_from_frame(tables[symbol].to_pandas(), interval) if symbol in tables else []
+            for symbol in (s.upper() for s in symbols)
+        }
+
     def get_latest_bar(
         self,
         session: Session,
@@ -567,12 +632,12 @@ class DataManager:
 
         ticks: List[TickData] = [
             TickData(
-                symbol=row['symbol'],
-                timestamp=row['timestamp'],
-                price=row['close'],
-                size=row['volume'],
+                symbol=bar.symbol,
+                timestamp=bar.timestamp,
+                price=bar.close,
+                size=bar.volume,
             )
-            for _, row in df.iterrows()
+            for bar in bars_from_frame(df, '1s')
         ]
         return ticks
 
@@ -1587,15 +1652,21 @@ class DataManager:
         session: Session,
         symbol: Optional[str] = None,
         interval: str = "1m",
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
     ) -> int:
         """Return the number of records for a symbol/interval from Parquet.
 
-        Used by CLI commands to summarize both bar and tick data.
+        Used by CLI commands to summarize both bar and tick data, and by
+        data checkers for availability. Counted from the parquet catalog
+        (no bars are read).
         
         Args:
             session: Database session (unused, kept for compatibility)
             symbol: Stock symbol (required)
-            interval: Time interval ('1m', '1d', '1s', 'tick')
+            interval: Time interval ('1m', '1d', '1s', 'tick', 'quotes')
+            start_date: Optional first day (inclusive, exchange timezone)
+            end_date: Optional last day (inclusive, exchange timezone)
             
         Returns:
             Number of bars/ticks
@@ -1606,11 +1677,7 @@ class DataManager:
         # Map 'tick' to '1s' (ticks stored as 1s bars in Parquet)
         parquet_interval = '1s' if interval == 'tick' else interval
         
-        try:
-            df = parquet_storage.read_bars(parquet_interval, symbol.upper())
-            return len(df)
-        except FileNotFoundError:
-            return 0
+        return parquet_storage.count_bars(parquet_interval, symbol, start_date, end_date)
     
     def get_date_range(
         self,
@@ -2052,7 +2119,7 @@ class DataManager:
                 # Delete specific date range (more complex)
                 # Iterate through year/month directories and delete matching files
                 files_deleted = 0
-                for file_path in base_path.rglob("*.parquet"):
+                for file_path in base_path.rglob("*.parquet*"):  # Incl. delta files
                     # Check if file falls within date range
                     # For now, just note this is complex and would need careful implementation
                     # Simplified: delete file if in range based on filename/path
@@ -2063,6 +2130,9 @@ class DataManager:
                     intervals_deleted.append(intv)
                     total_files_deleted += files_deleted
                     logger.warning(f"Deleted {files_deleted} {intv} files for {symbol} in range {start_date} to {end_date}")
+            
+            # Catalog rescans this symbol/interval on next lookup
+            parquet_storage.catalog.invalidate(intv, symbol)
         
         if intervals_deleted:
             message = f"Deleted {', '.join(intervals_deleted)} data for {symbol}"
@@ -2123,6 +2193,51 @@ class DataManager:
     
     # ==================== HISTORICAL DATA LOADING ====================
     
+    def _historical_date_range(self, days: int) -> Tuple[date, date]:
+        """Trailing date range used by historical loading.
+        
+        For backtest: ends at the backtest start date.
+        For live: ends today.
+        """
+        time_mgr = self.system_manager.get_time_manager()
+        
+        if self.system_manager.mode.value == "backtest":
+            end_date = time_mgr.backtest_start_date
+        else:
+            current_time = time_mgr.get_current_time()
+            end_date = current_time.date()
+        
+        return end_date - timedelta(days=days), end_date
+    
+    def count_historical_bars(
+        self,
+        symbol: str,
+        interval: str,
+        days: int = 30
+    ) -> int:
+        """Count bars load_historical_bars() would load, without reading them.
+        
+        Answered from the parquet catalog - used for availability checks.
+        
+        Args:
+            symbol: Symbol to check
+            interval: Interval string (e.g., "1m", "5m", "1d", "1w")
+            days: Number of trailing days
+            
+        Returns:
+            Number of bars available (0 if none or on error)
+        """
+        if self.system_manager is None:
+            logger.warning("SystemManager not available, cannot count historical bars")
+            return 0
+        
+        try:
+            start_date, end_date = self._historical_date_range(days)
+            return parquet_storage.count_bars(interval, symbol, start_date, end_date)
+        except Exception as e:
+            logger.error(f"Error counting historical bars for {symbol} {interval}: {e}")
+            return 0
+    
     def load_historical_bars(
         self,
         symbol: str,
@@ -2152,19 +2267,7 @@ class DataManager:
             logger.warning("SystemManager not available, cannot load historical bars")
             return []
         
-        # Get time_manager for date calculations
-        time_mgr = self.system_manager.get_time_manager()
-        
-        # Calculate date range
-        # For backtest: use backtest dates
-        # For live: use current date
-        if self.system_manager.mode.value == "backtest":
-            end_date = time_mgr.backtest_start_date
-        else:
-            current_time = time_mgr.get_current_time()
-            end_date = current_time.date()
-        
-        start_date = end_date - timedelta(days=days)
+        start_date, end_date = self._historical_date_range(days)
         
         logger.debug(
             f"Loading historical bars: {symbol} {interval} "
@@ -2187,20 +2290,8 @@ class DataManager:
                 )
                 return []
             
-            # Convert DataFrame to BarData objects
-            bars = []
-            for _, row in df.iterrows():
-                bar = BarData(
-                    timestamp=row['timestamp'],
-                    symbol=symbol,
-                    open=float(row['open']),
-                    high=float(row['high']),
-                    low=float(row['low']),
-                    close=float(row['close']),
-                    volume=int(row['volume']),
-                    interval=interval
-                )
-                bars.append(bar)
+            # Bulk column conversion (rows were validated on write)
+            bars = bars_from_frame(df, interval, symbol=symbol)
             
             logger.info(
                 f"Loaded {len(bars)} historical bars for {symbol} {interval} "
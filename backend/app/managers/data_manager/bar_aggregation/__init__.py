@@ -12,6 +12,7 @@ All aggregations share core OHLCV logic with zero code duplication.
 
 from app.managers.data_manager.bar_aggregation.modes import AggregationMode
 from app.managers.data_manager.bar_aggregation.aggregator import BarAggregator
+from app.managers.data_manager.bar_aggregation.incremental import IncrementalBarAggregator
 from app.managers.data_manager.bar_aggregation.mode_detector import (
     detect_aggregation_mode,
     validate_aggregation_params,
@@ -21,6 +22,7 @@ from app.managers.data_manager.bar_aggregation.mode_detector import (
 __all__ = [
     'AggregationMode',
     'BarAggregator',
+    'IncrementalBarAggregator',
     'detect_aggregation_mode',
     'validate_aggregation_params',
     'get_supported_targets',
@@ -0,0 +1,153 @@
+"""Incremental (Streaming) Bar Aggregation
+
+Stateful counterpart to BarAggregator for FIXED_CHUNK mode.
+
+BarAggregator regroups the whole source list on every call, which is
+quadratic over a session when called once per new base bar. The
+IncrementalBarAggregator folds each new base bar into the currently open
+window and emits the derived bar exactly once, when the window completes.
+
+Output is identical to:
+    BarAggregator(src, tgt, None, AggregationMode.FIXED_CHUNK).aggregate(
+        bars, require_complete=True, check_continuity=True
+    )
+for the same chronologically ordered input.
+"""
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.models.trading import BarData
+from app.threads.quality.requirement_analyzer import parse_interval
+
+
+class IncrementalBarAggregator:
+    """O(1)-per-bar FIXED_CHUNK aggregator (1s → 1m, 1m → Nm).
+
+    Window rules mirror group_by_fixed_chunks() + is_complete() + is_continuous():
+    - Window start = timestamp floored to target interval (epoch seconds)
+    - A window is emitted only with exactly chunk_size bars
+    - Every bar in the window must follow the previous one by source interval
+
+    Bars must be fed in chronological order. A bar that does not advance
+    time (duplicate or out-of-order) breaks the open window, just like the
+    batch path would reject the group.
+
+    Example:
+        agg = IncrementalBarAggregator("1m", "5m")
+        for bar in bars_1m:
+            bar_5m = agg.add_bar(bar)
+            if bar_5m:
+                derived.append(bar_5m)
+    """
+
+    def __init__(self, source_interval: str, target_interval: str):
+        """Initialize incremental aggregator.
+
+        Args:
+            source_interval: Source interval ("1s", "1m")
+            target_interval: Target interval ("1m", "5m", "15m", ...)
+
+        Raises:
+            ValueError: If intervals are not a valid FIXED_CHUNK pair
+        """
+        source_info = parse_interval(source_interval)
+        target_info = parse_interval(target_interval)
+
+        if target_interval.endswith('d') or target_interval.endswith('w'):
+            raise ValueError(
+                f"IncrementalBarAggregator supports FIXED_CHUNK targets only, "
+                f"got {target_interval} (use CALENDAR aggregation)"
+            )
+        if target_info.seconds < source_info.seconds or \
+                target_info.seconds % source_info.seconds != 0:
+            raise ValueError(
+                f"Target {target_interval} is not a whole multiple of "
+                f"source {source_interval}"
+            )
+
+        self.source_interval = source_interval
+        self.target_interval = target_interval
+        self.chunk_size = target_info.seconds // source_info.seconds
+
+        self._target_seconds = target_info.seconds
+        self._source_delta = timedelta(seconds=source_info.seconds)
+
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all state (new session or resync)."""
+        self._window_start: Optional[datetime] = None
+        self._symbol: Optional[str] = None
+        self._open = 0.0
+        self._high = 0.0
+        self._low = 0.0
+        self._close = 0.0
+        self._volume = 0
+        self._count = 0
+        self._last_timestamp: Optional[datetime] = None
+        self._broken = False    # Window failed completeness/continuity
+        self._emitted = False   # Window already produced its bar
+
+    def _window_for(self, timestamp: datetime) -> datetime:
+        """Floor timestamp to the target window (same math as group_by_fixed_chunks)."""
+        total_seconds = int(timestamp.timestamp())
+        window_start_seconds = (total_seconds // self._target_seconds) * self._target_seconds
+        return datetime.fromtimestamp(window_start_seconds, tz=timestamp.tzinfo)
+
+    def add_bar(self, bar: BarData) -> Optional[BarData]:
+        """Fold one source bar into the open window.
+
+        Args:
+            bar: Next source bar (chronological order)
+
+        Returns:
+            The completed derived bar when this bar closes its window, else None
+        """
+        window_start = self._window_for(bar.timestamp)
+
+        if window_start != self._window_start:
+            # New window - start fresh accumulation
+            self._window_start = window_start
+            self._symbol = bar.symbol
+            self._open = bar.open
+            self._high = bar.high
+            self._low = bar.low
+            self._close = bar.close
+            self._volume = bar.volume
+            self._count = 1
+            self._last_timestamp = bar.timestamp
+            self._broken = False
+            self._emitted = False
+        else:
+            # Same window - any extra bar after emission, duplicate or gap
+            # makes the batch group incomplete/discontinuous.
+            if self._emitted or self._broken:
+                self._broken = True
+                return None
+
+            if bar.timestamp != self._last_timestamp + self._source_delta:
+                self._broken = True
+                return None
+
+            if bar.high > self._high:
+                self._high = bar.high
+            if bar.low < self._low:
+                self._low = bar.low
+            self._close = bar.close
+            self._volume += bar.volume
+            self._count += 1
+            self._last_timestamp = bar.timestamp
+
+        if self._count == self.chunk_size and not self._broken:
+            self._emitted = True
+            return BarData(
+                symbol=self._symbol,
+                timestamp=self._window_start,
+                open=self._open,
+                high=self._high,
+                low=self._low,
+                close=self._close,
+                volume=self._volume
+            )
+
+        return None
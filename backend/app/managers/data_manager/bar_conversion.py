@@ -0,0 +1,160 @@
+"""Bulk Parquet DataFrame -> Bar Conversion
+
+Parquet reads return a DataFrame; turning it into bars row by row
+(df.iterrows() + a validated BarData per row) dominates historical and
+queue load time at session start.
+
+This module converts whole columns instead:
+    bars_from_frame()     -> List[BarData]  (objects built via model_construct)
+    columnar_from_frame() -> ColumnarBarSeries (no BarData objects at all)
+
+Rows were validated when they were written, so per-row pydantic validation
+is replaced by one vectorized check of the BarData constraints. A frame
+that fails the check (corrupt file, hand-edited data) falls back to
+validated per-row construction so callers see the same ValidationError
+they always did.
+"""
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.models.trading import BarData
+from app.managers.data_manager.columnar_bars import ColumnarBarSeries
+
+
+PRICE_COLUMNS = ("open", "high", "low", "close")
+
+
+def _float_column(df: pd.DataFrame, name: str) -> np.ndarray:
+    return df[name].to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _columns_valid(prices: List[np.ndarray], volume: np.ndarray) -> bool:
+    """Vectorized equivalent of BarData's field constraints (gt=0 / ge=0)."""
+    # NaN compares False, so NaNs fail these checks too
+    return all(bool(np.all(column > 0)) for column in prices) and bool(np.all(volume >= 0))
+
+
+def _timestamp_column(df: pd.DataFrame) -> pd.Series:
+    timestamps = df["timestamp"]
+    if not pd.api.types.is_datetime64_any_dtype(timestamps):
+        timestamps = pd.to_datetime(timestamps)
+    return timestamps
+
+
+def _validated_bars(df: pd.DataFrame, interval: str, symbol: Optional[str]) -> List[BarData]:
+    """Per-row validated construction (fallback for frames failing the bulk check)."""
+    symbols = df["symbol"].tolist() if symbol is None else [symbol] * len(df)
+    return [
+        BarData(
+            symbol=row_symbol,
+            timestamp=timestamp,
+            interval=interval,
+            open=open_,
+            high=high,
+            low=low,
+            close=close,
+            volume=volume
+        )
+        for row_symbol, timestamp, open_, high, low, close, volume in zip(
+            symbols,
+            df["timestamp"].tolist(),
+            *(df[name].tolist() for name in PRICE_COLUMNS),
+            df["volume"].tolist()
+        )
+    ]
+
+
+def bars_from_frame(
+    df: pd.DataFrame,
+    interval: str,
+    symbol: Optional[str] = None
+) -> List[BarData]:
+    """Convert a parquet bar DataFrame to BarData objects in bulk.
+
+    Args:
+        df: Frame with timestamp/open/high/low/close/volume (+ symbol) columns
+        interval: Interval of the bars
+        symbol: Symbol of every row (default: the frame's 'symbol' column)
+
+    Returns:
+        BarData list in frame order
+
+    Raises:
+        pydantic.ValidationError: If a row violates BarData constraints
+    """
+    if df.empty:
+        return []
+
+    prices = [_float_column(df, name) for name in PRICE_COLUMNS]
+    volume = _float_column(df, "volume")
+    if not _columns_valid(prices, volume):
+        return _validated_bars(df, interval, symbol)
+
+    timestamps = _timestamp_column(df).array.to_pydatetime().tolist()
+    symbols = df["symbol"].tolist() if symbol is None else [symbol] * len(df)
+
+    construct = BarData.model_construct
+    return [
+        construct(
+            timestamp=timestamp,
+            symbol=row_symbol,
+            interval=interval,
+            open=open_,
+            high=high,
+            low=low,
+            close=close,
+            volume=row_volume
+        )
+        for timestamp, row_symbol, open_, high, low, close, row_volume in zip(
+            timestamps,
+            symbols,
+            *(column.tolist() for column in prices),
+            volume.tolist()
+        )
+    ]
+
+
+def columnar_from_frame(
+    df: pd.DataFrame,
+    interval: str,
+    symbol: str,
+    max_bars: Optional[int] = None
+) -> ColumnarBarSeries:
+    """Convert a single-symbol parquet bar DataFrame to a ColumnarBarSeries.
+
+    Column arrays are copied straight into the series; no BarData objects
+    are created.
+
+    Args:
+        df: Frame with timestamp/open/high/low/close/volume columns
+        interval: Interval of the bars
+        symbol: Symbol of the bars
+        max_bars: Keep at most this many (latest) bars
+
+    Returns:
+        ColumnarBarSeries (empty if the frame is empty)
+
+    Raises:
+        ValueError: If a row violates BarData constraints
+    """
+    if df.empty:
+        return ColumnarBarSeries(max_bars=max_bars)
+
+    prices = [_float_column(df, name) for name in PRICE_COLUMNS]
+    volume = _float_column(df, "volume")
+    if not _columns_valid(prices, volume):
+        raise ValueError(f"Invalid OHLCV values in {symbol} {interval} bars")
+
+    timestamps = _timestamp_column(df)
+
+    return ColumnarBarSeries.from_arrays(
+        symbol,
+        interval,
+        timestamps.dt.as_unit("ns").array.asi8,
+        *prices,
+        volume,
+        tz=timestamps.dt.tz,
+        max_bars=max_bars
+    )
@@ -0,0 +1,112 @@
+"""Timestamp Queries on Bar Containers
+
+Range, since and last-N lookups over the containers SessionData keeps
+bars in (deque for the base interval, list for derived intervals,
+ColumnarBarSeries, snapshot views). Bars are kept in timestamp order, so
+lookups binary-search instead of filtering every bar, and results are
+copied at the size of the result, not of the session.
+
+Cost with n bars in the container and k bars returned:
+- ColumnarBarSeries: np.searchsorted on the timestamp column, O(log n + k)
+- list / snapshot views: bisect, O(log n + k)
+- deque: the search gallops back from the newest bar, so queries anchored
+  near the tail (since, last-N - what strategies ask for) touch O(log k)
+  bars and cost O(log k + k); a range deep in the past additionally walks
+  from the nearer end of the deque to the range.
+"""
+from collections import deque
+from datetime import datetime
+from itertools import islice
+from typing import List, Optional, Sequence
+
+from app.managers.data_manager.columnar_bars import ColumnarBarSeries
+from app.models.trading import BarData
+
+
+def bisect_timestamp(bars: Sequence[BarData], timestamp: datetime, right: bool = False) -> int:
+    """Index of the first bar at/after timestamp in a timestamp-ordered container.
+
+    Args:
+        bars: Bars in timestamp order
+        timestamp: Timestamp to search for
+        right: If True, first bar strictly after timestamp
+
+    Returns:
+        Insertion index in [0, len(bars)]
+    """
+    if isinstance(bars, ColumnarBarSeries):
+        return bars.index_after(timestamp) if right else bars.index_since(timestamp)
+
+    def before(bar: BarData) -> bool:
+        return bar.timestamp <= timestamp if right else bar.timestamp < timestamp
+
+    # Gallop back from the newest bar: the answer is in [lo, hi]
+    size = len(bars)
+    hi = size
+    step = 1
+    lo = size - step
+    while lo > 0 and not before(bars[lo]):
+        hi = lo
+        step *= 2
+        lo = size - step
+    lo = max(lo, 0)
+
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if before(bars[mid]):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def slice_bars(bars: Sequence[BarData], start: int, stop: int) -> List[BarData]:
+    """Copy bars[start:stop] into a list, touching only what is needed."""
+    if stop <= start:
+        return []
+    if not isinstance(bars, deque):
+        return list(bars[start:stop])
+
+    # deque has no slicing: walk in from the nearer end
+    size = len(bars)
+    if size - stop < start:
+        result = list(islice(reversed(bars), size - stop, size - start))
+        result.reverse()
+        return result
+    return list(islice(bars, start, stop))
+
+
+def bars_between(
+    bars: Sequence[BarData],
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+) -> List[BarData]:
+    """Bars with start <= timestamp <= end (either bound optional)."""
+    if isinstance(bars, ColumnarBarSeries):
+        return bars.between(start, end)
+
+    lo = bisect_timestamp(bars, start) if start is not None else 0
+    hi = bisect_timestamp(bars, end, right=True) if end is not None else len(bars)
+    return slice_bars(bars, lo, hi)
+
+
+def bars_since(bars: Sequence[BarData], timestamp: datetime) -> List[BarData]:
+    """Bars with timestamp >= timestamp."""
+    return bars_between(bars, start=timestamp)
+
+
+def last_n_bars(bars: Sequence[BarData], n: int) -> List[BarData]:
+    """The newest n bars (oldest to newest)."""
+    if n <= 0:
+        return []
+    size = len(bars)
+    return slice_bars(bars, max(size - n, 0), size)
+
+
+__all__ = [
+    'bisect_timestamp',
+    'slice_bars',
+    'bars_between',
+    'bars_since',
+    'last_n_bars',
+]
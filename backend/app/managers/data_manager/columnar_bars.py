@@ -0,0 +1,430 @@
+"""Columnar Bar Storage
+
+Opt-in backing store for BarIntervalData.data (session_data_config.columnar_bars).
+
+Instead of one pydantic BarData object per bar inside a deque/list, bars
+are stored in preallocated NumPy columns with an append cursor:
+    timestamp  int64   (ns since epoch; UTC for tz-aware bars)
+    open/high/low/close/volume  float64
+
+~48 bytes per bar instead of a full Python object, and consumers that
+want numbers (vectorized indicators, scanners, quality checks) can use
+zero-copy array views.
+
+Existing callers keep working: ColumnarBarSeries behaves like a read-mostly
+sequence of BarData (len, iteration, indexing, slicing, append, extend,
+clear). BarData objects are materialized lazily on access.
+"""
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from app.models.trading import BarData
+
+
+DEFAULT_CAPACITY = 512
+
+COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def datetime_to_ns(timestamp: datetime) -> int:
+    """Convert datetime to int64 nanoseconds since epoch (exact).
+
+    Naive datetimes are stored as wall-clock time, aware ones as UTC.
+    """
+    if timestamp.tzinfo is None:
+        delta = timestamp - _EPOCH_NAIVE
+    else:
+        delta = timestamp - _EPOCH_UTC
+    return (delta.days * 86400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1000
+
+
+def ns_to_datetime(ns: int, tz: Optional[tzinfo]) -> datetime:
+    """Inverse of datetime_to_ns()."""
+    if tz is None:
+        return _EPOCH_NAIVE + timedelta(microseconds=int(ns) // 1000)
+    return (_EPOCH_UTC + timedelta(microseconds=int(ns) // 1000)).astimezone(tz)
+
+
+class ColumnarBarSeries:
+    """Columnar (NumPy) bar series for one (symbol, interval).
+
+    Storage grows by doubling. With max_bars set it becomes a ring buffer:
+    the oldest bars are dropped once max_bars is exceeded, like
+    deque(maxlen=max_bars). Live bars are always one contiguous slice of
+    the columns, so array views never need copying.
+
+    Not thread-safe on its own - callers hold the SessionData symbol lock, exactly
+    as for the deque/list containers it replaces.
+
+    Example:
+        series = ColumnarBarSeries(bars)
+        closes = series.closes          # np.ndarray view (read-only)
+        last = series[-1]               # BarData (materialized on access)
+    """
+
+    def __init__(
+        self,
+        bars: Optional[Iterable[BarData]] = None,
+        capacity: int = DEFAULT_CAPACITY,
+        max_bars: Optional[int] = None
+    ):
+        """Initialize series.
+
+        Args:
+            bars: Initial bars (chronological)
+            capacity: Initial number of preallocated rows
+            max_bars: Keep at most this many bars (ring buffer), None = unbounded
+        """
+        if max_bars is not None and max_bars <= 0:
+            raise ValueError(f"max_bars must be > 0, got {max_bars}")
+
+        self.max_bars = max_bars
+        if max_bars is not None:
+            # 2x headroom: compaction happens once every max_bars appends
+            capacity = 2 * max_bars
+
+        self._capacity = max(1, capacity)
+        self._timestamp = np.empty(self._capacity, dtype=np.int64)
+        self._ohlcv = np.empty((5, self._capacity), dtype=np.float64)
+        self._start = 0
+        self._end = 0
+
+        # Per-series constants (taken from first bar)
+        self.symbol: Optional[str] = None
+        self.interval: Optional[str] = None
+        self._tz: Optional[tzinfo] = None
+        self._tz_aware: Optional[bool] = None
+
+        self._sorted = True
+        self._tail: Optional[BarData] = None  # Last appended object (hot path)
+        self._frozen_views = False  # snapshot() handed out views of the arrays
+
+        if bars is not None:
+            self.extend(bars)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        symbol: str,
+        interval: str,
+        timestamps: np.ndarray,
+        opens: np.ndarray,
+        highs: np.ndarray,
+        lows: np.ndarray,
+        closes: np.ndarray,
+        volumes: np.ndarray,
+        tz: Optional[tzinfo] = None,
+        max_bars: Optional[int] = None
+    ) -> "ColumnarBarSeries":
+        """Build a series straight from column arrays (no BarData objects).
+
+        Args:
+            symbol: Symbol of every row
+            interval: Interval of every row
+            timestamps: int64 ns since epoch (UTC if tz is set, else wall clock)
+            opens, highs, lows, closes, volumes: Float columns, same length
+            tz: Timezone of materialized timestamps (None = naive)
+            max_bars: Keep at most this many bars (ring buffer)
+
+        Returns:
+            New ColumnarBarSeries
+        """
+        size = len(timestamps)
+        if max_bars is not None and size > max_bars:
+            start = size - max_bars
+            timestamps = timestamps[start:]
+            opens, highs, lows, closes, volumes = (
+                column[start:] for column in (opens, highs, lows, closes, volumes)
+            )
+            size = max_bars
+
+        series = cls(capacity=max(size, DEFAULT_CAPACITY), max_bars=max_bars)
+        series.symbol = symbol
+        series.interval = interval
+        series._tz = tz
+        series._tz_aware = tz is not None
+
+        series._timestamp[:size] = timestamps
+        for row, column in enumerate((opens, highs, lows, closes, volumes)):
+            series._ohlcv[row, :size] = column
+        series._end = size
+        series._sorted = bool(size < 2 or np.all(np.diff(series._timestamp[:size]) >= 0))
+        return series
+
+    # =========================================================================
+    # Mutation
+    # =========================================================================
+
+    def append(self, bar: BarData) -> None:
+        """Append one bar."""
+        if self._tz_aware is None:
+            self.symbol = bar.symbol
+            self.interval = bar.interval
+            self._tz = bar.timestamp.tzinfo
+            self._tz_aware = self._tz is not None
+        elif (bar.timestamp.tzinfo is not None) != self._tz_aware:
+            raise ValueError(
+                f"Cannot mix naive and tz-aware timestamps in one series "
+                f"({self.symbol} {self.interval})"
+            )
+        elif bar.symbol != self.symbol or bar.interval != self.interval:
+            raise ValueError(
+                f"Bar {bar.symbol} {bar.interval} does not belong to series "
+                f"{self.symbol} {self.interval}"
+            )
+
+        if self._end == self._capacity:
+            self._make_room()
+
+        ts_ns = datetime_to_ns(bar.timestamp)
+        if self._end > self._start and ts_ns < self._timestamp[self._end - 1]:
+            self._sorted = False
+
+        i = self._end
+        self._timestamp[i] = ts_ns
+        ohlcv = self._ohlcv
+        ohlcv[0, i] = bar.open
+        ohlcv[1, i] = bar.high
+        ohlcv[2, i] = bar.low
+        ohlcv[3, i] = bar.close
+        ohlcv[4, i] = bar.volume
+        self._end += 1
+
+        if self.max_bars is not None and self._end - self._start > self.max_bars:
+            self._start += 1
+
+        self._tail = bar
+
+    def extend(self, bars: Iterable[BarData]) -> None:
+        """Append bars in order."""
+        for bar in bars:
+            self.append(bar)
+
+    def clear(self) -> None:
+        """Remove all bars (keeps allocated capacity)."""
+        if self._frozen_views:
+            # Copy-on-write: snapshots keep the old rows
+            self._timestamp = np.empty(self._capacity, dtype=np.int64)
+            self._ohlcv = np.empty((5, self._capacity), dtype=np.float64)
+            self._frozen_views = False
+        self._start = 0
+        self._end = 0
+        self._sorted = True
+        self._tail = None
+
+    def replace(self, bars: Iterable[BarData]) -> None:
+        """Replace contents in place (e.g. after sorted gap-fill insertion)."""
+        self.clear()
+        self.extend(bars)
+
+    def _make_room(self) -> None:
+        """Compact (ring buffer) or grow (unbounded) when the cursor hits the end."""
+        size = self._end - self._start
+
+        if self.max_bars is not None and not self._frozen_views:
+            # Ring buffer: slide live rows to the front
+            self._timestamp[:size] = self._timestamp[self._start:self._end]
+            self._ohlcv[:, :size] = self._ohlcv[:, self._start:self._end]
+        else:
+            # Grow (or, for a ring buffer with snapshots, copy-on-write)
+            if self.max_bars is None:
+                self._capacity *= 2
+            timestamp = np.empty(self._capacity, dtype=np.int64)
+            ohlcv = np.empty((5, self._capacity), dtype=np.float64)
+            timestamp[:size] = self._timestamp[self._start:self._end]
+            ohlcv[:, :size] = self._ohlcv[:, self._start:self._end]
+            self._timestamp = timestamp
+            self._ohlcv = ohlcv
+            self._frozen_views = False
+
+        self._start = 0
+        self._end = size
+
+    def snapshot(self) -> "FrozenBarSeries":
+        """Read-only view of the current bars that later writes never change.
+
+        No copy: the view shares the column arrays. Appends only write past
+        its rows; clear() and ring compaction move to fresh arrays first.
+        """
+        self._frozen_views = True
+        return FrozenBarSeries.over(self)
+
+    # =========================================================================
+    # Zero-copy column views
+    # =========================================================================
+
+    def _view(self, column: np.ndarray) -> np.ndarray:
+        view = column[self._start:self._end]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """int64 ns since epoch (UTC if tz-aware)."""
+        return self._view(self._timestamp)
+
+    @property
+    def opens(self) -> np.ndarray:
+        return self._view(self._ohlcv[0])
+
+    @property
+    def highs(self) -> np.ndarray:
+        return self._view(self._ohlcv[1])
+
+    @property
+    def lows(self) -> np.ndarray:
+        return self._view(self._ohlcv[2])
+
+    @property
+    def closes(self) -> np.ndarray:
+        return self._view(self._ohlcv[3])
+
+    @property
+    def volumes(self) -> np.ndarray:
+        return self._view(self._ohlcv[4])
+
+    def arrays(self) -> Dict[str, np.ndarray]:
+        """All columns as read-only views keyed by COLUMNS names."""
+        return {
+            "timestamp": self.timestamps,
+            "open": self.opens,
+            "high": self.highs,
+            "low": self.lows,
+            "close": self.closes,
+            "volume": self.volumes,
+        }
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated for column storage."""
+        return self._timestamp.nbytes + self._ohlcv.nbytes
+
+    # =========================================================================
+    # Sequence interface (lazy BarData view)
+    # =========================================================================
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __iter__(self) -> Iterator[BarData]:
+        for i in range(self._start, self._end):
+            yield self._materialize(i)
+
+    def __reversed__(self) -> Iterator[BarData]:
+        for i in range(self._end - 1, self._start - 1, -1):
+            yield self._materialize(i)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[BarData, List[BarData]]:
+        size = self._end - self._start
+
+        if isinstance(index, slice):
+            start, stop, step = index.indices(size)
+            return [self._materialize(self._start + i) for i in range(start, stop, step)]
+
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("ColumnarBarSeries index out of range")
+
+        if index == size - 1 and self._tail is not None:
+            return self._tail
+        return self._materialize(self._start + index)
+
+    def __repr__(self) -> str:
+        return (
+            f"ColumnarBarSeries({self.symbol} {self.interval}, "
+            f"{len(self)} bars, capacity={self._capacity})"
+        )
+
+    def _materialize(self, row: int) -> BarData:
+        """Build a BarData for a physical row (no validation - data came from BarData)."""
+        ohlcv = self._ohlcv
+        return BarData.model_construct(
+            timestamp=ns_to_datetime(self._timestamp[row], self._tz),
+            symbol=self.symbol,
+            interval=self.interval,
+            open=float(ohlcv[0, row]),
+            high=float(ohlcv[1, row]),
+            low=float(ohlcv[2, row]),
+            close=float(ohlcv[3, row]),
+            volume=float(ohlcv[4, row])
+        )
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def last_n(self, n: int) -> List[BarData]:
+        """Last n bars (oldest to newest)."""
+        if n <= 0:
+            return []
+        return self[-n:]
+
+    def index_since(self, timestamp: datetime) -> int:
+        """Logical index of the first bar with timestamp >= given timestamp."""
+        ts_ns = datetime_to_ns(timestamp)
+        timestamps = self._timestamp[self._start:self._end]
+
+        if self._sorted:
+            return int(np.searchsorted(timestamps, ts_ns, side="left"))
+
+        matches = np.nonzero(timestamps >= ts_ns)[0]
+        return int(matches[0]) if len(matches) else len(timestamps)
+
+    def index_after(self, timestamp: datetime) -> int:
+        """Logical index of the first bar with timestamp > given timestamp."""
+        ts_ns = datetime_to_ns(timestamp)
+        timestamps = self._timestamp[self._start:self._end]
+
+        if self._sorted:
+            return int(np.searchsorted(timestamps, ts_ns, side="right"))
+
+        matches = np.nonzero(timestamps > ts_ns)[0]
+        return int(matches[0]) if len(matches) else len(timestamps)
+
+    def since(self, timestamp: datetime) -> List[BarData]:
+        """All bars with timestamp >= given timestamp."""
+        return self.between(start=timestamp)
+
+    def between(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> List[BarData]:
+        """All bars with start <= timestamp <= end (either bound optional)."""
+        if self._sorted:
+            lo = self.index_since(start) if start is not None else 0
+            hi = self.index_after(end) if end is not None else len(self)
+            return self[lo:hi]
+
+        timestamps = self._timestamp[self._start:self._end]
+        mask = np.ones(len(timestamps), dtype=bool)
+        if start is not None:
+            mask &= timestamps >= datetime_to_ns(start)
+        if end is not None:
+            mask &= timestamps <= datetime_to_ns(end)
+        return [self._materialize(self._start + int(i)) for i in np.nonzero(mask)[0]]
+
+
+class FrozenBarSeries(ColumnarBarSeries):
+    """Read-only ColumnarBarSeries fixed at the rows of a snapshot()."""
+
+    @classmethod
+    def over(cls, series: ColumnarBarSeries) -> "FrozenBarSeries":
+        frozen = cls.__new__(cls)
+        frozen.__dict__.update(series.__dict__)
+        frozen._frozen_views = True
+        return frozen
+
+    def snapshot(self) -> "FrozenBarSeries":
+        return self
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("FrozenBarSeries is read-only (SessionData snapshot)")
+
+    append = extend = clear = replace = _read_only
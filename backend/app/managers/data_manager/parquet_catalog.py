@@ -0,0 +1,430 @@
+"""Parquet Dataset Catalog
+
+Metadata-only index of the parquet tree for one exchange group, stored in
+SQLite next to the data:
+
+  data/parquet/<exchange_group>/
+    ├── catalog.sqlite    <- this catalog
+    ├── bars/...
+    └── quotes/...
+
+One row per parquet file: data type (interval or 'quotes'), symbol, row
+count, min/max timestamp, covered exchange-timezone dates and size. Row
+counts and timestamps come from the parquet footer (row-group statistics),
+so cataloging a file never reads its data pages.
+
+Maintenance:
+- ParquetStorage.write_bars()/write_quotes() record every file they write
+  in one transaction.
+- The first query against a fresh catalog builds it from footers.
+- A (data_type, symbol) the catalog has never seen (files written outside
+  ParquetStorage, e.g. test fixtures) is scanned and cataloged on first
+  lookup.
+- Delta files from appends (see ParquetStorage.write_bars) are cataloged
+  as files of their own and removed by remove_files() once compacted.
+  count_rows() reads timestamps of files with deltas to count overwritten
+  rows once.
+- Deleting data must call invalidate(); rebuild() recovers from anything else.
+"""
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import date, datetime, time as time_type
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from app.logger import logger
+
+
+CATALOG_FILENAME = "catalog.sqlite"
+
+# Canonical files and their append delta files (<DAY>.parquet.delta-NNNNNN)
+FILE_PATTERN = "*.parquet*"
+DELTA_INFIX = ".delta-"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    data_type TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    row_count INTEGER NOT NULL,
+    min_ns INTEGER,
+    max_ns INTEGER,
+    tz TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    size_bytes INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_by_symbol ON files (data_type, symbol, start_date);
+CREATE TABLE IF NOT EXISTS scanned (
+    data_type TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    PRIMARY KEY (data_type, symbol)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+_NS_PER_UNIT = {"s": 1_000_000_000, "ms": 1_000_000, "us": 1_000, "ns": 1}
+
+
+def _ns_to_timestamp(ns: int, tz: Optional[str]) -> pd.Timestamp:
+    """Catalog nanoseconds -> Timestamp in the file's timezone."""
+    if tz is None:
+        return pd.Timestamp(ns)
+    return pd.Timestamp(ns, tz="UTC").tz_convert(tz)
+
+
+def _footer_timestamp_range(metadata, factor: int) -> Tuple[Optional[int], Optional[int]]:
+    """Timestamp min/max (ns) from row-group statistics, (None, None) if incomplete."""
+    minimum = maximum = None
+    for group in range(metadata.num_row_groups):
+        row_group = metadata.row_group(group)
+        chunks = [
+            row_group.column(position)
+            for position in range(row_group.num_columns)
+            if row_group.column(position).path_in_schema == "timestamp"
+        ]
+        if not chunks or chunks[0].statistics is None or not chunks[0].statistics.has_min_max:
+            return None, None
+        low = chunks[0].statistics.min_raw * factor
+        high = chunks[0].statistics.max_raw * factor
+        minimum = low if minimum is None else min(minimum, low)
+        maximum = high if maximum is None else max(maximum, high)
+    return minimum, maximum
+
+
+def read_file_stats(path: Path) -> Dict:
+    """Read row count and timestamp range of a parquet file from its footer.
+
+    Falls back to reading only the timestamp column when the footer has no
+    min/max statistics.
+
+    Args:
+        path: Parquet file
+
+    Returns:
+        Dict with row_count, min_ns, max_ns (UTC ns, wall-clock ns if naive),
+        tz, start_date, end_date (ISO, in file timezone) and size_bytes
+    """
+    parquet_file = pq.ParquetFile(path)
+    metadata = parquet_file.metadata
+    stats = {
+        "row_count": metadata.num_rows,
+        "min_ns": None,
+        "max_ns": None,
+        "tz": None,
+        "start_date": None,
+        "end_date": None,
+        "size_bytes": path.stat().st_size,
+    }
+
+    schema = parquet_file.schema_arrow
+    index = schema.get_field_index("timestamp")
+    if metadata.num_rows == 0 or index < 0 or not pa.types.is_timestamp(schema.field(index).type):
+        return stats
+
+    ts_type = schema.field(index).type
+    stats["tz"] = ts_type.tz
+
+    try:
+        minimum, maximum = _footer_timestamp_range(metadata, _NS_PER_UNIT[ts_type.unit])
+    except Exception:
+        minimum = maximum = None
+
+    if minimum is None:
+        timestamps = pq.read_table(path, columns=["timestamp"]).column(0)
+        values = timestamps.cast(pa.timestamp("ns", tz=ts_type.tz)).to_numpy().astype("int64")
+        minimum, maximum = int(values.min()), int(values.max())
+
+    stats["min_ns"] = int(minimum)
+    stats["max_ns"] = int(maximum)
+    stats["start_date"] = _ns_to_timestamp(minimum, ts_type.tz).date().isoformat()
+    stats["end_date"] = _ns_to_timestamp(maximum, ts_type.tz).date().isoformat()
+    return stats
+
+
+class ParquetCatalog:
+    """SQLite catalog of the parquet files of one exchange group.
+
+    Thread-safe: every operation uses its own connection, writes are
+    serialized by a lock and committed as one transaction.
+    """
+
+    def __init__(self, root: Path):
+        """Initialize catalog.
+
+        Args:
+            root: Exchange group directory (data/parquet/<exchange_group>)
+        """
+        self.root = Path(root)
+        self.db_path = self.root / CATALOG_FILENAME
+        self._lock = threading.Lock()
+        self._initialized = False
+        self._built = False
+
+    # =========================================================================
+    # Connection / Bootstrap
+    # =========================================================================
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.root.mkdir(parents=True, exist_ok=True)
+            with closing(sqlite3.connect(self.db_path)) as conn:
+                conn.executescript(_SCHEMA)
+            self._initialized = True
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _ensure_built(self) -> None:
+        """Build the catalog from footers the first time it is queried."""
+        if self._built:
+            return
+        with closing(self._connect()) as conn:
+            built = conn.execute("SELECT value FROM meta WHERE key = 'built'").fetchone()
+        if built is None:
+            self.rebuild()
+        self._built = True
+
+    def _symbol_dir(self, data_type: str, symbol: str) -> Path:
+        if data_type == "quotes":
+            return self.root / "quotes" / symbol
+        return self.root / "bars" / data_type / symbol
+
+    def _ensure_scanned(self, data_type: str, symbol: str) -> None:
+        """Catalog a (data_type, symbol) directory the catalog has never seen."""
+        self._ensure_built()
+        with closing(self._connect()) as conn:
+            seen = conn.execute(
+                "SELECT 1 FROM scanned WHERE data_type = ? AND symbol = ?",
+                (data_type, symbol)
+            ).fetchone()
+        if seen is not None:
+            return
+
+        symbol_dir = self._symbol_dir(data_type, symbol)
+        if not symbol_dir.is_dir():
+            return
+
+        logger.debug(f"[CATALOG] Scanning uncataloged {data_type} {symbol}")
+        self.record_files(data_type, symbol, sorted(symbol_dir.rglob(FILE_PATTERN)))
+
+    # =========================================================================
+    # Maintenance
+    # =========================================================================
+
+    def record_files(self, data_type: str, symbol: str, paths: Iterable[Path]) -> None:
+        """Record (or refresh) files in one transaction.
+
+        Args:
+            data_type: Interval string or 'quotes'
+            symbol: Symbol (upper case)
+            paths: Parquet files just written
+        """
+        rows = []
+        for path in paths:
+            try:
+                stats = read_file_stats(Path(path))
+            except Exception as e:
+                logger.error(f"[CATALOG] Cannot read footer of {path}: {e}")
+                continue
+            rows.append((
+                str(Path(path).resolve().relative_to(self.root.resolve())),
+                data_type, symbol,
+                stats["row_count"], stats["min_ns"], stats["max_ns"], stats["tz"],
+                stats["start_date"], stats["end_date"], stats["size_bytes"],
+            ))
+
+        with self._lock, closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            conn.execute(
+                "INSERT OR IGNORE INTO scanned VALUES (?, ?)",
+                (data_type, symbol)
+            )
+
+    def remove_files(self, paths: Iterable[Path]) -> None:
+        """Forget files that were deleted (e.g. compacted delta files)."""
+        root = self.root.resolve()
+        keys = [(str(Path(path).resolve().relative_to(root)),) for path in paths]
+        with self._lock, closing(self._connect()) as conn, conn:
+            conn.executemany("DELETE FROM files WHERE path = ?", keys)
+
+    def invalidate(self, data_type: str, symbol: str) -> None:
+        """Forget a (data_type, symbol); it is rescanned on next lookup.
+
+        Call after deleting files outside write_bars()/write_quotes().
+        """
+        with self._lock, closing(self._connect()) as conn, conn:
+            conn.execute(
+                "DELETE FROM files WHERE data_type = ? AND symbol = ?",
+                (data_type, symbol)
+            )
+            conn.execute(
+                "DELETE FROM scanned WHERE data_type = ? AND symbol = ?",
+                (data_type, symbol)
+            )
+
+    def rebuild(self) -> int:
+        """Rebuild the whole catalog from parquet footers.
+
+        Returns:
+            Number of files cataloged
+        """
+        targets: List[Tuple[str, str, Path]] = []
+        bars_dir = self.root / "bars"
+        if bars_dir.is_dir():
+            for interval_dir in sorted(bars_dir.iterdir()):
+                if interval_dir.is_dir():
+                    for symbol_dir in sorted(interval_dir.iterdir()):
+                        if symbol_dir.is_dir():
+                            targets.append((interval_dir.name, symbol_dir.name, symbol_dir))
+        quotes_dir = self.root / "quotes"
+        if quotes_dir.is_dir():
+            for symbol_dir in sorted(quotes_dir.iterdir()):
+                if symbol_dir.is_dir():
+                    targets.append(("quotes", symbol_dir.name, symbol_dir))
+
+        with self._lock, closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM files")
+            conn.execute("DELETE FROM scanned")
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('built', ?)", (datetime.now().isoformat(),))
+
+        count = 0
+        for data_type, symbol, symbol_dir in targets:
+            paths = sorted(symbol_dir.rglob(FILE_PATTERN))
+            self.record_files(data_type, symbol, paths)
+            count += len(paths)
+
+        logger.info(f"[CATALOG] Rebuilt {self.db_path}: {count} files")
+        return count
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def get_symbols(self, data_type: str) -> List[str]:
+        """Symbols with at least one cataloged file for data_type."""
+        self._ensure_built()
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT symbol FROM files WHERE data_type = ? AND row_count > 0 "
+                "ORDER BY symbol",
+                (data_type,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def get_data_types(self, symbol: str) -> List[str]:
+        """Intervals (and 'quotes') with at least one cataloged file for symbol."""
+        self._ensure_built()
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT data_type FROM files WHERE symbol = ? AND row_count > 0 "
+                "ORDER BY data_type",
+                (symbol,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def get_date_range(
+        self,
+        data_type: str,
+        symbol: str
+    ) -> Tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]:
+        """Earliest and latest timestamp for (data_type, symbol).
+
+        Returns:
+            (min, max) in the stored timezone, or (None, None) if no data
+        """
+        self._ensure_scanned(data_type, symbol)
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT MIN(min_ns), MAX(max_ns), MAX(tz) FROM files "
+                "WHERE data_type = ? AND symbol = ? AND row_count > 0",
+                (data_type, symbol)
+            ).fetchone()
+        if row is None or row[0] is None:
+            return None, None
+        return _ns_to_timestamp(row[0], row[2]), _ns_to_timestamp(row[1], row[2])
+
+    def count_rows(
+        self,
+        data_type: str,
+        symbol: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> int:
+        """Count rows with timestamps on [start_date, end_date] (file timezone days).
+
+        Files entirely inside the range are counted from the catalog; only
+        files straddling a range boundary (e.g. yearly 1d files) or with
+        pending delta files have their timestamp column read.
+
+        Args:
+            data_type: Interval string or 'quotes'
+            symbol: Symbol (upper case)
+            start_date: First day (inclusive), None = unbounded
+            end_date: Last day (inclusive), None = unbounded
+
+        Returns:
+            Row count
+        """
+        self._ensure_scanned(data_type, symbol)
+
+        start_key = start_date.isoformat() if start_date is not None else "0000-01-01"
+        end_key = end_date.isoformat() if end_date is not None else "9999-12-31"
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT path, row_count, start_date, end_date, tz FROM files "
+                "WHERE data_type = ? AND symbol = ? AND row_count > 0 "
+                "AND end_date >= ? AND start_date <= ?",
+                (data_type, symbol, start_key, end_key)
+            ).fetchall()
+
+        # Group delta files with their canonical file
+        groups: Dict[str, List[Tuple]] = {}
+        for row in rows:
+            groups.setdefault(row[0].split(DELTA_INFIX)[0], []).append(row)
+
+        total = 0
+        for members in groups.values():
+            if len(members) == 1:
+                path, row_count, file_start, file_end, tz = members[0]
+                if file_start >= start_key and file_end <= end_key:
+                    total += row_count
+                    continue
+            # Straddles the range, or has deltas that may overwrite rows
+            paths = [self.root / member[0] for member in members]
+            total += self._count_partial(paths, members[0][4], start_date, end_date)
+        return total
+
+    @staticmethod
+    def _count_partial(
+        paths: List[Path],
+        tz: Optional[str],
+        start_date: Optional[date],
+        end_date: Optional[date]
+    ) -> int:
+        """Count distinct rows of a file (and its deltas) inside the day range.
+
+        Reads the timestamp column only.
+        """
+        timestamps = pd.concat(
+            [pq.read_table(path, columns=["timestamp"]).column(0).to_pandas() for path in paths],
+            ignore_index=True
+        )
+        if len(paths) > 1:
+            timestamps = timestamps.drop_duplicates()
+        mask = pd.Series(True, index=timestamps.index)
+        if start_date is not None:
+            mask &= timestamps >= pd.Timestamp(datetime.combine(start_date, time_type.min), tz=tz)
+        if end_date is not None:
+            mask &= timestamps <= pd.Timestamp(datetime.combine(end_date, time_type.max), tz=tz)
+        return int(mask.sum())
@@ -4,6 +4,8 @@ Handles storage and retrieval of market data in Parquet format.
 
 Unified Structure (multi-exchange support + ANY interval):
   data/parquet/<exchange_group>/
+    ├── catalog.sqlite                                         (file metadata, see parquet_catalog)
+    ├── .../<DAY>.parquet.delta-NNNNNN                         (appended batches, until compacted)
     ├── bars/<interval>/<SYMBOL>/<YEAR>/<MONTH>/<DAY>.parquet  (daily files for 1s, 1m)
     ├── bars/<interval>/<SYMBOL>/<YEAR>.parquet                (yearly files for 1d, 1w)
     └── quotes/<SYMBOL>/<YEAR>/<MONTH>/<DAY>.parquet           (daily files)
@@ -35,14 +37,19 @@ TIMEZONE ARCHITECTURE:
 - NO conversion on read/write - data stored and returned as-is
 - Rest of system works exclusively in exchange timezone
 """
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 from datetime import datetime, date, timezone, time as time_type, timedelta
 from collections import defaultdict
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 
 from app.config import settings
@@ -52,6 +59,15 @@ from app.managers.data_manager.symbol_exchange_mapping import (
     register_symbol
 )
 from app.managers.data_manager.interval_storage import IntervalStorageStrategy
+from app.managers.data_manager.parquet_catalog import DELTA_INFIX, ParquetCatalog
+from app.managers.data_manager.columnar_bars import datetime_to_ns
+
+
+# Delta files (<DAY>.parquet.delta-000001) per file before compaction
+DEFAULT_MAX_DELTA_FILES = 32
+
+# Reader threads for read_bars_multi()
+DEFAULT_READ_WORKERS = 16
 
 
 class ParquetStorage:
@@ -70,8 +86,31 @@ class ParquetStorage:
         # Initialize unified storage strategy
         self.storage_strategy = IntervalStorageStrategy(self.base_path, exchange_group)
         
+        # Metadata catalog (lazy - see catalog property)
+        self._catalog: Optional[ParquetCatalog] = None
+        
+        # Append-only writes: delta files per day, compacted at this count
+        self.max_delta_files = DEFAULT_MAX_DELTA_FILES
+        self._write_lock = threading.RLock()
+        
         logger.info(f"Parquet storage initialized: base={self.base_path}, group={exchange_group}")
     
+    @property
+    def catalog(self) -> ParquetCatalog:
+        """Metadata catalog of the current exchange group (created on first use)."""
+        root = self.base_path / self.exchange_group
+        if self._catalog is None or self._catalog.root != root:
+            self._catalog = ParquetCatalog(root)
+        return self._catalog
+    
+    def rebuild_catalog(self) -> int:
+        """Rebuild the metadata catalog from parquet footers (recovery).
+        
+        Returns:
+            Number of files cataloged
+        """
+        return self.catalog.rebuild()
+    
     def _get_system_timezone(self) -> str:
         """Get system timezone from SystemManager"""
         from app.managers.system_manager import get_system_manager
@@ -152,6 +191,148 @@ class ParquetStorage:
             # Bar intervals: use unified storage strategy
             return self.storage_strategy.get_file_path(data_type, symbol, year, month, day)
     
+    # =========================================================================
+    # Delta Files (append-only writes) and Compaction
+    # =========================================================================
+    #
+    # Appending to <DAY>.parquet writes the batch to a sidecar delta file
+    # next to it: <DAY>.parquet.delta-000001, -000002, ... Readers merge a
+    # file with its deltas (later rows win on duplicate symbol+timestamp).
+    # Compaction folds the deltas back into the canonical file.
+    
+    def get_delta_paths(self, file_path: Path) -> List[Path]:
+        """Delta files of a canonical parquet file, oldest first."""
+        return sorted(file_path.parent.glob(f"{file_path.name}{DELTA_INFIX}*"))
+    
+    def _write_file_or_delta(
+        self,
+        file_path: Path,
+        df: pd.DataFrame,
+        compression: str,
+        append: bool
+    ) -> Path:
+        """Write a day/year group: new delta when appending, else the canonical file.
+        
+        Returns:
+            Path actually written
+        """
+        with self._write_lock:
+            if append and file_path.exists():
+                deltas = self.get_delta_paths(file_path)
+                sequence = int(deltas[-1].name.rsplit('-', 1)[1]) + 1 if deltas else 1
+                target = file_path.with_name(f"{file_path.name}{DELTA_INFIX}{sequence:06d}")
+            else:
+                target = file_path
+                # Overwrite supersedes any pending deltas
+                stale = self.get_delta_paths(file_path)
+                for delta in stale:
+                    delta.unlink()
+                if stale:
+                    self.catalog.remove_files(stale)
+            
+            df.to_parquet(
+                target,
+                compression=compression,
+                index=False,
+                engine='pyarrow',
+            )
+            return target
+    
+    def _read_file(self, file_path: Path) -> pd.DataFrame:
+        """Read a canonical parquet file merged with its delta files."""
+        df = pd.read_parquet(file_path)
+        deltas = self.get_delta_paths(file_path)
+        if not deltas:
+            return df
+        
+        merged = pd.concat([df] + [pd.read_parquet(delta) for delta in deltas], ignore_index=True)
+        merged = merged.drop_duplicates(subset=['symbol', 'timestamp'], keep='last')
+        return merged.sort_values('timestamp').reset_index(drop=True)
+    
+    def _file_key(self, file_path: Path) -> Tuple[str, str]:
+        """(data_type, symbol) of a file: bars/<interval>/<SYMBOL>/... or quotes/<SYMBOL>/..."""
+        parts = file_path.relative_to(self.base_path / self.exchange_group).parts
+        if parts[0] == 'bars':
+            return parts[1], parts[2]
+        return 'quotes', parts[1]
+    
+    def compact_file(self, file_path: Path, compression: str = 'zstd') -> bool:
+        """Fold a file's delta files into the canonical file.
+        
+        The merged file replaces the canonical one atomically before deltas
+        are removed, so a crash in between leaves deltas that merge to the
+        same rows.
+        
+        Args:
+            file_path: Canonical parquet file
+            compression: Compression codec for the rewritten file
+            
+        Returns:
+            True if deltas were compacted
+        """
+        with self._write_lock:
+            deltas = self.get_delta_paths(file_path)
+            if not deltas:
+                return False
+            
+            merged = self._read_file(file_path)
+            temp_path = file_path.with_suffix('.compacting')
+            merged.to_parquet(temp_path, compression=compression, index=False, engine='pyarrow')
+            os.replace(temp_path, file_path)
+            
+            for delta in deltas:
+                delta.unlink()
+        
+        data_type, symbol = self._file_key(file_path)
+        self.catalog.remove_files(deltas)
+        self.catalog.record_files(data_type, symbol, [file_path])
+        
+        logger.info(f"Compacted {len(deltas)} delta files into {file_path} ({len(merged)} rows)")
+        return True
+    
+    def compact(
+        self,
+        data_type: Optional[str] = None,
+        symbol: Optional[str] = None,
+        compression: str = 'zstd'
+    ) -> int:
+        """Compact all files with pending deltas.
+        
+        Args:
+            data_type: Only this interval (or 'quotes'), None = all
+            symbol: Only this symbol, None = all
+            compression: Compression codec for rewritten files
+            
+        Returns:
+            Number of files compacted
+        """
+        root = self.base_path / self.exchange_group
+        canonicals = sorted({
+            delta.with_name(delta.name.split(DELTA_INFIX)[0])
+            for delta in root.rglob(f"*.parquet{DELTA_INFIX}*")
+        })
+        
+        compacted = 0
+        for canonical in canonicals:
+            file_type, file_symbol = self._file_key(canonical)
+            if data_type is not None and file_type != data_type:
+                continue
+            if symbol is not None and file_symbol != symbol.upper():
+                continue
+            if self.compact_file(canonical, compression):
+                compacted += 1
+        
+        return compacted
+    
+    def _compact_if_needed(self, files_written: List[Path], compression: str) -> None:
+        """Compact files whose delta count reached max_delta_files."""
+        for written in files_written:
+            if DELTA_INFIX not in written.name:
+                continue
+            canonical = written.with_name(written.name.split(DELTA_INFIX)[0])
+            if len(self.get_delta_paths(canonical)) >= self.max_delta_files:
+                self.compact_file(canonical, compression)
+    
     def aggregate_ticks_to_1s(self, ticks: List[Dict]) -> List[Dict]:
         """Aggregate trade ticks to 1-second bars.
         
@@ -256,10 +437,11 @@ class ParquetStorage:
             data_type: Interval string (e.g., '1s', '1m', '60m', '1d', '1w')
             symbol: Stock symbol
             compression: Compression codec (zstd, snappy, gzip, none)
-            append: If True, append to existing file (reads, merges, writes)
+            append: If True, add to existing files as delta files (merged on
+                    read, folded in by compaction) instead of overwriting
             
         Returns:
-            (total_written, file_paths): Count and list of files written
+            (total_written, file_paths): Rows written and list of files written
         """
         if not bars:
             logger.warning("No bars to write")
@@ -324,33 +506,21 @@ class ParquetStorage:
             # Drop helper columns
             group_df = group_df.drop(columns=['year', 'month', 'day'])
             
-            # Handle append mode
-            if append and file_path.exists():
-                logger.info(f"Appending to existing file: {file_path}")
-                existing_df = pd.read_parquet(file_path)
-                group_df = pd.concat([existing_df, group_df])
-                
-                # Remove duplicates (keep last)
-                group_df = group_df.drop_duplicates(subset=['symbol', 'timestamp'], keep='last')
-                group_df = group_df.sort_values('timestamp')
-            
-            # Write to Parquet
-            group_df.to_parquet(
-                file_path,
-                compression=compression,
-                index=False,
-                engine='pyarrow',
-            )
+            # Append mode: delta file (cost scales with the batch, not the file)
+            written_path = self._write_file_or_delta(file_path, group_df, compression, append)
             
             rows_written = len(group_df)
             total_written += rows_written
-            files_written.append(file_path)
+            files_written.append(written_path)
             
             logger.info(
-                f"Wrote {rows_written} {data_type} bars to {file_path.name} "
-                f"(size: {file_path.stat().st_size / 1024:.1f} KB)"
+                f"Wrote {rows_written} {data_type} bars to {written_path.name} "
+                f"(size: {written_path.stat().st_size / 1024:.1f} KB)"
             )
         
+        self.catalog.record_files(data_type, symbol, files_written)
+        self._compact_if_needed(files_written, compression)
+        
         return total_written, files_written
     
     def write_quotes(
@@ -368,10 +538,11 @@ class ParquetStorage:
             quotes: List of quote dicts
             symbol: Stock symbol
             compression: Compression codec
-            append: If True, append to existing file
+            append: If True, add to existing files as delta files (merged on
+                    read, folded in by compaction) instead of overwriting
             
         Returns:
-            (total_written, file_paths): Count and list of files written
+            (total_written, file_paths): Rows written and list of files written
         """
         if not quotes:
             logger.warning("No quotes to write")
@@ -414,33 +585,21 @@ class ParquetStorage:
             # Drop helper columns
             group_df = group_df.drop(columns=['year', 'month', 'day'])
             
-            # Handle append mode
-            if append and file_path.exists():
-                logger.info(f"Appending to existing file: {file_path}")
-                existing_df = pd.read_parquet(file_path)
-                group_df = pd.concat([existing_df, group_df])
-                
-                # Remove duplicates
-                group_df = group_df.drop_duplicates(subset=['symbol', 'timestamp'], keep='last')
-                group_df = group_df.sort_values('timestamp')
-            
-            # Write to Parquet
-            group_df.to_parquet(
-                file_path,
-                compression=compression,
-                index=False,
-                engine='pyarrow',
-            )
+            # Append mode: delta file (cost scales with the batch, not the file)
+            written_path = self._write_file_or_delta(file_path, group_df, compression, append)
             
             rows_written = len(group_df)
             total_written += rows_written
-            files_written.append(file_path)
+            files_written.append(written_path)
             
             logger.info(
-                f"Wrote {rows_written} quotes to {file_path.name} "
-                f"(size: {file_path.stat().st_size / 1024:.1f} KB)"
+                f"Wrote {rows_written} quotes to {written_path.name} "
+                f"(size: {written_path.stat().st_size / 1024:.1f} KB)"
             )
         
+        self.catalog.record_files('quotes', symbol, files_written)
+        self._compact_if_needed(files_written, compression)
+        
         return total_written, files_written
     
     def read_bars(
@@ -466,8 +625,9 @@ class ParquetStorage:
             start_date: Optional start date in exchange timezone
             end_date: Optional end date in exchange timezone
             request_timezone: DEPRECATED - data always returned in exchange timezone
-            regular_hours_only: If True, filter to regular trading hours only
-                               (09:30-16:00 ET). Default False keeps all hours.
+            regular_hours_only: If True, filter each day to its regular trading
+                               hours (09:30-16:00 ET, early closes honored).
+                               Default False keeps all hours.
         
         Returns:
             DataFrame with bars in exchange timezone (timezone-aware)
@@ -497,7 +657,7 @@ class ParquetStorage:
             dfs = []
             for file_path in files:
                 try:
-                    df = pd.read_parquet(file_path)
+                    df = self._read_file(file_path)
                     dfs.append(df)
                 except Exception as e:
                     logger.error(f"Error reading {file_path}: {e}")
@@ -515,7 +675,7 @@ class ParquetStorage:
             start_dt = datetime.combine(start_date, datetime.min.time())
             end_dt = datetime.combine(end_date, datetime.max.time())
             
-            logger.info(f"[read_bars] Querying {data_type} for {symbol}: {start_dt} to {end_dt}")
+            logger.debug(f"[read_bars] Querying {data_type} for {symbol}: {start_dt} to {end_dt}")
             
             files = self._get_files_for_date_range(
                 data_type, symbol,
@@ -523,7 +683,7 @@ class ParquetStorage:
                 end_dt
             )
             
-            logger.info(f"[read_bars] Found {len(files)} files for {symbol} {data_type}: {files}")
+            logger.debug(f"[read_bars] Found {len(files)} files for {symbol} {data_type}: {files}")
             
             if not files:
                 logger.warning(f"No files found for {symbol} {data_type} in date range {start_date} to {end_date}")
@@ -533,7 +693,7 @@ class ParquetStorage:
             dfs = []
             for file_path in files:
                 try:
-                    df = pd.read_parquet(file_path)
+                    df = self._read_file(file_path)
                     dfs.append(df)
                 except Exception as e:
                     logger.error(f"Error reading {file_path}: {e}")
@@ -551,74 +711,198 @@ class ParquetStorage:
         # Data is already in exchange timezone - no conversion needed
         # Timestamps are timezone-aware as stored in parquet
         
-        # Filter to regular trading hours if requested
-        if regular_hours_only and not result.empty and start_date is not None:
+        # Filter to regular trading hours if requested (each day its own session)
+        if regular_hours_only and not result.empty:
+            timestamps = result['timestamp']
+            mask = self._regular_hours_mask(
+                timestamps.dt.as_unit('ns').array.asi8,
+                timestamps.dt.tz is not None
+            )
+            if mask is not None:
+                bars_before = len(result)
+                result = result[mask].reset_index(drop=True)
+                logger.debug(
+                    f"[FILTER] Filtered {bars_before - len(result)}/{bars_before} "
+                    f"extended hours bars for {symbol}"
+                )
+        
+        logger.debug(
+            f"Loaded {len(result)} {data_type} bars for {symbol} "
+            f"(timezone: {request_timezone})"
+        )
+        return result
+    
+    def _regular_hours_table(
+        self,
+        first_day: date,
+        last_day: date
+    ) -> Optional[Dict[date, Tuple[datetime, datetime]]]:
+        """Regular session (open, close) per trading day from TimeManager's cached table.
+        
+        Returns:
+            Dict of trading date -> (open, close), or None if the calendar
+            is unavailable (caller then keeps all bars)
+        """
+        try:
             from app.managers.system_manager import get_system_manager
-            from app.models.database import SessionLocal
-            
-            sys_mgr = get_system_manager()
-            time_mgr = sys_mgr.get_time_manager()
+            time_mgr = get_system_manager().get_time_manager()
+            return time_mgr.get_regular_hours_table(first_day, last_day)
+        except Exception as e:
+            logger.warning(f"Could not filter to regular hours: {e}, returning all bars")
+            return None
+    
+    def _regular_hours_mask(self, timestamps_ns: np.ndarray, tz_aware: bool) -> Optional[np.ndarray]:
+        """Vectorized regular-hours mask over a (multi-day) timestamp column.
+        
+        Each bar is kept if it lies within [open, close] of its own trading
+        day; bars on non-trading days are dropped.
+        
+        Args:
+            timestamps_ns: int64 ns since epoch (UTC if tz_aware, else wall clock)
+            tz_aware: Whether the column is timezone-aware
             
-            # CRITICAL: Ensure we have a date object for trading session query
-            # start_date might be a datetime (from session_coordinator passing datetime objects)
-            query_date = start_date.date() if isinstance(start_date, datetime) else start_date
+        Returns:
+            Boolean mask, or None if the calendar is unavailable
+        """
+        if len(timestamps_ns) == 0:
+            return np.zeros(0, dtype=bool)
+        
+        tz = ZoneInfo(self._get_system_timezone())
+        first_day, last_day = (
+            (pd.Timestamp(int(ns), tz='UTC').tz_convert(tz) if tz_aware else pd.Timestamp(int(ns))).date()
+            for ns in (timestamps_ns.min(), timestamps_ns.max())
+        )
+        hours = self._regular_hours_table(first_day, last_day)
+        if hours is None:
+            return None
+        if not hours:
+            return np.zeros(len(timestamps_ns), dtype=bool)
+        
+        sessions = [hours[day] for day in sorted(hours)]
+        if not tz_aware:
+            sessions = [(open_.replace(tzinfo=None), close.replace(tzinfo=None)) for open_, close in sessions]
+        opens = np.array([datetime_to_ns(open_) for open_, _ in sessions], dtype=np.int64)
+        closes = np.array([datetime_to_ns(close) for _, close in sessions], dtype=np.int64)
+        
+        # Latest session opening at or before each bar (sessions never overlap)
+        index = np.searchsorted(opens, timestamps_ns, side='right') - 1
+        valid = index >= 0
+        return valid & (timestamps_ns <= closes[np.maximum(index, 0)])
+    
+    # =========================================================================
+    # Multi-Symbol Batched Reads
+    # =========================================================================
+    
+    def _resolve_files(
+        self,
+        data_type: str,
+        symbol: str,
+        start_date: Optional[date],
+        end_date: Optional[date]
+    ) -> List[Path]:
+        """Canonical files holding a symbol's bars for a date range (all if no range)."""
+        if start_date is None and end_date is None:
+            symbol_dir = self.base_path / self.exchange_group / "bars" / data_type / symbol
+            return sorted(symbol_dir.rglob("*.parquet")) if symbol_dir.exists() else []
+        
+        return self._get_files_for_date_range(
+            data_type, symbol,
+            datetime.combine(start_date, datetime.min.time()),
+            datetime.combine(end_date, datetime.max.time())
+        )
+    
+    def _read_table(self, file_path: Path) -> pa.Table:
+        """Read one file as an Arrow table (merged with its delta files)."""
+        if not self.get_delta_paths(file_path):
+            return pq.read_table(file_path)
+        return pa.Table.from_pandas(self._read_file(file_path), preserve_index=False)
+    
+    def read_bars_multi(
+        self,
+        data_type: str,
+        symbols: List[str],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        regular_hours_only: bool = False,
+        by_symbol: bool = False,
+        max_workers: Optional[int] = None
+    ) -> Union[pa.Table, Dict[str, pa.Table]]:
+        """Read bars of many symbols in one batch.
+        
+        All files are resolved up front and read concurrently by a bounded
+        thread pool (pyarrow releases the GIL while decoding), so loading a
+        large universe is I/O-bound instead of one read_bars() per symbol.
+        
+        Args:
+            data_type: Interval string (e.g., '1m', '1d')
+            symbols: Stock symbols
+            start_date: Optional start date in exchange timezone
+            end_date: Optional end date in exchange timezone
+            regular_hours_only: If True, keep each day's regular trading hours only
+            by_symbol: If True, return {symbol: table} instead of one long table
+            max_workers: Reader threads (default: min(DEFAULT_READ_WORKERS, files))
             
-            # Get regular trading hours for the start date
+        Returns:
+            One table sorted by (symbol, timestamp), or a dict of per-symbol
+            tables sorted by timestamp (symbols without data are omitted)
+        """
+        symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        files = [
+            (symbol, file_path)
+            for symbol in symbols
+            for file_path in self._resolve_files(data_type, symbol, start_date, end_date)
+        ]
+        
+        def read(item: Tuple[str, Path]) -> Optional[pa.Table]:
+            symbol, file_path = item
             try:
-                logger.info(f"[FILTER] Querying trading session for date: {query_date} (original: {start_date}, type: {type(start_date)})")
-                
-                with SessionLocal() as session:
-                    trading_session = time_mgr.get_trading_session(session, query_date)
-                    
-                    if trading_session:
-                        logger.info(
-                            f"[FILTER] {start_date}: Trading session: "
-                            f"is_early_close={trading_session.is_early_close}, "
-                            f"regular_close={trading_session.regular_close}"
-                        )
-                    
-                    if trading_session and not trading_session.is_holiday:
-                        # Create timezone-aware market open/close times using the date object
-                        from zoneinfo import ZoneInfo
-                        tz = ZoneInfo(request_timezone)
-                        market_open = datetime.combine(query_date, trading_session.regular_open).replace(tzinfo=tz)
-                        market_close = datetime.combine(query_date, trading_session.regular_close).replace(tzinfo=tz)
-                        
-                        # Log early close detection
-                        if trading_session.is_early_close:
-                            logger.info(
-                                f"[FILTER] Early close day {start_date}: market closes at {trading_session.regular_close} "
-                                f"(holiday: {trading_session.holiday_name})"
-                            )
-                        
-                        # Filter bars
-                        bars_before = len(result)
-                        logger.info(f"[FILTER] {start_date}: Before filtering: {bars_before} bars (range: {market_open.time()}-{market_close.time()})")
-                        
-                        # Apply filter (make a copy to avoid view issues)
-                        result = result[(result['timestamp'] >= market_open) & (result['timestamp'] <= market_close)].copy()
-                        bars_filtered = bars_before - len(result)
-                        
-                        logger.info(
-                            f"[FILTER] {start_date}: Filtered {bars_filtered}/{bars_before} extended hours bars for {symbol} "
-                            f"(kept {len(result)} regular hours: {market_open.time()}-{market_close.time()})"
-                        )
-                        
-                        # Debug: Show first and last bar after filtering
-                        if len(result) > 0:
-                            first_bar_time = result.iloc[0]['timestamp'].time()
-                            last_bar_time = result.iloc[-1]['timestamp'].time()
-                            logger.info(
-                                f"[FILTER] {start_date}: After filtering: First bar={first_bar_time}, Last bar={last_bar_time}"
-                            )
+                table = self._read_table(file_path)
             except Exception as e:
-                logger.warning(f"Could not filter to regular hours: {e}, returning all bars")
+                logger.error(f"Error reading {file_path}: {e}")
+                return None
+            if 'symbol' not in table.column_names:
+                table = table.append_column('symbol', pa.array([symbol] * table.num_rows, pa.string()))
+            return table
+        
+        tables: List[pa.Table] = []
+        if files:
+            workers = max_workers or min(DEFAULT_READ_WORKERS, len(files))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="parquet-read") as executor:
+                tables = [table for table in executor.map(read, files) if table is not None]
         
         logger.info(
-            f"Loaded {len(result)} {data_type} bars for {symbol} "
-            f"(timezone: {request_timezone})"
+            f"[read_bars_multi] Read {len(tables)}/{len(files)} {data_type} files "
+            f"for {len(symbols)} symbols"
         )
-        return result
+        
+        if not tables:
+            return {} if by_symbol else pa.table({})
+        
+        result = pa.concat_tables(tables, promote_options="permissive")
+        
+        if regular_hours_only and result.num_rows:
+            timestamps = result.column('timestamp')
+            timestamps_ns = pc.cast(
+                timestamps, pa.timestamp('ns', timestamps.type.tz)
+            ).cast(pa.int64()).to_numpy()
+            mask = self._regular_hours_mask(timestamps_ns, timestamps.type.tz is not None)
+            if mask is not None:
+                result = result.filter(pa.array(mask))
+        
+        result = result.sort_by([('symbol', 'ascending'), ('timestamp', 'ascending')])
+        if not by_symbol:
+            return result
+        
+        # Sorted by symbol: slice contiguous runs (zero-copy)
+        tables_by_symbol: Dict[str, pa.Table] = {}
+        symbol_column = result.column('symbol').to_numpy(zero_copy_only=False)
+        if len(symbol_column):
+            boundaries = np.flatnonzero(symbol_column[1:] != symbol_column[:-1]) + 1
+            starts = np.concatenate(([0], boundaries))
+            ends = np.concatenate((boundaries, [len(symbol_column)]))
+            for start, end in zip(starts, ends):
+                tables_by_symbol[str(symbol_column[start])] = result.slice(start, end - start)
+        return tables_by_symbol
     
     def read_quotes(
         self,
@@ -662,7 +946,7 @@ class ParquetStorage:
             dfs = []
             for file_path in files:
                 try:
-                    df = pd.read_parquet(file_path)
+                    df = self._read_file(file_path)
                     dfs.append(df)
                 except Exception as e:
                     logger.error(f"Error reading {file_path}: {e}")
@@ -688,7 +972,7 @@ class ParquetStorage:
             dfs = []
             for file_path in files:
                 try:
-                    df = pd.read_parquet(file_path)
+                    df = self._read_file(file_path)
                     dfs.append(df)
                 except Exception as e:
                     logger.error(f"Error reading {file_path}: {e}")
@@ -771,88 +1055,53 @@ class ParquetStorage:
                 current = start_date.replace(month=1, day=1)
                 end = end_date.replace(month=1, day=1)
                 
-                logger.info(f"[_get_files] YEARLY granularity for {data_type}, iterating {current.year} to {end.year}")
+                logger.debug(f"[_get_files] YEARLY granularity for {data_type}, iterating {current.year} to {end.year}")
                 
                 while current <= end:
                     year = current.year
                     
                     file_path = self.get_file_path(data_type, symbol, year, None, None)
-                    logger.info(f"[_get_files] Checking {file_path}, exists={file_path.exists()}")
+                    logger.debug(f"[_get_files] Checking {file_path}, exists={file_path.exists()}")
                     
                     if file_path.exists():
                         files.append(file_path)
                     
                     current = current.replace(year=current.year + 1)
         
-        logger.info(f"[_get_files] Returning {len(files)} files for {symbol} {data_type}")
+        logger.debug(f"[_get_files] Returning {len(files)} files for {symbol} {data_type}")
         return files
     
     def get_available_symbols(self, data_type: str = '1m') -> List[str]:
         """Get list of symbols with available data.
         
+        Answered from the catalog (no directory scan).
+        
         Args:
             data_type: Data type to check
             
         Returns:
             List of symbols
         """
-        # New structure: <exchange_group>/bars/<interval>/<SYMBOL>/ or <exchange_group>/quotes/<SYMBOL>/
-        if data_type == 'quotes':
-            file_dir = self.base_path / self.exchange_group / "quotes"
-        else:
-            file_dir = self.base_path / self.exchange_group / "bars" / data_type
-        
-        if not file_dir.exists():
-            return []
-        
-        # Extract symbols from directory names (each symbol has its own folder)
-        symbols = set()
-        for symbol_dir in file_dir.glob("*"):
-            if symbol_dir.is_dir():
-                symbols.add(symbol_dir.name)
-        
-        return sorted(symbols)
+        return self.catalog.get_symbols(data_type)
     
     def get_available_intervals(self, symbol: str) -> List[str]:
         """Get list of available bar intervals for a symbol.
         
+        Answered from the catalog (no directory scan).
+        
         Args:
             symbol: Stock symbol
             
         Returns:
             List of interval strings (e.g., ['1s', '1m', '1d'])
         """
-        # Scan bars directory for intervals
-        bars_dir = self.base_path / self.exchange_group / "bars"
-        
-        if not bars_dir.exists():
-            return []
-        
-        intervals = set()
-        
-        # Check each interval directory
-        for interval_dir in bars_dir.glob("*"):
-            if interval_dir.is_dir():
-                # Check if this interval has data for the symbol
-                symbol_dir = interval_dir / symbol.upper()
-                if symbol_dir.exists() and symbol_dir.is_dir():
-                    # Check if there are any parquet files
-                    has_data = any(symbol_dir.rglob("*.parquet"))
-                    if has_data:
-                        intervals.add(interval_dir.name)
-        
-        # Also check for quotes
-        quotes_dir = self.base_path / self.exchange_group / "quotes" / symbol.upper()
-        if quotes_dir.exists() and quotes_dir.is_dir():
-            has_quotes = any(quotes_dir.rglob("*.parquet"))
-            if has_quotes:
-                intervals.add("quotes")
-        
-        return sorted(intervals)
+        return self.catalog.get_data_types(symbol.upper())
     
     def get_date_range(self, data_type: str, symbol: str) -> Tuple[Optional[datetime], Optional[datetime]]:
         """Get earliest and latest dates available for a symbol.
         
+        Answered from the catalog (no file reads).
+        
         Args:
             data_type: Data type to check
             symbol: Stock symbol
@@ -861,13 +1110,34 @@ class ParquetStorage:
             (min_date, max_date) or (None, None) if no data
         """
         try:
-            df = self.read_bars(data_type, symbol) if data_type != 'quotes' else self.read_quotes(symbol)
-            if df.empty:
-                return None, None
-            return df['timestamp'].min(), df['timestamp'].max()
+            return self.catalog.get_date_range(data_type, symbol.upper())
         except Exception as e:
             logger.error(f"Error getting date range: {e}")
             return None, None
+    
+    def count_bars(
+        self,
+        data_type: str,
+        symbol: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> int:
+        """Count stored bars (or quotes) in a date range without reading data.
+        
+        Args:
+            data_type: Interval string or 'quotes'
+            symbol: Stock symbol
+            start_date: First day in exchange timezone (inclusive), None = unbounded
+            end_date: Last day in exchange timezone (inclusive), None = unbounded
+            
+        Returns:
+            Number of rows (0 if none)
+        """
+        if isinstance(start_date, datetime):
+            start_date = start_date.date()
+        if isinstance(end_date, datetime):
+            end_date = end_date.date()
+        return self.catalog.count_rows(data_type, symbol.upper(), start_date, end_date)
 
 
 # Global instance
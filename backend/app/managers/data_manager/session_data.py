@@ -11,7 +11,8 @@ PERFORMANCE OPTIMIZATIONS:
 - Designed for high-frequency reads by AnalysisEngine and other modules
 """
 from datetime import datetime, date, time, timedelta
-from typing import Dict, List, Optional, Set, Deque, Union, Tuple, Any
+from typing import Dict, Iterable, List, Optional, Set, Deque, Union, Tuple, Any
+from types import MappingProxyType
 from dataclasses import dataclass, field
 from collections import defaultdict, deque
 import asyncio
@@ -19,6 +20,12 @@ import threading
 
 from app.models.trading import BarData, TickData
 from app.logger import logger
+from app.managers.data_manager.columnar_bars import ColumnarBarSeries
+from app.managers.data_manager.bar_queries import bars_between, bars_since, last_n_bars
+from app.indicators.manager import indicator_value, refresh_indicator
+from app.managers.data_manager.session_snapshot import SessionSnapshot, SymbolSnapshot
+from app.managers.data_manager.symbol_locks import ContentionLock, SymbolLocks
+from app.managers.data_manager.bar_conversion import bars_from_frame
 
 
 # Import GapInfo for gap storage
@@ -44,10 +51,24 @@ class BarIntervalData:
     """
     derived: bool               # Is this computed from another interval?
     base: Optional[str]         # Source interval (None if streamed)
-    data: Union[Deque[BarData], List[BarData]]  # Actual bars (Deque for base, List for derived)
+    data: Union[Deque[BarData], List[BarData], ColumnarBarSeries]  # Actual bars (Deque for base, List for derived, ColumnarBarSeries if columnar_bars)
     quality: float = 0.0        # Quality percentage (0-100)
     gaps: List[Any] = field(default_factory=list)  # GapInfo objects
     updated: bool = False       # New data since last check
+    
+    def clear(self) -> None:
+        """Drop all bars without touching published snapshots of them.
+        
+        Deques/lists are swapped for a new empty container instead of
+        being cleared in place; ColumnarBarSeries copies on write itself.
+        """
+        if isinstance(self.data, ColumnarBarSeries):
+            self.data.clear()
+        elif isinstance(self.data, deque):
+            self.data = deque(maxlen=self.data.maxlen)
+        else:
+            self.data = []
+        self.updated = False
 
 
 @dataclass
@@ -80,6 +101,38 @@ class HistoricalBarIntervalData:
     quality: float = 0.0
     gaps: List[Any] = field(default_factory=list)  # GapInfo objects
     date_range: Optional[DateRange] = None
+    # Per-date {field: (sum, count)}, cached for trailing indicators
+    day_stats: Dict[date, Dict[str, Tuple[float, int]]] = field(default_factory=dict)
+    
+    def field_total(self, day: date, field_name: str) -> Tuple[float, int]:
+        """(sum, count) of a bar field over one date's bars (cached).
+        
+        A cached entry is reused only while the date's bar count is
+        unchanged, so bars appended to a date are picked up.
+        
+        Args:
+            day: Date in data_by_date
+            field_name: OHLCV field ('open', 'high', 'low', 'close', 'volume')
+        """
+        bars = self.data_by_date.get(day, [])
+        fields = self.day_stats.setdefault(day, {})
+        stats = fields.get(field_name)
+        if stats is None or stats[1] != len(bars):
+            stats = (sum(getattr(bar, field_name) for bar in bars), len(bars))
+            fields[field_name] = stats
+        return stats
+    
+    def evict_before(self, first_day: date) -> int:
+        """Drop dates (and their cached stats) older than first_day.
+        
+        Returns:
+            Number of dates dropped
+        """
+        old_days = [day for day in self.data_by_date if day < first_day]
+        for day in old_days:
+            del self.data_by_date[day]
+            self.day_stats.pop(day, None)
+        return len(old_days)
 
 
 @dataclass
@@ -157,6 +210,7 @@ class SymbolSessionData:
             "quotes": 0,
             "bars_base": 0,
             "bars_derived": {},  # {interval: index}
+            "indicator_history": {},  # {indicator key: history revision}
             "last_export_time": None  # Timestamp of last export
         },
         repr=False  # Don't show in repr
@@ -242,12 +296,8 @@ class SymbolSessionData:
         if not interval_data or not interval_data.data:
             return []
         
-        # Return last n bars
-        bars = interval_data.data
-        if len(bars) <= n:
-            return list(bars)
-        else:
-            return list(bars)[-n:]
+        # Return last n bars (copies only those n)
+        return last_n_bars(interval_data.data, n)
     
     def get_bars_since(self, timestamp: datetime, interval = None) -> List[BarData]:
         """Get all bars since a specific timestamp.
@@ -272,8 +322,38 @@ class SymbolSessionData:
         if not interval_data or not interval_data.data:
             return []
         
-        # Filter bars by timestamp
-        return [b for b in interval_data.data if b.timestamp >= timestamp]
+        # Binary search from the tail, copy only the matching bars
+        return bars_since(interval_data.data, timestamp)
+    
+    def get_bars_between(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        interval = None
+    ) -> List[BarData]:
+        """Get session bars with start <= timestamp <= end.
+        
+        Args:
+            start: Optional start timestamp (inclusive)
+            end: Optional end timestamp (inclusive)
+            interval: Bar interval (string like "1s", "1m", "5m"). If None, uses base_interval.
+            
+        Returns:
+            List of bars in range (oldest to newest)
+        """
+        # Normalize interval: convert int to string
+        if isinstance(interval, int):
+            interval = f"{interval}m"
+        
+        # Default to base interval
+        if interval is None:
+            interval = self.base_interval
+        
+        interval_data = self.bars.get(interval)
+        if not interval_data or not interval_data.data:
+            return []
+        
+        return bars_between(interval_data.data, start, end)
     
     def get_bar_count(self, interval = None) -> int:
         """Get count of bars for an interval (O(1) operation).
@@ -313,6 +393,7 @@ class SymbolSessionData:
             ind_data.current_value = None
             ind_data.last_updated = None
             ind_data.valid = False
+            ind_data.pending = None
             # Keep: config, state (for stateful indicators like EMA)
         
         self.quotes_updated = False
@@ -367,12 +448,14 @@ class SymbolSessionData:
             logger.warning(f"Failed to serialize indicator state: {e}")
             return None
     
-    def to_json(self, complete: bool = True) -> dict:
+    def to_json(self, complete: bool = True, snapshot: Optional[SymbolSnapshot] = None) -> dict:
         """Export symbol session data to JSON format.
         
         Args:
             complete: If True, return full data including historical.
                      If False, return delta (new data only, excludes historical).
+            snapshot: Published snapshot to take bars, indicators and metrics
+                     from (safe without SessionData._lock). None = live data.
         
         Returns:
             Dictionary with structure:
@@ -385,15 +468,20 @@ class SymbolSessionData:
               "historical": {bars, indicators}
             }
         """
+        if snapshot is not None:
+            bars, indicators, metrics = snapshot.bars, snapshot.indicators, snapshot.metrics
+        else:
+            bars, indicators, metrics = self.bars, self.indicators, self.metrics
+        
         result = {
             "bars": {},
             "quotes": {},
             "ticks": {},
             "metrics": {
-                "volume": self.metrics.volume,
-                "high": self.metrics.high,
-                "low": self.metrics.low,
-                "last_update": self.metrics.last_update.isoformat() if self.metrics.last_update else None
+                "volume": metrics.volume,
+                "high": metrics.high,
+                "low": metrics.low,
+                "last_update": metrics.last_update.isoformat() if metrics.last_update else None
             },
             "indicators": {},  # Will populate below
             "historical": {},
@@ -407,14 +495,15 @@ class SymbolSessionData:
         }
         
         # DEBUG: Log indicator count for debugging
-        indicator_count = len(self.indicators)
+        indicator_count = len(indicators)
         if indicator_count > 0:
             logger.debug(f"{self.symbol}: Serializing {indicator_count} indicators")
         else:
             logger.warning(f"{self.symbol}: No indicators to serialize (indicators dict is empty)")
         
         # Serialize indicators (IndicatorData objects to dict)
-        for key, indicator_data in self.indicators.items():
+        for key, indicator_data in indicators.items():
+            refresh_indicator(indicator_data, self.symbol)  # Lazy: export current value
             # Check if it's an IndicatorData object or plain value
             if hasattr(indicator_data, 'current_value'):
                 # IndicatorData object - serialize properly
@@ -441,12 +530,17 @@ class SymbolSessionData:
                 if hasattr(indicator_data, 'state') and indicator_data.state:
                     indicator_export["state"] = self._serialize_indicator_state(indicator_data.state)
                 
-                if hasattr(indicator_data, 'historical_values') and indicator_data.historical_values:
-                    # Only export historical values in complete mode (can be large)
+                history = getattr(indicator_data, 'historical_values', None)
+                if history:
+                    # Delta mode: only entries written since the last export
                     if complete:
-                        indicator_export["historical_values"] = indicator_data.historical_values
+                        count = len(history)
                     else:
-                        indicator_export["historical_values_count"] = len(indicator_data.historical_values)
+                        exported = self._last_export_indices.setdefault("indicator_history", {})
+                        count = history.changed_since(exported.get(key, 0))
+                        exported[key] = history.revision
+                    indicator_export["historical_values"] = history.to_list(count)
+                    indicator_export["historical_values_count"] = len(history)
                 
                 result["indicators"][key] = indicator_export
             else:
@@ -454,7 +548,7 @@ class SymbolSessionData:
                 result["indicators"][key] = indicator_data
         
         # === BARS (Self-Describing Structure) ===
-        for interval, interval_data in self.bars.items():
+        for interval, interval_data in bars.items():
             if not interval_data.data:
                 continue
             
@@ -464,8 +558,8 @@ class SymbolSessionData:
             else:
                 start_idx = self._last_export_indices.get("bars", {}).get(interval, 0)
             
-            # Only export new bars
-            bars_list = list(interval_data.data)
+            # Only export new bars (snapshot views slice without a full copy)
+            bars_list = interval_data.data if snapshot is not None else list(interval_data.data)
             if len(bars_list) > start_idx:
                 new_bars = bars_list[start_idx:]
                 
@@ -663,6 +757,8 @@ class SessionData:
     a trading session. Integrates with SystemManager and replaces SessionTracker.
     
     Thread-safe for concurrent access from main coordinator and data-upkeep threads.
+    Locking is per symbol (see symbol_locks.py): a registry lock guards
+    membership, and each symbol's data has its own lock.
     """
     
     def __init__(self):
@@ -691,8 +787,19 @@ class SessionData:
         # Delta export tracking: timestamp of last export
         self._last_export_time: Optional[datetime] = None
         
-        # Thread lock for concurrent access
-        self._lock = threading.RLock()
+        # Registry lock: _symbols membership, config symbols, symbol locks,
+        # snapshot publication. Lock order is registry -> symbol.
+        self._lock = ContentionLock("registry")
+        
+        # Per-symbol locks for each symbol's bars, quality, gaps, indicators
+        # and historical data
+        self._data_locks = SymbolLocks()
+        
+        # Published immutable snapshots (replaced wholesale, read lock-free)
+        self._snapshot: SessionSnapshot = SessionSnapshot()
+        
+        # Serializes exporters (delta indices) without blocking writers
+        self._export_lock = threading.Lock()
         
         # Scanner framework support
         self._config_symbols: Set[str] = set()  # Symbols from session_config
@@ -702,6 +809,34 @@ class SessionData:
         
         logger.info("SessionData initialized")
     
+    # ==================== LOCKING ====================
+    
+    def _symbol_lock(self, symbol: str) -> ContentionLock:
+        """Lock guarding one symbol's data (symbol upper case)."""
+        return self._data_locks.get(symbol)
+    
+    def _registered_items(self) -> List[Tuple[str, SymbolSessionData]]:
+        """Registered (symbol, data) pairs, copied under the registry lock."""
+        with self._lock:
+            return list(self._symbols.items())
+    
+    def get_lock_stats(self) -> Dict[str, Any]:
+        """Lock acquisition and contention counters.
+        
+        Returns:
+            {"registry": {acquisitions, contentions},
+             "symbols": {acquisitions, contentions, symbols: {symbol: {...}}}}
+        """
+        return {
+            "registry": self._lock.stats(),
+            "symbols": self._data_locks.stats(),
+        }
+    
+    def reset_lock_stats(self) -> None:
+        """Zero all lock counters."""
+        self._lock.reset_stats()
+        self._data_locks.reset_stats()
+    
     def apply_config(self, config: 'SessionDataConfig') -> None:
         """Apply session data configuration from SessionConfig.
         
@@ -839,14 +974,14 @@ class SessionData:
             {"AAPL": ["5m", "15m"], "RIVN": ["5m"]}
         """
         result = {}
-        with self._lock:
-            for symbol, symbol_data in self._symbols.items():
+        for symbol, symbol_data in self._registered_items():
+            with self._symbol_lock(symbol):
                 derived = [
                     interval for interval, data in symbol_data.bars.items()
                     if data.derived
                 ]
-                if derived:
-                    result[symbol] = derived
+            if derived:
+                result[symbol] = derived
         return result
     
     def get_symbol_data(self, symbol: str, internal: bool = False) -> Optional[SymbolSessionData]:
@@ -863,9 +998,8 @@ class SessionData:
         if not internal and not self._session_active:
             return None
         
-        symbol = symbol.upper()
-        with self._lock:
-            return self._symbols.get(symbol)
+        # Single dict lookup: atomic, no registry lock needed
+        return self._symbols.get(symbol.upper())
     
     def is_stream_active(self, symbol: str, stream_type: str) -> bool:
         """Check if a stream is currently active for a symbol.
@@ -883,7 +1017,7 @@ class SessionData:
         symbol = symbol.upper()
         stream_type = stream_type.lower()
         
-        with self._lock:
+        with self._symbol_lock(symbol):
             if symbol not in self._symbols:
                 return False
             
@@ -925,7 +1059,7 @@ class SessionData:
         current_session_date = self.get_current_session_date()
         bar_date = bar.timestamp.date()
         
-        with self._lock:
+        with self._symbol_lock(symbol):
             symbol_data = self._symbols[symbol]
             
             # Set base_interval from first bar if not already set
@@ -977,7 +1111,7 @@ class SessionData:
         if symbol not in self._symbols:
             self.register_symbol(symbol)
         
-        with self._lock:
+        with self._symbol_lock(symbol):
             symbol_data = self._symbols[symbol]
             
             if insert_mode == "historical":
@@ -1015,8 +1149,10 @@ class SessionData:
                         bars_list.insert(idx, bar)
                         symbol_data.update_from_bar(bar)
                     # Replace deque with updated sorted list
-                    from collections import deque
-                    interval_data.data = deque(bars_list)
+                    if isinstance(interval_data.data, ColumnarBarSeries):
+                        interval_data.data.replace(bars_list)
+                    else:
+                        interval_data.data = deque(bars_list)
                     interval_data.updated = True
                 # Signal upkeep thread that new data arrived
                 self._data_arrival_event.set()
@@ -1046,8 +1182,10 @@ class SessionData:
                         idx = bisect.bisect_left([b.timestamp for b in bars_list], bar.timestamp)
                         bars_list.insert(idx, bar)
                         symbol_data.update_from_bar(bar)
-                    from collections import deque
-                    interval_data.data = deque(bars_list)
+                    if isinstance(interval_data.data, ColumnarBarSeries):
+                        interval_data.data.replace(bars_list)
+                    else:
+                        interval_data.data = deque(bars_list)
                     interval_data.updated = True
                 # Signal upkeep thread that new data arrived
                 self._data_arrival_event.set()
@@ -1085,7 +1223,7 @@ class SessionData:
         
         symbol = symbol.upper()
         
-        with self._lock:
+        with self._symbol_lock(symbol):
             symbol_data = self._symbols.get(symbol)
             if symbol_data is None:
                 return None
@@ -1117,12 +1255,45 @@ class SessionData:
         
         symbol = symbol.upper()
         
-        with self._lock:
+        with self._symbol_lock(symbol):
             symbol_data = self._symbols.get(symbol)
             if symbol_data is None:
                 return []
             return symbol_data.get_last_n_bars(n, interval)
     
+    def get_indicator(self, symbol: str, indicator_key: str) -> Optional[Any]:
+        """Get an indicator of a symbol.
+        
+        Lazy indicators are caught up on the bars noted since their last
+        read before being returned (see indicators.manager.refresh_indicator).
+        
+        Args:
+            symbol: Stock symbol
+            indicator_key: Indicator key (e.g., "sma_20_1d")
+            
+        Returns:
+            IndicatorData or None if not registered
+        """
+        symbol = symbol.upper()
+        
+        with self._symbol_lock(symbol):
+            symbol_data = self._symbols.get(symbol)
+            indicator = symbol_data.indicators.get(indicator_key) if symbol_data else None
+        return refresh_indicator(indicator, symbol)
+    
+    def get_indicator_value(self, symbol: str, indicator_key: str, field: Optional[str] = None):
+        """Get the current value of an indicator (None if missing or not valid).
+        
+        Args:
+            symbol: Stock symbol
+            indicator_key: Indicator key (e.g., "bbands_20_5m")
+            field: Field of a multi-value indicator (e.g., "upper")
+            
+        Returns:
+            Indicator value or None
+        """
+        return indicator_value(self.get_indicator(symbol, indicator_key), indicator_key, field)
+    
     def get_bars_since(
         self,
         symbol: str,
@@ -1147,7 +1318,7 @@ class SessionData:
         
         symbol = symbol.upper()
         
-        with self._lock:
+        with self._symbol_lock(symbol):
             symbol_data = self._symbols.get(symbol)
             if symbol_data is None:
                 return []
@@ -1170,7 +1341,7 @@ class SessionData:
         
         symbol = symbol.upper()
         
-        with self._lock:
+        with self._symbol_lock(symbol):
             symbol_data = self._symbols.get(symbol)
             if symbol_data is None:
                 return 0
@@ -1195,14 +1366,14 @@ class SessionData:
             Dictionary mapping symbol to latest bar
         """
         result = {}
-        with self._lock:
-            for symbol in symbols:
-                symbol = symbol.upper()
-                symbol_data = self._symbols.get(symbol)
-                if symbol_data:
+        for symbol in symbols:
+            symbol = symbol.upper()
+            symbol_data = self._symbols.get(symbol)
+            if symbol_data:
+                with self._symbol_lock(symbol):
                     result[symbol] = symbol_data.get_latest_bar(interval)
-                else:
-                    result[symbol] = None
+            else:
+                result[symbol] = None
         return result
     
     def get_bars_ref(
@@ -1215,7 +1386,8 @@ class SessionData:
         
         ⚠️ WARNING: Returns mutable container reference.
         Caller must NOT modify the returned container.
-        For read-only iteration and access only.
+        For read-only iteration and access only. It can grow while being
+        iterated; get_symbol_snapshot() gives a view that cannot.
         
         Performance:
         - Zero memory allocation
@@ -1229,7 +1401,8 @@ class SessionData:
             internal: If True, bypass session_active check.
             
         Returns:
-            Direct reference to bars deque (1m) or list (derived)
+            Direct reference to bars deque (1m) or list (derived), or the
+            ColumnarBarSeries (lazy BarData view) when columnar_bars is on.
             Empty container if symbol/interval not found
         """
         # Block external callers during deactivation
@@ -1238,7 +1411,7 @@ class SessionData:
         
         symbol = symbol.upper()
         
-        with self._lock:
+        with self._symbol_lock(symbol):
             symbol_data = self._symbols.get(symbol)
             if symbol_data is None:
                 return deque() if interval == 1 else []
@@ -1257,72 +1430,45 @@ class SessionData:
                 # Return empty container of appropriate type
                 return deque() if interval == 1 else []
     
-    def get_bars(
+    def get_bar_arrays(
         self,
         symbol: str,
         interval: int = 1,
-        start: Optional[datetime] = None,
-        end: Optional[datetime] = None,
         internal: bool = False
-    ) -> List[BarData]:
-        """Get bars for a symbol (CREATES COPY).
-        
-        ⚠️ PERFORMANCE NOTE: This method creates a copy of bars.
-        For high-frequency access without filtering, use get_bars_ref() instead.
+    ) -> Optional[Dict[str, Any]]:
+        """Get zero-copy NumPy column views of a bar series.
         
-        Use this method when:
-        - You need time-based filtering (start/end)
-        - You need to modify the returned list
-        - You need to store the list long-term
-        
-        For read-only iteration without filtering, prefer get_bars_ref().
+        Only available when bars are stored columnar
+        (session_data_config.columnar_bars). Views are read-only and
+        reflect the series at call time; take .copy() to keep them across
+        later appends.
         
         Args:
             symbol: Stock symbol
-            interval: Bar interval in minutes (1, 5, 15, etc.)
-            start: Optional start time filter
-            end: Optional end time filter
+            interval: Bar interval in minutes (1, 5, 15, etc.) or interval string
             internal: If True, bypass session_active check.
             
         Returns:
-            List of bars matching criteria (copy created)
+            Dict of column name -> np.ndarray (timestamp as int64 ns, OHLCV as
+            float64), or None if the series is missing or not columnar
         """
         # Block external callers during deactivation
         if not internal and not self._session_active:
-            return []
+            return None
         
         symbol = symbol.upper()
+        interval_key = f"{interval}m" if isinstance(interval, int) else str(interval)
         
-        with self._lock:
+        with self._symbol_lock(symbol):
             symbol_data = self._symbols.get(symbol)
             if symbol_data is None:
-                return []
-            
-            # Normalize interval to string format
-            if isinstance(interval, int):
-                interval_key = f"{interval}m"
-            else:
-                interval_key = str(interval)
+                return None
             
-            # Get bars from new structure (creates copy)
             interval_data = symbol_data.bars.get(interval_key)
-            if interval_data:
-                bars = list(interval_data.data)  # Create copy
-            else:
-                return []
-            
-            # Apply time filters if specified
-            if start is not None or end is not None:
-                filtered = []
-                for bar in bars:
-                    if start and bar.timestamp < start:
-                        continue
-                    if end and bar.timestamp > end:
-                        continue
-                    filtered.append(bar)
-                return filtered
+            if interval_data is None or not isinstance(interval_data.data, ColumnarBarSeries):
+                return None
             
-            return bars
+            return interval_data.data.arrays()
     
     def get_session_metrics(self, symbol: str, internal: bool = False) -> Dict[str, any]:
         """Get current session metrics for a symbol.
@@ -1340,7 +1486,7 @@ class SessionData:
         
         symbol = symbol.upper()
         
-        with self._lock:
+        with self._symbol_lock(symbol):
             symbol_data = self._symbols.get(symbol)
             if symbol_data is None:
                 return {}
@@ -1362,6 +1508,85 @@ class SessionData:
                 "bar_count": bar_count,
             }
     
+    # ==================== SNAPSHOTS (Lock-Free Reads) ====================
+    # Writers publish an immutable version of each symbol after every
+    # processed timestamp; readers take it without the lock or any copy.
+    # See session_snapshot.py for how bar history stays immutable.
+    
+    def publish_snapshots(
+        self,
+        symbols: Optional[Iterable[str]] = None,
+        timestamp: Optional[datetime] = None
+    ) -> SessionSnapshot:
+        """Publish new snapshots for symbols (called once per timestamp).
+        
+        Symbols not listed keep their previous snapshot, which is still
+        valid: their data has not changed since it was published.
+        
+        Args:
+            symbols: Symbols whose data changed (None = all registered)
+            timestamp: Session time of the data being published
+        
+        Returns:
+            The new SessionSnapshot
+        """
+        with self._lock:
+            return self._publish_locked(
+                self._symbols.keys() if symbols is None else symbols,
+                timestamp
+            )
+    
+    def _publish_locked(
+        self,
+        symbols: Iterable[str],
+        timestamp: Optional[datetime]
+    ) -> SessionSnapshot:
+        """Build and swap in a new SessionSnapshot (caller holds the registry lock)."""
+        previous = self._snapshot
+        epoch = previous.epoch + 1
+        published = {
+            symbol: snapshot for symbol, snapshot in previous.symbols.items()
+            if symbol in self._symbols
+        }
+        for symbol in symbols:
+            symbol = symbol.upper()
+            symbol_data = self._symbols.get(symbol)
+            if symbol_data is not None:
+                with self._symbol_lock(symbol):
+                    published[symbol] = SymbolSnapshot.capture(symbol_data, epoch, timestamp)
+        
+        # Single reference assignment: readers see the old or the new epoch
+        self._snapshot = SessionSnapshot(
+            epoch=epoch,
+            timestamp=timestamp if timestamp is not None else previous.timestamp,
+            symbols=MappingProxyType(published)
+        )
+        return self._snapshot
+    
+    def _republish_locked(self) -> None:
+        """Refresh published symbols after history was rewritten (caller holds the registry lock)."""
+        if self._snapshot.symbols:
+            self._publish_locked(list(self._snapshot.symbols), None)
+    
+    def snapshot(self) -> SessionSnapshot:
+        """Latest published SessionSnapshot (lock-free, consistent across symbols).
+        
+        Returns:
+            SessionSnapshot (epoch 0 with no symbols until the first publication)
+        """
+        return self._snapshot
+    
+    def get_symbol_snapshot(self, symbol: str) -> Optional[SymbolSnapshot]:
+        """Latest published snapshot of one symbol (lock-free).
+        
+        Args:
+            symbol: Stock symbol
+        
+        Returns:
+            SymbolSnapshot, or None if the symbol has not been published
+        """
+        return self._snapshot.symbols.get(symbol.upper())
+    
     # ==================== HISTORICAL BARS METHODS (Phase 3) ====================
     
     def get_current_session_date(self) -> Optional[date]:
@@ -1417,48 +1642,46 @@ class SessionData:
         start_date = end_date - timedelta(days=trailing_days)
         
         total_loaded = 0
+        symbol_data = self._symbols[symbol]
         
-        with self._lock:
-            symbol_data = self._symbols[symbol]
-            
-            for interval in intervals:
-                try:
-                    # Query database using same interface detection as gap filling
-                    bars_db = self._query_historical_bars(
-                        data_repository,
-                        symbol,
-                        start_date,
-                        end_date,
-                        interval
-                    )
-                    
-                    if not bars_db:
-                        continue
-                    
-                    # Group by date
-                    from collections import defaultdict
-                    bars_by_date = defaultdict(list)
-                    for bar in bars_db:
-                        bar_date = bar.timestamp.date()
-                        bars_by_date[bar_date].append(bar)
-                    
-                    # Store in historical.bars
-                    interval_key = f"{interval}m" if isinstance(interval, int) else interval
+        for interval in intervals:
+            try:
+                # Query parquet outside any lock (slow I/O)
+                bars_db = self._query_historical_bars(
+                    data_repository,
+                    symbol,
+                    start_date,
+                    end_date,
+                    interval
+                )
+                
+                if not bars_db:
+                    continue
+                
+                # Group by date
+                bars_by_date = defaultdict(list)
+                for bar in bars_db:
+                    bar_date = bar.timestamp.date()
+                    bars_by_date[bar_date].append(bar)
+                
+                # Store in historical.bars (only this symbol is locked)
+                interval_key = f"{interval}m" if isinstance(interval, int) else interval
+                with self._symbol_lock(symbol):
                     if interval_key not in symbol_data.historical.bars:
                         symbol_data.historical.bars[interval_key] = HistoricalBarIntervalData()
                     
                     symbol_data.historical.bars[interval_key].data_by_date.update(dict(bars_by_date))
-                    total_loaded += len(bars_db)
-                    
-                    # Format interval for display
-                    interval_str = f"{interval}m" if isinstance(interval, int) else interval
-                    logger.debug(
-                        f"Loaded {len(bars_db)} historical {interval_str} bars for {symbol}"
-                    )
+                total_loaded += len(bars_db)
                 
-                except Exception as e:
-                    logger.error(f"Error loading historical bars for {symbol}: {e}")
-                    continue
+                # Format interval for display
+                interval_str = f"{interval}m" if isinstance(interval, int) else interval
+                logger.debug(
+                    f"Loaded {len(bars_db)} historical {interval_str} bars for {symbol}"
+                )
+            
+            except Exception as e:
+                logger.error(f"Error loading historical bars for {symbol}: {e}")
+                continue
         
         logger.info(
             f"Loaded {total_loaded} historical bars for {symbol} "
@@ -1499,22 +1722,8 @@ class SessionData:
             end_date=end_dt
         )
         
-        # Convert DataFrame to list of BarData objects
-        bars_db = []
-        if not df.empty:
-            for _, row in df.iterrows():
-                bars_db.append(BarData(
-                    symbol=row['symbol'],
-                    timestamp=row['timestamp'],
-                    interval=row.get('interval', interval_str),
-                    open=row['open'],
-                    high=row['high'],
-                    low=row['low'],
-                    close=row['close'],
-                    volume=row['volume']
-                ))
-        
-        return bars_db
+        # Bulk column conversion (rows were validated on write)
+        return bars_from_frame(df, interval_str)
     
     def get_historical_bars(
         self,
@@ -1540,7 +1749,7 @@ class SessionData:
         
         symbol = symbol.upper()
         
-        with self._lock:
+        with self._symbol_lock(symbol):
             symbol_data = self._symbols.get(symbol)
             if symbol_data is None:
                 return {}
@@ -1562,19 +1771,25 @@ class SessionData:
         self,
         symbol: str,
         interval: int = 1,
-        internal: bool = False
+        internal: bool = False,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
     ) -> List[BarData]:
         """Get all bars including historical and current session.
         
-        Chronologically ordered from oldest to newest.
+        Chronologically ordered from oldest to newest. With start/end only
+        the days in range are visited and the bars at the range edges are
+        found by binary search, so the copy is sized to the result.
         
         Args:
             symbol: Stock symbol
             interval: Bar interval
             internal: If True, bypass session_active check.
+            start: Optional start timestamp (inclusive)
+            end: Optional end timestamp (inclusive)
             
         Returns:
-            All bars chronologically ordered
+            All bars (in range) chronologically ordered
         """
         # Block external callers during deactivation
         if not internal and not self._session_active:
@@ -1582,7 +1797,7 @@ class SessionData:
         
         symbol = symbol.upper()
         
-        with self._lock:
+        with self._symbol_lock(symbol):
             symbol_data = self._symbols.get(symbol)
             if symbol_data is None:
                 return []
@@ -1593,14 +1808,27 @@ class SessionData:
             interval_key = f"{interval}m" if isinstance(interval, int) else interval
             historical_data = symbol_data.historical.bars.get(interval_key)
             if historical_data and historical_data.data_by_date:
+                start_date = start.date() if start is not None else None
+                end_date = end.date() if end is not None else None
                 for bar_date in sorted(historical_data.data_by_date.keys()):
-                    all_bars.extend(historical_data.data_by_date[bar_date])
+                    if start_date is not None and bar_date < start_date:
+                        continue
+                    if end_date is not None and bar_date > end_date:
+                        break
+                    day_bars = historical_data.data_by_date[bar_date]
+                    if bar_date == start_date or bar_date == end_date:
+                        all_bars.extend(bars_between(day_bars, start, end))
+                    else:
+                        all_bars.extend(day_bars)
             
             # Add current session bars from new structure
             interval_key = f"{interval}m" if isinstance(interval, int) else str(interval)
             interval_data = symbol_data.bars.get(interval_key)
             if interval_data:
-                all_bars.extend(list(interval_data.data))
+                if start is None and end is None:
+                    all_bars.extend(interval_data.data)
+                else:
+                    all_bars.extend(bars_between(interval_data.data, start, end))
             
             return all_bars
     
@@ -1629,37 +1857,39 @@ class SessionData:
         with self._lock:
             
             # For each symbol, move current session to historical
-            for symbol_data in self._symbols.values():
-                # Move all bars (base and derived) to historical
-                for interval_key, interval_data in symbol_data.bars.items():
-                    if len(interval_data.data) > 0:
-                        # Store with same interval key format
-                        if interval_key not in symbol_data.historical.bars:
-                            symbol_data.historical.bars[interval_key] = HistoricalBarIntervalData()
-                        
-                        symbol_data.historical.bars[interval_key].data_by_date[old_date] = list(interval_data.data)
-                
-                # Remove oldest day if exceeding trailing days
-                max_days = self.historical_bars_trailing_days
-                if max_days > 0:
-                    for interval_key in list(symbol_data.historical.bars.keys()):
-                        interval_data = symbol_data.historical.bars[interval_key]
-                        dates = sorted(interval_data.data_by_date.keys())
-                        while len(dates) > max_days:
-                            oldest = dates.pop(0)
-                            del interval_data.data_by_date[oldest]
-                            logger.debug(
-                                f"Removed oldest historical day: {oldest} for interval {interval_key}"
-                            )
-                
-                # Clear current session data from new structure
-                for interval_data in symbol_data.bars.values():
-                    interval_data.data.clear()
-                    interval_data.updated = False
-                
-                symbol_data.quotes.clear()
-                symbol_data.ticks.clear()
-                symbol_data.reset_session_metrics()
+            for symbol, symbol_data in self._symbols.items():
+                with self._symbol_lock(symbol):
+                    # Move all bars (base and derived) to historical
+                    for interval_key, interval_data in symbol_data.bars.items():
+                        if len(interval_data.data) > 0:
+                            # Store with same interval key format
+                            if interval_key not in symbol_data.historical.bars:
+                                symbol_data.historical.bars[interval_key] = HistoricalBarIntervalData()
+                            
+                            symbol_data.historical.bars[interval_key].data_by_date[old_date] = list(interval_data.data)
+                    
+                    # Remove oldest day if exceeding trailing days
+                    max_days = self.historical_bars_trailing_days
+                    if max_days > 0:
+                        for interval_key in list(symbol_data.historical.bars.keys()):
+                            interval_data = symbol_data.historical.bars[interval_key]
+                            dates = sorted(interval_data.data_by_date.keys())
+                            while len(dates) > max_days:
+                                oldest = dates.pop(0)
+                                del interval_data.data_by_date[oldest]
+                                logger.debug(
+                                    f"Removed oldest historical day: {oldest} for interval {interval_key}"
+                                )
+                    
+                    # Clear current session data from new structure
+                    for interval_data in symbol_data.bars.values():
+                        interval_data.clear()
+                    
+                    symbol_data.quotes.clear()
+                    symbol_data.ticks.clear()
+                    symbol_data.reset_session_metrics()
+            
+            self._republish_locked()
             
             # Session state managed by upkeep thread
         
@@ -1679,15 +1909,17 @@ class SessionData:
         """
         with self._lock:
             # Reset all symbol data using new structure
-            for symbol_data in self._symbols.values():
-                # Clear all bar intervals
-                for interval_data in symbol_data.bars.values():
-                    interval_data.data.clear()
-                    interval_data.updated = False
-                
-                symbol_data.quotes.clear()
-                symbol_data.ticks.clear()
-                symbol_data.reset_session_metrics()
+            for symbol, symbol_data in self._symbols.items():
+                with self._symbol_lock(symbol):
+                    # Clear all bar intervals
+                    for interval_data in symbol_data.bars.values():
+                        interval_data.clear()
+                    
+                    symbol_data.quotes.clear()
+                    symbol_data.ticks.clear()
+                    symbol_data.reset_session_metrics()
+            
+            self._republish_locked()
             
             current_date = self.get_current_session_date()
             logger.info(f"Reset session data for date: {current_date}")
@@ -1713,6 +1945,7 @@ class SessionData:
         with self._lock:
             num_symbols = len(self._symbols)
             self._symbols.clear()
+            self._publish_locked((), None)
             logger.warning(f"⚠ Session data cleared! Removed {num_symbols} symbols")
             import traceback
             logger.debug(f"Clear called from:\n{''.join(traceback.format_stack()[-5:-1])}")
@@ -1740,6 +1973,7 @@ class SessionData:
             
             # Remove SymbolSessionData
             del self._symbols[symbol]
+            self._publish_locked((), None)
             
             logger.info(
                 f"[SESSION_DATA] Removed {symbol} "
@@ -1776,11 +2010,35 @@ class SessionData:
         else:
             self.deactivate_session()
     
+    def set_historical_interval_data(
+        self,
+        symbol: str,
+        interval: str,
+        interval_data: HistoricalBarIntervalData
+    ) -> None:
+        """Install a symbol's historical bars for one interval (replaces existing).
+        
+        Used to carry a rolled historical window into a new session
+        without re-appending its bars.
+        
+        Args:
+            symbol: Stock symbol
+            interval: Bar interval (e.g., "1m", "1d")
+            interval_data: Historical bars to install
+        """
+        symbol = symbol.upper()
+        # Register first: the registry lock is never taken under a symbol lock
+        symbol_data = self._symbols.get(symbol) or self.register_symbol(symbol)
+        
+        with self._symbol_lock(symbol):
+            symbol_data.historical.bars[interval] = interval_data
+    
     def clear_historical_bars(self) -> None:
         """Clear all historical bars for all symbols."""
         with self._lock:
-            for symbol_data in self._symbols.values():
-                symbol_data.historical.bars.clear()
+            for symbol, symbol_data in self._symbols.items():
+                with self._symbol_lock(symbol):
+                    symbol_data.historical.bars.clear()
             logger.debug("Cleared all historical bars")
     
     def clear_symbol_historical(self, symbol: str) -> None:
@@ -1789,7 +2047,7 @@ class SessionData:
         Args:
             symbol: Symbol to clear historical data for
         """
-        with self._lock:
+        with self._symbol_lock(symbol):
             symbol_data = self._symbols.get(symbol)
             if symbol_data:
                 symbol_data.historical.bars.clear()
@@ -1803,17 +2061,18 @@ class SessionData:
         with self._lock:
             symbols_cleared = []
             for symbol, symbol_data in self._symbols.items():
-                # Get count from base interval before clearing
-                base_interval_data = symbol_data.bars.get(symbol_data.base_interval)
-                bars_before = len(base_interval_data.data) if base_interval_data else 0
-                
-                # Clear all bar intervals
-                for interval_data in symbol_data.bars.values():
-                    interval_data.data.clear()
-                    interval_data.updated = False
-                
-                symbol_data._latest_bar = None
+                with self._symbol_lock(symbol):
+                    # Get count from base interval before clearing
+                    base_interval_data = symbol_data.bars.get(symbol_data.base_interval)
+                    bars_before = len(base_interval_data.data) if base_interval_data else 0
+                    
+                    # Clear all bar intervals
+                    for interval_data in symbol_data.bars.values():
+                        interval_data.clear()
+                    
+                    symbol_data._latest_bar = None
                 symbols_cleared.append(f"{symbol}({bars_before}→0)")
+            self._republish_locked()
             logger.info(f"Cleared current session bars for {len(self._symbols)} symbols: {', '.join(symbols_cleared)}")
     
     def append_bar(self, symbol: str, interval: str, bar: BarData) -> None:
@@ -1826,10 +2085,10 @@ class SessionData:
         """
         symbol = symbol.upper()
         
-        with self._lock:
-            symbol_data = self._symbols.get(symbol)
-            if symbol_data is None:
-                symbol_data = self.register_symbol(symbol)
+        # Register first: the registry lock is never taken under a symbol lock
+        symbol_data = self._symbols.get(symbol) or self.register_symbol(symbol)
+        
+        with self._symbol_lock(symbol):
             
             # Store in historical bars by date
             bar_date = bar.timestamp.date()
@@ -1871,10 +2130,10 @@ class SessionData:
         else:
             interval_key = str(interval)
         
-        with self._lock:
-            symbol_data = self._symbols.get(symbol)
-            if symbol_data is None:
-                symbol_data = self.register_symbol(symbol)
+        # Register first: the registry lock is never taken under a symbol lock
+        symbol_data = self._symbols.get(symbol) or self.register_symbol(symbol)
+        
+        with self._symbol_lock(symbol):
             
             # Update quality in bar structure
             interval_data = symbol_data.bars.get(interval_key)
@@ -1902,7 +2161,7 @@ class SessionData:
         else:
             interval_key = str(interval)
         
-        with self._lock:
+        with self._symbol_lock(symbol):
             symbol_data = self._symbols.get(symbol)
             if symbol_data is None:
                 return None
@@ -1927,10 +2186,10 @@ class SessionData:
         else:
             interval_key = str(interval)
         
-        with self._lock:
-            symbol_data = self._symbols.get(symbol)
-            if symbol_data is None:
-                symbol_data = self.register_symbol(symbol)
+        # Register first: the registry lock is never taken under a symbol lock
+        symbol_data = self._symbols.get(symbol) or self.register_symbol(symbol)
+        
+        with self._symbol_lock(symbol):
             
             # Update gaps in bar structure
             interval_data = symbol_data.bars.get(interval_key)
@@ -1958,7 +2217,7 @@ class SessionData:
         else:
             interval_key = str(interval)
         
-        with self._lock:
+        with self._symbol_lock(symbol):
             symbol_data = self._symbols.get(symbol)
             if symbol_data is None:
                 return []
@@ -1976,10 +2235,8 @@ class SessionData:
             value: Indicator value (can be scalar, list, dict, etc.)
         """
         symbol = symbol.upper()
-        with self._lock:
-            symbol_data = self.get_symbol_data(symbol)
-            if symbol_data is None:
-                symbol_data = self.register_symbol(symbol)
+        symbol_data = self.get_symbol_data(symbol) or self.register_symbol(symbol)
+        with self._symbol_lock(symbol):
             symbol_data.historical.indicators[name] = value
             logger.debug(f"Set historical indicator for {symbol}: {name} = {value}")
     
@@ -2006,7 +2263,7 @@ class SessionData:
             max_price = session_data.get_historical_indicator("AAPL", "max_price_5d")
         """
         symbol = symbol.upper()
-        with self._lock:
+        with self._symbol_lock(symbol):
             symbol_data = self.get_symbol_data(symbol)
             if symbol_data is None:
                 return None
@@ -2026,7 +2283,7 @@ class SessionData:
             # {'avg_volume_2d': 12345678.9, 'max_price_5d': 150.25}
         """
         symbol = symbol.upper()
-        with self._lock:
+        with self._symbol_lock(symbol):
             symbol_data = self.get_symbol_data(symbol)
             if symbol_data is None:
                 return {}
@@ -2054,7 +2311,7 @@ class SessionData:
         
         symbol = symbol.upper()
         
-        with self._lock:
+        with self._symbol_lock(symbol):
             symbol_data = self._symbols.get(symbol)
             if not symbol_data:
                 return None
@@ -2105,13 +2362,26 @@ class SessionData:
             # No data available
             return None
     
-    def get_bars(self, symbol: str, interval: str, internal: bool = False) -> Optional[List[BarData]]:
+    def get_bars(
+        self,
+        symbol: str,
+        interval: str,
+        internal: bool = False,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> Optional[List[BarData]]:
         """Get all bars (historical + current session) for a symbol/interval.
         
+        Creates a copy. With start/end, the range is located by binary
+        search (O(log n + k)); for read-only access to the current session
+        without copying, use get_bars_ref().
+        
         Args:
             symbol: Stock symbol
             interval: Bar interval (e.g., "1m", "5m")
             internal: If True, bypass session_active check.
+            start: Optional start timestamp (inclusive)
+            end: Optional end timestamp (inclusive)
             
         Returns:
             List of bars in chronological order, or None if session deactivated
@@ -2131,7 +2401,7 @@ class SessionData:
         else:
             interval_int = interval
         
-        return self.get_all_bars_including_historical(symbol, interval_int)
+        return self.get_all_bars_including_historical(symbol, interval_int, start=start, end=end)
     
     # ==================== SCANNER FRAMEWORK SUPPORT ====================
     
@@ -2261,7 +2531,10 @@ class SessionData:
                     "period": 20,
                     "interval": "1d",
                     "type": "trend",
-                    "params": {}
+                    "params": {},
+                    "incremental": False,  # Optional: streaming updates
+                    "history": 0,          # Optional: recent values to keep
+                    "evaluation": "eager"  # Optional: "lazy" = on read
                 }
         
         Returns:
@@ -2273,80 +2546,83 @@ class SessionData:
         
         logger.info(f"[ADHOC] add_indicator({symbol}, {indicator_type}, interval={config.get('interval')})")
         
-        with self._lock:
-            # Register symbol if not exists
-            if symbol not in self._symbols:
-                self.register_symbol(symbol)
-            
-            symbol_data = self._symbols[symbol]
-            
-            # Create IndicatorConfig
-            indicator_config = IndicatorConfig(
-                name=indicator_type,
-                type=IndicatorType(config.get("type", "trend")),
-                period=config.get("period", 0),
-                interval=config["interval"],
-                params=config.get("params", {})
-            )
-            
-            key = indicator_config.make_key()
-            
-            # Check if already exists
-            if key in symbol_data.indicators:
-                logger.debug(f"{symbol}: Indicator {key} already exists")
-                return False
-            
-            # UNIFIED ROUTINE: Use requirement_analyzer to determine needed bars
-            logger.debug(f"Analyzing requirements for {key}...")
-            
-            # Get SystemManager from SessionCoordinator
-            if not self._session_coordinator:
-                logger.error("SessionCoordinator not set - cannot analyze indicator requirements")
-                return False
-            
-            system_manager = self._session_coordinator._system_manager
-            
-            # Analyze requirements (creates its own DB session internally)
-            from app.threads.quality.requirement_analyzer import analyze_indicator_requirements
-            requirements = analyze_indicator_requirements(
-                indicator_config=indicator_config,
-                system_manager=system_manager,
-                warmup_multiplier=2.0,  # 2x period for warmup
-                from_date=None,  # Use current date
-                exchange="NYSE"
-            )
-            
-            logger.info(
-                f"[ADHOC] Indicator {key} requires: "
-                f"intervals={requirements.required_intervals}, "
-                f"historical_bars={requirements.historical_bars}, "
-                f"historical_days={requirements.historical_days}"
-            )
-            logger.debug(f"[ADHOC] Reasoning: {requirements.reason}")
-            
-            # Provision required bars automatically
-            for required_interval in requirements.required_intervals:
-                # Add historical bars for warmup
-                if requirements.historical_days > 0:
-                    logger.debug(
-                        f"[ADHOC] Provisioning {requirements.historical_days} days "
-                        f"of {required_interval} bars for {symbol}"
-                    )
-                    self.add_historical_bars(
-                        symbol=symbol,
-                        interval=required_interval,
-                        days=requirements.historical_days
-                    )
-                
-                # Add session bars for real-time updates
-                logger.debug(f"[ADHOC] Provisioning {required_interval} session bars for {symbol}")
-                self.add_session_bars(
+        # Register symbol if not exists
+        symbol_data = self._symbols.get(symbol) or self.register_symbol(symbol)
+        
+        # Create IndicatorConfig
+        indicator_config = IndicatorConfig(
+            name=indicator_type,
+            type=IndicatorType(config.get("type", "trend")),
+            period=config.get("period", 0),
+            interval=config["interval"],
+            params=config.get("params", {}),
+            incremental=config.get("incremental", False),
+            history=config.get("history", 0),
+            evaluation=config.get("evaluation", "eager")
+        )
+        
+        key = indicator_config.make_key()
+        
+        # Check if already exists
+        with self._symbol_lock(symbol):
+            exists = key in symbol_data.indicators
+        if exists:
+            logger.debug(f"{symbol}: Indicator {key} already exists")
+            return False
+        
+        # UNIFIED ROUTINE: Use requirement_analyzer to determine needed bars
+        # (runs without locks - it queries the database)
+        logger.debug(f"Analyzing requirements for {key}...")
+        
+        # Get SystemManager from SessionCoordinator
+        if not self._session_coordinator:
+            logger.error("SessionCoordinator not set - cannot analyze indicator requirements")
+            return False
+        
+        system_manager = self._session_coordinator._system_manager
+        
+        # Analyze requirements (creates its own DB session internally)
+        from app.threads.quality.requirement_analyzer import analyze_indicator_requirements
+        requirements = analyze_indicator_requirements(
+            indicator_config=indicator_config,
+            system_manager=system_manager,
+            warmup_multiplier=2.0,  # 2x period for warmup
+            from_date=None,  # Use current date
+            exchange="NYSE"
+        )
+        
+        logger.info(
+            f"[ADHOC] Indicator {key} requires: "
+            f"intervals={requirements.required_intervals}, "
+            f"historical_bars={requirements.historical_bars}, "
+            f"historical_days={requirements.historical_days}"
+        )
+        logger.debug(f"[ADHOC] Reasoning: {requirements.reason}")
+        
+        # Provision required bars automatically
+        for required_interval in requirements.required_intervals:
+            # Add historical bars for warmup
+            if requirements.historical_days > 0:
+                logger.debug(
+                    f"[ADHOC] Provisioning {requirements.historical_days} days "
+                    f"of {required_interval} bars for {symbol}"
+                )
+                self.add_historical_bars(
                     symbol=symbol,
-                    interval=required_interval
+                    interval=required_interval,
+                    days=requirements.historical_days
                 )
             
-            # Add metadata (invalid until calculated)
-            from app.indicators import IndicatorData
+            # Add session bars for real-time updates
+            logger.debug(f"[ADHOC] Provisioning {required_interval} session bars for {symbol}")
+            self.add_session_bars(
+                symbol=symbol,
+                interval=required_interval
+            )
+        
+        # Add metadata (invalid until calculated)
+        from app.indicators import IndicatorData
+        with self._symbol_lock(symbol):
             symbol_data.indicators[key] = IndicatorData(
                 name=indicator_type,
                 type=config.get("type", "trend"),
@@ -2355,24 +2631,24 @@ class SessionData:
                 last_updated=None,
                 valid=False
             )
-            
-            # Register with IndicatorManager
-            if self._indicator_manager:
-                self._indicator_manager.register_symbol_indicators(
-                    symbol=symbol,
-                    indicators=[indicator_config],
-                    historical_bars=None  # Will calculate when bars available
-                )
-                logger.debug(f"Registered indicator {key} with IndicatorManager")
-            else:
-                logger.warning("IndicatorManager not set, indicator not registered")
-            
-            logger.success(
-                f"[ADHOC] Added indicator {key} for {symbol} "
-                f"(provisioned {len(requirements.required_intervals)} intervals, "
-                f"{requirements.historical_days} days historical)"
+        
+        # Register with IndicatorManager
+        if self._indicator_manager:
+            self._indicator_manager.register_symbol_indicators(
+                symbol=symbol,
+                indicators=[indicator_config],
+                historical_bars=None  # Will calculate when bars available
             )
-            return True
+            logger.debug(f"Registered indicator {key} with IndicatorManager")
+        else:
+            logger.warning("IndicatorManager not set, indicator not registered")
+        
+        logger.success(
+            f"[ADHOC] Added indicator {key} for {symbol} "
+            f"(provisioned {len(requirements.required_intervals)} intervals, "
+            f"{requirements.historical_days} days historical)"
+        )
+        return True
     
     def add_symbol(self, symbol: str) -> bool:
         """Add symbol as full strategy symbol (idempotent).
@@ -2705,16 +2981,29 @@ class SessionData:
         # Get last export time before updating it
         last_export_time = self._last_export_time
         
+        # Published snapshots serialize without SessionData locks, so an
+        # export never stalls the coordinator/processor hot path
+        published = self._snapshot.symbols
+        with self._lock:
+            symbols = dict(self._symbols)
+        
         result = {
             "_session_active": self._session_active,
-            "_active_symbols": sorted(list(self._symbols.keys())),
+            "_active_symbols": sorted(symbols.keys()),
+            "_lock_stats": self.get_lock_stats(),
             "symbols": {}
         }
         
         # Export each symbol's data
-        with self._lock:
-            for symbol, symbol_data in self._symbols.items():
-                result["symbols"][symbol] = symbol_data.to_json(complete=complete)
+        with self._export_lock:
+            for symbol, symbol_data in symbols.items():
+                snapshot = published.get(symbol)
+                if snapshot is not None:
+                    result["symbols"][symbol] = symbol_data.to_json(complete=complete, snapshot=snapshot)
+                else:
+                    # Not published yet (no timestamp processed): live data, locked
+                    with self._symbol_lock(symbol):
+                        result["symbols"][symbol] = symbol_data.to_json(complete=complete)
             
             # Update last export time for next delta
             # Always use TimeManager through session coordinator
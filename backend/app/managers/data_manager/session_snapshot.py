@@ -0,0 +1,236 @@
+"""Session Data Snapshots
+
+Immutable per-symbol versions of SessionData, published once per processed
+timestamp (DataProcessor, after derived bars and indicators are up to
+date). Readers - AnalysisEngine, strategies, JSON export for the API/CLI -
+take the published snapshot with a single attribute read: no
+SessionData lock, and no copy of bar history.
+
+How history stays immutable without copying it:
+- Bar containers only grow at the end between publications, so a
+  snapshot just records (container, length) and BarsView exposes that
+  prefix. Later appends land past the recorded length and are invisible.
+- Writers that rewrite history (gap-fill insertion, session reset) swap
+  in a new container instead of editing the old one in place.
+- ColumnarBarSeries is copy-on-write: snapshot() hands out a frozen view
+  of the current rows, and the series moves to fresh arrays before it
+  would overwrite a row that view can see (clear, ring compaction).
+
+Small per-symbol state (quality, gaps, metrics, indicator values) is
+copied at publication. Lazy indicators are copied with the frozen bars they
+still have to fold in, and evaluated when the snapshot is read.
+
+Example:
+    snapshot = session_data.get_symbol_snapshot("AAPL")
+    bars = snapshot.get_bars("5m")      # stable while new bars arrive
+    sma = snapshot.get_indicator_value("sma_20_5m")
+"""
+import copy
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Iterator, List, Mapping, Optional, Sequence, Union
+
+from app.indicators.manager import indicator_history, indicator_value, refresh_indicator
+from app.managers.data_manager.columnar_bars import ColumnarBarSeries
+from app.models.trading import BarData
+
+
+def _empty_mapping() -> Mapping:
+    return MappingProxyType({})
+
+
+class BarsView(Sequence):
+    """Read-only view of the first `length` bars of a deque/list.
+
+    Indexing, slicing and iteration never look past `length`, so bars
+    appended after the snapshot was taken are not visible.
+    """
+
+    __slots__ = ("_container", "_length")
+
+    def __init__(self, container: Sequence[BarData], length: int):
+        self._container = container
+        self._length = length
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[BarData, List[BarData]]:
+        if isinstance(index, slice):
+            return [self._container[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("BarsView index out of range")
+        return self._container[index]
+
+    def __iter__(self) -> Iterator[BarData]:
+        # By index: a deque iterator raises if the writer appends meanwhile
+        container = self._container
+        for i in range(self._length):
+            yield container[i]
+
+    def __reversed__(self) -> Iterator[BarData]:
+        container = self._container
+        for i in range(self._length - 1, -1, -1):
+            yield container[i]
+
+    def __repr__(self) -> str:
+        return f"BarsView({self._length} bars)"
+
+
+def freeze_bars(container: Sequence[BarData]) -> Sequence[BarData]:
+    """Immutable view of a bar container as it is now (no copy)."""
+    if isinstance(container, ColumnarBarSeries):
+        return container.snapshot()
+    return BarsView(container, len(container))
+
+
+@dataclass(frozen=True)
+class IntervalSnapshot:
+    """Published state of one bar interval (mirrors BarIntervalData)."""
+    derived: bool
+    base: Optional[str]
+    data: Sequence[BarData]
+    quality: float
+    gaps: tuple = ()
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Published session metrics (mirrors SessionMetrics)."""
+    volume: int = 0
+    high: Optional[float] = None
+    low: Optional[float] = None
+    last_update: Optional[datetime] = None
+
+
+@dataclass(frozen=True)
+class SymbolSnapshot:
+    """Immutable version of one symbol's session data.
+
+    Attributes:
+        symbol: Stock symbol
+        epoch: Publication counter of the SessionSnapshot it was published in
+        timestamp: Session time of publication (None if unknown)
+        bars: interval -> IntervalSnapshot
+        indicators: indicator key -> IndicatorData copy
+        metrics: Session metrics at publication
+    """
+    symbol: str
+    epoch: int
+    timestamp: Optional[datetime]
+    bars: Mapping[str, IntervalSnapshot] = field(default_factory=_empty_mapping)
+    indicators: Mapping[str, Any] = field(default_factory=_empty_mapping)
+    metrics: MetricsSnapshot = field(default_factory=MetricsSnapshot)
+
+    @classmethod
+    def capture(
+        cls,
+        symbol_data: Any,
+        epoch: int,
+        timestamp: Optional[datetime] = None
+    ) -> "SymbolSnapshot":
+        """Snapshot a SymbolSessionData (caller holds its symbol lock).
+
+        Args:
+            symbol_data: SymbolSessionData to capture
+            epoch: Epoch being published
+            timestamp: Session time of publication
+
+        Returns:
+            New SymbolSnapshot
+        """
+        bars = {
+            interval: IntervalSnapshot(
+                derived=interval_data.derived,
+                base=interval_data.base,
+                data=freeze_bars(interval_data.data),
+                quality=interval_data.quality,
+                gaps=tuple(interval_data.gaps)
+            )
+            for interval, interval_data in symbol_data.bars.items()
+        }
+        # Values are replaced, never mutated in place: a shallow copy is enough
+        indicators = {
+            key: copy.copy(indicator)
+            for key, indicator in symbol_data.indicators.items()
+        }
+        metrics = symbol_data.metrics
+        return cls(
+            symbol=symbol_data.symbol,
+            epoch=epoch,
+            timestamp=timestamp,
+            bars=MappingProxyType(bars),
+            indicators=MappingProxyType(indicators),
+            metrics=MetricsSnapshot(
+                volume=metrics.volume,
+                high=metrics.high,
+                low=metrics.low,
+                last_update=metrics.last_update
+            )
+        )
+
+    def get_bars(self, interval: Union[int, str]) -> Sequence[BarData]:
+        """Bars of an interval at publication (empty if not tracked)."""
+        interval_data = self.bars.get(_interval_key(interval))
+        return interval_data.data if interval_data else ()
+
+    def get_quality(self, interval: Union[int, str]) -> Optional[float]:
+        """Quality of an interval at publication (None if not tracked)."""
+        interval_data = self.bars.get(_interval_key(interval))
+        return interval_data.quality if interval_data else None
+
+    def get_indicator(self, indicator_key: str) -> Optional[Any]:
+        """IndicatorData at publication (None if not registered).
+
+        A lazy indicator is caught up to the bars of publication on read
+        (see indicators.manager.refresh_indicator).
+        """
+        return refresh_indicator(self.indicators.get(indicator_key), self.symbol)
+
+    def get_indicator_value(self, indicator_key: str, field: Optional[str] = None):
+        """Indicator value at publication (see indicators.manager.indicator_value)."""
+        return indicator_value(self.get_indicator(indicator_key), indicator_key, field)
+
+    def get_indicator_history(self, indicator_key: str, n: int, field: Optional[str] = None):
+        """Last n indicator values up to publication (see indicators.manager.indicator_history).
+
+        The history buffer is shared with the live indicator, so entries
+        recorded after publication are skipped by timestamp.
+        """
+        indicator = self.get_indicator(indicator_key)
+        until = indicator.last_updated if indicator is not None else None
+        return indicator_history(indicator, n, field, until)
+
+
+@dataclass(frozen=True)
+class SessionSnapshot:
+    """Consistent cross-symbol view: the symbol snapshots of one epoch.
+
+    Attributes:
+        epoch: Incremented on every publication (0 = nothing published)
+        timestamp: Session time of the latest publication
+        symbols: symbol -> SymbolSnapshot
+    """
+    epoch: int = 0
+    timestamp: Optional[datetime] = None
+    symbols: Mapping[str, SymbolSnapshot] = field(default_factory=_empty_mapping)
+
+    def get(self, symbol: str) -> Optional[SymbolSnapshot]:
+        return self.symbols.get(symbol.upper())
+
+
+def _interval_key(interval: Union[int, str]) -> str:
+    return f"{interval}m" if isinstance(interval, int) else str(interval)
+
+
+__all__ = [
+    'BarsView',
+    'IntervalSnapshot',
+    'MetricsSnapshot',
+    'SymbolSnapshot',
+    'SessionSnapshot',
+    'freeze_bars',
+]
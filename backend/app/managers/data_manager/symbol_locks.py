@@ -0,0 +1,98 @@
+"""Per-Symbol Locks for SessionData
+
+SessionData splits its locking in two:
+- a registry lock for membership (the symbols dict, config symbols,
+  symbol locks) and for publishing snapshots
+- one SymbolLock per symbol for that symbol's bars, quality, gaps,
+  indicators and historical data
+
+Work on different symbols (quality updates, historical loads, reads)
+proceeds concurrently. Lock order is registry -> symbol: code holding a
+symbol lock never takes the registry lock.
+
+Every lock counts acquisitions and contentions (acquisitions that had to
+wait), so the effect of striping is visible in SessionData.get_lock_stats().
+"""
+import threading
+from typing import Any, Dict
+
+
+class ContentionLock:
+    """Re-entrant lock that counts how often acquiring it had to wait.
+
+    Each acquire first tries without blocking; only if that fails is it
+    counted as contended and the caller blocks. Counters are updated while
+    the lock is held, so they need no lock of their own.
+    """
+
+    __slots__ = ("name", "_lock", "acquisitions", "contentions")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.RLock()
+        self.acquisitions = 0
+        self.contentions = 0
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        if self._lock.acquire(blocking=False):
+            self.acquisitions += 1
+            return True
+        if not blocking or not self._lock.acquire(timeout=timeout):
+            return False
+        self.acquisitions += 1
+        self.contentions += 1
+        return True
+
+    def release(self) -> None:
+        self._lock.release()
+
+    def __enter__(self) -> "ContentionLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
+
+    def stats(self) -> Dict[str, int]:
+        return {"acquisitions": self.acquisitions, "contentions": self.contentions}
+
+    def reset_stats(self) -> None:
+        self.acquisitions = 0
+        self.contentions = 0
+
+    def __repr__(self) -> str:
+        return f"ContentionLock({self.name}, {self.contentions}/{self.acquisitions} contended)"
+
+
+class SymbolLocks:
+    """One ContentionLock per symbol, created on first use."""
+
+    def __init__(self):
+        self._locks: Dict[str, ContentionLock] = {}
+
+    def get(self, symbol: str) -> ContentionLock:
+        """Lock of a symbol (symbol must already be upper case)."""
+        lock = self._locks.get(symbol)
+        if lock is None:
+            # setdefault is atomic: racing creators end up with the same lock
+            lock = self._locks.setdefault(symbol, ContentionLock(symbol))
+        return lock
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-symbol counters plus totals."""
+        locks = list(self._locks.values())
+        return {
+            "acquisitions": sum(lock.acquisitions for lock in locks),
+            "contentions": sum(lock.contentions for lock in locks),
+            "symbols": {lock.name: lock.stats() for lock in locks},
+        }
+
+    def reset_stats(self) -> None:
+        for lock in list(self._locks.values()):
+            lock.reset_stats()
+
+
+__all__ = [
+    'ContentionLock',
+    'SymbolLocks',
+]
@@ -14,7 +14,7 @@ Key Responsibilities:
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Any, Dict, List, Sequence, Tuple
 from datetime import date
 
 # Logging
@@ -26,11 +26,18 @@ from app.core.enums import SystemState, OperationMode
 
 # Models
 from app.models.session_config import SessionConfig
+from app.models.strategy_config import StrategyConfig
 from app.models.database import SessionLocal
 
 # Monitoring
 from app.monitoring.performance_metrics import PerformanceMetrics
 
+if TYPE_CHECKING:
+    from app.managers.system_manager.parallel_backtest import ParallelBacktestReport
+    from app.managers.system_manager.parameter_sweep import ParameterSweepReport
+    from app.strategies.base import SignalRecord
+    from app.threads.analysis_engine import Signal
+
 
 class SystemManager:
     """
@@ -311,6 +318,24 @@ class SystemManager:
         # Load config
         config = SessionConfig.from_file(str(config_path))
         
+        return self.apply_session_config(config)
+    
+    def apply_session_config(self, config: SessionConfig) -> SessionConfig:
+        """
+        Validate an in-memory session configuration and adopt its exchange/mode.
+        
+        Used by load_session_config() and by runners that build configs
+        programmatically (parameter sweeps).
+        
+        Args:
+            config: Session configuration
+            
+        Returns:
+            The validated SessionConfig
+            
+        Raises:
+            ValueError: If config validation fails
+        """
         # Validate
         config.validate()
         
@@ -377,7 +402,13 @@ class SystemManager:
     # System Lifecycle
     # =========================================================================
     
-    def start(self, config_file: Optional[str] = None) -> bool:
+    def start(
+        self,
+        config_file: Optional[str] = None,
+        backtest_window: Optional[Tuple[date, date]] = None,
+        session_config: Optional[SessionConfig] = None,
+        analysis_strategies: Optional[Sequence[StrategyConfig]] = None
+    ) -> bool:
         """
         Start the trading system.
         
@@ -392,6 +423,12 @@ class SystemManager:
         
         Args:
             config_file: Path to session config (default: session_configs/example_session.json)
+            backtest_window: Optional (start_date, end_date) overriding the config's
+                backtest window (used by parallel backtest shards)
+            session_config: In-memory config to use instead of config_file
+            analysis_strategies: Strategies the AnalysisEngine instantiates
+                for this run (used by parameter sweeps of AnalysisEngine
+                strategies)
             
         Returns:
             True if started successfully
@@ -413,8 +450,14 @@ class SystemManager:
         try:
             # 1. Load configuration
             logger.info("[SESSION_FLOW] 2.a: SystemManager - Loading configuration")
-            logger.info(f"Loading configuration: {config_file}")
-            self._session_config = self.load_session_config(config_file)
+            if session_config is not None:
+                logger.info(f"Using in-memory configuration: {session_config.session_name}")
+                self._session_config = self.apply_session_config(session_config)
+            else:
+                logger.info(f"Loading configuration: {config_file}")
+                self._session_config = self.load_session_config(config_file)
+            if backtest_window is not None:
+                self._apply_backtest_window_override(*backtest_window)
             logger.info(f"[SESSION_FLOW] 2.a: Complete - Config loaded: {self._session_config.session_name}")
             
             # 2. Initialize managers
@@ -477,6 +520,8 @@ class SystemManager:
             logger.info("[SESSION_FLOW] 2.e: SystemManager - Creating 4-thread pool")
             logger.info("Creating thread pool...")
             self._create_thread_pool(session_data, time_manager, data_manager)
+            if analysis_strategies:
+                self._analysis_engine.load_strategies(analysis_strategies)
             logger.info("[SESSION_FLOW] 2.e: Complete - Thread pool created")
             
             # 6. Wire threads together
@@ -525,6 +570,26 @@ class SystemManager:
             self._state = SystemState.STOPPED
             raise RuntimeError(f"System startup failed: {e}") from e
     
+    def _apply_backtest_window_override(self, start_date: date, end_date: date) -> None:
+        """Replace the loaded config's backtest window before startup.
+        
+        Args:
+            start_date: Window start (inclusive)
+            end_date: Window end (inclusive)
+            
+        Raises:
+            ValueError: If config is not a backtest config or dates are invalid
+        """
+        if self._session_config.mode != "backtest" or self._session_config.backtest_config is None:
+            raise ValueError("backtest_window override requires a backtest session config")
+        
+        backtest_config = self._session_config.backtest_config
+        backtest_config.start_date = start_date.strftime("%Y-%m-%d")
+        backtest_config.end_date = end_date.strftime("%Y-%m-%d")
+        backtest_config.validate()
+        
+        logger.info(f"Backtest window override: {start_date} to {end_date}")
+    
     def _create_thread_pool(
         self,
         session_data: SessionData,
@@ -646,6 +711,9 @@ class SystemManager:
         self._analysis_engine.set_notification_queue(analysis_queue)
         self._analysis_engine.set_processor_subscription(analysis_subscription)
         
+        # 6. Processor → analysis direct calls (fused backtest pipeline)
+        self._data_processor.set_analysis_engine(self._analysis_engine)
+        
         logger.success("Thread pool wired")
     
     def _log_startup_success(self):
@@ -685,6 +753,8 @@ class SystemManager:
             logger.info(f"End Date:       {time_mgr.backtest_end_date}")
             if config.backtest_config:
                 logger.info(f"Speed:          {config.backtest_config.speed_multiplier}x")
+                if config.backtest_config.fused:
+                    logger.info("Pipeline:       fused (single-threaded)")
         
         logger.info("")
         logger.info("Thread Pool:    4 threads")
@@ -708,7 +778,7 @@ class SystemManager:
         Returns:
             True if stopped successfully
         """
-        if self._state == SystemState.STOPPED:
+        if self._state == SystemState.STOPPED and self._coordinator is None:
             logger.debug("System already stopped")
             return True
         
@@ -844,6 +914,118 @@ class SystemManager:
         
         return True
     
+    def wait_for_completion(self, timeout: Optional[float] = None) -> bool:
+        """Block until the SessionCoordinator finishes (backtest end).
+        
+        The coordinator sets state to STOPPED when the backtest window is
+        exhausted; call stop() afterwards to shut down the remaining threads.
+        
+        Args:
+            timeout: Max seconds to wait (None = wait forever)
+            
+        Returns:
+            True if the coordinator finished, False on timeout or if never started
+        
+        Raises:
+            RuntimeError: The coordinator loop ended on an error (the
+                backtest did not cover its whole window)
+        """
+        coordinator = self._coordinator
+        if coordinator is None:
+            return False
+        
+        coordinator.join(timeout=timeout)
+        if coordinator.is_alive():
+            return False
+        
+        if coordinator.error is not None:
+            raise RuntimeError(
+                f"Backtest aborted: coordinator failed ({coordinator.error})"
+            ) from coordinator.error
+        return True
+    
+    def run_parallel_backtest(
+        self,
+        config_file: str,
+        max_workers: Optional[int] = None,
+        num_shards: Optional[int] = None
+    ) -> 'ParallelBacktestReport':
+        """Run a backtest with trading days sharded across worker processes.
+        
+        Each shard runs an isolated SystemManager in its own process; this
+        instance only plans shards and merges results. See
+        parallel_backtest.run_parallel_backtest() for the cross-day state caveat.
+        
+        Args:
+            config_file: Path to backtest session config JSON
+            max_workers: Worker processes (default: CPU count)
+            num_shards: Number of shards (default: max_workers)
+            
+        Returns:
+            Merged ParallelBacktestReport
+            
+        Raises:
+            RuntimeError: If this system is running
+        """
+        if self._state != SystemState.STOPPED:
+            raise RuntimeError(f"Cannot run parallel backtest - system is {self._state.value}")
+        
+        from app.managers.system_manager.parallel_backtest import run_parallel_backtest
+        return run_parallel_backtest(config_file, max_workers=max_workers, num_shards=num_shards)
+    
+    def run_parameter_sweep(
+        self,
+        config_file: str,
+        grid: Dict[str, List[Any]],
+        strategy: Optional[str] = None,
+        max_workers: Optional[int] = None
+    ) -> 'ParameterSweepReport':
+        """Backtest every combination of a strategy parameter grid.
+        
+        All variants run side by side in one system per day shard, so bars,
+        historical data and indicators are loaded once per day, not once per
+        variant. See parameter_sweep.run_parameter_sweep().
+        
+        Args:
+            config_file: Path to backtest session config JSON
+            grid: Parameter name -> list of values
+            strategy: Module path of the strategy to vary (default: the only
+                enabled strategy); AnalysisEngine strategies such as
+                sma_crossover are named here
+            max_workers: Worker processes for day shards (default: 1)
+            
+        Returns:
+            ParameterSweepReport with one row per variant
+            
+        Raises:
+            RuntimeError: If this system is running
+        """
+        if self._state != SystemState.STOPPED:
+            raise RuntimeError(f"Cannot run parameter sweep - system is {self._state.value}")
+        
+        from app.managers.system_manager.parameter_sweep import run_parameter_sweep
+        return run_parameter_sweep(config_file, grid, strategy=strategy, max_workers=max_workers)
+    
+    def get_strategy_signals(self) -> Dict[str, List['SignalRecord']]:
+        """Get signals generated by each loaded strategy during this run.
+        
+        Returns:
+            Dictionary: strategy name -> signal records (empty if no strategies)
+        """
+        if self._strategy_manager is None:
+            return {}
+        return self._strategy_manager.get_signals()
+    
+    def get_generated_signals(self) -> List['Signal']:
+        """Get signals generated by the AnalysisEngine during this run.
+        
+        Returns:
+            Signals in generation order (empty if engine not created)
+        """
+        if self._analysis_engine is None:
+            return []
+        return self._analysis_engine.get_signals()
+    
     # =========================================================================
     # State Queries
     # =========================================================================
@@ -0,0 +1,424 @@
+"""
+Parallel Backtest Runner - Multi-day backtests across a process pool
+
+SessionCoordinator runs backtest days strictly one after another. When a
+session config carries no state across days (strategies flat at EOD,
+historical windows loaded per session from the database), the days are
+independent and can run in parallel.
+
+Workflow:
+1. Expand the BacktestConfig window into trading days (TimeManager calendar)
+2. Split the days into contiguous shards (one per worker by default)
+3. Run each shard in its own process: a fresh SystemManager with the full
+   coordinator/processor/quality/analysis thread stack, whose backtest
+   window is overridden to the shard's dates
+4. Merge per-shard PerformanceMetrics and signals into one report
+
+Processes (not threads) give full isolation: SystemManager, SessionData and
+the manager singletons are per-process, and worker processes are never
+reused across shards (max_tasks_per_child=1).
+
+Usage:
+    from app.managers.system_manager.parallel_backtest import run_parallel_backtest
+
+    report = run_parallel_backtest("session_configs/example_session.json", max_workers=8)
+    print(report.format_report())
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence, Union
+
+# Logging
+from app.logger import logger
+
+from app.models.session_config import SessionConfig
+from app.models.strategy_config import StrategyConfig
+from app.models.database import SessionLocal
+from app.monitoring.performance_metrics import PerformanceMetrics
+
+
+# =============================================================================
+# Data Structures
+# =============================================================================
+
+@dataclass(frozen=True)
+class BacktestShard:
+    """Contiguous block of trading days run by one worker.
+
+    Attributes:
+        index: Shard number (chronological)
+        start_date: First trading day (inclusive)
+        end_date: Last trading day (inclusive)
+        trading_days: Number of trading days in the shard
+    """
+    index: int
+    start_date: date
+    end_date: date
+    trading_days: int
+
+
+@dataclass
+class ShardResult:
+    """Outcome of one shard run (returned from the worker process).
+
+    Attributes:
+        shard: Shard that was run
+        metrics: Shard's PerformanceMetrics (None if it failed to start)
+        signals: Signals generated by the shard's AnalysisEngine
+        strategy_signals: Strategy name -> SignalRecords from the shard's strategies
+        wall_time: Seconds spent in the worker
+        error: Error message if the shard failed
+    """
+    shard: BacktestShard
+    metrics: Optional[PerformanceMetrics] = None
+    signals: List = field(default_factory=list)
+    strategy_signals: Dict[str, List] = field(default_factory=dict)
+    wall_time: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def succeeded(self) -> bool:
+        """True if the shard ran to completion."""
+        return self.error is None
+
+
+@dataclass
+class ParallelBacktestReport:
+    """Merged result of a parallel backtest.
+
+    Attributes:
+        shards: Per-shard results (chronological)
+        metrics: PerformanceMetrics merged across successful shards
+        signals: All AnalysisEngine signals, ordered by timestamp
+        strategy_signals: Strategy name -> SignalRecords, chronological
+        workers: Number of worker processes used
+        wall_time: Total wall-clock seconds for the whole run
+    """
+    shards: List[ShardResult]
+    metrics: PerformanceMetrics
+    signals: List
+    strategy_signals: Dict[str, List]
+    workers: int
+    wall_time: float
+
+    @property
+    def failed_shards(self) -> List[ShardResult]:
+        """Shards that raised an error."""
+        return [result for result in self.shards if not result.succeeded]
+
+    @property
+    def speedup(self) -> float:
+        """Sum of shard times / wall time (ideal = workers)."""
+        shard_time = sum(result.wall_time for result in self.shards)
+        return shard_time / self.wall_time if self.wall_time > 0 else 0.0
+
+    def format_report(self) -> str:
+        """Format shard summary plus merged backtest metrics."""
+        lines = []
+        lines.append("Parallel Backtest Summary:")
+        lines.append("=" * 50)
+        lines.append(f"  - Workers: {self.workers}")
+        lines.append(f"  - Shards: {len(self.shards)} ({len(self.failed_shards)} failed)")
+        lines.append(f"  - Trading Days: {self.metrics.backtest_trading_days}")
+        lines.append(f"  - Signals: {len(self.signals)}")
+        for name, records in self.strategy_signals.items():
+            lines.append(f"  - Strategy {name}: {len(records)} signals")
+        lines.append(f"  - Wall Time: {self.wall_time:.2f} s")
+        lines.append(f"  - Speedup: {self.speedup:.2f}x")
+
+        for result in self.shards:
+            shard = result.shard
+            status = "OK" if result.succeeded else f"FAILED ({result.error})"
+            lines.append(
+                f"  [{shard.index}] {shard.start_date} to {shard.end_date} "
+                f"({shard.trading_days} days): {result.wall_time:.2f} s - {status}"
+            )
+
+        lines.append("")
+        lines.append(self.metrics.format_report('backtest'))
+        return "\n".join(lines)
+
+
+# =============================================================================
+# Sharding
+# =============================================================================
+
+def plan_backtest_shards(
+    trading_dates: Sequence[date],
+    num_shards: int
+) -> List[BacktestShard]:
+    """Split trading days into contiguous, evenly sized shards.
+
+    Contiguous blocks keep per-shard startup (historical load, indicator
+    warmup) to one cold start per worker. Shard sizes differ by at most one day.
+
+    Args:
+        trading_dates: Trading days in chronological order
+        num_shards: Desired number of shards (capped at number of days)
+
+    Returns:
+        Shards in chronological order (empty if no trading dates)
+
+    Raises:
+        ValueError: If num_shards < 1
+    """
+    if num_shards < 1:
+        raise ValueError(f"num_shards must be >= 1, got {num_shards}")
+
+    dates = sorted(trading_dates)
+    if not dates:
+        return []
+
+    num_shards = min(num_shards, len(dates))
+    base_size, remainder = divmod(len(dates), num_shards)
+
+    shards = []
+    start = 0
+    for index in range(num_shards):
+        size = base_size + (1 if index < remainder else 0)
+        block = dates[start:start + size]
+        shards.append(BacktestShard(
+            index=index,
+            start_date=block[0],
+            end_date=block[-1],
+            trading_days=len(block)
+        ))
+        start += size
+
+    return shards
+
+
+def _get_backtest_trading_dates(config: SessionConfig) -> List[date]:
+    """Expand the config's backtest window into trading days.
+
+    Args:
+        config: Backtest session config
+
+    Returns:
+        Trading days in the window (chronological)
+    """
+    from app.managers.system_manager.api import get_system_manager
+
+    backtest_config = config.backtest_config
+    start_date = datetime.strptime(backtest_config.start_date, "%Y-%m-%d").date()
+    end_date = datetime.strptime(backtest_config.end_date, "%Y-%m-%d").date()
+
+    time_manager = get_system_manager().get_time_manager()
+    with SessionLocal() as session:
+        return time_manager.get_trading_dates_in_range(
+            session,
+            start_date,
+            end_date,
+            exchange=config.exchange_group
+        )
+
+
+# =============================================================================
+# Worker
+# =============================================================================
+
+def run_backtest_shard(
+    config: Union[str, SessionConfig],
+    shard: BacktestShard,
+    analysis_strategies: Optional[Sequence[StrategyConfig]] = None
+) -> ShardResult:
+    """Run one shard to completion (executes in a worker process).
+
+    Args:
+        config: Path to session config JSON, or an in-memory SessionConfig
+        shard: Shard to run
+        analysis_strategies: Strategies the AnalysisEngine instantiates
+            (see SystemManager.start)
+
+    Returns:
+        ShardResult with metrics and signals, or error set on failure
+    """
+    from app.managers.system_manager.api import get_system_manager
+
+    start = time.perf_counter()
+    system_mgr = get_system_manager()
+
+    try:
+        logger.info(
+            f"[PARALLEL] Shard {shard.index} starting: "
+            f"{shard.start_date} to {shard.end_date} (pid {os.getpid()})"
+        )
+        window = (shard.start_date, shard.end_date)
+        if isinstance(config, SessionConfig):
+            system_mgr.start(
+                session_config=config,
+                backtest_window=window,
+                analysis_strategies=analysis_strategies
+            )
+        else:
+            system_mgr.start(config, backtest_window=window, analysis_strategies=analysis_strategies)
+        system_mgr.wait_for_completion()
+
+        result = ShardResult(
+            shard=shard,
+            metrics=system_mgr.performance_metrics,
+            signals=system_mgr.get_generated_signals(),
+            strategy_signals=system_mgr.get_strategy_signals()
+        )
+    except Exception as e:
+        logger.error(f"[PARALLEL] Shard {shard.index} failed: {e}", exc_info=True)
+        result = ShardResult(shard=shard, error=str(e))
+    finally:
+        system_mgr.stop()
+
+    result.wall_time = time.perf_counter() - start
+    logger.info(f"[PARALLEL] Shard {shard.index} finished in {result.wall_time:.2f}s")
+    return result
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+def merge_shard_results(
+    results: Sequence[ShardResult],
+    workers: int,
+    wall_time: float
+) -> ParallelBacktestReport:
+    """Merge per-shard results into one report.
+
+    Args:
+        results: Shard results (any order)
+        workers: Number of worker processes used
+        wall_time: Total wall-clock seconds
+
+    Returns:
+        ParallelBacktestReport
+    """
+    ordered = sorted(results, key=lambda result: result.shard.index)
+
+    merged = PerformanceMetrics()
+    signals = []
+    strategy_signals: Dict[str, List] = {}
+    for result in ordered:
+        if result.metrics is not None:
+            merged.merge(result.metrics)
+        signals.extend(result.signals)
+        # Shards are chronological, so concatenation keeps records in order
+        for name, records in result.strategy_signals.items():
+            strategy_signals.setdefault(name, []).extend(records)
+
+    # Stable sort: same-timestamp signals keep shard/generation order
+    signals.sort(key=lambda signal: signal.timestamp)
+
+    # Report the parallel wall time as the backtest duration
+    merged.backtest_start_time = 0.0
+    merged.backtest_end_time = wall_time
+
+    return ParallelBacktestReport(
+        shards=ordered,
+        metrics=merged,
+        signals=signals,
+        strategy_signals=strategy_signals,
+        workers=workers,
+        wall_time=wall_time
+    )
+
+
+def run_shards(
+    config: Union[str, SessionConfig],
+    shards: Sequence[BacktestShard],
+    workers: int,
+    analysis_strategies: Optional[Sequence[StrategyConfig]] = None
+) -> List[ShardResult]:
+    """Run shards on a pool of fresh worker processes.
+
+    Args:
+        config: Path to session config JSON, or an in-memory SessionConfig
+        shards: Shards to run
+        workers: Max concurrent worker processes
+        analysis_strategies: Strategies the AnalysisEngine instantiates in
+            every shard (see SystemManager.start)
+
+    Returns:
+        Shard results (completion order); crashed workers yield error results
+    """
+    results = []
+
+    # spawn: never inherit the parent's running threads/singletons
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        max_tasks_per_child=1
+    ) as executor:
+        futures = {
+            executor.submit(run_backtest_shard, config, shard, analysis_strategies): shard
+            for shard in shards
+        }
+        for future in as_completed(futures):
+            shard = futures[future]
+            try:
+                results.append(future.result())
+            except Exception as e:
+                # Worker process died (e.g. killed) - result never came back
+                logger.error(f"[PARALLEL] Shard {shard.index} crashed: {e}")
+                results.append(ShardResult(shard=shard, error=str(e)))
+
+    return results
+
+
+def run_parallel_backtest(
+    config_file: str,
+    max_workers: Optional[int] = None,
+    num_shards: Optional[int] = None
+) -> ParallelBacktestReport:
+    """Run a backtest with trading days sharded across worker processes.
+
+    Only valid for session configs without cross-day state: each shard
+    starts cold on its first day exactly as a sequential backtest starts on
+    its first day, so strategies carrying positions or state overnight
+    will see different results at shard boundaries.
+
+    Args:
+        config_file: Path to backtest session config JSON
+        max_workers: Worker processes (default: os.cpu_count())
+        num_shards: Number of shards (default: max_workers)
+
+    Returns:
+        Merged ParallelBacktestReport
+
+    Raises:
+        ValueError: If config is not a backtest config or has no trading days
+    """
+    config = SessionConfig.from_file(config_file)
+    config.validate()
+
+    if config.mode != "backtest" or config.backtest_config is None:
+        raise ValueError("Parallel backtest requires a backtest session config")
+
+    max_workers = max_workers or os.cpu_count() or 1
+    trading_dates = _get_backtest_trading_dates(config)
+    shards = plan_backtest_shards(trading_dates, num_shards or max_workers)
+
+    if not shards:
+        raise ValueError(
+            f"No trading days in backtest window "
+            f"{config.backtest_config.start_date} to {config.backtest_config.end_date}"
+        )
+
+    workers = min(max_workers, len(shards))
+    logger.info(
+        f"[PARALLEL] {len(trading_dates)} trading days -> "
+        f"{len(shards)} shards on {workers} workers"
+    )
+
+    start = time.perf_counter()
+    results = run_shards(config_file, shards, workers)
+    report = merge_shard_results(results, workers, time.perf_counter() - start)
+
+    if report.failed_shards:
+        logger.error(f"[PARALLEL] {len(report.failed_shards)} shard(s) failed")
+    logger.info(f"\n{report.format_report()}")
+
+    return report
@@ -0,0 +1,462 @@
+"""
+Parameter Sweep Runner - Backtest every combination of a strategy parameter grid
+
+Running one backtest per parameter combination repeats the expensive part
+(historical load, bar replay, derived bars, indicator warmup) once per
+variant although only the strategy logic differs.
+
+Instead, every variant is loaded as its own strategy instance into ONE
+session config:
+    simple_ma_cross  {fast_period: 5, slow_period: 20}  -> simple_ma_cross_v0
+    simple_ma_cross  {fast_period: 5, slow_period: 30}  -> simple_ma_cross_v1
+    ...
+StrategyManager runs each variant in its own StrategyThread, all fed from
+the same SessionData, so each day's bars and indicators are loaded and
+computed once and fanned out to every variant.
+
+Trading days can additionally be split into shards run in worker processes
+(same machinery as parallel_backtest), trading cross-day state for speed.
+
+AnalysisEngine strategies (sma_crossover, rsi_strategy) are not loaded by
+StrategyManager: name them with strategy= and the variants are passed to
+every shard as a per-run override that the AnalysisEngine instantiates
+(SystemManager.start(analysis_strategies=...)), one instance per variant.
+Their base config is their session_data_config.strategies entry if there
+is one (disabled, e.g. to set intervals), else the strategy's defaults.
+
+Usage:
+    from app.managers.system_manager.parameter_sweep import run_parameter_sweep
+
+    report = run_parameter_sweep(
+        "session_configs/my_strategy_backtest.json",
+        {"fast_period": [5, 10], "slow_period": [20, 30]}
+    )
+    print(report.format_report())
+"""
+
+import copy
+import importlib
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Logging
+from app.logger import logger
+
+from app.models.session_config import SessionConfig
+from app.models.strategy_config import StrategyConfig
+from app.managers.system_manager.parallel_backtest import (
+    ParallelBacktestReport,
+    _get_backtest_trading_dates,
+    merge_shard_results,
+    plan_backtest_shards,
+    run_shards,
+)
+from app.strategies.base import BaseStrategy, Signal, SignalAction, SignalRecord
+from app.threads.analysis_engine import BaseStrategy as AnalysisEngineStrategy
+from app.threads.analysis_engine import Signal as AnalysisEngineSignal
+
+
+# =============================================================================
+# Data Structures
+# =============================================================================
+
+@dataclass(frozen=True)
+class SweepVariant:
+    """One parameter combination.
+
+    Attributes:
+        name: Strategy instance name the variant runs under
+        params: Parameter values overriding the base strategy config
+    """
+    name: str
+    params: Dict[str, Any]
+
+
+@dataclass
+class SweepVariantResult:
+    """Backtest outcome of one variant.
+
+    P&L is a simple long-only replay of the variant's signals: BUY opens a
+    position when flat, SELL/CLOSE closes it, positions still open at the
+    end are marked at the last signal price seen for the symbol.
+
+    Attributes:
+        variant: Variant that was run
+        signals: Signal count
+        buys: BUY signal count
+        sells: SELL/CLOSE signal count
+        round_trips: Closed positions (including end-of-run marks)
+        net_pnl: Realized P&L in price units x quantity
+    """
+    variant: SweepVariant
+    signals: int = 0
+    buys: int = 0
+    sells: int = 0
+    round_trips: int = 0
+    net_pnl: float = 0.0
+
+    @classmethod
+    def from_signals(
+        cls,
+        variant: SweepVariant,
+        records: Sequence[SignalRecord]
+    ) -> 'SweepVariantResult':
+        """Summarize a variant's signal records (chronological)."""
+        result = cls(variant=variant, signals=len(records))
+        positions: Dict[str, Tuple[float, int]] = {}  # symbol -> (entry price, quantity)
+        last_price: Dict[str, float] = {}
+
+        for record in records:
+            signal = record.signal
+            if record.price is not None:
+                last_price[signal.symbol] = record.price
+
+            if signal.action == SignalAction.BUY:
+                result.buys += 1
+                if signal.symbol not in positions and record.price is not None:
+                    positions[signal.symbol] = (record.price, signal.quantity or 1)
+            elif signal.action in (SignalAction.SELL, SignalAction.CLOSE):
+                result.sells += 1
+                position = positions.pop(signal.symbol, None)
+                if position is not None and record.price is not None:
+                    entry, quantity = position
+                    result.net_pnl += (record.price - entry) * quantity
+                    result.round_trips += 1
+                elif position is not None:
+                    positions[signal.symbol] = position
+
+        # Mark open positions at the last known price
+        for symbol, (entry, quantity) in positions.items():
+            result.net_pnl += (last_price[symbol] - entry) * quantity
+            result.round_trips += 1
+
+        return result
+
+
+@dataclass
+class ParameterSweepReport:
+    """Results of a parameter sweep.
+
+    Attributes:
+        strategy: Module path of the swept strategy
+        results: One result per variant (grid order)
+        backtest: Underlying (merged) backtest report
+    """
+    strategy: str
+    results: List[SweepVariantResult]
+    backtest: ParallelBacktestReport
+
+    def ranked(self) -> List[SweepVariantResult]:
+        """Results sorted by net P&L (best first)."""
+        return sorted(self.results, key=lambda result: result.net_pnl, reverse=True)
+
+    def format_report(self) -> str:
+        """Format a results table, best variant first."""
+        lines = []
+        lines.append(f"Parameter Sweep: {self.strategy}")
+        lines.append("=" * 50)
+        lines.append(f"  - Variants: {len(self.results)}")
+        lines.append(f"  - Trading Days: {self.backtest.metrics.backtest_trading_days}")
+        lines.append(f"  - Shards: {len(self.backtest.shards)} ({len(self.backtest.failed_shards)} failed)")
+        lines.append(f"  - Wall Time: {self.backtest.wall_time:.2f} s")
+        lines.append("")
+
+        for result in self.ranked():
+            params = ", ".join(f"{key}={value}" for key, value in result.variant.params.items())
+            lines.append(
+                f"  {result.variant.name}: pnl={result.net_pnl:.2f} "
+                f"trades={result.round_trips} signals={result.signals} ({params})"
+            )
+
+        return "\n".join(lines)
+
+
+# =============================================================================
+# Grid / Config Expansion
+# =============================================================================
+
+def expand_parameter_grid(grid: Dict[str, Sequence[Any]]) -> List[Dict[str, Any]]:
+    """Expand a parameter grid into all combinations.
+
+    Args:
+        grid: Parameter name -> candidate values
+
+    Returns:
+        One dict per combination (last parameter varies fastest)
+
+    Raises:
+        ValueError: If the grid is empty or a parameter has no values
+    """
+    if not grid:
+        raise ValueError("Parameter grid is empty")
+
+    for name, values in grid.items():
+        if not values:
+            raise ValueError(f"Parameter '{name}' has no values")
+
+    names = list(grid.keys())
+    return [
+        dict(zip(names, combination))
+        for combination in itertools.product(*(grid[name] for name in names))
+    ]
+
+
+def _strategy_classes(module_path: str) -> Optional[List[type]]:
+    """Strategy classes (either framework) defined by a module.
+
+    Returns:
+        Classes found, or None if the module cannot be imported
+    """
+    try:
+        module = importlib.import_module(module_path)
+    except ImportError:
+        return None
+
+    return [
+        attr for attr in vars(module).values()
+        if isinstance(attr, type)
+        and issubclass(attr, (BaseStrategy, AnalysisEngineStrategy))
+        and attr not in (BaseStrategy, AnalysisEngineStrategy)
+    ]
+
+
+def _analysis_engine_module(name: str) -> Optional[str]:
+    """Module path of an AnalysisEngine strategy, given as path or short name.
+
+    Returns:
+        Module path, or None if name resolves to no module defining only
+        AnalysisEngine strategies
+    """
+    for module_path in (name, f"app.strategies.{name}"):
+        classes = _strategy_classes(module_path)
+        if classes and not any(issubclass(cls, BaseStrategy) for cls in classes):
+            return module_path
+    return None
+
+
+def _require_sweepable(module_path: str):
+    """Check that a module defines a strategy class (either framework).
+
+    Raises:
+        ValueError: If the module cannot be imported or defines no strategy
+    """
+    classes = _strategy_classes(module_path)
+    if classes is None:
+        raise ValueError(f"Strategy module '{module_path}' cannot be imported")
+    if not classes:
+        raise ValueError(f"Strategy module '{module_path}' defines no strategy class")
+
+
+def _find_target_strategy(config: SessionConfig, strategy: Optional[str]) -> StrategyConfig:
+    """Find the strategy config to vary.
+
+    An AnalysisEngine strategy named by strategy uses its (typically
+    disabled, as StrategyManager cannot load it) session config entry, or
+    a config of its own (module defaults) if it has none.
+
+    Raises:
+        ValueError: If no (or no unique) matching enabled strategy exists
+    """
+    enabled = [s for s in config.session_data_config.strategies if s.enabled]
+
+    if strategy is not None:
+        matches = [s for s in enabled if strategy in (s.module, s.instance_name)]
+        if not matches:
+            module_path = _analysis_engine_module(strategy)
+            if module_path is not None:
+                configured = [
+                    s for s in config.session_data_config.strategies if s.module == module_path
+                ]
+                return configured[0] if len(configured) == 1 else StrategyConfig(module=module_path)
+    else:
+        matches = enabled
+
+    if len(matches) != 1:
+        target = f"'{strategy}'" if strategy else "an enabled strategy"
+        raise ValueError(
+            f"Parameter sweep needs exactly one match for {target}, found {len(matches)}"
+        )
+
+    return matches[0]
+
+
+def is_analysis_engine_strategy(target: StrategyConfig) -> bool:
+    """Whether a sweep target runs in the AnalysisEngine (not StrategyManager)."""
+    return _analysis_engine_module(target.module) == target.module
+
+
+def variant_strategy_configs(
+    target: StrategyConfig,
+    variants: Sequence[SweepVariant]
+) -> List[StrategyConfig]:
+    """One StrategyConfig per variant (target config updated with its params)."""
+    return [
+        StrategyConfig(
+            module=target.module,
+            enabled=True,
+            config={**copy.deepcopy(target.config), **variant.params},
+            name=variant.name,
+            process=target.process
+        )
+        for variant in variants
+    ]
+
+
+def analysis_engine_signal_records(
+    signals: Sequence[AnalysisEngineSignal]
+) -> Dict[str, List[SignalRecord]]:
+    """Group AnalysisEngine signals by strategy as signal records.
+
+    Args:
+        signals: AnalysisEngine signals (chronological)
+
+    Returns:
+        Strategy name -> records, as StrategyManager.get_signals() returns
+    """
+    records: Dict[str, List[SignalRecord]] = {}
+    for signal in signals:
+        records.setdefault(signal.strategy_name, []).append(SignalRecord(
+            strategy_name=signal.strategy_name,
+            timestamp=signal.timestamp,
+            interval=signal.interval,
+            signal=Signal(
+                symbol=signal.symbol,
+                action=SignalAction(signal.action.value),
+                quantity=signal.quantity,
+                price=signal.price
+            ),
+            price=signal.price
+        ))
+    return records
+
+
+def build_sweep_config(
+    config: SessionConfig,
+    grid: Dict[str, Sequence[Any]],
+    strategy: Optional[str] = None
+) -> Tuple[SessionConfig, StrategyConfig, List[SweepVariant]]:
+    """Build a session config that runs every variant side by side.
+
+    The target strategy is replaced by one StrategyConfig per combination
+    (its config updated with the combination); other strategies are kept.
+    AnalysisEngine targets are removed from (or never were in) the sweep
+    config instead; their variants run through variant_strategy_configs().
+
+    Args:
+        config: Base session config (not modified)
+        grid: Parameter name -> candidate values
+        strategy: Module path or name of the strategy to vary (default: the
+            only enabled strategy)
+
+    Returns:
+        (sweep SessionConfig, target StrategyConfig, list of SweepVariant)
+
+    Raises:
+        ValueError: If the grid or target strategy is invalid
+    """
+    combinations = expand_parameter_grid(grid)
+    target = _find_target_strategy(config, strategy)
+
+    sweep_config = copy.deepcopy(config)
+    variants = [
+        SweepVariant(name=f"{target.instance_name}_v{number}", params=params)
+        for number, params in enumerate(combinations)
+    ]
+
+    strategies = sweep_config.session_data_config.strategies
+    index = next(
+        (i for i, s in enumerate(config.session_data_config.strategies) if s is target),
+        None
+    )
+    if index is not None:
+        if is_analysis_engine_strategy(target):
+            del strategies[index]  # StrategyManager cannot load it
+        else:
+            strategies[index:index + 1] = variant_strategy_configs(target, variants)
+    return sweep_config, target, variants
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+def run_parameter_sweep(
+    config_file: str,
+    grid: Dict[str, Sequence[Any]],
+    strategy: Optional[str] = None,
+    max_workers: Optional[int] = None
+) -> ParameterSweepReport:
+    """Backtest every combination of a strategy parameter grid.
+
+    All variants share one system (one data load, one indicator pass) per
+    day shard. With max_workers > 1, trading days are sharded across
+    worker processes like run_parallel_backtest() - only valid for
+    strategies without cross-day state.
+
+    Args:
+        config_file: Path to backtest session config JSON
+        grid: Parameter name -> candidate values
+        strategy: Module path or name of the strategy to vary
+        max_workers: Worker processes (default: 1, one sequential run)
+
+    Returns:
+        ParameterSweepReport
+
+    Raises:
+        ValueError: If config, grid or target strategy is invalid
+    """
+    config = SessionConfig.from_file(config_file)
+    config.validate()
+
+    if config.mode != "backtest" or config.backtest_config is None:
+        raise ValueError("Parameter sweep requires a backtest session config")
+
+    sweep_config, target, variants = build_sweep_config(config, grid, strategy)
+    _require_sweepable(target.module)
+    sweep_config.validate()
+
+    analysis_strategies = None
+    if is_analysis_engine_strategy(target):
+        analysis_strategies = variant_strategy_configs(target, variants)
+
+    workers = max(1, max_workers or 1)
+    trading_dates = _get_backtest_trading_dates(config)
+    shards = plan_backtest_shards(trading_dates, workers)
+
+    if not shards:
+        raise ValueError(
+            f"No trading days in backtest window "
+            f"{config.backtest_config.start_date} to {config.backtest_config.end_date}"
+        )
+
+    workers = min(workers, len(shards))
+    logger.info(
+        f"[SWEEP] {target.module}: {len(variants)} variants x "
+        f"{len(trading_dates)} trading days, {len(shards)} shards on {workers} workers"
+    )
+
+    start = time.perf_counter()
+    results = run_shards(sweep_config, shards, workers, analysis_strategies)
+    backtest = merge_shard_results(results, workers, time.perf_counter() - start)
+
+    if backtest.failed_shards:
+        logger.error(f"[SWEEP] {len(backtest.failed_shards)} shard(s) failed")
+
+    if analysis_strategies is None:
+        variant_signals = backtest.strategy_signals
+    else:
+        variant_signals = analysis_engine_signal_records(backtest.signals)
+
+    report = ParameterSweepReport(
+        strategy=target.module,
+        results=[
+            SweepVariantResult.from_signals(variant, variant_signals.get(variant.name, []))
+            for variant in variants
+        ],
+        backtest=backtest
+    )
+
+    logger.info(f"\n{report.format_report()}")
+    return report
@@ -67,6 +67,10 @@ class TimeManager:
         self._cache_hits = 0
         self._cache_misses = 0
         
+        # Regular session hours per date, filled one calendar year at a time
+        # Key: (exchange, asset_class, year) -> {date: (open, close)}
+        self._regular_hours_cache: Dict[Tuple[str, str, int], Dict[date, Tuple[datetime, datetime]]] = {}
+        
         if system_manager is None:
             logger.warning("TimeManager initialized without SystemManager - mode checks will fail!")
         else:
@@ -507,6 +511,93 @@ class TimeManager:
             
             return hours
     
+    def get_regular_hours_table(
+        self,
+        start_date: date,
+        end_date: date,
+        exchange: Optional[str] = None,
+        asset_class: Optional[str] = None
+    ) -> Dict[date, Tuple[datetime, datetime]]:
+        """Get regular session (open, close) for every trading day in a range
+        
+        CACHING: Built from the trading calendar one calendar year at a time
+        (one holiday query per year) and cached until invalidate_cache().
+        Repeated calls need no database session.
+        
+        Args:
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+            exchange: Exchange group identifier (uses system default if None)
+            asset_class: Asset class (uses system default if None)
+            
+        Returns:
+            Dict of trading date -> (open, close) as timezone-aware datetimes
+            in the market timezone. Weekends and full holidays are absent;
+            early closes carry their early close time.
+        """
+        if exchange is None:
+            exchange = self.default_exchange_group
+        if asset_class is None:
+            asset_class = self.default_asset_class
+        
+        table: Dict[date, Tuple[datetime, datetime]] = {}
+        for year in range(start_date.year, end_date.year + 1):
+            year_table = self._regular_hours_cache.get((exchange, asset_class, year))
+            if year_table is None:
+                year_table = self._build_regular_hours_year(exchange, asset_class, year)
+                self._regular_hours_cache[(exchange, asset_class, year)] = year_table
+            
+            table.update(
+                (day, hours) for day, hours in year_table.items()
+                if start_date <= day <= end_date
+            )
+        return table
+    
+    def _build_regular_hours_year(
+        self,
+        exchange: str,
+        asset_class: str,
+        year: int
+    ) -> Dict[date, Tuple[datetime, datetime]]:
+        """Compute regular session hours for every trading day of a year."""
+        config = self.get_market_config(exchange, asset_class)
+        if config is None:
+            logger.warning(f"No configuration found for {exchange} {asset_class}")
+            return {}
+        
+        from app.models.database import SessionLocal
+        
+        first_day = date(year, 1, 1)
+        last_day = date(year, 12, 31)
+        exchange_group = self.get_exchange_group(exchange)
+        with SessionLocal() as session:
+            holidays = {
+                holiday.date: holiday
+                for holiday in TradingCalendarRepository.get_holidays_in_range(
+                    session, first_day, last_day, exchange_group
+                )
+            }
+        
+        tz = ZoneInfo(config.timezone)
+        table: Dict[date, Tuple[datetime, datetime]] = {}
+        day = first_day
+        while day <= last_day:
+            holiday = holidays.get(day)
+            if config.is_trading_day_of_week(day.weekday()) and not (holiday and holiday.is_closed):
+                close_time = (
+                    holiday.early_close_time
+                    if holiday is not None and holiday.early_close_time is not None
+                    else config.regular_close
+                )
+                table[day] = (
+                    datetime.combine(day, config.regular_open, tzinfo=tz),
+                    datetime.combine(day, close_time, tzinfo=tz)
+                )
+            day += timedelta(days=1)
+        
+        logger.debug(f"Built regular hours table for {exchange} {asset_class} {year}: {len(table)} trading days")
+        return table
+    
     # ==================== Market Status ====================
     
     def is_market_open(
@@ -1758,6 +1849,9 @@ class TimeManager:
             'result': None
         }
         
+        # Clear regular session hours tables
+        self._regular_hours_cache = {}
+        
         # Reset statistics
         self._cache_hits = 0
         self._cache_misses = 0
@@ -20,6 +20,10 @@ class SessionIndicatorConfig:
         interval: Which bar interval to compute on (e.g., "5m", "1d")
         type: Indicator type (trend, momentum, volatility, volume, support_resistance)
         params: Additional parameters (e.g., {"num_std": 2.0} for Bollinger Bands)
+        incremental: Update from streaming state instead of full recalculation
+        history: Number of recent values to keep per symbol (0 = none)
+        evaluation: "eager" (every bar) or "lazy" (when the value is read;
+            requires history = 0)
     
     Examples:
         {"name": "sma", "period": 20, "interval": "5m", "type": "trend"}
@@ -32,6 +36,9 @@ class SessionIndicatorConfig:
     interval: str
     type: str
     params: Dict[str, Any] = field(default_factory=dict)
+    incremental: bool = False
+    history: int = 0
+    evaluation: str = "eager"
     
     def validate(self) -> None:
         """Validate session indicator configuration."""
@@ -63,6 +70,25 @@ class SessionIndicatorConfig:
         # Validate params is a dict
         if not isinstance(self.params, dict):
             raise ValueError("Indicator params must be a dictionary")
+        
+        if not isinstance(self.incremental, bool):
+            raise ValueError("Indicator incremental must be a boolean")
+        
+        if not isinstance(self.history, int) or isinstance(self.history, bool) or self.history < 0:
+            raise ValueError(f"Indicator history must be an integer >= 0 (got {self.history})")
+        
+        valid_evaluations = ["eager", "lazy"]
+        if self.evaluation not in valid_evaluations:
+            raise ValueError(
+                f"Invalid indicator evaluation '{self.evaluation}'. "
+                f"Must be one of: {valid_evaluations}"
+            )
+        
+        if self.evaluation == "lazy" and self.history > 0:
+            raise ValueError(
+                "Lazy indicators cannot keep history (values are only "
+                "calculated when read, not at every bar)"
+            )
 
 
 @dataclass
@@ -78,6 +104,10 @@ class HistoricalIndicatorConfig:
         interval: Bar interval (typically "1d" for historical)
         type: Indicator type (typically "historical")
         params: Additional parameters
+        incremental: Update from streaming state instead of full recalculation
+        history: Number of recent values to keep per symbol (0 = none)
+        evaluation: "eager" (every bar) or "lazy" (when the value is read;
+            requires history = 0)
     
     Examples:
         {"name": "avg_volume", "period": 5, "unit": "days", "interval": "1d", "type": "historical"}
@@ -90,6 +120,9 @@ class HistoricalIndicatorConfig:
     interval: str = "1d"
     type: str = "historical"
     params: Dict[str, Any] = field(default_factory=dict)
+    incremental: bool = False
+    history: int = 0
+    evaluation: str = "eager"
     
     def validate(self) -> None:
         """Validate historical indicator configuration."""
@@ -127,6 +160,25 @@ class HistoricalIndicatorConfig:
         # Validate params is a dict
         if not isinstance(self.params, dict):
             raise ValueError("Indicator params must be a dictionary")
+        
+        if not isinstance(self.incremental, bool):
+            raise ValueError("Indicator incremental must be a boolean")
+        
+        if not isinstance(self.history, int) or isinstance(self.history, bool) or self.history < 0:
+            raise ValueError(f"Indicator history must be an integer >= 0 (got {self.history})")
+        
+        valid_evaluations = ["eager", "lazy"]
+        if self.evaluation not in valid_evaluations:
+            raise ValueError(
+                f"Invalid indicator evaluation '{self.evaluation}'. "
+                f"Must be one of: {valid_evaluations}"
+            )
+        
+        if self.evaluation == "lazy" and self.history > 0:
+            raise ValueError(
+                "Lazy indicators cannot keep history (values are only "
+                "calculated when read, not at every bar)"
+            )
 
 
 @dataclass
@@ -44,10 +44,15 @@ class BacktestConfig:
         start_date: Start date for backtest window (YYYY-MM-DD)
         end_date: End date for backtest window (YYYY-MM-DD)
         speed_multiplier: Speed multiplier (0=max, >0=realtime multiplier)
+        fused: Run the data-driven pipeline (derived bars, indicators,
+            analysis engine, strategies) inline on the coordinator thread
+            instead of handing each bar between threads (requires
+            speed_multiplier=0)
     """
     start_date: str
     end_date: str
     speed_multiplier: float = 0.0
+    fused: bool = False
     
     def validate(self) -> None:
         """Validate backtest configuration."""
@@ -80,6 +85,9 @@ class BacktestConfig:
         # Validate speed_multiplier
         if self.speed_multiplier < 0:
             raise ValueError("speed_multiplier must be >= 0 (0 = max speed)")
+        
+        if self.fused and self.speed_multiplier != 0:
+            raise ValueError("fused pipeline requires speed_multiplier = 0 (data-driven)")
 
 
 # =============================================================================
@@ -219,9 +227,13 @@ class StreamingConfig:
                                    notifying analysis engine of old data.
         catchup_check_interval: Check lag every N bars (default: 10)
                                Lower = more responsive, higher = less overhead
+        batched_indicators: Evaluate indicators of all symbols on an interval
+                            together as NumPy vectors, once per timestamp
+                            batch (default: False)
     """
     catchup_threshold_seconds: int = 60
     catchup_check_interval: int = 10
+    batched_indicators: bool = False
     
     def validate(self) -> None:
         """Validate streaming configuration."""
@@ -324,6 +336,8 @@ class SessionDataConfig:
         indicators: Indicator configurations (session and historical) - NEW!
         scanners: Scanner configurations - NEW!
         strategies: Strategy configurations - NEW!
+        columnar_bars: Store session bars in NumPy columns (ColumnarBarSeries)
+                       instead of deques/lists of BarData objects
     """
     symbols: List[str]
     streams: List[str]
@@ -333,6 +347,7 @@ class SessionDataConfig:
     indicators: IndicatorsConfig = field(default_factory=IndicatorsConfig)
     scanners: List[ScannerConfig] = field(default_factory=list)
     strategies: List[StrategyConfig] = field(default_factory=list)
+    columnar_bars: bool = False
     
     def validate(self) -> None:
         """Validate session data configuration."""
@@ -557,7 +572,8 @@ class SessionConfig:
             backtest_config = BacktestConfig(
                 start_date=backtest_data.get("start_date"),
                 end_date=backtest_data.get("end_date"),
-                speed_multiplier=backtest_data.get("speed_multiplier", 0.0)
+                speed_multiplier=backtest_data.get("speed_multiplier", 0.0),
+                fused=backtest_data.get("fused", False)
             )
         
         # Parse session_data_config (required)
@@ -606,7 +622,8 @@ class SessionConfig:
         stream_data = sd_data.get("streaming", {})
         streaming = StreamingConfig(
             catchup_threshold_seconds=stream_data.get("catchup_threshold_seconds", 60),
-            catchup_check_interval=stream_data.get("catchup_check_interval", 10)
+            catchup_check_interval=stream_data.get("catchup_check_interval", 10),
+            batched_indicators=stream_data.get("batched_indicators", False)
         )
         
         # Parse gap_filler config
@@ -629,7 +646,10 @@ class SessionConfig:
                     period=ind_data.get("period"),
                     interval=ind_data.get("interval"),
                     type=ind_data.get("type"),
-                    params=ind_data.get("params", {})
+                    params=ind_data.get("params", {}),
+                    incremental=ind_data.get("incremental", False),
+                    history=ind_data.get("history", 0),
+                    evaluation=ind_data.get("evaluation", "eager")
                 )
             )
         
@@ -643,7 +663,10 @@ class SessionConfig:
                     unit=ind_data.get("unit"),
                     interval=ind_data.get("interval", "1d"),
                     type=ind_data.get("type", "historical"),
-                    params=ind_data.get("params", {})
+                    params=ind_data.get("params", {}),
+                    incremental=ind_data.get("incremental", False),
+                    history=ind_data.get("history", 0),
+                    evaluation=ind_data.get("evaluation", "eager")
                 )
             )
         
@@ -672,7 +695,9 @@ class SessionConfig:
             strategy_config = StrategyConfig(
                 module=strategy_dict["module"],
                 enabled=strategy_dict.get("enabled", True),
-                config=strategy_dict.get("config", {})
+                config=strategy_dict.get("config", {}),
+                name=strategy_dict.get("name"),
+                process=strategy_dict.get("process", False)
             )
             strategies.append(strategy_config)
         
@@ -684,7 +709,8 @@ class SessionConfig:
             gap_filler=gap_filler,
             indicators=indicators_config,
             scanners=scanners,
-            strategies=strategies
+            strategies=strategies,
+            columnar_bars=sd_data.get("columnar_bars", False)
         )
         
         # Parse trading config (required)
@@ -773,15 +799,18 @@ class SessionConfig:
             result["backtest_config"] = {
                 "start_date": self.backtest_config.start_date,
                 "end_date": self.backtest_config.end_date,
-                "speed_multiplier": self.backtest_config.speed_multiplier
+                "speed_multiplier": self.backtest_config.speed_multiplier,
+                "fused": self.backtest_config.fused
             }
         
         result["session_data_config"] = {
             "symbols": self.session_data_config.symbols,
             "streams": self.session_data_config.streams,
+            "columnar_bars": self.session_data_config.columnar_bars,
             "streaming": {
                 "catchup_threshold_seconds": self.session_data_config.streaming.catchup_threshold_seconds,
-                "catchup_check_interval": self.session_data_config.streaming.catchup_check_interval
+                "catchup_check_interval": self.session_data_config.streaming.catchup_check_interval,
+                "batched_indicators": self.session_data_config.streaming.batched_indicators
             },
             "historical": {
                 "enable_quality": self.session_data_config.historical.enable_quality,
@@ -807,7 +836,10 @@ class SessionConfig:
                         "period": ind.period,
                         "interval": ind.interval,
                         "type": ind.type,
-                        "params": ind.params
+                        "params": ind.params,
+                        "incremental": ind.incremental,
+                        "history": ind.history,
+                        "evaluation": ind.evaluation
                     }
                     for ind in self.session_data_config.indicators.session
                 ],
@@ -818,7 +850,10 @@ class SessionConfig:
                         "unit": ind.unit,
                         "interval": ind.interval,
                         "type": ind.type,
-                        "params": ind.params
+                        "params": ind.params,
+                        "incremental": ind.incremental,
+                        "history": ind.history,
+                        "evaluation": ind.evaluation
                     }
                     for ind in self.session_data_config.indicators.historical
                 ]
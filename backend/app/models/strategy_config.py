@@ -1,6 +1,6 @@
 """Strategy configuration models."""
 from dataclasses import dataclass, field
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
 @dataclass
@@ -11,10 +11,22 @@ class StrategyConfig:
         module: Python module path (e.g., "strategies.examples.simple_ma_cross")
         enabled: Whether strategy is enabled
         config: Strategy-specific configuration
+        name: Instance name (default: last part of module path). Needed when
+              the same module is loaded more than once (parameter sweeps).
+        process: Run in a worker process that reads SessionData from a
+                 shared-memory mirror (CPU-heavy strategies), instead of a
+                 thread of the main process.
     """
     module: str
     enabled: bool = True
     config: Dict[str, Any] = field(default_factory=dict)
+    name: Optional[str] = None
+    process: bool = False
+    
+    @property
+    def instance_name(self) -> str:
+        """Name the loaded strategy instance runs under."""
+        return self.name or self.module.split('.')[-1]
     
     def validate(self) -> None:
         """Validate strategy configuration."""
@@ -24,3 +36,6 @@ class StrategyConfig:
         # Module path validation (basic check)
         if not all(part.isidentifier() for part in self.module.split('.')):
             raise ValueError(f"Invalid module path: {self.module}")
+        
+        if self.name is not None and not self.name:
+            raise ValueError("Strategy name cannot be empty")
@@ -49,6 +49,17 @@ class MetricStats:
         self.sum_value += value
         self.count += 1
     
+    def merge(self, other: 'MetricStats') -> None:
+        """Fold another set of running statistics into this one.
+        
+        Args:
+            other: Statistics recorded elsewhere (e.g. a worker process)
+        """
+        self.min_value = min(self.min_value, other.min_value)
+        self.max_value = max(self.max_value, other.max_value)
+        self.sum_value += other.sum_value
+        self.count += other.count
+    
     def reset(self) -> None:
         """Reset all statistics."""
         self.min_value = float('inf')
@@ -145,6 +156,14 @@ class MetricTracker:
         """
         self.stats.record(value)
     
+    def merge(self, other: 'MetricTracker') -> None:
+        """Fold another tracker's statistics into this one.
+        
+        Args:
+            other: Tracker for the same metric
+        """
+        self.stats.merge(other.stats)
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get current statistics.
         
@@ -647,6 +666,45 @@ class PerformanceMetrics:
         
         logger.info("All metrics reset")
     
+    # =========================================================================
+    # Merging (Parallel Backtests)
+    # =========================================================================
+    
+    def merge(self, other: 'PerformanceMetrics') -> None:
+        """Fold metrics from another run (e.g. one backtest shard) into this one.
+        
+        Timing trackers and counters are combined exactly (running sums).
+        Trading days are added. Initial load keeps the slowest shard, since
+        shards load in parallel. Backtest start/end times are NOT merged -
+        perf_counter values from different processes are not comparable, so
+        the caller times the overall run itself.
+        
+        Args:
+            other: Metrics to merge in
+        """
+        self.analysis_engine.merge(other.analysis_engine)
+        self.data_processor.merge(other.data_processor)
+        self.session_gap.merge(other.session_gap)
+        self.session_duration.merge(other.session_duration)
+        self.data_loading_subsequent.merge(other.data_loading_subsequent)
+        
+        self.bars_processed.increment(other.bars_processed.get())
+        self.iterations.increment(other.iterations.get())
+        self.backpressure_coordinator_to_processor.increment(
+            other.backpressure_coordinator_to_processor.get()
+        )
+        self.backpressure_processor_to_analysis.increment(
+            other.backpressure_processor_to_analysis.get()
+        )
+        
+        if other.data_loading_initial is not None:
+            self.data_loading_initial = max(
+                self.data_loading_initial or 0.0,
+                other.data_loading_initial
+            )
+        
+        self.backtest_trading_days += other.backtest_trading_days
+    
     # =========================================================================
     # Summary Access
     # =========================================================================
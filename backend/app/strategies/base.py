@@ -8,10 +8,14 @@ Note: This is separate from the legacy BaseStrategy in analysis_engine.py
 """
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import List, Tuple, Dict, Any, Optional
 from enum import Enum
 import logging
 
+from app.indicators.manager import get_indicator_history, get_indicator_value
+from app.managers.data_manager.bar_queries import bars_since, last_n_bars
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,12 +47,34 @@ class Signal:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class SignalRecord:
+    """Signal stamped with where and when it was generated.
+    
+    Recorded by StrategyThread for backtest reports (Signal itself carries
+    no timestamp and price is optional).
+    
+    Attributes:
+        strategy_name: Strategy instance that generated the signal
+        timestamp: Session time when the signal was generated
+        interval: Interval whose new data triggered the signal
+        signal: The signal
+        price: signal.price, else last close of the triggering interval
+    """
+    strategy_name: str
+    timestamp: datetime
+    interval: str
+    signal: Signal
+    price: Optional[float] = None
+
+
 @dataclass
 class StrategyContext:
     """Context provided to strategies.
     
     Provides access to:
-    - SessionData (zero-copy bar access)
+    - SessionData (zero-copy bar access; a shared-memory mirror when the
+      strategy runs in a worker process)
     - TimeManager (current time)
     - Performance metrics
     - System configuration
@@ -73,17 +99,49 @@ class StrategyContext:
         return self.time_manager.get_current_time()
     
     def get_bars(self, symbol: str, interval: str):
-        """Get bars reference (zero-copy).
+        """Get bars (zero-copy).
+        
+        Reads the published snapshot when there is one, so the bars do not
+        change while the strategy iterates them.
         
         Args:
             symbol: Symbol to get bars for
             interval: Interval (e.g., "5m")
             
         Returns:
-            Reference to deque of bars
+            Read-only sequence of bars
         """
+        snapshot = self.session_data.get_symbol_snapshot(symbol)
+        if snapshot is not None:
+            return snapshot.get_bars(interval)
         return self.session_data.get_bars_ref(symbol, interval)
     
+    def get_last_n_bars(self, symbol: str, interval: str, n: int) -> List:
+        """Get the newest n bars, copying only those n.
+        
+        Args:
+            symbol: Symbol to get bars for
+            interval: Interval (e.g., "5m")
+            n: Number of bars
+            
+        Returns:
+            List of up to n bars (oldest to newest)
+        """
+        return last_n_bars(self.get_bars(symbol, interval) or (), n)
+    
+    def get_bars_since(self, symbol: str, interval: str, timestamp: datetime) -> List:
+        """Get bars with timestamp >= given timestamp (binary search).
+        
+        Args:
+            symbol: Symbol to get bars for
+            interval: Interval (e.g., "5m")
+            timestamp: Start timestamp (inclusive)
+            
+        Returns:
+            List of bars since timestamp (oldest to newest)
+        """
+        return bars_since(self.get_bars(symbol, interval) or (), timestamp)
+    
     def get_bar_quality(self, symbol: str, interval: str) -> float:
         """Get bar quality percentage.
         
@@ -94,8 +152,48 @@ class StrategyContext:
         Returns:
             Quality percentage (0-100)
         """
-        quality = self.session_data.get_quality_metric(symbol, interval)
+        snapshot = self.session_data.get_symbol_snapshot(symbol)
+        if snapshot is not None:
+            quality = snapshot.get_quality(interval)
+        else:
+            quality = self.session_data.get_quality_metric(symbol, interval)
         return quality if quality is not None else 0.0
+    
+    def get_indicator(self, symbol: str, indicator_key: str, field: Optional[str] = None):
+        """Get current indicator value.
+        
+        Args:
+            symbol: Symbol
+            indicator_key: Indicator key (e.g., "sma_20_5m")
+            field: Field of a multi-value indicator (e.g., "upper" for BB)
+            
+        Returns:
+            Indicator value, or None if missing or not yet valid
+        """
+        snapshot = self.session_data.get_symbol_snapshot(symbol)
+        if snapshot is not None:
+            return snapshot.get_indicator_value(indicator_key, field)
+        return get_indicator_value(self.session_data, symbol, indicator_key, field)
+    
+    def get_indicator_history(self, symbol: str, indicator_key: str, n: int, field: Optional[str] = None):
+        """Get the last n values of an indicator.
+        
+        Requires the indicator to be configured with a history capacity.
+        
+        Args:
+            symbol: Symbol
+            indicator_key: Indicator key (e.g., "rsi_14_5m")
+            n: Number of values (fewer if not that many are kept)
+            field: Field of a multi-value indicator (e.g., "upper" for BB)
+            
+        Returns:
+            (timestamps, values) arrays oldest first, or None if the
+            indicator is missing or keeps no history
+        """
+        snapshot = self.session_data.get_symbol_snapshot(symbol)
+        if snapshot is not None:
+            return snapshot.get_indicator_history(indicator_key, n, field)
+        return get_indicator_history(self.session_data, symbol, indicator_key, n, field)
 
 
 class BaseStrategy(ABC):
@@ -260,4 +358,5 @@ __all__ = [
     'StrategyContext',
     'Signal',
     'SignalAction',
+    'SignalRecord',
 ]
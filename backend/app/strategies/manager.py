@@ -7,8 +7,9 @@ import logging
 from typing import List, Dict, Set, Tuple, Optional
 from pathlib import Path
 
-from app.strategies.base import BaseStrategy, StrategyContext
+from app.strategies.base import BaseStrategy, StrategyContext, SignalRecord
 from app.strategies.thread import StrategyThread
+from app.strategies.process import StrategyProcess
 from app.models.strategy_config import StrategyConfig
 from app.managers.data_manager.session_data import get_session_data
 
@@ -205,8 +206,8 @@ class StrategyManager:
                 logger.error(f"No strategy class found in {config.module}")
                 return False
             
-            # Extract name from module
-            name = config.module.split('.')[-1]
+            # Instance name (defaults to module name)
+            name = config.instance_name
             
             # Create strategy instance
             strategy = strategy_class(name=name, config=config.config)
@@ -217,15 +218,19 @@ class StrategyManager:
             # Determine mode
             mode = self._determine_mode()
             
-            # Create thread
-            thread = StrategyThread(
+            # Create thread (strategy runs in a worker process if configured)
+            thread_class = StrategyProcess if config.process else StrategyThread
+            thread = thread_class(
                 strategy=strategy,
                 context=context,
                 mode=mode
             )
             
             self._strategy_threads.append(thread)
-            logger.info(f"Loaded strategy: {name} ({strategy_class.__name__})")
+            logger.info(
+                f"Loaded strategy: {name} ({strategy_class.__name__}"
+                f"{', worker process' if config.process else ''})"
+            )
             
             return True
             
@@ -370,7 +375,51 @@ class StrategyManager:
         for thread in threads:
             thread.notify(symbol, interval, data_type)
     
-    def wait_for_strategies(self, timeout: Optional[float] = None) -> bool:
+    def notify_strategies_batch(
+        self,
+        notifications: List[Tuple[str, str, str]]
+    ) -> List[StrategyThread]:
+        """Notify subscribed strategies of a batch of new data.
+        
+        Each subscribed thread receives its notifications (in batch order)
+        as a single queue item and signals ready once.
+        
+        Args:
+            notifications: (symbol, interval, data_type) tuples
+        
+        Returns:
+            Threads that were notified (pass to wait_for_strategies)
+        """
+        batches: Dict[StrategyThread, List[Tuple[str, str, str]]] = {}
+        for symbol, interval, data_type in notifications:
+            for thread in self.get_subscribed_threads(symbol, interval):
+                batches.setdefault(thread, []).append((symbol, interval, data_type))
+        
+        for thread, batch in batches.items():
+            thread.notify_batch(batch)
+        
+        return list(batches)
+    
+    def run_strategies_inline(self, symbol: str, interval: str, data_type: str = "bars"):
+        """Run subscribed strategies on the caller's thread.
+        
+        Fused backtest pipeline counterpart of notify_strategies() +
+        wait_for_strategies(): strategies run in subscription order and
+        return before the next bar is processed.
+        
+        Args:
+            symbol: Symbol with new data
+            interval: Interval with new data
+            data_type: Type of data
+        """
+        for thread in self.get_subscribed_threads(symbol, interval):
+            thread.process_inline(symbol, interval, data_type)
+    
+    def wait_for_strategies(
+        self,
+        timeout: Optional[float] = None,
+        threads: Optional[List[StrategyThread]] = None
+    ) -> bool:
         """Wait for all strategies to signal ready.
         
         Called by DataProcessor after notifying strategies.
@@ -378,6 +427,7 @@ class StrategyManager:
         
         Args:
             timeout: Timeout in seconds (None = infinite for data-driven)
+            threads: Only wait for these threads (default: all strategies)
             
         Returns:
             True if all ready, False if timeout
@@ -392,7 +442,7 @@ class StrategyManager:
         
         all_ready = True
         
-        for thread in self._strategy_threads:
+        for thread in (self._strategy_threads if threads is None else threads):
             subscription = thread.get_subscription()
             ready = subscription.wait_until_ready(timeout=actual_timeout)
             
@@ -458,6 +508,17 @@ class StrategyManager:
             'strategies': strategy_metrics,
         }
     
+    def get_signals(self) -> Dict[str, List[SignalRecord]]:
+        """Get signals generated by each strategy so far.
+        
+        Returns:
+            Dictionary: strategy name -> signal records (oldest first)
+        """
+        return {
+            thread.strategy.name: thread.get_signals()
+            for thread in self._strategy_threads
+        }
+    
     # =========================================================================
     # Mid-Session Symbol Addition
     # =========================================================================
@@ -0,0 +1,332 @@
+"""Out-of-process strategy execution.
+
+A strategy configured with "process": true runs in its own worker process
+instead of a thread of the main process, so CPU-heavy strategies run on
+their own core without contending for the GIL with the coordinator and
+DataProcessor.
+
+    Main process                              Worker process
+    ------------                              --------------
+    StrategyProcess (StrategyThread)          _worker_main()
+      RemoteStrategy  -- pipe: notifications -->  strategy.on_bars()
+                      <-- pipe: signals ---------
+      SharedSessionMirror  == shared memory ==>  SharedSessionView
+
+The worker's StrategyContext reads bars, quality and indicator values
+from the shared-memory mirror with the same calls as in-process
+(get_bars, get_bar_quality, get_indicator); only small messages cross the
+pipe. Queueing, ready signalling, signal records and metrics stay in the
+main process, in StrategyThread.
+"""
+import logging
+import multiprocessing
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.strategies.base import BaseStrategy, StrategyContext, Signal
+from app.strategies.shared_memory import SharedSessionMirror, SharedSessionView
+from app.strategies.thread import StrategyThread
+
+logger = logging.getLogger(__name__)
+
+
+# (signals, processing time in seconds, error message or None) per notification
+RunResult = Tuple[List[Signal], float, Optional[str]]
+
+
+class StrategyProcessError(Exception):
+    """Raised when a strategy worker process fails or exits unexpectedly."""
+    pass
+
+
+class _WorkerClock:
+    """TimeManager stand-in: session time of the request being processed."""
+
+    def __init__(self):
+        self.now: Optional[datetime] = None
+
+    def get_current_time(self) -> Optional[datetime]:
+        return self.now
+
+
+def _worker_main(conn, strategy_class, name: str, config: Dict[str, Any], mode: str):
+    """Worker process entry point: run one strategy over the pipe.
+
+    Requests are (command, ...) tuples; every request gets one reply.
+
+    Args:
+        conn: Worker end of the pipe
+        strategy_class: BaseStrategy subclass (importable by module path)
+        name: Strategy instance name
+        config: Strategy config
+        mode: Execution mode ("live", "backtest")
+    """
+    view = SharedSessionView()
+    clock = _WorkerClock()
+    context = StrategyContext(
+        session_data=view,
+        time_manager=clock,
+        system_manager=None,  # Not available across processes
+        mode=mode
+    )
+    strategy = strategy_class(name=name, config=config)
+
+    try:
+        while True:
+            try:
+                request = conn.recv()
+            except EOFError:
+                break
+            if request is None:
+                break
+
+            command = request[0]
+            try:
+                if command == "run":
+                    _, update, clock.now, notifications = request
+                    view.apply(update)
+                    conn.send(_run_notifications(strategy, notifications))
+                elif command == "setup":
+                    _, update, clock.now = request
+                    view.apply(update)
+                    conn.send(bool(strategy.setup(context)))
+                elif command == "symbol_added":
+                    strategy.on_symbol_added(request[1])
+                    conn.send(None)
+                elif command == "teardown":
+                    strategy.teardown(context)
+                    conn.send(None)
+                else:
+                    conn.send(StrategyProcessError(f"Unknown request: {command}"))
+            except Exception as e:
+                logger.error(f"[{name}] Worker error in {command}: {e}", exc_info=True)
+                conn.send(StrategyProcessError(f"{type(e).__name__}: {e}"))
+    finally:
+        view.close()
+        conn.close()
+
+
+def _run_notifications(strategy: BaseStrategy, notifications) -> List[RunResult]:
+    """Call on_bars() for each notification, capturing errors per notification."""
+    results: List[RunResult] = []
+    for symbol, interval, data_type in notifications:
+        start_time = time.time()
+        try:
+            signals = strategy.on_bars(symbol, interval) or []
+            results.append((list(signals), time.time() - start_time, None))
+        except Exception as e:
+            results.append(([], time.time() - start_time, f"{type(e).__name__}: {e}"))
+    return results
+
+
+class RemoteStrategy(BaseStrategy):
+    """Main-process proxy for a strategy running in a worker process.
+
+    Lifecycle hooks and on_bars() are forwarded to the worker; setup()
+    starts it and teardown() stops it. get_subscriptions() is answered by a
+    local copy of the strategy (it only reads config), which also receives
+    on_symbol_added() so subscriptions can be rebuilt in this process.
+    """
+
+    def __init__(self, strategy: BaseStrategy):
+        """Initialize proxy.
+
+        Args:
+            strategy: Strategy instance (local copy; its class and config
+                are used to create the worker's instance)
+        """
+        super().__init__(strategy.name, strategy.config)
+        self.local = strategy
+
+        self._process: Optional[multiprocessing.Process] = None
+        self._conn = None
+        self._mirror: Optional[SharedSessionMirror] = None
+
+    # =========================================================================
+    # Strategy Interface
+    # =========================================================================
+
+    def get_subscriptions(self) -> List[Tuple[str, str]]:
+        return self.local.get_subscriptions()
+
+    def setup(self, context: StrategyContext) -> bool:
+        """Start the worker process and run setup() there.
+
+        Args:
+            context: Main-process context (its SessionData is mirrored)
+
+        Returns:
+            Result of the worker's setup()
+        """
+        self.context = context
+        self._mirror = SharedSessionMirror(context.session_data)
+
+        # spawn: never inherit the parent's running threads/singletons
+        mp_context = multiprocessing.get_context("spawn")
+        self._conn, worker_conn = mp_context.Pipe()
+        self._process = mp_context.Process(
+            target=_worker_main,
+            args=(worker_conn, type(self.local), self.name, self.config, context.mode),
+            name=f"Strategy-{self.name}",
+            daemon=True
+        )
+        self._process.start()
+        worker_conn.close()
+        logger.info(f"[{self.name}] Started strategy worker (pid={self._process.pid})")
+
+        try:
+            return bool(self._request(("setup", self._sync(), self._current_time())))
+        except StrategyProcessError as e:
+            logger.error(f"[{self.name}] Worker setup failed: {e}")
+            self._shutdown_worker()
+            return False
+
+    def on_bars(self, symbol: str, interval: str) -> List[Signal]:
+        """Run on_bars() in the worker (one round trip)."""
+        signals, _, error = self.run_batch([(symbol, interval, "bars")])[0]
+        if error:
+            raise StrategyProcessError(error)
+        return signals
+
+    def run_batch(self, notifications: List[Tuple[str, str, str]]) -> List[RunResult]:
+        """Run a batch of notifications in the worker (one round trip).
+
+        Args:
+            notifications: (symbol, interval, data_type) tuples
+
+        Returns:
+            (signals, processing time, error) per notification
+        """
+        if not self.is_running():
+            raise StrategyProcessError(f"Strategy worker {self.name} not running")
+        return self._request(
+            ("run", self._sync(), self._current_time(), list(notifications))
+        )
+
+    def on_symbol_added(self, symbol: str):
+        self.local.on_symbol_added(symbol)
+        if self.is_running():
+            self._request(("symbol_added", symbol))
+
+    def teardown(self, context: StrategyContext):
+        """Run teardown() in the worker, then stop it and free shared memory."""
+        try:
+            if self.is_running():
+                self._request(("teardown",))
+        except StrategyProcessError as e:
+            logger.error(f"[{self.name}] Worker teardown failed: {e}")
+        finally:
+            self._shutdown_worker()
+
+    # =========================================================================
+    # Worker Management
+    # =========================================================================
+
+    def is_running(self) -> bool:
+        """True while the worker process is alive."""
+        return self._process is not None and self._process.is_alive()
+
+    def _sync(self) -> Dict[str, Any]:
+        symbols = {symbol for symbol, _ in self.local.get_subscriptions()}
+        return self._mirror.sync(symbols)
+
+    def _current_time(self) -> Optional[datetime]:
+        try:
+            return self.context.get_current_time()
+        except Exception:
+            return None
+
+    def _request(self, request: tuple):
+        """Send a request and wait for its reply."""
+        if self._conn is None:
+            raise StrategyProcessError(f"Strategy worker {self.name} not started")
+        try:
+            self._conn.send(request)
+            reply = self._conn.recv()
+        except (EOFError, OSError) as e:
+            raise StrategyProcessError(f"Strategy worker {self.name} exited: {e}") from e
+
+        if isinstance(reply, StrategyProcessError):
+            raise reply
+        return reply
+
+    def _shutdown_worker(self, timeout: float = 5.0):
+        """Stop the worker process and unlink the mirror."""
+        if self._conn is not None:
+            try:
+                self._conn.send(None)
+            except (OSError, ValueError):
+                pass
+
+        if self._process is not None:
+            self._process.join(timeout)
+            if self._process.is_alive():
+                logger.warning(f"[{self.name}] Worker did not exit - terminating")
+                self._process.terminate()
+                self._process.join(timeout)
+            self._process = None
+
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+        if self._mirror is not None:
+            self._mirror.close()
+            self._mirror = None
+
+
+class StrategyProcess(StrategyThread):
+    """StrategyThread whose strategy runs in a worker process.
+
+    The thread keeps the queue, StreamSubscription, signal records and
+    metrics; each notification batch is one round trip to the worker,
+    during which this thread waits without holding the GIL.
+    """
+
+    def __init__(
+        self,
+        strategy: BaseStrategy,
+        context: StrategyContext,
+        mode: str
+    ):
+        """Initialize strategy process.
+
+        Args:
+            strategy: Strategy instance to run (class must be importable)
+            context: Strategy context (main process)
+            mode: Execution mode (data-driven, clock-driven, live)
+        """
+        super().__init__(RemoteStrategy(strategy), context, mode)
+
+    def _process_batch(self, notifications: List[Tuple[str, str, str]]):
+        """Run a notification batch in the worker, signaling ready once.
+
+        Args:
+            notifications: (symbol, interval, data_type) tuples
+        """
+        try:
+            results = self.strategy.run_batch(notifications)
+        except Exception as e:
+            logger.error(f"[{self.strategy.name}] Worker batch failed: {e}")
+            self._errors += len(notifications)
+            results = []
+
+        for (symbol, interval, _), (signals, processing_time, error) in zip(notifications, results):
+            if error:
+                logger.error(
+                    f"[{self.strategy.name}] Error processing {symbol} {interval}: {error}"
+                )
+                self._errors += 1
+                continue
+            self._record_run(symbol, interval, signals, processing_time)
+
+        self._subscription.signal_ready()
+
+
+# Export public API
+__all__ = [
+    'StrategyProcess',
+    'RemoteStrategy',
+    'StrategyProcessError',
+]
@@ -0,0 +1,495 @@
+"""Shared-memory mirror of SessionData for out-of-process strategies.
+
+StrategyProcess workers cannot reach the coordinator's SessionData, so the
+parent keeps a mirror of the data their strategies read in
+multiprocessing.shared_memory blocks:
+
+    bars        one block per (symbol, interval), columnar like
+                ColumnarBarSeries: int64 timestamps + float64 OHLCV
+    scalars     one block of float64 slots: bar quality per
+                (symbol, interval), indicator values and valid flags
+
+Only the block names, bar counts and slot layout cross the pipe
+(SharedSessionMirror.sync() -> SharedSessionView.apply()); the worker maps
+the blocks and reads them in place through SharedBarSeries, a read-only
+ColumnarBarSeries.
+
+The parent writes only while its worker is idle (between a reply and the
+next request), so readers never see a partially written block.
+"""
+import logging
+import math
+from dataclasses import dataclass, field
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.indicators.manager import refresh_indicator
+from app.managers.data_manager.columnar_bars import (
+    ColumnarBarSeries,
+    datetime_to_ns,
+)
+
+logger = logging.getLogger(__name__)
+
+
+MIN_SERIES_CAPACITY = 1024
+MIN_SCALAR_CAPACITY = 256
+
+# Slot keys: ("quality", symbol, interval), ("valid", symbol, indicator_key)
+# and ("value", symbol, indicator_key, field) - field None for scalar values
+SlotKey = Tuple[Any, ...]
+
+
+def _series_nbytes(capacity: int) -> int:
+    return capacity * 8 * 6
+
+
+def _series_arrays(block: SharedMemory, capacity: int) -> Tuple[np.ndarray, np.ndarray]:
+    """int64 timestamp column and float64 (5, capacity) OHLCV over a block."""
+    timestamps = np.ndarray((capacity,), dtype=np.int64, buffer=block.buf)
+    ohlcv = np.ndarray((5, capacity), dtype=np.float64, buffer=block.buf, offset=capacity * 8)
+    return timestamps, ohlcv
+
+
+def _attach(name: str) -> SharedMemory:
+    """Map an existing block.
+
+    Spawned workers share the parent's resource tracker, so attaching adds
+    no registration of its own; the creating process unlinks the block.
+    """
+    return SharedMemory(name=name)
+
+
+def _release(block: SharedMemory, unlink: bool = False) -> bool:
+    """Close (and optionally unlink) a block.
+
+    Returns:
+        False if NumPy views still reference it (closed later)
+    """
+    try:
+        block.close()
+    except BufferError:
+        return False
+    if unlink:
+        try:
+            block.unlink()
+        except FileNotFoundError:
+            pass
+    return True
+
+
+# =============================================================================
+# Writer (parent process)
+# =============================================================================
+
+@dataclass
+class _SeriesWriter:
+    """Parent-side state of one mirrored bar series."""
+    block: SharedMemory
+    capacity: int
+    timestamps: np.ndarray
+    ohlcv: np.ndarray
+    symbol: str
+    interval: str
+    tz: Any = None
+    written: int = 0
+    last_ns: Optional[int] = None
+
+
+class SharedSessionMirror:
+    """Parent-side shared-memory copy of the SessionData a strategy reads.
+
+    sync() brings the mirror up to date for a set of symbols (every bar
+    interval, its quality and every indicator of each symbol) and returns
+    the update message for SharedSessionView.apply(). Bars are copied
+    incrementally: only bars appended since the last sync are written,
+    unless the source container was rewritten (gap fill, session clear).
+
+    Not thread-safe: one mirror per worker, synced from one thread.
+    """
+
+    def __init__(self, session_data):
+        """Initialize mirror.
+
+        Args:
+            session_data: SessionData to mirror
+        """
+        self.session_data = session_data
+        self._series: Dict[Tuple[str, str], _SeriesWriter] = {}
+        self._retired: List[SharedMemory] = []
+
+        self._scalar_block: Optional[SharedMemory] = None
+        self._scalars: Optional[np.ndarray] = None
+        self._slots: Dict[SlotKey, int] = {}
+        self._layout_version = 0
+        self._sent_layout_version = -1
+
+    def sync(self, symbols: Iterable[str]) -> Dict[str, Any]:
+        """Copy new data for symbols into shared memory.
+
+        Args:
+            symbols: Symbols whose data the worker may read
+
+        Returns:
+            Update message for SharedSessionView.apply()
+        """
+        # Blocks replaced by the previous sync - the worker has moved on
+        self._retired = [block for block in self._retired if not _release(block, unlink=True)]
+
+        series: Dict[Tuple[str, str], Tuple[str, int, int, Any]] = {}
+        values: Dict[SlotKey, float] = {}
+
+        for symbol in dict.fromkeys(symbol.upper() for symbol in symbols):
+            symbol_data = self.session_data.get_symbol_data(symbol, internal=True)
+            if symbol_data is None:
+                continue
+
+            for interval, interval_data in list(symbol_data.bars.items()):
+                values[("quality", symbol, interval)] = interval_data.quality
+                writer = self._sync_series(symbol, interval, interval_data.data)
+                if writer is not None:
+                    series[(symbol, interval)] = (
+                        writer.block.name, writer.capacity, writer.written, writer.tz
+                    )
+
+            for key, indicator in list(symbol_data.indicators.items()):
+                refresh_indicator(indicator, symbol)  # Mirrored values are read by workers
+                values[("valid", symbol, key)] = 1.0 if indicator.valid else 0.0
+                value = indicator.current_value
+                if isinstance(value, dict):
+                    for field_name, field_value in value.items():
+                        values[("value", symbol, key, field_name)] = field_value
+                else:
+                    values[("value", symbol, key, None)] = value
+
+        # Symbols no longer mirrored
+        for key in [key for key in self._series if key not in series]:
+            self._retired.append(self._series.pop(key).block)
+
+        self._write_scalars(values)
+
+        update: Dict[str, Any] = {"series": series}
+        if self._sent_layout_version != self._layout_version:
+            update["scalars"] = (self._scalar_block.name, len(self._scalars), dict(self._slots))
+            self._sent_layout_version = self._layout_version
+        return update
+
+    def close(self):
+        """Unlink every block (worker must have exited or released them)."""
+        blocks = [writer.block for writer in self._series.values()] + self._retired
+        if self._scalar_block is not None:
+            blocks.append(self._scalar_block)
+        self._series.clear()
+        self._retired = []
+        self._scalar_block = None
+        self._scalars = None
+        self._slots = {}
+        for block in blocks:
+            _release(block, unlink=True)
+
+    def _sync_series(self, symbol: str, interval: str, data) -> Optional[_SeriesWriter]:
+        """Bring one mirrored series up to date with its source container."""
+        count = len(data)
+        writer = self._series.get((symbol, interval))
+        if writer is None and count == 0:
+            return None
+
+        start = writer.written if writer is not None else 0
+        if writer is not None and (
+            count < writer.written or (
+                writer.written > 0 and
+                datetime_to_ns(data[writer.written - 1].timestamp) != writer.last_ns
+            )
+        ):
+            start = 0
+
+        if writer is None or count > writer.capacity:
+            capacity = max(MIN_SERIES_CAPACITY, 2 * count)
+            block = SharedMemory(create=True, size=_series_nbytes(capacity))
+            if writer is not None:
+                self._retired.append(writer.block)
+            timestamps, ohlcv = _series_arrays(block, capacity)
+            writer = _SeriesWriter(
+                block=block, capacity=capacity, timestamps=timestamps, ohlcv=ohlcv,
+                symbol=symbol, interval=interval
+            )
+            self._series[(symbol, interval)] = writer
+            start = 0
+
+        if count == 0:
+            writer.written = 0
+            writer.last_ns = None
+            return writer
+
+        if isinstance(data, ColumnarBarSeries):
+            # Column copy, no BarData objects
+            columns = data.arrays()
+            writer.timestamps[start:count] = columns["timestamp"][start:count]
+            for row, column in enumerate(("open", "high", "low", "close", "volume")):
+                writer.ohlcv[row, start:count] = columns[column][start:count]
+        else:
+            timestamps, ohlcv = writer.timestamps, writer.ohlcv
+            for i in range(start, count):
+                bar = data[i]
+                timestamps[i] = datetime_to_ns(bar.timestamp)
+                ohlcv[0, i] = bar.open
+                ohlcv[1, i] = bar.high
+                ohlcv[2, i] = bar.low
+                ohlcv[3, i] = bar.close
+                ohlcv[4, i] = bar.volume
+
+        writer.tz = data[0].timestamp.tzinfo
+        writer.written = count
+        writer.last_ns = int(writer.timestamps[count - 1])
+        return writer
+
+    def _write_scalars(self, values: Dict[SlotKey, Any]):
+        """Write quality and indicator values, re-laying out slots if the key set changed."""
+        if set(values) != set(self._slots):
+            self._slots = {key: index for index, key in enumerate(values)}
+            self._layout_version += 1
+
+            if self._scalars is None or len(values) > len(self._scalars):
+                if self._scalar_block is not None:
+                    self._scalars = None
+                    self._retired.append(self._scalar_block)
+                capacity = max(MIN_SCALAR_CAPACITY, 2 * len(values))
+                self._scalar_block = SharedMemory(create=True, size=capacity * 8)
+                self._scalars = np.ndarray((capacity,), dtype=np.float64, buffer=self._scalar_block.buf)
+
+        scalars = self._scalars
+        for key, value in values.items():
+            try:
+                scalars[self._slots[key]] = math.nan if value is None else float(value)
+            except (TypeError, ValueError):
+                scalars[self._slots[key]] = math.nan
+
+
+# =============================================================================
+# Reader (worker process)
+# =============================================================================
+
+class SharedBarSeries(ColumnarBarSeries):
+    """Read-only ColumnarBarSeries over a shared-memory block (no copy).
+
+    Behaves like the containers SessionData.get_bars_ref() returns (len,
+    iteration, indexing, slicing, NumPy column views); BarData objects are
+    materialized on access.
+    """
+
+    @classmethod
+    def over(
+        cls,
+        timestamps: np.ndarray,
+        ohlcv: np.ndarray,
+        count: int,
+        symbol: str,
+        interval: str,
+        tz: Any
+    ) -> "SharedBarSeries":
+        """View the first count rows of shared columns."""
+        series = cls.__new__(cls)
+        series.max_bars = None
+        series._capacity = len(timestamps)
+        series._timestamp = timestamps
+        series._ohlcv = ohlcv
+        series._start = 0
+        series._end = count
+        series.symbol = symbol
+        series.interval = interval
+        series._tz = tz
+        series._tz_aware = tz is not None
+        series._sorted = bool(count < 2 or np.all(np.diff(timestamps[:count]) >= 0))
+        series._tail = None
+        return series
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("SharedBarSeries is read-only (mirror of the coordinator's SessionData)")
+
+    append = extend = clear = replace = _read_only
+
+
+@dataclass
+class SharedIntervalView:
+    """Worker-side stand-in for BarIntervalData (bars and quality)."""
+    data: Any
+    quality: float = 0.0
+
+
+@dataclass
+class SharedIndicatorView:
+    """Worker-side stand-in for IndicatorData (value and valid flag)."""
+    current_value: Any
+    valid: bool
+
+
+@dataclass
+class SharedSymbolView:
+    """Worker-side stand-in for SymbolSessionData."""
+    symbol: str
+    bars: Dict[str, SharedIntervalView] = field(default_factory=dict)
+    indicators: Dict[str, SharedIndicatorView] = field(default_factory=dict)
+
+
+class SharedSessionView:
+    """Worker-side, read-only SessionData over a SharedSessionMirror.
+
+    Implements the SessionData reads StrategyContext uses
+    (get_bars_ref, get_quality_metric, get_symbol_data), so strategies run
+    unchanged in a worker process.
+    """
+
+    def __init__(self):
+        self._blocks: Dict[str, SharedMemory] = {}
+        self._stale: List[SharedMemory] = []
+
+        # (symbol, interval) -> (block name, capacity, count, tz)
+        self._series: Dict[Tuple[str, str], Tuple[str, int, int, Any]] = {}
+        self._views: Dict[Tuple[str, str], SharedBarSeries] = {}
+
+        self._scalars: Optional[np.ndarray] = None
+        self._scalar_name: Optional[str] = None
+        self._slots: Dict[SlotKey, int] = {}
+        self._symbols: Dict[str, Dict[str, Any]] = {}
+
+    def apply(self, update: Dict[str, Any]):
+        """Apply an update message from SharedSessionMirror.sync().
+
+        Args:
+            update: Block names, bar counts and (if changed) slot layout
+        """
+        series = update["series"]
+        for key, (name, capacity, count, tz) in series.items():
+            previous = self._series.get(key)
+            if previous is None or previous[:3] != (name, capacity, count):
+                self._views.pop(key, None)
+        for key in [key for key in self._views if key not in series]:
+            del self._views[key]
+        self._series = series
+
+        if "scalars" in update:
+            name, capacity, slots = update["scalars"]
+            if name != self._scalar_name:
+                self._scalars = None
+                block = self._map(name)
+                self._scalars = np.ndarray((capacity,), dtype=np.float64, buffer=block.buf)
+                self._scalar_name = name
+            self._slots = slots
+            self._build_symbol_index()
+
+        # Unmap blocks the mirror no longer references
+        live = {name for name, _, _, _ in series.values()}
+        if self._scalar_name is not None:
+            live.add(self._scalar_name)
+        for name in [name for name in self._blocks if name not in live]:
+            self._stale.append(self._blocks.pop(name))
+        self._stale = [block for block in self._stale if not _release(block)]
+
+    def close(self):
+        """Unmap every block."""
+        self._views.clear()
+        self._scalars = None
+        self._stale.extend(self._blocks.values())
+        self._blocks.clear()
+        self._stale = [block for block in self._stale if not _release(block)]
+
+    # =========================================================================
+    # SessionData reads
+    # =========================================================================
+
+    def get_bars_ref(self, symbol: str, interval=1, internal: bool = False):
+        """Bars of a symbol/interval as a read-only SharedBarSeries.
+
+        Returns:
+            SharedBarSeries, or an empty list if the interval has no bars
+        """
+        key = (symbol.upper(), f"{interval}m" if isinstance(interval, int) else str(interval))
+        view = self._views.get(key)
+        if view is not None:
+            return view
+
+        entry = self._series.get(key)
+        if entry is None:
+            return []
+
+        name, capacity, count, tz = entry
+        timestamps, ohlcv = _series_arrays(self._map(name), capacity)
+        view = SharedBarSeries.over(timestamps, ohlcv, count, key[0], key[1], tz)
+        self._views[key] = view
+        return view
+
+    def get_quality_metric(self, symbol: str, interval) -> Optional[float]:
+        """Quality percentage of a symbol/interval, None if not mirrored."""
+        interval_key = f"{interval}m" if isinstance(interval, int) else str(interval)
+        return self._scalar(("quality", symbol.upper(), interval_key))
+
+    def get_symbol_snapshot(self, symbol: str) -> None:
+        """No published snapshots here: the view only changes between batches."""
+        return None
+
+    def get_symbol_data(self, symbol: str, internal: bool = False) -> Optional[SharedSymbolView]:
+        """Bars, quality and indicator values of a symbol.
+
+        Returns:
+            SharedSymbolView or None if the symbol is not mirrored
+        """
+        symbol = symbol.upper()
+        entry = self._symbols.get(symbol)
+        if entry is None:
+            return None
+
+        view = SharedSymbolView(symbol=symbol)
+        for interval in entry["intervals"]:
+            view.bars[interval] = SharedIntervalView(
+                data=self.get_bars_ref(symbol, interval),
+                quality=self._scalar(("quality", symbol, interval)) or 0.0
+            )
+        for key, fields in entry["indicators"].items():
+            view.indicators[key] = SharedIndicatorView(
+                current_value=self._indicator_value(symbol, key, fields),
+                valid=self._scalar(("valid", symbol, key)) == 1.0
+            )
+        return view
+
+    # =========================================================================
+    # Helpers
+    # =========================================================================
+
+    def _map(self, name: str) -> SharedMemory:
+        block = self._blocks.get(name)
+        if block is None:
+            block = _attach(name)
+            self._blocks[name] = block
+        return block
+
+    def _scalar(self, key: SlotKey) -> Optional[float]:
+        index = self._slots.get(key)
+        if index is None or self._scalars is None:
+            return None
+        value = float(self._scalars[index])
+        return None if math.isnan(value) else value
+
+    def _indicator_value(self, symbol: str, key: str, fields: List[Optional[str]]):
+        if fields == [None]:
+            return self._scalar(("value", symbol, key, None))
+        return {name: self._scalar(("value", symbol, key, name)) for name in fields}
+
+    def _build_symbol_index(self):
+        """symbol -> intervals and indicator fields, from the slot layout."""
+        symbols: Dict[str, Dict[str, Any]] = {}
+        for slot in self._slots:
+            entry = symbols.setdefault(slot[1], {"intervals": [], "indicators": {}})
+            if slot[0] == "quality":
+                entry["intervals"].append(slot[2])
+            elif slot[0] == "value":
+                entry["indicators"].setdefault(slot[2], []).append(slot[3])
+        self._symbols = symbols
+
+
+__all__ = [
+    'SharedSessionMirror',
+    'SharedSessionView',
+    'SharedBarSeries',
+]
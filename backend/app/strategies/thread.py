@@ -5,10 +5,10 @@ Each strategy runs in its own thread with dedicated queue and synchronization.
 import threading
 import queue
 import time
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 import logging
 
-from app.strategies.base import BaseStrategy, StrategyContext
+from app.strategies.base import BaseStrategy, StrategyContext, Signal, SignalRecord
 from app.threads.sync.stream_subscription import StreamSubscription
 
 logger = logging.getLogger(__name__)
@@ -65,6 +65,9 @@ class StrategyThread(threading.Thread):
         self._total_processing_time = 0.0
         self._max_processing_time = 0.0
         
+        # Generated signals (backtest reports, parameter sweeps)
+        self._signals: List[SignalRecord] = []
+        
         logger.info(f"Created strategy thread: {strategy.name} (mode={mode})")
     
     # =========================================================================
@@ -118,6 +121,20 @@ class StrategyThread(threading.Thread):
             logger.warning(f"[{self.strategy.name}] Queue full - dropping notification")
             self._errors += 1
     
+    def notify_batch(self, notifications: List[Tuple[str, str, str]]):
+        """Add a batch of notifications to the queue as one item.
+        
+        The batch is processed in order and ready is signaled once.
+        
+        Args:
+            notifications: (symbol, interval, data_type) tuples
+        """
+        try:
+            self._queue.put(list(notifications), block=False)
+        except queue.Full:
+            logger.warning(f"[{self.strategy.name}] Queue full - dropping notification batch")
+            self._errors += 1
+    
     def get_queue_size(self) -> int:
         """Get current queue size."""
         return self._queue.qsize()
@@ -137,8 +154,11 @@ class StrategyThread(threading.Thread):
                     # Sentinel value - exit
                     break
                 
-                # Process notification
-                self._process_notification(notification)
+                # Process notification (single or batch)
+                if isinstance(notification, list):
+                    self._process_batch(notification)
+                else:
+                    self._process_notification(notification)
                 
             except queue.Empty:
                 # Timeout - check stop event
@@ -153,6 +173,42 @@ class StrategyThread(threading.Thread):
     def _process_notification(self, notification: Tuple[str, str, str]):
         """Process a single notification.
         
+        Args:
+            notification: (symbol, interval, data_type) tuple
+        """
+        self._run_strategy(notification)
+        
+        # Signal ready to DataProcessor (mode-aware blocking), also after
+        # errors so DataProcessor is never blocked
+        self._subscription.signal_ready()
+    
+    def _process_batch(self, notifications: List[Tuple[str, str, str]]):
+        """Process a notification batch, signaling ready once at the end.
+        
+        Args:
+            notifications: (symbol, interval, data_type) tuples
+        """
+        for notification in notifications:
+            self._run_strategy(notification)
+        
+        self._subscription.signal_ready()
+    
+    def process_inline(self, symbol: str, interval: str, data_type: str = "bars"):
+        """Run the strategy for one notification on the caller's thread.
+        
+        Used by the fused backtest pipeline: no queue and no ready signal,
+        the caller continues once on_bars() returns.
+        
+        Args:
+            symbol: Symbol with new data
+            interval: Interval with new data
+            data_type: Type of data ("bars", "quotes", etc.)
+        """
+        self._run_strategy((symbol, interval, data_type))
+    
+    def _run_strategy(self, notification: Tuple[str, str, str]):
+        """Call on_bars() for a notification and record signals and metrics.
+        
         Args:
             notification: (symbol, interval, data_type) tuple
         """
@@ -163,23 +219,7 @@ class StrategyThread(threading.Thread):
         try:
             # Call strategy's on_bars method
             signals = self.strategy.on_bars(symbol, interval)
-            
-            # Track signals
-            if signals:
-                self._signals_generated += len(signals)
-                logger.debug(
-                    f"[{self.strategy.name}] Generated {len(signals)} signals "
-                    f"for {symbol} {interval}"
-                )
-            
-            # Update metrics
-            self._notifications_processed += 1
-            processing_time = time.time() - start_time
-            self._total_processing_time += processing_time
-            self._max_processing_time = max(self._max_processing_time, processing_time)
-            
-            # Signal ready to DataProcessor (mode-aware blocking)
-            self._subscription.signal_ready()
+            self._record_run(symbol, interval, signals, time.time() - start_time)
             
         except Exception as e:
             logger.error(
@@ -187,9 +227,74 @@ class StrategyThread(threading.Thread):
                 exc_info=True
             )
             self._errors += 1
-            
-            # Still signal ready (don't block DataProcessor)
-            self._subscription.signal_ready()
+    
+    def _record_run(
+        self,
+        symbol: str,
+        interval: str,
+        signals: List[Signal],
+        processing_time: float
+    ):
+        """Record the signals and metrics of one successful on_bars() call.
+        
+        Args:
+            symbol: Symbol of the notification
+            interval: Interval of the notification
+            signals: Signals returned by the strategy
+            processing_time: Seconds spent in on_bars()
+        """
+        # Track signals
+        if signals:
+            self._signals_generated += len(signals)
+            self._record_signals(symbol, interval, signals)
+            logger.debug(
+                f"[{self.strategy.name}] Generated {len(signals)} signals "
+                f"for {symbol} {interval}"
+            )
+        
+        # Update metrics
+        self._notifications_processed += 1
+        self._total_processing_time += processing_time
+        self._max_processing_time = max(self._max_processing_time, processing_time)
+    
+    def _record_signals(self, symbol: str, interval: str, signals: List[Signal]):
+        """Stamp signals with session time and price and keep them.
+        
+        Args:
+            symbol: Symbol whose data triggered the signals
+            interval: Interval whose data triggered the signals
+            signals: Signals returned by the strategy
+        """
+        timestamp = self.context.get_current_time()
+        
+        # Price is informational - never let the lookup fail the strategy
+        last_close = None
+        try:
+            bars = self.context.get_bars(symbol, interval)
+            if bars:
+                last_close = bars[-1].close
+        except Exception as e:
+            logger.debug(f"[{self.strategy.name}] No price for {symbol} {interval}: {e}")
+        
+        for signal in signals:
+            price = signal.price
+            if price is None and signal.symbol == symbol:
+                price = last_close
+            self._signals.append(SignalRecord(
+                strategy_name=self.strategy.name,
+                timestamp=timestamp,
+                interval=interval,
+                signal=signal,
+                price=price
+            ))
+    
+    def get_signals(self) -> List[SignalRecord]:
+        """Get signals generated so far (oldest first).
+        
+        Returns:
+            Copy of the signal record list
+        """
+        return list(self._signals)
     
     # =========================================================================
     # Subscription Management
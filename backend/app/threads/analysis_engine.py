@@ -34,11 +34,14 @@ Key Design:
 - Strategy-based: Pluggable strategy framework
 """
 
+import copy
+import importlib
+import inspect
 import threading
 import queue
 import time
 from datetime import datetime
-from typing import Optional, Dict, List, Any, Tuple
+from typing import Optional, Dict, List, Any, Sequence, Tuple
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 from enum import Enum
@@ -51,6 +54,7 @@ from app.managers.data_manager.session_data import SessionData, get_session_data
 from app.threads.sync.stream_subscription import StreamSubscription
 from app.monitoring.performance_metrics import PerformanceMetrics
 from app.models.session_config import SessionConfig
+from app.models.strategy_config import StrategyConfig
 
 
 # =========================================================================
@@ -224,8 +228,9 @@ class AnalysisEngine(threading.Thread):
         self._stop_event = threading.Event()
         self._running = False
         
-        # Notification queue (from DataProcessor)
-        self._notification_queue: queue.Queue[Tuple[str, str, str]] = queue.Queue()
+        # Notification queue (from DataProcessor): one batch of
+        # (symbol, interval, data_type) per processed timestamp
+        self._notification_queue: queue.Queue[List[Tuple[str, str, str]]] = queue.Queue()
         
         # StreamSubscription for signaling ready to processor
         self._processor_subscription: Optional[StreamSubscription] = None
@@ -245,6 +250,9 @@ class AnalysisEngine(threading.Thread):
         self._decisions_rejected = 0
         self._processing_times: List[float] = []
         
+        # Generated signals in order (backtest reports, parallel shard merge)
+        self._signals: List[Signal] = []
+        
         logger.info(
             f"AnalysisEngine initialized: mode={self.mode}, "
             f"speed={self.speed}, quality_threshold={self._min_quality_threshold}"
@@ -317,6 +325,44 @@ class AnalysisEngine(threading.Thread):
         self._strategies.append(strategy)
         logger.info(f"Strategy registered: {strategy.name}")
     
+    def load_strategies(self, configs: Sequence[StrategyConfig]):
+        """Instantiate and register strategies from configs.
+        
+        Each enabled config's module must define an AnalysisEngine
+        strategy class (BaseStrategy subclass of this module); it runs
+        under config.instance_name with a copy of config.config, so one
+        module can be loaded once per parameter set (parameter sweeps).
+        
+        Args:
+            configs: Strategy configurations
+        
+        Raises:
+            ValueError: If a module defines no AnalysisEngine strategy
+            ImportError: If a module cannot be imported
+        """
+        for config in configs:
+            if not config.enabled:
+                continue
+            
+            module = importlib.import_module(config.module)
+            strategy_class = next(
+                (
+                    attr for attr in vars(module).values()
+                    if isinstance(attr, type)
+                    and issubclass(attr, BaseStrategy)
+                    and not inspect.isabstract(attr)
+                ),
+                None
+            )
+            if strategy_class is None:
+                raise ValueError(f"No AnalysisEngine strategy class found in {config.module}")
+            
+            self.register_strategy(strategy_class(
+                name=config.instance_name,
+                session_data=self.session_data,
+                config=copy.deepcopy(config.config)
+            ))
+    
     # =========================================================================
     # Thread Lifecycle
     # =========================================================================
@@ -365,8 +411,9 @@ class AnalysisEngine(threading.Thread):
     def _processing_loop(self):
         """Main event-driven processing loop.
         
-        Waits for notifications from DataProcessor, executes strategies,
-        generates signals, makes decisions, and signals ready.
+        Waits for notification batches from DataProcessor, executes
+        strategies, generates signals, makes decisions, and signals ready
+        once per batch.
         
         Flow:
         1. Wait on notification queue (blocking with timeout)
@@ -374,8 +421,8 @@ class AnalysisEngine(threading.Thread):
         3. Execute strategies
         4. Generate signals
         5. Make trading decisions
-        6. Signal ready to processor
-        7. Record metrics
+        6. Record metrics
+        7. Signal ready to processor
         """
         logger.info("Starting event-driven analysis loop")
         
@@ -391,53 +438,19 @@ class AnalysisEngine(threading.Thread):
                 if notification is None or self._stop_event.is_set():
                     break
                 
-                # Parse notification: (symbol, interval, data_type)
-                symbol, interval, data_type = notification
-                
-                logger.debug(
-                    f"Processing notification: {symbol} {interval} {data_type}"
-                )
-                
-                # Start timing
-                start_time = self.metrics.start_timer()
-                
-                # 2. Read data from SessionData (ZERO-COPY: direct reference)
-                bars_ref = self.session_data.get_bars_ref(symbol, interval)
-                quality = self.session_data.get_quality_metric(symbol, interval)
-                
-                if not bars_ref:
-                    logger.debug(f"No bars for {symbol} {interval}, skipping")
-                    continue
-                
-                logger.debug(
-                    f"Processing {symbol} {interval}: {len(bars_ref)} bars, "
-                    f"quality={quality:.1f}%"
-                )
-                
-                # 3. Execute strategies and generate signals (pass zero-copy reference)
-                signals = self._execute_strategies(symbol, interval, bars_ref)
-                
-                # 4. Make trading decisions
-                if signals:
-                    decisions = self._make_decisions(signals, quality)
-                    
-                    # Log approved decisions
-                    for decision in decisions:
-                        if decision.approved:
-                            logger.info(f"APPROVED: {decision}")
-                        else:
-                            logger.debug(f"REJECTED: {decision}")
+                # 2-6. Run strategies for each (symbol, interval, data_type)
+                for symbol, interval, data_type in notification:
+                    try:
+                        self.process_notification(symbol, interval, data_type)
+                    except Exception as e:
+                        logger.error(
+                            f"Error processing notification {symbol} {interval}: {e}",
+                            exc_info=True
+                        )
                 
-                # 5. Signal ready to processor
+                # 7. Signal ready to processor, once per batch
                 self._signal_ready_to_processor()
                 
-                # 6. Record metrics
-                elapsed = self.metrics.elapsed_time(start_time)
-                self._processing_times.append(elapsed)
-                self.metrics.record_analysis_engine(start_time)
-                
-                logger.debug(f"Processed {symbol} {interval} in {elapsed:.3f}s")
-                
             except Exception as e:
                 logger.error(
                     f"Error processing notification: {e}",
@@ -446,6 +459,68 @@ class AnalysisEngine(threading.Thread):
         
         logger.info("Analysis loop exited")
     
+    def process_notification(self, symbol: str, interval: str, data_type: str) -> bool:
+        """Analyze one DataProcessor notification on the caller's thread.
+        
+        Used by the processing loop, and called directly by DataProcessor
+        in the fused backtest pipeline (no queue, no ready signal).
+        
+        Args:
+            symbol: Symbol with new data
+            interval: Interval (or indicator name) with new data
+            data_type: "bars" or "indicator"
+        
+        Returns:
+            True if processed, False if there were no bars to analyze
+        """
+        logger.debug(
+            f"Processing notification: {symbol} {interval} {data_type}"
+        )
+        
+        # Start timing
+        start_time = self.metrics.start_timer()
+        
+        # Read data from SessionData (ZERO-COPY: published snapshot if any,
+        # else direct reference)
+        snapshot = self.session_data.get_symbol_snapshot(symbol)
+        if snapshot is not None:
+            bars_ref = snapshot.get_bars(interval)
+            quality = snapshot.get_quality(interval)
+        else:
+            bars_ref = self.session_data.get_bars_ref(symbol, interval)
+            quality = self.session_data.get_quality_metric(symbol, interval)
+        
+        if not bars_ref:
+            logger.debug(f"No bars for {symbol} {interval}, skipping")
+            return False
+        
+        logger.debug(
+            f"Processing {symbol} {interval}: {len(bars_ref)} bars, "
+            f"quality={quality:.1f}%"
+        )
+        
+        # Execute strategies and generate signals (pass zero-copy reference)
+        signals = self._execute_strategies(symbol, interval, bars_ref)
+        
+        # Make trading decisions
+        if signals:
+            decisions = self._make_decisions(signals, quality)
+            
+            # Log approved decisions
+            for decision in decisions:
+                if decision.approved:
+                    logger.info(f"APPROVED: {decision}")
+                else:
+                    logger.debug(f"REJECTED: {decision}")
+        
+        # Record metrics
+        elapsed = self.metrics.elapsed_time(start_time)
+        self._processing_times.append(elapsed)
+        self.metrics.record_analysis_engine(start_time)
+        
+        logger.debug(f"Processed {symbol} {interval} in {elapsed:.3f}s")
+        return True
+    
     # =========================================================================
     # Strategy Execution
     # =========================================================================
@@ -482,6 +557,7 @@ class AnalysisEngine(threading.Thread):
                         f"for {symbol} {interval}"
                     )
                     all_signals.extend(signals)
+                    self._signals.extend(signals)
                     self._signals_generated += len(signals)
             
             except Exception as e:
@@ -623,6 +699,14 @@ class AnalysisEngine(threading.Thread):
             "min_quality_threshold": self._min_quality_threshold
         }
     
+    def get_signals(self) -> List[Signal]:
+        """Get all signals generated so far (oldest first).
+        
+        Returns:
+            Copy of the signal list
+        """
+        return list(self._signals)
+    
     def to_json(self, complete: bool = True) -> dict:
         """Export AnalysisEngine state to JSON format.
         
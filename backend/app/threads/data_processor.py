@@ -48,11 +48,8 @@ from app.threads.sync.stream_subscription import StreamSubscription
 from app.monitoring.performance_metrics import PerformanceMetrics
 from app.models.session_config import SessionConfig
 
-# Derived bar computation (existing utility)
-from app.managers.data_manager.derived_bars import (
-    compute_derived_bars,
-    compute_all_derived_intervals
-)
+# Derived bar computation (incremental, O(1) per base bar)
+from app.managers.data_manager.bar_aggregation import IncrementalBarAggregator
 
 
 class OverrunError(Exception):
@@ -115,8 +112,9 @@ class DataProcessor(threading.Thread):
         self._stop_event = threading.Event()
         self._running = False
         
-        # Notification queue FROM coordinator
-        self._notification_queue: queue.Queue[Tuple[str, str, datetime]] = queue.Queue()
+        # Notification queue FROM coordinator: one batch of
+        # (symbol, interval, timestamp) per simulated timestamp
+        self._notification_queue: queue.Queue[List[Tuple[str, str, datetime]]] = queue.Queue()
         
         # Subscription for signaling ready TO coordinator
         self._coordinator_subscription: Optional[StreamSubscription] = None
@@ -127,6 +125,9 @@ class DataProcessor(threading.Thread):
         # Subscription for waiting on analysis engine (Phase 7)
         self._analysis_subscription: Optional[StreamSubscription] = None
         
+        # Analysis engine called directly by the fused backtest pipeline
+        self._analysis_engine = None
+        
         # Strategy manager reference (NEW)
         self._strategy_manager = strategy_manager
         
@@ -138,6 +139,12 @@ class DataProcessor(threading.Thread):
         # Auto-computation flag (always enabled for now)
         self._auto_compute_derived = True
         
+        # Incremental derived-bar state
+        # {symbol: {interval: IncrementalBarAggregator}}
+        self._derived_aggregators: Dict[str, Dict[str, IncrementalBarAggregator]] = {}
+        # {symbol: (base bars consumed, timestamp of last consumed bar)}
+        self._derived_cursors: Dict[str, Tuple[int, Optional[datetime]]] = {}
+        
         # Performance tracking
         self._processing_times = []
         
@@ -202,6 +209,15 @@ class DataProcessor(threading.Thread):
         self._analysis_subscription = subscription
         logger.debug("Analysis engine subscription configured")
     
+    def set_analysis_engine(self, analysis_engine):
+        """Set analysis engine for the fused backtest pipeline.
+        
+        Args:
+            analysis_engine: AnalysisEngine called inline by process_inline()
+        """
+        self._analysis_engine = analysis_engine
+        logger.debug("Analysis engine configured for inline processing")
+    
     def pause_notifications(self):
         """Pause AnalysisEngine notifications (during catchup).
         
@@ -253,7 +269,50 @@ class DataProcessor(threading.Thread):
             interval: Interval with new data
             timestamp: Timestamp of new data
         """
-        self._notification_queue.put((symbol, interval, timestamp))
+        self._notification_queue.put([(symbol, interval, timestamp)])
+    
+    def notify_batch_available(self, notifications: List[Tuple[str, str, datetime]]):
+        """Receive all bars of one simulated timestamp as a single notification.
+        
+        The batch is processed in one pass and ready is signaled to the
+        coordinator once, so synchronization cost does not grow with the
+        number of symbols.
+        
+        Args:
+            notifications: (symbol, interval, timestamp) per bar
+        """
+        if notifications:
+            self._notification_queue.put(list(notifications))
+    
+    def process_inline(self, symbol: str, interval: str, timestamp: datetime):
+        """Process one bar on the caller's thread (fused backtest pipeline).
+        
+        Args:
+            symbol: Symbol with new data
+            interval: Interval with new data
+            timestamp: Timestamp of new data
+        """
+        self.process_batch_inline([(symbol, interval, timestamp)])
+    
+    def process_batch_inline(self, notifications: List[Tuple[str, str, datetime]]):
+        """Process a batch on the caller's thread (fused backtest pipeline).
+        
+        Runs the same steps as the processing loop for one batch - derived
+        bars, indicators, analysis engine, strategies - in the same order,
+        but calls the analysis engine and strategies directly instead of
+        queueing to them and waiting for their ready signals. No ready
+        signal is sent to the coordinator, which is the caller.
+        
+        Args:
+            notifications: (symbol, interval, timestamp) per bar
+        """
+        try:
+            self._process_batch(notifications, inline=True)
+        except Exception as e:
+            logger.error(
+                f"Error processing notification: {e}",
+                exc_info=True
+            )
     
     def run(self):
         """Main thread entry point - starts event-driven processing loop."""
@@ -296,15 +355,16 @@ class DataProcessor(threading.Thread):
     def _processing_loop(self):
         """Main event-driven processing loop.
         
-        Waits for notifications from coordinator, processes data, signals ready.
+        Waits for notification batches from coordinator, processes data,
+        signals ready once per batch.
         
         Flow:
         1. Wait on notification queue (blocking with timeout)
         2. Read data from session_data (zero-copy)
         3. Generate derived bars
         4. Calculate real-time indicators
-        5. Signal ready to coordinator
-        6. Notify analysis engine
+        5. Notify analysis engine and strategies
+        6. Signal ready to coordinator
         """
         logger.info("Starting event-driven processing loop")
         
@@ -320,64 +380,7 @@ class DataProcessor(threading.Thread):
                 if notification is None or self._stop_event.is_set():
                     break
                 
-                # Start timing
-                start_time = self.metrics.start_timer()
-                
-                symbol, interval, timestamp = notification
-                logger.debug(
-                    f"Processing notification: {symbol} {interval} @ {timestamp.time()}"
-                )
-                
-                # 2. Process based on interval
-                if interval == "1m":
-                    # Generate derived bars from 1m bars
-                    self._generate_derived_bars(symbol)
-                
-                # 3. Calculate real-time indicators
-                self._calculate_realtime_indicators(symbol, interval)
-                
-                # 4. Notify analysis engine (only if session is active)
-                # Check session_active to prevent notifications during lag/catchup
-                if self.session_data._session_active:
-                    self._notify_analysis_engine(symbol, interval)
-                    
-                    # In data-driven mode, wait for analysis engine to finish
-                    # before signaling ready to coordinator
-                    if self._should_wait_for_analysis():
-                        logger.debug("[DATA-DRIVEN] Waiting for analysis engine...")
-                        if self._analysis_subscription:
-                            self._analysis_subscription.wait_until_ready()
-                            self._analysis_subscription.reset()
-                        logger.debug("[DATA-DRIVEN] Analysis engine ready")
-                    
-                    # 4b. Notify strategy manager (NEW)
-                    self._notify_strategy_manager(symbol, interval)
-                    
-                    # Wait for strategies in data-driven mode
-                    if self._should_wait_for_analysis():
-                        logger.debug("[DATA-DRIVEN] Waiting for strategies...")
-                        if self._strategy_manager:
-                            success = self._strategy_manager.wait_for_strategies(timeout=None)
-                            if not success:
-                                logger.warning("[DATA-DRIVEN] Strategy timeout")
-                        logger.debug("[DATA-DRIVEN] Strategies ready")
-                else:
-                    logger.debug(
-                        f"[PROCESSOR] Skipping notification (session inactive): {symbol} {interval}"
-                    )
-                
-                # 5. Signal ready to coordinator (mode-aware)
-                # Only after analysis engine finishes (in data-driven mode)
-                self._signal_ready_to_coordinator()
-                
-                # 6. Record timing and metrics
-                elapsed = self.metrics.elapsed_time(start_time)
-                self._processing_times.append(elapsed)
-                
-                # Record in performance metrics
-                self.metrics.record_data_processor(start_time)
-                
-                logger.debug(f"Processed {symbol} {interval} in {elapsed:.3f}s")
+                self._process_batch(notification)
                 
             except Exception as e:
                 logger.error(
@@ -387,129 +390,288 @@ class DataProcessor(threading.Thread):
         
         logger.info("Processing loop exited")
     
+    def _process_batch(
+        self,
+        notifications: List[Tuple[str, str, datetime]],
+        inline: bool = False
+    ):
+        """Process one notification batch (steps 2-6 of the processing loop).
+        
+        Each step runs over the whole batch before the next one: derived
+        bars for every symbol, then indicators, then one analysis engine
+        batch and one batch per strategy, then a single ready signal.
+        
+        Args:
+            notifications: (symbol, interval, timestamp) per bar
+            inline: Fused pipeline - run analysis engine and strategies
+                directly and skip all thread synchronization
+        """
+        # Start timing
+        start_time = self.metrics.start_timer()
+        
+        # Distinct (symbol, interval) pairs, in arrival order
+        keys = list(dict.fromkeys(
+            (symbol, interval) for symbol, interval, _ in notifications
+        ))
+        logger.debug(
+            f"Processing batch: {len(notifications)} notifications @ "
+            f"{notifications[-1][2].time() if notifications else None}"
+        )
+        
+        # 2-3. Generate derived bars and calculate real-time indicators
+        self._update_symbols(keys)
+        
+        # Publish immutable snapshots of the updated symbols: readers below
+        # (and exporters) see this timestamp without taking the lock
+        self.session_data.publish_snapshots(
+            {symbol for symbol, _ in keys},
+            notifications[-1][2] if notifications else None
+        )
+        
+        # 4. Notify analysis engine (only if session is active)
+        # Check session_active to prevent notifications during lag/catchup
+        if self.session_data._session_active and inline:
+            # Fused pipeline: analysis engine and strategies run on this thread
+            self._notify_analysis_engine(keys, inline=True)
+            self._notify_strategy_manager(keys, inline=True)
+        elif self.session_data._session_active:
+            analysis_notified = self._notify_analysis_engine(keys)
+            
+            # In data-driven mode, wait for analysis engine to finish
+            # before signaling ready to coordinator
+            if analysis_notified and self._should_wait_for_analysis():
+                logger.debug("[DATA-DRIVEN] Waiting for analysis engine...")
+                if self._analysis_subscription:
+                    self._analysis_subscription.wait_until_ready()
+                    self._analysis_subscription.reset()
+                logger.debug("[DATA-DRIVEN] Analysis engine ready")
+            
+            # 4b. Notify strategy manager (NEW)
+            strategy_threads = self._notify_strategy_manager(keys)
+            
+            # Wait for the notified strategies in data-driven mode
+            if strategy_threads and self._should_wait_for_analysis():
+                logger.debug("[DATA-DRIVEN] Waiting for strategies...")
+                success = self._strategy_manager.wait_for_strategies(
+                    timeout=None, threads=strategy_threads
+                )
+                if not success:
+                    logger.warning("[DATA-DRIVEN] Strategy timeout")
+                logger.debug("[DATA-DRIVEN] Strategies ready")
+        else:
+            logger.debug(
+                f"[PROCESSOR] Skipping batch (session inactive): {keys}"
+            )
+        
+        # 5. Signal ready to coordinator (mode-aware), once per batch
+        # Only after analysis engine finishes (in data-driven mode)
+        if not inline:
+            self._signal_ready_to_coordinator()
+        
+        # 6. Record timing and metrics
+        elapsed = self.metrics.elapsed_time(start_time)
+        self._processing_times.append(elapsed)
+        
+        # Record in performance metrics
+        self.metrics.record_data_processor(start_time)
+        
+        logger.debug(f"Processed {len(keys)} symbol/intervals in {elapsed:.3f}s")
+    
+    # =========================================================================
+    # Per-Batch Symbol Updates
+    # =========================================================================
+    
+    def _update_symbols(self, keys: List[Tuple[str, str]]):
+        """Generate derived bars and indicators for a batch's symbols.
+        
+        In batched indicator mode, only derived bars are generated per
+        symbol; indicators are then updated for all symbols together.
+        
+        Args:
+            keys: (symbol, interval) pairs with new data, in arrival order
+        """
+        batched = self._indicators_batched()
+        
+        # 2. Generate derived bars from 1m bars
+        derived_keys = []
+        for symbol in dict.fromkeys(symbol for symbol, interval in keys if interval == "1m"):
+            intervals = self._generate_derived_bars(symbol)
+            if batched:
+                derived_keys.extend((symbol, interval) for interval in intervals)
+        
+        if batched:
+            self._calculate_batched_indicators(keys + derived_keys)
+            return
+        
+        # 3. Calculate real-time indicators
+        for symbol, interval in keys:
+            self._calculate_realtime_indicators(symbol, interval)
+    
     # =========================================================================
     # Derived Bar Generation
     # =========================================================================
     
-    def _generate_derived_bars(self, symbol: str):
+    def _generate_derived_bars(self, symbol: str) -> List[str]:
         """Generate derived bars for a symbol.
         
-        Reads 1m bars from session_data and generates configured derived
-        intervals (5m, 15m, 30m, etc.) using progressive computation.
+        Feeds only the NEW base bars (since the last call) into per-(symbol,
+        interval) IncrementalBarAggregator instances. Each derived bar is
+        emitted exactly once, when its window closes - O(1) work per base bar
+        instead of re-aggregating the whole session on every notification.
         
-        Progressive: Computes each interval as soon as enough bars available.
-        - 5m bars: Generated as soon as 5 1m bars exist
-        - 15m bars: Generated when 15 1m bars exist
-        - etc.
+        Output matches compute_derived_bars() (FIXED_CHUNK, complete +
+        continuous). If the base container was rewritten behind our back
+        (gap fill insertion, session clear), state is rebuilt by replaying
+        the base bars once.
         
         Args:
             symbol: Symbol to generate derived bars for
+            
+        Returns:
+            Derived intervals that received new bars
         """
         if not self._auto_compute_derived:
-            return
+            return []
         
         try:
             # Get symbol data (includes bar structure)
             symbol_data = self.session_data.get_symbol_data(symbol, internal=True)
             if not symbol_data:
-                return
+                return []
             
             # Get derived intervals for this symbol from bar structure
+            # (minute intervals only - daily/weekly use CALENDAR aggregation)
             symbol_intervals = [
                 interval for interval, interval_data in symbol_data.bars.items()
-                if interval_data.derived
+                if interval_data.derived and interval.endswith('m')
             ]
             
             if not symbol_intervals:
-                return
+                return []
             
             # 1. Read base bars from session_data (ZERO-COPY: direct reference)
-            # Use base_interval from symbol data
             base_interval = symbol_data.base_interval
             base_interval_data = symbol_data.bars.get(base_interval)
             
             if not base_interval_data or not base_interval_data.data:
                 logger.debug(f"No {base_interval} bars available for {symbol}")
-                return
+                return []
             
-            # Convert to list only for processing (small overhead, required for compute_derived_bars)
-            bars_base = list(base_interval_data.data)
+            base_bars = base_interval_data.data
+            base_count = len(base_bars)
             
-            # 2. Progressive computation: Process intervals in ascending order
-            # This ensures we compute 5m as soon as 5 bars exist, 15m when 15 exist, etc.
-            # Parse intervals to int for sorting and comparison
-            intervals_parsed = []
-            for interval_str in symbol_intervals:
-                if interval_str.endswith('m'):
-                    interval_int = int(interval_str[:-1])
-                    intervals_parsed.append(interval_int)
+            # 2. Determine where we left off (replay if container changed)
+            aggregators = self._get_derived_aggregators(
+                symbol, base_interval, symbol_intervals
+            )
+            cursor, last_timestamp = self._derived_cursors.get(symbol, (0, None))
+            if cursor > base_count or (
+                cursor > 0 and base_bars[cursor - 1].timestamp != last_timestamp
+            ):
+                logger.debug(
+                    f"{symbol}: Base {base_interval} bars changed out of order, "
+                    f"replaying {base_count} bars for derived aggregation"
+                )
+                cursor = 0
+            # Full replay: dedupe against everything already stored (O(n), rare)
+            existing_timestamps: Optional[Dict[str, set]] = None
+            if cursor == 0:
+                existing_timestamps = {}
+                for interval_str, aggregator in aggregators.items():
+                    aggregator.reset()
+                    interval_data = symbol_data.bars.get(interval_str)
+                    existing_timestamps[interval_str] = {
+                        bar.timestamp for bar in interval_data.data
+                    } if interval_data else set()
             
-            sorted_intervals = sorted(intervals_parsed)
+            # 3. Fold new base bars (deque indexing near the tail is O(1))
+            new_bars_by_interval: Dict[str, int] = defaultdict(int)
+            for i in range(cursor, base_count):
+                base_bar = base_bars[i]
+                for interval_str, aggregator in aggregators.items():
+                    derived_bar = aggregator.add_bar(base_bar)
+                    if derived_bar is None:
+                        continue
+                    
+                    interval_data = symbol_data.bars.get(interval_str)
+                    if not interval_data:
+                        continue
+                    
+                    # Skip bars already present
+                    if existing_timestamps is not None:
+                        if derived_bar.timestamp in existing_timestamps[interval_str]:
+                            continue
+                    elif interval_data.data and \
+                            interval_data.data[-1].timestamp >= derived_bar.timestamp:
+                        continue
+                    
+                    interval_data.data.append(derived_bar)
+                    new_bars_by_interval[interval_str] += 1
             
-            for interval in sorted_intervals:
-                # Check if we have enough bars for this interval
-                if len(bars_base) < interval:
-                    logger.debug(
-                        f"Skipping {interval}m bars for {symbol}: "
-                        f"only {len(bars_base)} of {interval} {base_interval} bars available"
-                    )
-                    continue
-                
-                # 3. Compute derived bars for this interval
-                derived_bars = compute_derived_bars(
-                    bars_base,
-                    source_interval="1m",
-                    target_interval=f"{interval}m"
+            self._derived_cursors[symbol] = (base_count, base_bars[base_count - 1].timestamp)
+            
+            # 4. Flag updates and refresh derived-interval indicators
+            for interval_str, new_bar_count in new_bars_by_interval.items():
+                interval_data = symbol_data.bars[interval_str]
+                interval_data.updated = True
+                logger.debug(
+                    f"Generated {new_bar_count} new {interval_str} bars for {symbol} "
+                    f"(total {len(interval_data.data)})"
                 )
                 
-                if not derived_bars:
-                    continue
-                
-                # 4. Get existing derived bars from bar structure
-                interval_str = f"{interval}m"
-                interval_data = symbol_data.bars.get(interval_str)
-                
-                if not interval_data:
-                    logger.warning(f"No interval data for {interval_str} on {symbol}")
-                    continue
-                
-                # 5. Add only new bars (skip duplicates)
-                new_bar_count = 0
-                for derived_bar in derived_bars:
-                    # Check if bar already exists
-                    exists = any(
-                        bar.timestamp == derived_bar.timestamp
-                        for bar in interval_data.data
-                    )
-                    
-                    if not exists:
-                        # Append to derived bars (list)
-                        interval_data.data.append(derived_bar)
-                        new_bar_count += 1
-                
-                # Set updated flag if new bars were added
-                if new_bar_count > 0:
-                    interval_data.updated = True
-                    logger.debug(
-                        f"Generated {new_bar_count} new {interval}m bars for {symbol} "
-                        f"(total {len(derived_bars)})"
+                # Phase 6b: Update indicators for this derived interval
+                # (batched mode: after all symbols, see _update_symbols)
+                if self.indicator_manager and not self._indicators_batched():
+                    # Pass the live series; only batch indicators copy it
+                    self.indicator_manager.update_indicators(
+                        symbol=symbol,
+                        interval=interval_str,
+                        bars=interval_data.data
                     )
-                    
-                    # Phase 6b: Update indicators for this derived interval
-                    if self.indicator_manager:
-                        # Get all bars for this interval
-                        all_bars = list(interval_data.data)
-                        self.indicator_manager.update_indicators(
-                            symbol=symbol,
-                            interval=interval_str,
-                            bars=all_bars
-                        )
+            
+            return list(new_bars_by_interval)
             
         except Exception as e:
             logger.error(
                 f"Error generating derived bars for {symbol}: {e}",
                 exc_info=True
             )
+            return []
+    
+    def _get_derived_aggregators(
+        self,
+        symbol: str,
+        base_interval: str,
+        intervals: List[str]
+    ) -> Dict[str, IncrementalBarAggregator]:
+        """Get (or create) incremental aggregators for a symbol's derived intervals.
+        
+        If the interval set changed (e.g. interval added mid-session), the
+        symbol's cursor is dropped so the next pass replays all base bars.
+        
+        Args:
+            symbol: Symbol
+            base_interval: Source interval for aggregation
+            intervals: Derived intervals currently configured for the symbol
+        
+        Returns:
+            Dict of interval -> IncrementalBarAggregator (smallest interval first)
+        """
+        aggregators = self._derived_aggregators.setdefault(symbol, {})
+        
+        if set(aggregators.keys()) != set(intervals):
+            for interval_str in list(aggregators.keys()):
+                if interval_str not in intervals:
+                    del aggregators[interval_str]
+            for interval_str in intervals:
+                if interval_str not in aggregators:
+                    aggregators[interval_str] = IncrementalBarAggregator(
+                        base_interval, interval_str
+                    )
+            self._derived_cursors.pop(symbol, None)
+        
+        # Progressive order: 5m before 15m before 30m, etc.
+        return dict(sorted(aggregators.items(), key=lambda item: item[1].chunk_size))
     
     # =========================================================================
     # Real-Time Indicator Calculation
@@ -542,10 +704,9 @@ class DataProcessor(threading.Thread):
             if not interval_data or not interval_data.data:
                 return
             
-            # Get all bars for this interval
-            all_bars = list(interval_data.data)
-            
-            # Update indicators for this interval
+            # Update indicators for this interval (live series; only
+            # batch indicators copy it)
+            all_bars = interval_data.data
             self.indicator_manager.update_indicators(
                 symbol=symbol,
                 interval=interval,
@@ -563,6 +724,34 @@ class DataProcessor(threading.Thread):
                 exc_info=True
             )
     
+    def _indicators_batched(self) -> bool:
+        """True if indicators are updated for all symbols together."""
+        return getattr(self.indicator_manager, 'batched', False) is True
+    
+    def _calculate_batched_indicators(self, keys: List[Tuple[str, str]]):
+        """Update indicators of all updated symbols, one pass per interval.
+        
+        Args:
+            keys: (symbol, interval) pairs with new bars (base and derived)
+        """
+        bars_by_interval: Dict[str, Dict[str, Any]] = defaultdict(dict)
+        for symbol, interval in keys:
+            symbol_data = self.session_data.get_symbol_data(symbol, internal=True)
+            if not symbol_data:
+                continue
+            interval_data = symbol_data.bars.get(interval)
+            if interval_data and interval_data.data:
+                bars_by_interval[interval][symbol] = interval_data.data
+        
+        for interval, bars_by_symbol in bars_by_interval.items():
+            try:
+                self.indicator_manager.update_indicators_batch(interval, bars_by_symbol)
+            except Exception as e:
+                logger.error(
+                    f"Error calculating batched indicators for {interval}: {e}",
+                    exc_info=True
+                )
+    
     # =========================================================================
     # Synchronization
     # =========================================================================
@@ -617,15 +806,24 @@ class DataProcessor(threading.Thread):
     # Analysis Engine Notification
     # =========================================================================
     
-    def _notify_analysis_engine(self, symbol: str, interval: str):
+    def _notify_analysis_engine(
+        self,
+        keys: List[Tuple[str, str]],
+        inline: bool = False
+    ) -> bool:
         """Notify analysis engine that data is available.
         
-        Sends lightweight notifications (tuples) to analysis engine queue.
-        Analysis engine reads actual data from SessionData (zero-copy).
+        Sends one batch of lightweight notifications (tuples) for all
+        (symbol, interval) pairs to the analysis engine queue. Analysis
+        engine reads actual data from SessionData (zero-copy).
         
         Args:
-            symbol: Symbol with new data
-            interval: Interval with new data
+            keys: (symbol, interval) pairs with new data
+            inline: Fused pipeline - process each notification with the
+                analysis engine on this thread instead of queueing it
+        
+        Returns:
+            True if a batch was queued (analysis engine will signal ready)
         
         Note:
             Notifications are dropped (not queued) when paused during dynamic
@@ -635,103 +833,129 @@ class DataProcessor(threading.Thread):
         # Check if notifications are paused (Phase 3: Dynamic symbol management)
         if not self._notifications_paused.is_set():
             logger.debug(
-                f"[PROCESSOR] Dropping notification (paused): {symbol} {interval}"
+                f"[PROCESSOR] Dropping notifications (paused): {keys}"
             )
-            return  # Drop notification during catchup
+            return False  # Drop notifications during catchup
         
-        if not self._analysis_engine_queue:
-            return
+        if inline and not self._analysis_engine:
+            return False
+        if not inline and not self._analysis_engine_queue:
+            return False
         
+        notifications: List[Tuple[str, str, str]] = []
         try:
-            # Notify about derived bars (if base interval bar triggered generation)
-            symbol_data = self.session_data.get_symbol_data(symbol, internal=True)
-            if symbol_data and interval == symbol_data.base_interval:
-                # Get derived intervals for this symbol
-                derived_intervals = [
-                    iv for iv, iv_data in symbol_data.bars.items()
-                    if iv_data.derived
-                ]
+            for symbol, interval in keys:
+                symbol_data = self.session_data.get_symbol_data(symbol, internal=True)
+                if not symbol_data:
+                    continue
                 
-                for derived_interval in derived_intervals:
-                    self._analysis_engine_queue.put(
-                        (symbol, derived_interval, "bars")
-                    )
-                    logger.debug(
-                        f"Notified analysis engine: {symbol} {derived_interval} bars"
-                    )
-            
-            # Notify about indicators (query from SessionData, no separate tracking)
-            symbol_data = self.session_data.get_symbol_data(symbol, internal=True)
-            if symbol_data and symbol_data.indicators:
+                # Notify about derived bars (if base interval bar triggered generation)
+                if interval == symbol_data.base_interval:
+                    for derived_interval, interval_data in symbol_data.bars.items():
+                        if interval_data.derived:
+                            notifications.append((symbol, derived_interval, "bars"))
+                
+                # Notify about indicators (query from SessionData, no separate tracking)
                 for indicator_name in symbol_data.indicators.keys():
-                    self._analysis_engine_queue.put(
-                        (symbol, indicator_name, "indicator")
-                    )
-                    logger.debug(
-                        f"Notified analysis engine: {symbol} {indicator_name}"
-                    )
+                    notifications.append((symbol, indicator_name, "indicator"))
             
         except Exception as e:
             logger.error(
                 f"Error notifying analysis engine: {e}",
                 exc_info=True
             )
+            return False
+        
+        if not notifications:
+            return False
+        
+        if inline:
+            for notification in notifications:
+                self._analyze_inline(notification)
+            return False
+        
+        self._analysis_engine_queue.put(notifications)
+        logger.debug(f"Notified analysis engine: {len(notifications)} notifications")
+        return True
+    
+    def _analyze_inline(self, notification: Tuple[str, str, str]):
+        """Run the analysis engine for one notification on this thread.
+        
+        Errors are logged per notification, as the analysis engine loop does.
+        
+        Args:
+            notification: (symbol, interval, data_type) tuple
+        """
+        try:
+            self._analysis_engine.process_notification(*notification)
+        except Exception as e:
+            logger.error(
+                f"Error in inline analysis of {notification}: {e}",
+                exc_info=True
+            )
     
     # =========================================================================
     # Strategy Manager Notification (NEW)
     # =========================================================================
     
-    def _notify_strategy_manager(self, symbol: str, interval: str):
+    def _notify_strategy_manager(
+        self,
+        keys: List[Tuple[str, str]],
+        inline: bool = False
+    ) -> list:
         """Notify strategy manager that data is available.
         
-        Routes notifications only to strategies subscribed to (symbol, interval).
+        Routes notifications only to strategies subscribed to (symbol, interval);
+        each strategy receives its share of the batch as one notification.
         Strategies read data from SessionData (zero-copy).
         
         Args:
-            symbol: Symbol with new data
-            interval: Interval with new data
+            keys: (symbol, interval) pairs with new data
+            inline: Fused pipeline - run subscribed strategies on this thread
+        
+        Returns:
+            Strategy threads that were notified (to wait on), empty if inline
         """
         # Check if notifications are paused
         if not self._notifications_paused.is_set():
             logger.debug(
-                f"[PROCESSOR] Dropping strategy notification (paused): {symbol} {interval}"
+                f"[PROCESSOR] Dropping strategy notifications (paused): {keys}"
             )
-            return
+            return []
         
         if not self._strategy_manager:
-            return
+            return []
         
+        notifications: List[Tuple[str, str, str]] = []
         try:
-            # Get symbol data
-            symbol_data = self.session_data.get_symbol_data(symbol, internal=True)
-            if not symbol_data:
-                return
+            for symbol, interval in keys:
+                symbol_data = self.session_data.get_symbol_data(symbol, internal=True)
+                if not symbol_data or interval != symbol_data.base_interval:
+                    continue
+                
+                # Base interval (1m bars), then derived intervals
+                notifications.append((symbol, interval, "bars"))
+                for derived_interval, interval_data in symbol_data.bars.items():
+                    if interval_data.derived:
+                        notifications.append((symbol, derived_interval, "bars"))
             
-            # Notify about base interval (1m bars)
-            if interval == symbol_data.base_interval:
-                self._strategy_manager.notify_strategies(symbol, interval, "bars")
-                logger.debug(f"Notified strategies: {symbol} {interval}")
+            if inline:
+                for symbol, interval, data_type in notifications:
+                    self._strategy_manager.run_strategies_inline(symbol, interval, data_type)
+                return []
             
-            # Notify about derived intervals
-            if interval == symbol_data.base_interval:
-                derived_intervals = [
-                    iv for iv, iv_data in symbol_data.bars.items()
-                    if iv_data.derived
-                ]
-                
-                for derived_interval in derived_intervals:
-                    self._strategy_manager.notify_strategies(
-                        symbol, derived_interval, "bars"
-                    )
-                    logger.debug(
-                        f"Notified strategies: {symbol} {derived_interval} (derived)"
-                    )
+            threads = self._strategy_manager.notify_strategies_batch(notifications)
+            logger.debug(
+                f"Notified {len(threads)} strategies: {len(notifications)} notifications"
+            )
+            return threads
         
         except Exception as e:
             logger.error(
                 f"Error notifying strategy manager: {e}",
                 exc_info=True
             )
+            return []
     
     # =========================================================================
     # Helpers
@@ -797,6 +1021,10 @@ class DataProcessor(threading.Thread):
         if hasattr(self, '_processing_times'):
             self._processing_times.clear()
         
+        # Drop incremental derived-bar state (new session starts empty)
+        self._derived_aggregators.clear()
+        self._derived_cursors.clear()
+        
         # Clear subscriptions will be rebuilt in setup()
         # Note: Don't stop the thread, just reset state
         
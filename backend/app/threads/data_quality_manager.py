@@ -119,7 +119,8 @@ class DataQualityManager(threading.Thread):
         self._running = False
         
         # Notification queue FROM coordinator (tuples: symbol, interval, timestamp)
-        self._notification_queue: queue.Queue[Tuple[str, str, datetime]] = queue.Queue()
+        # Items are one batch of (symbol, interval, timestamp) per timestamp
+        self._notification_queue: queue.Queue[List[Tuple[str, str, datetime]]] = queue.Queue()
         
         # Configuration (extract from system_manager.session_config)
         gap_filler_config = system_manager.session_config.session_data_config.gap_filler
@@ -191,8 +192,22 @@ class DataQualityManager(threading.Thread):
         """
         # Only queue notifications for base intervals (streamed data)
         # Derived bars get quality copied from base bars
-        if interval in ["1m", "1s", "1d"]:  # Streamed intervals
-            self._notification_queue.put((symbol, interval, timestamp))
+        self.notify_batch_available([(symbol, interval, timestamp)])
+    
+    def notify_batch_available(self, notifications: List[Tuple[str, str, datetime]]):
+        """Receive all new bars of one timestamp as a single notification.
+        
+        Args:
+            notifications: (symbol, interval, timestamp) per bar
+        """
+        # Only queue notifications for base intervals (streamed data)
+        # Derived bars get quality copied from base bars
+        batch = [
+            notification for notification in notifications
+            if notification[1] in ["1m", "1s", "1d"]  # Streamed intervals
+        ]
+        if batch:
+            self._notification_queue.put(batch)
     
     def run(self):
         """Main thread entry point - starts event-driven processing loop."""
@@ -271,21 +286,23 @@ class DataQualityManager(threading.Thread):
                 if notification is None or self._stop_event.is_set():
                     break
                 
-                symbol, interval, timestamp = notification
-                
                 # Skip if quality disabled
                 if not self._enable_quality:
                     continue
                 
-                # 2. Calculate quality for symbol
-                self._calculate_quality(symbol, interval)
-                
-                # 3. Fill gaps (live mode only)
-                if self.gap_filling_enabled:
-                    self._check_and_fill_gaps(symbol, interval)
-                
-                # 4. Propagate quality to derived bars
-                self._propagate_quality_to_derived(symbol, interval)
+                # Once per (symbol, interval) in the batch
+                for symbol, interval in dict.fromkeys(
+                    (symbol, interval) for symbol, interval, _ in notification
+                ):
+                    # 2. Calculate quality for symbol
+                    self._calculate_quality(symbol, interval)
+                    
+                    # 3. Fill gaps (live mode only)
+                    if self.gap_filling_enabled:
+                        self._check_and_fill_gaps(symbol, interval)
+                    
+                    # 4. Propagate quality to derived bars
+                    self._propagate_quality_to_derived(symbol, interval)
                 
             except Exception as e:
                 logger.error(
@@ -546,20 +563,10 @@ class DataQualityManager(threading.Thread):
                 return 0
             
             # Convert DataFrame to BarData and add to SessionData
-            from app.models.trading import BarData
+            from app.managers.data_manager.bar_conversion import bars_from_frame
             filled_count = 0
             
-            for _, row in df.iterrows():
-                bar = BarData(
-                    symbol=row['symbol'],
-                    timestamp=row['timestamp'],
-                    open=row['open'],
-                    high=row['high'],
-                    low=row['low'],
-                    close=row['close'],
-                    volume=row['volume']
-                )
-                
+            for bar in bars_from_frame(df, interval):
                 # Add bar to SessionData
                 self.session_data.append_bar(symbol, interval, bar)
                 filled_count += 1
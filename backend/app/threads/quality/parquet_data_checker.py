@@ -5,7 +5,7 @@ Follows architecture: Use DataManager API, not direct storage access.
 """
 
 from typing import Callable
-from datetime import date, datetime, time
+from datetime import date
 
 from app.logger import logger
 
@@ -33,8 +33,8 @@ def create_data_manager_checker(
         >>> print(f"Found {count} bars")
     
     Architecture Note:
-        This uses DataManager's public API (get_bars), not direct storage access.
-        DataManager handles Parquet reading internally.
+        This uses DataManager's public API (get_bar_count), not direct storage
+        access. Counts come from the parquet catalog, no bars are read.
     """
     
     def data_checker(symbol: str, interval: str, start_date: date, end_date: date) -> int:
@@ -50,23 +50,15 @@ def create_data_manager_checker(
             Number of bars available (0 if none)
         """
         try:
-            # Convert dates to datetime (full day range)
-            start_dt = datetime.combine(start_date, time.min)
-            end_dt = datetime.combine(end_date, time.max)
-            
-            # Use DataManager API to get bars
-            # Note: session=None since DataManager doesn't use DB anymore
-            bars = data_manager.get_bars(
+            # Count via DataManager API (parquet catalog - no bar reads)
+            count = data_manager.get_bar_count(
                 session=None,  # Not needed for Parquet storage
                 symbol=symbol,
-                start=start_dt,
-                end=end_dt,
                 interval=interval,
-                regular_hours_only=False  # Get all data for validation
+                start_date=start_date,
+                end_date=end_date
             )
             
-            count = len(bars) if bars else 0
-            
             if count > 0:
                 logger.debug(
                     f"[DATA_CHECKER] {symbol} {interval}: {count} bars "
@@ -111,15 +103,13 @@ def create_parquet_data_checker(
     def data_checker(symbol: str, interval: str, start_date: date, end_date: date) -> int:
         """Check data availability in Parquet storage (test backdoor)."""
         try:
-            df = parquet_storage.read_bars(
-                data_type=interval,
-                symbol=symbol,
+            count = parquet_storage.count_bars(
+                interval,
+                symbol,
                 start_date=start_date,
                 end_date=end_date
             )
             
-            count = len(df)
-            
             if count > 0:
                 logger.debug(
                     f"[DATA_CHECKER] {symbol} {interval}: {count} bars "
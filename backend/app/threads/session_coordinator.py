@@ -26,8 +26,10 @@ Dependencies (Phase 1 & 2):
 - TimeManager (Phase 2.2) - Time/calendar with caching
 """
 
+import heapq
 import threading
 import queue
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, date, time, timedelta
 from typing import Optional, Dict, List, Any, Tuple, Set
 from collections import defaultdict
@@ -42,11 +44,14 @@ from app.managers.data_manager.session_data import (
     SessionData, 
     get_session_data,
     SymbolSessionData,
-    BarIntervalData
+    BarIntervalData,
+    HistoricalBarIntervalData
 )
+from app.managers.data_manager.columnar_bars import ColumnarBarSeries
 from app.threads.sync.stream_subscription import StreamSubscription
 from app.monitoring.performance_metrics import PerformanceMetrics
 from app.models.session_config import SessionConfig
+from app.models.trading import BarData
 
 # Existing infrastructure
 from app.models.database import SessionLocal
@@ -74,6 +79,41 @@ from app.models.indicator_config import (
 )
 
 
+# Bar intervals loaded into backtest queues from parquet
+BACKTEST_BAR_INTERVALS = ("1s", "1m", "5m", "15m", "30m", "1h", "1d")
+
+
+@dataclass
+class QueuePrefetch:
+    """Backtest queue bars being read ahead for one session date.
+    
+    Attributes:
+        session_date: Trading date the bars belong to
+        streams: Interval -> symbols (upper case) covered by the read
+        future: Resolves to {interval: {symbol: [BarData]}}
+    """
+    session_date: date
+    streams: Dict[str, Tuple[str, ...]]
+    future: Future
+
+
+@dataclass
+class HistoricalWindow:
+    """Trailing historical bars loaded for one (symbol, interval, trailing_days).
+    
+    Carried across session teardown so the next day only reads the dates
+    that entered the window (see _load_historical_data_config).
+    
+    Attributes:
+        start_date: First trading date of the window
+        end_date: Last date of the window (day before the session)
+        data: Bars by date, installed as-is into the next session
+    """
+    start_date: date
+    end_date: date
+    data: HistoricalBarIntervalData
+
+
 @dataclass
 class SymbolValidationResult:
     """Result of per-symbol validation for loading.
@@ -245,15 +285,20 @@ class SessionCoordinator(threading.Thread):
         self.metrics = PerformanceMetrics()
         self.subscriptions: Dict[str, StreamSubscription] = {}
         
+        # Extract immutable config values during init (performance optimization)
+        session_config = self._system_manager.session_config
+        
         # Phase 3-5: Indicator manager
-        self.indicator_manager = IndicatorManager(self.session_data)
+        streaming_config = getattr(session_config.session_data_config, 'streaming', None)
+        self.indicator_manager = IndicatorManager(
+            self.session_data,
+            batched=getattr(streaming_config, 'batched_indicators', False) is True
+        )
         logger.info(
             f"IndicatorManager initialized with {len(list_indicators())} "
             f"registered indicators"
         )
         
-        # Extract immutable config values during init (performance optimization)
-        session_config = self._system_manager.session_config
         self._symbols = session_config.session_data_config.symbols
         self._streams = session_config.session_data_config.streams
         
@@ -280,6 +325,19 @@ class SessionCoordinator(threading.Thread):
         # Queue storage for backtest streaming
         # Structure: {(symbol, interval): deque of BarData}
         self._bar_queues: Dict[Tuple[str, str], 'deque'] = {}
+        # Min-heap of (head timestamp, queue_key) for k-way merge of the queues.
+        # None = stale, rebuilt on next use (see _get_queue_heap)
+        self._queue_heap: Optional[List[Tuple[datetime, Tuple[str, str]]]] = None
+        # Next trading day's queue bars, read in the background while the
+        # current day streams (see _start_queue_prefetch)
+        self._queue_prefetch: Optional[QueuePrefetch] = None
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        
+        # Trailing historical windows loaded this session, keyed by
+        # (symbol, interval, trailing_days). Moved to _historical_carry on
+        # teardown and rolled forward by the next session's load.
+        self._historical_windows: Dict[Tuple[str, str, int], HistoricalWindow] = {}
+        self._historical_carry: Dict[Tuple[str, str, int], HistoricalWindow] = {}
         
         # Symbol management (thread-safe)
         self._symbol_operation_lock = threading.Lock()
@@ -320,6 +378,7 @@ class SessionCoordinator(threading.Thread):
         self._base_interval: Optional[str] = None  # Stored from validation
         self._derived_intervals_validated: List[str] = []  # Stored from validation
         self._session_count = 0  # Track number of sessions run
+        self._error: Optional[Exception] = None  # Failure that ended the loop
         
         logger.info(
             f"SessionCoordinator initialized (mode={session_config.mode}, "
@@ -351,7 +410,10 @@ class SessionCoordinator(threading.Thread):
                     type=IndicatorType(ind_cfg.type),
                     period=ind_cfg.period,
                     interval=ind_cfg.interval,
-                    params=ind_cfg.params.copy() if ind_cfg.params else {}
+                    params=ind_cfg.params.copy() if ind_cfg.params else {},
+                    incremental=ind_cfg.incremental,
+                    history=ind_cfg.history,
+                    evaluation=ind_cfg.evaluation
                 )
                 result['session'].append(config)
                 logger.debug(f"Parsed session indicator: {config.make_key()}")
@@ -370,7 +432,10 @@ class SessionCoordinator(threading.Thread):
                     type=IndicatorType(ind_cfg.type),
                     period=ind_cfg.period,
                     interval=ind_cfg.interval,
-                    params=ind_cfg.params.copy() if ind_cfg.params else {}
+                    params=ind_cfg.params.copy() if ind_cfg.params else {},
+                    incremental=ind_cfg.incremental,
+                    history=ind_cfg.history,
+                    evaluation=ind_cfg.evaluation
                 )
                 result['historical'].append(config)
                 logger.debug(f"Parsed historical indicator: {config.make_key()}")
@@ -623,7 +688,7 @@ class SessionCoordinator(threading.Thread):
                 symbol_data.bars[interval] = BarIntervalData(
                     derived=(not is_base),
                     base=requirements['base_interval'] if not is_base else None,
-                    data=deque(bars)
+                    data=self._new_bar_container(derived=False, bars=bars)
                 )
             
             logger.debug(
@@ -635,6 +700,28 @@ class SessionCoordinator(threading.Thread):
             f"(base: {requirements['base_interval']})"
         )
     
+    def _new_bar_container(self, derived: bool, bars: Optional[List] = None):
+        """Create the container for BarIntervalData.data.
+        
+        Deque for streamed (base) intervals, list for derived intervals, or a
+        ColumnarBarSeries for both when session_data_config.columnar_bars is on.
+        
+        Args:
+            derived: True for derived (generated) intervals
+            bars: Initial bars (chronological)
+        
+        Returns:
+            Empty or pre-filled bar container
+        """
+        session_config = getattr(self._system_manager, 'session_config', None)
+        session_data_config = getattr(session_config, 'session_data_config', None)
+        if getattr(session_data_config, 'columnar_bars', False) is True:
+            return ColumnarBarSeries(bars)
+        
+        if derived:
+            return list(bars) if bars else []
+        return deque(bars) if bars else deque()
+    
     def _register_symbol_indicators(
         self,
         symbol: str,
@@ -781,7 +868,10 @@ class SessionCoordinator(threading.Thread):
             
         except Exception as e:
             logger.error(f"SessionCoordinator error: {e}", exc_info=True)
+            if self._error is None:
+                self._error = e
         finally:
+            self._cancel_queue_prefetch(shutdown=True)
             self._running = False
             logger.info("SessionCoordinator thread stopped")
     
@@ -834,6 +924,11 @@ class SessionCoordinator(threading.Thread):
         """
         return not self._stream_paused.is_set()
     
+    @property
+    def error(self) -> Optional[Exception]:
+        """Exception that ended the coordinator loop (None if it ran to completion)."""
+        return self._error
+    
     # =========================================================================
     # Properties - Single Source of Truth via SystemManager
     # =========================================================================
@@ -1020,6 +1115,7 @@ class SessionCoordinator(threading.Thread):
             for key in queues_to_remove:
                 del self._bar_queues[key]
                 logger.debug(f"[SYMBOL] Removed queue {key}")
+            self._invalidate_queue_heap()
             
             # Clean up lag check counter
             self._symbol_check_counters.pop(symbol, None)
@@ -1033,6 +1129,8 @@ class SessionCoordinator(threading.Thread):
         
         # Remove from session_data (has its own lock)
         removed = self.session_data.remove_symbol(symbol)
+        if hasattr(self, 'indicator_manager') and self.indicator_manager:
+            self.indicator_manager.remove_symbol(symbol)
         
         if removed:
             logger.info(f"[SYMBOL] Successfully removed {symbol} from session")
@@ -1060,14 +1158,17 @@ class SessionCoordinator(threading.Thread):
         logger.info("PHASE 1: TEARDOWN & CLEANUP")
         logger.info("=" * 70)
         
-        # Step 1a: Clear SessionData
+        # Step 1a: Clear SessionData (keep historical windows to roll forward)
         logger.info("Step 1a: Clearing SessionData")
+        self._historical_carry = self._historical_windows
+        self._historical_windows = {}
         self.session_data.clear()
         logger.debug(f"SessionData cleared - removed all symbols")
         
         # Step 1b: Clear stream queues
         logger.info("Step 1b: Clearing stream queues")
         self._bar_queues.clear()
+        self._invalidate_queue_heap()
         if hasattr(self, '_quote_queues'):
             self._quote_queues.clear()
         if hasattr(self, '_tick_queues'):
@@ -1136,6 +1237,8 @@ class SessionCoordinator(threading.Thread):
         # Sub-step 2-4: Load historical data and indicators
         logger.info("Step 3.2: Loading historical data and indicators")
         self._manage_historical_data(symbols=validated_symbols)
+        # Windows not rolled forward (symbol/config removed) are dropped
+        self._historical_carry = {}
         
         # Sub-step 3.5: Register session indicators
         logger.info("Step 3.3: Registering session indicators")
@@ -1307,6 +1410,9 @@ class SessionCoordinator(threading.Thread):
                 # Step 6: Activate session
                 self._activate_session()  # EXISTING method (unchanged)
                 
+                # Read next day's queues while this day streams (backtest)
+                self._start_queue_prefetch()
+                
                 # Step 7: Stream data
                 self._streaming_phase()  # EXISTING method (unchanged)
                 
@@ -1342,6 +1448,7 @@ class SessionCoordinator(threading.Thread):
                 
             except Exception as e:
                 logger.error(f"Error in coordinator loop: {e}", exc_info=True)
+                self._error = e
                 break
         
         logger.info("=" * 70)
@@ -2263,12 +2370,35 @@ class SessionCoordinator(threading.Thread):
             f"Loading backtest queue: {current_date} (single day)"
         )
         
+        # Batched read: one multi-symbol read per bar interval instead of
+        # one read per symbol/interval. Streams read ahead by the background
+        # prefetch are taken as-is; only streams it did not cover (e.g.
+        # symbols added since it started) are read here, so the result is
+        # the same with or without the prefetch.
+        streamed_by_symbol = {
+            symbol: self._get_streamed_intervals_for_symbol(symbol)
+            for symbol in symbols_to_process
+        }
+        symbols_by_interval = self._group_bar_streams(streamed_by_symbol)
+        
+        prefetched_bars = self._take_queue_prefetch(current_date, symbols_by_interval)
+        missing_streams = {
+            interval: [s for s in interval_symbols if s.upper() not in prefetched_bars.get(interval, {})]
+            for interval, interval_symbols in symbols_by_interval.items()
+        }
+        loaded_bars = self._read_backtest_bars(
+            current_date,
+            {interval: syms for interval, syms in missing_streams.items() if syms}
+        )
+        for interval, bars_by_symbol in loaded_bars.items():
+            prefetched_bars.setdefault(interval, {}).update(bars_by_symbol)
+        
         # Load bars for each streamed symbol/interval
         total_streams = 0
         total_bars = 0
         
         for symbol in symbols_to_process:
-            streamed_intervals = self._get_streamed_intervals_for_symbol(symbol)
+            streamed_intervals = streamed_by_symbol[symbol]
             
             if not streamed_intervals:
                 logger.warning(f"{symbol}: No streamed intervals to load")
@@ -2278,7 +2408,7 @@ class SessionCoordinator(threading.Thread):
             for interval in streamed_intervals:
                 try:
                     # Classify interval type
-                    is_bar_interval = interval in ["1s", "1m", "5m", "15m", "30m", "1h", "1d"]
+                    is_bar_interval = interval in BACKTEST_BAR_INTERVALS
                     is_quotes = interval == "quotes"
                     is_ticks = interval == "ticks"
                     
@@ -2301,27 +2431,15 @@ class SessionCoordinator(threading.Thread):
                         f"{start_date} to {end_date}"
                     )
                     
-                    # Convert dates to datetimes (naive - timezone handled by data_manager)
-                    start_dt = datetime.combine(start_date, time(0, 0))
-                    end_dt = datetime.combine(end_date, time(23, 59, 59))
-                    
-                    # Load data from DataManager
-                    with SessionLocal() as db_session:
-                        if is_bar_interval:
-                            bars = self._data_manager.get_bars(
-                                session=db_session,
-                                symbol=symbol,
-                                start=start_dt,
-                                end=end_dt,
-                                interval=interval,
-                                regular_hours_only=True  # Filter to 09:30-16:00 only
-                            )
-                        elif is_quotes:
-                            # TODO: Implement quotes loading when available
-                            logger.warning(
-                                f"[SESSION_FLOW] PHASE_3.2: Quotes loading not yet implemented for {symbol}, skipping"
-                            )
-                            continue
+                    # Bars were read in the batched prefetch above
+                    if is_bar_interval:
+                        bars = prefetched_bars[interval].get(symbol.upper(), [])
+                    elif is_quotes:
+                        # TODO: Implement quotes loading when available
+                        logger.warning(
+                            f"[SESSION_FLOW] PHASE_3.2: Quotes loading not yet implemented for {symbol}, skipping"
+                        )
+                        continue
                     
                     # Check availability
                     if not bars:
@@ -2371,9 +2489,149 @@ class SessionCoordinator(threading.Thread):
                     # Re-raise to abort backtest on critical errors
                     raise
         
+        # New queue heads must enter the merge heap
+        self._invalidate_queue_heap()
+
         logger.info(f"[SESSION_FLOW] PHASE_3.2: Complete - Loaded {total_bars} bars across {total_streams} streams")
         logger.info(f"Loaded {total_streams} backtest streams with {total_bars} total bars")
     
+    def _group_bar_streams(self, streamed_by_symbol: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        """Invert symbol -> streamed intervals into bar interval -> symbols."""
+        symbols_by_interval: Dict[str, List[str]] = {}
+        for symbol, streamed_intervals in streamed_by_symbol.items():
+            for interval in streamed_intervals or []:
+                if interval in BACKTEST_BAR_INTERVALS:
+                    symbols_by_interval.setdefault(interval, []).append(symbol)
+        return symbols_by_interval
+    
+    def _read_backtest_bars(
+        self,
+        session_date: date,
+        symbols_by_interval: Dict[str, List[str]]
+    ) -> Dict[str, Dict[str, List]]:
+        """Read one session day's regular-hours bars for queue loading.
+        
+        Pure read (no coordinator state touched) - safe to run on the
+        prefetch worker.
+        
+        Args:
+            session_date: Trading date to read
+            symbols_by_interval: Bar interval -> symbols
+        
+        Returns:
+            {interval: {SYMBOL: [BarData]}}
+        """
+        start_dt = datetime.combine(session_date, time(0, 0))
+        end_dt = datetime.combine(session_date, time(23, 59, 59))
+        
+        bars: Dict[str, Dict[str, List]] = {}
+        with SessionLocal() as db_session:
+            for interval, interval_symbols in symbols_by_interval.items():
+                bars[interval] = self._data_manager.get_bars_multi(
+                    session=db_session,
+                    symbols=interval_symbols,
+                    start=start_dt,
+                    end=end_dt,
+                    interval=interval,
+                    regular_hours_only=True  # Filter to 09:30-16:00 only
+                )
+        return bars
+    
+    def _start_queue_prefetch(self):
+        """Start reading the next trading day's queue bars in the background.
+        
+        Backtest only. Covers the config symbols with the streams they have
+        today; _load_backtest_queues() on the next day takes the result and
+        reads anything not covered itself.
+        """
+        if self.mode != "backtest":
+            return
+        
+        self._cancel_queue_prefetch()
+        
+        current_date = self._time_manager.get_current_time().date()
+        with SessionLocal() as session:
+            next_date = self._time_manager.get_next_trading_date(
+                session,
+                current_date,
+                exchange=self.session_config.exchange_group
+            )
+        end_date = self._time_manager.backtest_end_date
+        if next_date is None or (end_date is not None and next_date > end_date):
+            return
+        
+        streamed_by_symbol = {
+            symbol: self._get_streamed_intervals_for_symbol(symbol)
+            for symbol in self.session_config.session_data_config.symbols
+        }
+        symbols_by_interval = self._group_bar_streams(streamed_by_symbol)
+        if not symbols_by_interval:
+            return
+        
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix="queue-prefetch"
+            )
+        
+        self._queue_prefetch = QueuePrefetch(
+            session_date=next_date,
+            streams={
+                interval: tuple(symbol.upper() for symbol in interval_symbols)
+                for interval, interval_symbols in symbols_by_interval.items()
+            },
+            future=self._prefetch_executor.submit(
+                self._read_backtest_bars, next_date, symbols_by_interval
+            )
+        )
+        logger.debug(f"[PREFETCH] Reading {next_date} queues in background")
+    
+    def _take_queue_prefetch(
+        self,
+        session_date: date,
+        symbols_by_interval: Dict[str, List[str]]
+    ) -> Dict[str, Dict[str, List]]:
+        """Hand over prefetched bars for session_date (waits if still reading).
+        
+        Args:
+            session_date: Date being loaded
+            symbols_by_interval: Streams being loaded (bar interval -> symbols)
+        
+        Returns:
+            {interval: {SYMBOL: [BarData]}} for the requested streams the
+            prefetch covered; empty if there is no prefetch for this date
+        """
+        prefetch = self._queue_prefetch
+        if prefetch is None or prefetch.session_date != session_date:
+            return {}
+        self._queue_prefetch = None
+        
+        try:
+            bars = prefetch.future.result()
+        except Exception as e:
+            logger.warning(f"[PREFETCH] Background read for {session_date} failed, reading now: {e}")
+            return {}
+        
+        taken: Dict[str, Dict[str, List]] = {}
+        for interval, interval_symbols in symbols_by_interval.items():
+            covered = set(prefetch.streams.get(interval, ()))
+            taken[interval] = {
+                symbol.upper(): bars[interval][symbol.upper()]
+                for symbol in interval_symbols
+                if symbol.upper() in covered
+            }
+        logger.debug(f"[PREFETCH] Using prefetched queues for {session_date}")
+        return taken
+    
+    def _cancel_queue_prefetch(self, shutdown: bool = False):
+        """Drop any pending prefetch (and stop the worker if shutdown)."""
+        if self._queue_prefetch is not None:
+            self._queue_prefetch.future.cancel()
+            self._queue_prefetch = None
+        if shutdown and self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+            self._prefetch_executor = None
+    
     def _start_live_streams(self):
         """Start live API streams for live mode.
         
@@ -2677,6 +2935,12 @@ class SessionCoordinator(threading.Thread):
         # Streaming loop
         iteration = 0
         total_bars_processed = 0
+        fused = self._is_fused_pipeline()
+        if fused:
+            logger.info(
+                "[SESSION_FLOW] PHASE_5.2: Fused pipeline - processing bars inline "
+                "on the coordinator thread"
+            )
         
         while not self._stop_event.is_set():
             iteration += 1
@@ -2778,8 +3042,8 @@ class SessionCoordinator(threading.Thread):
                 if speed_multiplier == 0:
                     # DATA-DRIVEN: Wait for processor to finish before continuing
                     # This ensures synchronization - coordinator doesn't push more data
-                    # until processor signals it's ready
-                    if bars_processed > 0 and self._processor_subscription:
+                    # until processor signals it's ready (fused: already processed inline)
+                    if bars_processed > 0 and self._processor_subscription and not fused:
                         logger.debug(
                             f"[DATA-DRIVEN] Waiting for processor to finish "
                             f"{bars_processed} bars..."
@@ -3500,7 +3764,7 @@ class SessionCoordinator(threading.Thread):
         symbol_data.bars[interval] = BarIntervalData(
             derived=is_derived,
             base=req.base_interval if is_derived else None,
-            data=deque() if not is_derived else [],
+            data=self._new_bar_container(derived=is_derived),
             quality=0.0,
             gaps=[],
             updated=False
@@ -3611,7 +3875,8 @@ class SessionCoordinator(threading.Thread):
     def _check_parquet_data(self, symbol: str, interval: str, check_date: date) -> bool:
         """Check if Parquet data exists for symbol/interval/date.
         
-        REUSES: DataManager.load_historical_bars() API
+        REUSES: DataManager.count_historical_bars() API (catalog lookup,
+        same range as load_historical_bars())
         
         Args:
             symbol: Symbol to check
@@ -3623,12 +3888,12 @@ class SessionCoordinator(threading.Thread):
         """
         try:
             # Call DataManager API (which uses TimeManager internally)
-            bars = self._data_manager.load_historical_bars(
+            count = self._data_manager.count_historical_bars(
                 symbol=symbol,
                 interval=interval,
                 days=1  # Just check for this date
             )
-            return len(bars) > 0
+            return count > 0
         except Exception as e:
             logger.debug(f"{symbol}: Error checking Parquet data: {e}")
             return False
@@ -3636,7 +3901,7 @@ class SessionCoordinator(threading.Thread):
     def _check_historical_data_availability(self, symbol: str) -> bool:
         """Check if historical data exists for symbol.
         
-        REUSES: DataManager.load_historical_bars() API
+        REUSES: DataManager.count_historical_bars() API (catalog lookup)
         Infers: Required intervals from config
         
         Args:
@@ -3658,12 +3923,12 @@ class SessionCoordinator(threading.Thread):
         
         try:
             # Call DataManager API (uses TimeManager internally)
-            bars = self._data_manager.load_historical_bars(
+            count = self._data_manager.count_historical_bars(
                 symbol=symbol,
                 interval=interval,
                 days=days
             )
-            return len(bars) > 0
+            return count > 0
         except Exception as e:
             logger.error(f"{symbol}: Error checking historical data: {e}", exc_info=True)
             return False
@@ -3845,7 +4110,7 @@ class SessionCoordinator(threading.Thread):
             base_interval: BarIntervalData(
                 derived=False,  # Streamed, not generated
                 base=None,      # Not derived from anything
-                data=deque(),   # Empty deque for base interval
+                data=self._new_bar_container(derived=False),
                 quality=0.0,
                 gaps=[],
                 updated=False
@@ -3857,7 +4122,7 @@ class SessionCoordinator(threading.Thread):
             bars[interval] = BarIntervalData(
                 derived=True,       # Generated, not streamed
                 base=base_interval, # Derived from base
-                data=[],            # Empty list for derived
+                data=self._new_bar_container(derived=True),
                 quality=0.0,
                 gaps=[],
                 updated=False
@@ -3986,7 +4251,7 @@ class SessionCoordinator(threading.Thread):
                 base_interval: BarIntervalData(
                     derived=False,
                     base=None,
-                    data=deque(),
+                    data=self._new_bar_container(derived=False),
                     quality=0.0,
                     gaps=[],
                     updated=False
@@ -3998,7 +4263,7 @@ class SessionCoordinator(threading.Thread):
                 bars[interval] = BarIntervalData(
                     derived=True,
                     base=base_interval,
-                    data=[],
+                    data=self._new_bar_container(derived=True),
                     quality=0.0,
                     gaps=[],
                     updated=False
@@ -4072,15 +4337,50 @@ class SessionCoordinator(threading.Thread):
             f"({trailing_days} trading days)"
         )
         
-        # Load bars for each symbol and interval
+        for interval in intervals:
+            self._load_historical_interval(
+                symbols, interval, trailing_days, start_date, end_date
+            )
+    
+    def _load_historical_interval(
+        self,
+        symbols: List[str],
+        interval: str,
+        trailing_days: int,
+        start_date: date,
+        end_date: date
+    ):
+        """Load one interval's trailing window, rolling carried windows forward.
+        
+        A symbol whose previous-session window still covers start_date keeps
+        its bars in memory: dates before start_date are evicted and only the
+        dates after the carried end_date are read from parquet. Other symbols
+        (first session, newly added, window gap) get a full batched read.
+        
+        Args:
+            symbols: Symbols to load
+            interval: Bar interval
+            trailing_days: Config trailing days (part of the window key)
+            start_date: First date of the window
+            end_date: Last date of the window
+        """
+        cold: List[str] = []
+        # First date to read -> [(symbol, carried window)]
+        warm: Dict[date, List[Tuple[str, HistoricalWindow]]] = defaultdict(list)
+        
         for symbol in symbols:
-            for interval in intervals:
-                bars = self._load_historical_bars(
-                    symbol,
-                    interval,
-                    start_date,
-                    end_date
-                )
+            window = self._historical_carry.pop((symbol.upper(), interval, trailing_days), None)
+            if window is not None and window.start_date <= start_date and window.end_date <= end_date:
+                read_from = max(window.end_date + timedelta(days=1), start_date)
+                warm[read_from].append((symbol, window))
+            else:
+                cold.append(symbol)
+        
+        # Cold symbols: batched read of the full window
+        if cold:
+            bars_by_symbol = self._load_historical_bars_multi(cold, interval, start_date, end_date)
+            for symbol in cold:
+                bars = bars_by_symbol.get(symbol.upper(), [])
                 
                 if not bars:
                     logger.warning(
@@ -4092,10 +4392,61 @@ class SessionCoordinator(threading.Thread):
                 for bar in bars:
                     self.session_data.append_bar(symbol, interval, bar)
                 
+                self._record_historical_window(symbol, interval, trailing_days, start_date, end_date)
+                
                 logger.info(
                     f"[SESSION_FLOW] PHASE_2.1: Stored {len(bars)} {interval} bars for {symbol} "
                     f"in historical storage ({start_date} to {end_date})"
                 )
+        
+        # Warm symbols: evict old dates, read only the new ones
+        for read_from, entries in warm.items():
+            if read_from <= end_date:
+                bars_by_symbol = self._load_historical_bars_multi(
+                    [symbol for symbol, _ in entries], interval, read_from, end_date
+                )
+            else:
+                bars_by_symbol = {}
+            
+            for symbol, window in entries:
+                evicted = window.data.evict_before(start_date)
+                new_bars = bars_by_symbol.get(symbol.upper(), [])
+                for bar in new_bars:
+                    window.data.data_by_date.setdefault(bar.timestamp.date(), []).append(bar)
+                
+                self.session_data.set_historical_interval_data(symbol, interval, window.data)
+                self._historical_windows[(symbol.upper(), interval, trailing_days)] = HistoricalWindow(
+                    start_date=start_date,
+                    end_date=end_date,
+                    data=window.data
+                )
+                
+                logger.info(
+                    f"[SESSION_FLOW] PHASE_2.1: Rolled {interval} window for {symbol} "
+                    f"to {start_date}..{end_date} (+{len(new_bars)} bars, -{evicted} dates)"
+                )
+    
+    def _record_historical_window(
+        self,
+        symbol: str,
+        interval: str,
+        trailing_days: int,
+        start_date: date,
+        end_date: date
+    ):
+        """Remember a freshly loaded window so the next session can roll it."""
+        symbol_data = self.session_data.get_symbol_data(symbol, internal=True)
+        if symbol_data is None:
+            return
+        interval_data = symbol_data.historical.bars.get(interval)
+        if interval_data is None:
+            interval_data = HistoricalBarIntervalData()
+            self.session_data.set_historical_interval_data(symbol, interval, interval_data)
+        self._historical_windows[(symbol.upper(), interval, trailing_days)] = HistoricalWindow(
+            start_date=start_date,
+            end_date=end_date,
+            data=interval_data
+        )
     
     def _resolve_symbols(self, apply_to) -> List[str]:
         """Resolve 'all' or specific symbol list.
@@ -4240,6 +4591,49 @@ class SessionCoordinator(threading.Thread):
             )
             return []
     
+    def _load_historical_bars_multi(
+        self,
+        symbols: List[str],
+        interval: str,
+        start_date: date,
+        end_date: date
+    ) -> Dict[str, List['BarData']]:
+        """Load historical bars for many symbols in one batched read.
+        
+        Args:
+            symbols: Stock symbols
+            interval: Bar interval (e.g., "1m", "1d")
+            start_date: Start date
+            end_date: End date
+            
+        Returns:
+            Dict of upper-case symbol -> BarData list (empty on error)
+        """
+        from datetime import datetime, time
+        from app.models.database import SessionLocal
+        
+        try:
+            with SessionLocal() as db_session:
+                bars_by_symbol = self._data_manager.get_bars_multi(
+                    session=db_session,
+                    symbols=symbols,
+                    start=datetime.combine(start_date, time(0, 0)),
+                    end=datetime.combine(end_date, time(23, 59, 59)),
+                    interval=interval
+                )
+        except Exception as e:
+            logger.error(
+                f"Error loading historical {interval} bars for {len(symbols)} symbols: {e}",
+                exc_info=True
+            )
+            return {}
+        
+        logger.info(
+            f"[SESSION_FLOW] PHASE_2.1: Loaded {sum(len(b) for b in bars_by_symbol.values())} "
+            f"{interval} bars for {len(symbols)} symbols ({start_date} to {end_date})"
+        )
+        return bars_by_symbol
+    
     # =========================================================================
     # Historical Indicator Calculation
     # =========================================================================
@@ -4406,8 +4800,9 @@ class SessionCoordinator(threading.Thread):
             f"(skip_early_close={skip_early_close})"
         )
         
-        # Collect field values from this symbol's 1d bars
-        field_values = []
+        if field not in ('open', 'high', 'low', 'close', 'volume'):
+            logger.warning(f"Unknown field: {field}")
+            return 0.0
         
         # Use internal=True since session not active yet (Phase 2)
         symbol_data = self.session_data.get_symbol_data(symbol, internal=True)
@@ -4439,37 +4834,25 @@ class SessionCoordinator(threading.Thread):
         dates_to_use = dates[-period_days:] if len(dates) > period_days else dates
         logger.debug(f"Using {len(dates_to_use)} dates for {period_days}-day period: {dates_to_use}")
         
-        for date in dates_to_use:
-            bars = historical_1d_data.data_by_date[date]
-            logger.debug(f"Processing {len(bars)} bars for date {date}")
-            for bar in bars:
-                # Extract field value
-                if field == 'volume':
-                    value = bar.volume
-                elif field == 'close':
-                    value = bar.close
-                elif field == 'open':
-                    value = bar.open
-                elif field == 'high':
-                    value = bar.high
-                elif field == 'low':
-                    value = bar.low
-                else:
-                    logger.warning(f"Unknown field: {field}")
-                    continue
-                
-                field_values.append(value)
+        # Per-day totals are cached on the (rolled) window, so only dates
+        # new since the previous session are aggregated
+        total = 0.0
+        count = 0
+        for day in dates_to_use:
+            day_total, day_count = historical_1d_data.field_total(day, field)
+            total += day_total
+            count += day_count
         
-        if not field_values:
+        if count == 0:
             logger.warning(f"No data to calculate {field} average for {symbol}")
             return 0.0
         
         # Calculate average
-        avg = sum(field_values) / len(field_values)
+        avg = total / count
         
         logger.info(
             f"✓ Calculated daily {field} average for {symbol}: {avg:.2f} "
-            f"(from {len(field_values)} values over {len(dates_to_use)} days, values={field_values})"
+            f"(from {count} values over {len(dates_to_use)} days)"
         )
         
         return avg
@@ -4661,6 +5044,9 @@ class SessionCoordinator(threading.Thread):
                     f"from {queue_key}, {len(queue)} remain"
                 )
         
+        if total_dropped > 0:
+            self._invalidate_queue_heap()
+        
         return total_dropped
     
     def get_queue_stats(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
@@ -4694,11 +5080,57 @@ class SessionCoordinator(threading.Thread):
         
         return stats
 
+    def _invalidate_queue_heap(self):
+        """Mark the queue-head heap stale (queues loaded, removed or trimmed).
+
+        The heap is rebuilt lazily on next use, so bulk queue changes cost a
+        single O(n) heapify instead of per-change bookkeeping.
+        """
+        self._queue_heap = None
+
+    def _rebuild_queue_heap(self) -> List[Tuple[datetime, Tuple[str, str]]]:
+        """Rebuild the min-heap of (head timestamp, queue_key) from the queues.
+
+        Invariant: exactly one entry per non-empty queue, keyed on the
+        timestamp of that queue's front bar.
+
+        Returns:
+            The rebuilt heap
+        """
+        heap = [
+            (bar_queue[0].timestamp, queue_key)
+            for queue_key, bar_queue in self._bar_queues.items()
+            if bar_queue
+        ]
+        heapq.heapify(heap)
+        self._queue_heap = heap
+        return heap
+
+    def _get_queue_heap(self) -> List[Tuple[datetime, Tuple[str, str]]]:
+        """Get the queue-head heap, rebuilding it if stale.
+
+        Returns:
+            Heap of (head timestamp, queue_key)
+        """
+        heap = self._queue_heap
+        if heap is None:
+            return self._rebuild_queue_heap()
+
+        if heap:
+            # Cheap consistency check on the top entry (tests and tools may
+            # replace _bar_queues directly)
+            head_timestamp, queue_key = heap[0]
+            bar_queue = self._bar_queues.get(queue_key)
+            if not bar_queue or bar_queue[0].timestamp != head_timestamp:
+                return self._rebuild_queue_heap()
+
+        return heap
+
     def _get_next_queue_timestamp(self) -> Optional[datetime]:
         """Get the next timestamp from queues.
 
-        Queries all queues and returns the earliest timestamp.
-        This determines when we advance time to next.
+        Returns the earliest head timestamp across all queues in O(1) by
+        peeking the queue-head heap. This determines when we advance time to next.
 
         Returns:
             Next timestamp or None if all queues empty
@@ -4707,37 +5139,33 @@ class SessionCoordinator(threading.Thread):
             logger.debug("[SESSION_FLOW] PHASE_5.2: No queues initialized")
             return None
 
-        # Find minimum timestamp across all queue fronts
-        min_timestamp = None
-        queue_count = 0
-        empty_count = 0
-
-        for queue_key, queue in self._bar_queues.items():
-            queue_count += 1
-            if queue:  # Queue not empty
-                bar = queue[0]  # Peek at front (don't pop yet)
-                if min_timestamp is None or bar.timestamp < min_timestamp:
-                    min_timestamp = bar.timestamp
-            else:
-                empty_count += 1
+        heap = self._get_queue_heap()
 
-        if min_timestamp:
+        if heap:
+            min_timestamp = heap[0][0]
             logger.debug(
                 f"[SESSION_FLOW] PHASE_5.2: Next timestamp: {min_timestamp.time()} "
-                f"({queue_count - empty_count}/{queue_count} queues active)"
-            )
-        else:
-            logger.debug(
-                f"[SESSION_FLOW] PHASE_5.2: All queues empty ({empty_count}/{queue_count})"
+                f"({len(heap)}/{len(self._bar_queues)} queues active)"
             )
+            return min_timestamp
 
-        return min_timestamp
+        logger.debug(
+            f"[SESSION_FLOW] PHASE_5.2: All queues empty "
+            f"({len(self._bar_queues)}/{len(self._bar_queues)})"
+        )
+        return None
 
     def _process_queue_data_at_timestamp(self, timestamp: datetime) -> int:
         """Process all queue data up to and including the given timestamp.
 
-        Consumes bars from queues with timestamp <= current time.
+        Consumes bars from queues with timestamp <= current time, in global
+        timestamp order across queues (ties broken by (symbol, interval)).
         This supports clock-driven mode where time advances by fixed intervals.
+        
+        Bars sharing a timestamp are handed to the data processor and quality
+        manager as one batch (see _dispatch_bar_batch), so thread
+        synchronization happens once per simulated timestamp rather than
+        once per symbol.
 
         Args:
             timestamp: Current time - process all bars up to this time
@@ -4753,130 +5181,149 @@ class SessionCoordinator(threading.Thread):
         # Track dropped bars (outside regular hours)
         bars_dropped = 0
         bars_dropped_by_symbol = {}
+        
+        # Fused pipeline: process each batch inline instead of notifying threads
+        fused = self._is_fused_pipeline()
+        
+        # Bars of the current timestamp: (symbol, interval, ts) for the
+        # processor, (symbol, base_interval, ts) for the quality manager
+        batch: List[Tuple[str, str, datetime]] = []
+        quality_batch: List[Tuple[str, str, datetime]] = []
 
-        # Process all queues that have data at or before this timestamp
-        for queue_key, queue in self._bar_queues.items():
-            symbol, interval = queue_key
+        # Pop bars in global timestamp order (k-way merge over queue heads).
+        # Only queues whose head is due are touched: O(log n) per bar.
+        heap = self._get_queue_heap()
+        while heap and heap[0][0] <= timestamp:
+            head_timestamp, queue_key = heapq.heappop(heap)
+            bar_queue = self._bar_queues.get(queue_key)
+            if not bar_queue or bar_queue[0].timestamp != head_timestamp:
+                # Queue changed outside the coordinator - resync heap
+                heap = self._rebuild_queue_heap()
+                continue
 
-            # Consume all bars with timestamp <= current time
-            # (Clock-driven: process multiple bars if time advanced past them)
-            while queue and queue[0].timestamp <= timestamp:
-                bar = queue.popleft()
-                
-                # ========== Per-Symbol Lag Detection ==========
-                # Only check lag in clock-driven and live modes
-                # In data-driven mode, we block anyway so lag is irrelevant
-                if self._should_check_lag():
-                    # Check lag BEFORE incrementing (so new symbols check immediately on first bar)
-                    if self._symbol_check_counters[symbol] % self._catchup_check_interval == 0:
-                        current_time = self._time_manager.get_current_time()
-                        lag_seconds = (current_time - bar.timestamp).total_seconds()
-                        
-                        if lag_seconds > self._catchup_threshold:
-                            if self.session_data._session_active:
-                                logger.info(
-                                    f"[STREAMING] Lag detected for {symbol} "
-                                    f"({lag_seconds:.1f}s > {self._catchup_threshold}s) "
-                                    f"- deactivating session"
-                                )
-                                self.session_data.deactivate_session()
-                        else:
-                            if not self.session_data._session_active:
-                                logger.info(
-                                    f"[STREAMING] Caught up on {symbol} "
-                                    f"({lag_seconds:.1f}s ≤ {self._catchup_threshold}s) "
-                                    f"- reactivating session"
-                                )
-                                self.session_data.activate_session()
-                
-                # Increment counter for this symbol AFTER check
-                self._symbol_check_counters[symbol] += 1
-                # ===============================================
-                
-                # DEBUG: Log each bar being processed from queue
-                logger.debug(
-                    f"[QUEUE_POP] {symbol} {interval}: Processing bar at {bar.timestamp} "
-                    f"(queue remaining: {len(queue)})"
-                )
+            symbol, interval = queue_key
+            bar = bar_queue.popleft()
+            if bar_queue:
+                heapq.heappush(heap, (bar_queue[0].timestamp, queue_key))
+            
+            # Next timestamp reached: dispatch the previous one's batch first
+            if batch and batch[-1][2] != bar.timestamp:
+                self._dispatch_bar_batch(batch, quality_batch, fused)
+                batch, quality_batch = [], []
+            
+            # ========== Per-Symbol Lag Detection ==========
+            # Only check lag in clock-driven and live modes
+            # In data-driven mode, we block anyway so lag is irrelevant
+            if self._should_check_lag():
+                # Check lag BEFORE incrementing (so new symbols check immediately on first bar)
+                if self._symbol_check_counters[symbol] % self._catchup_check_interval == 0:
+                    current_time = self._time_manager.get_current_time()
+                    lag_seconds = (current_time - bar.timestamp).total_seconds()
+                    
+                    if lag_seconds > self._catchup_threshold:
+                        if self.session_data._session_active:
+                            logger.info(
+                                f"[STREAMING] Lag detected for {symbol} "
+                                f"({lag_seconds:.1f}s > {self._catchup_threshold}s) "
+                                f"- deactivating session"
+                            )
+                            self.session_data.deactivate_session()
+                    else:
+                        if not self.session_data._session_active:
+                            logger.info(
+                                f"[STREAMING] Caught up on {symbol} "
+                                f"({lag_seconds:.1f}s ≤ {self._catchup_threshold}s) "
+                                f"- reactivating session"
+                            )
+                            self.session_data.activate_session()
+            
+            # Increment counter for this symbol AFTER check
+            self._symbol_check_counters[symbol] += 1
+            # ===============================================
+            
+            # DEBUG: Log each bar being processed from queue
+            logger.debug(
+                f"[QUEUE_POP] {symbol} {interval}: Processing bar at {bar.timestamp} "
+                f"(queue remaining: {len(bar_queue)})"
+            )
 
-                # Filter: Drop bars outside regular trading hours
-                if hasattr(self, '_market_open') and hasattr(self, '_market_close'):
-                    bar_time = bar.timestamp
-                    if bar_time < self._market_open or bar_time > self._market_close:
-                        # Bar is outside regular trading hours - DROP IT
-                        logger.debug(
-                            f"[SESSION_FLOW] PHASE_5.3: Dropping {symbol} {interval} bar at {bar_time.time()} "
-                            f"(outside {self._market_open.time()}-{self._market_close.time()})"
-                        )
-                        if symbol not in bars_dropped_by_symbol:
-                            bars_dropped_by_symbol[symbol] = 0
-                        bars_dropped_by_symbol[symbol] += 1
-                        bars_dropped += 1
-                        continue  # Skip this bar, don't add to session_data
+            # Filter: Drop bars outside regular trading hours
+            if hasattr(self, '_market_open') and hasattr(self, '_market_close'):
+                bar_time = bar.timestamp
+                if bar_time < self._market_open or bar_time > self._market_close:
+                    # Bar is outside regular trading hours - DROP IT
+                    logger.debug(
+                        f"[SESSION_FLOW] PHASE_5.3: Dropping {symbol} {interval} bar at {bar_time.time()} "
+                        f"(outside {self._market_open.time()}-{self._market_close.time()})"
+                    )
+                    if symbol not in bars_dropped_by_symbol:
+                        bars_dropped_by_symbol[symbol] = 0
+                    bars_dropped_by_symbol[symbol] += 1
+                    bars_dropped += 1
+                    continue  # Skip this bar, don't add to session_data
 
-                # Get or register symbol data
-                symbol_data = self.session_data.get_symbol_data(symbol)
-                if symbol_data is None:
-                    symbol_data = self.session_data.register_symbol(symbol)
+            # Get or register symbol data
+            symbol_data = self.session_data.get_symbol_data(symbol)
+            if symbol_data is None:
+                symbol_data = self.session_data.register_symbol(symbol)
 
-                # Add to current session bars (not historical)
-                # Get base interval data
-                base_interval = symbol_data.base_interval
-                if base_interval not in symbol_data.bars:
-                    from app.managers.data_manager.session_data import BarIntervalData
-                    symbol_data.bars[base_interval] = BarIntervalData(
-                        derived=False,
-                        base=None,
-                        data=deque()
-                    )
-                
-                base_bars = symbol_data.bars[base_interval].data
-                bars_before = len(base_bars)
-                
-                # DEBUG: Log ALL bars being added (not just first 5)
-                logger.debug(
-                    f"[BAR_ADD] {symbol} bar at {bar.timestamp.time()} | "
-                    f"Before: {bars_before} | Will be #{bars_before + 1}"
+            # Add to current session bars (not historical)
+            # Get base interval data
+            base_interval = symbol_data.base_interval
+            if base_interval not in symbol_data.bars:
+                from app.managers.data_manager.session_data import BarIntervalData
+                symbol_data.bars[base_interval] = BarIntervalData(
+                    derived=False,
+                    base=None,
+                    data=self._new_bar_container(derived=False)
+                )
+            
+            base_bars = symbol_data.bars[base_interval].data
+            bars_before = len(base_bars)
+            
+            # DEBUG: Log ALL bars being added (not just first 5)
+            logger.debug(
+                f"[BAR_ADD] {symbol} bar at {bar.timestamp.time()} | "
+                f"Before: {bars_before} | Will be #{bars_before + 1}"
+            )
+            
+            base_bars.append(bar)
+            symbol_data.update_from_bar(bar)
+            
+            # Verify count after adding
+            bars_after = len(base_bars)
+            if bars_after != bars_before + 1:
+                logger.error(
+                    f"[BAR_ADD] Count mismatch! Before: {bars_before}, "
+                    f"After: {bars_after}, Expected: {bars_after + 1}"
                 )
-                
-                base_bars.append(bar)
-                symbol_data.update_from_bar(bar)
-                
-                # Verify count after adding
-                bars_after = len(base_bars)
-                if bars_after != bars_before + 1:
-                    logger.error(
-                        f"[BAR_ADD] Count mismatch! Before: {bars_before}, "
-                        f"After: {bars_after}, Expected: {bars_after + 1}"
-                    )
 
-                # Phase 6b: Update indicators for this base interval
-                if hasattr(self, 'indicator_manager') and self.indicator_manager:
-                    # Convert deque to list for indicator calculation
-                    bars_list = list(base_bars)
-                    self.indicator_manager.update_indicators(
-                        symbol=symbol,
-                        interval=base_interval,
-                        bars=bars_list
-                    )
+            # Phase 6b: Update indicators for this base interval (batched
+            # mode: DataProcessor updates all symbols of the timestamp together)
+            if hasattr(self, 'indicator_manager') and self.indicator_manager \
+                    and not self.indicator_manager.batched:
+                # Pass the live deque; only batch indicators copy it
+                self.indicator_manager.update_indicators(
+                    symbol=symbol,
+                    interval=base_interval,
+                    bars=base_bars
+                )
 
-                # Track for logging
-                if symbol not in bars_by_symbol:
-                    bars_by_symbol[symbol] = 0
-                bars_by_symbol[symbol] += 1
+            # Track for logging
+            if symbol not in bars_by_symbol:
+                bars_by_symbol[symbol] = 0
+            bars_by_symbol[symbol] += 1
 
-                bars_processed += 1
+            bars_processed += 1
 
-                # Notify data processor for derived bar computation
-                if hasattr(self, 'data_processor') and self.data_processor:
-                    self.data_processor.notify_data_available(symbol, interval, bar.timestamp)
-                
-                # Notify quality manager for quality calculation
-                if hasattr(self, 'quality_manager') and self.quality_manager:
-                    # Notify with symbol's BASE interval, not queue interval
-                    # (queues might have mixed intervals, but quality tracks base interval)
-                    base_interval = symbol_data.base_interval
-                    self.quality_manager.notify_data_available(symbol, base_interval, bar.timestamp)
+            # Batch notifications for data processor (derived bars) and
+            # quality manager. Quality uses the symbol's BASE interval, not
+            # the queue interval (queues might have mixed intervals)
+            batch.append((symbol, interval, bar.timestamp))
+            quality_batch.append((symbol, symbol_data.base_interval, bar.timestamp))
+        
+        if batch:
+            self._dispatch_bar_batch(batch, quality_batch, fused)
 
         # Log summary
         if bars_processed > 0:
@@ -4893,6 +5340,47 @@ class SessionCoordinator(threading.Thread):
 
         return bars_processed
 
+    def _dispatch_bar_batch(
+        self,
+        batch: List[Tuple[str, str, datetime]],
+        quality_batch: List[Tuple[str, str, datetime]],
+        fused: bool
+    ):
+        """Hand one timestamp's bars to the data processor and quality manager.
+        
+        Args:
+            batch: (symbol, interval, timestamp) per bar, for the data processor
+            quality_batch: (symbol, base_interval, timestamp) per bar
+            fused: Process the batch inline instead of notifying the processor
+        """
+        # Notify data processor for derived bar computation
+        if hasattr(self, 'data_processor') and self.data_processor:
+            if fused:
+                self.data_processor.process_batch_inline(batch)
+            else:
+                self.data_processor.notify_batch_available(batch)
+        
+        # Notify quality manager for quality calculation
+        if hasattr(self, 'quality_manager') and self.quality_manager:
+            self.quality_manager.notify_batch_available(quality_batch)
+    
+    def _is_fused_pipeline(self) -> bool:
+        """Determine if the fused (single-threaded) backtest pipeline is on.
+        
+        Fused mode runs DataProcessor, AnalysisEngine and strategies inline
+        on the coordinator thread for every bar. Only applies to data-driven
+        backtests (speed = 0), where the threads would block on each other
+        anyway.
+        
+        Returns:
+            True if bars should be processed inline, False otherwise
+        """
+        if self.mode != "backtest":
+            return False
+        
+        config = self.session_config.backtest_config
+        return bool(config and config.fused and config.speed_multiplier == 0)
+    
     def _should_check_lag(self) -> bool:
         """Determine if lag detection should run based on mode.
         
@@ -83,7 +83,8 @@ class GapScannerComplete(BaseScanner):
                     "period": 20,
                     "interval": "1d",
                     "type": "trend",
-                    "params": {}
+                    "params": {},
+                    "evaluation": "lazy"  # Only computed when scan() reads it
                 }
             )
             # The above call AUTOMATICALLY (via requirement_analyzer):
@@ -214,9 +214,9 @@ class TestSessionDataLock:
         
         # Verify lock exists
         assert hasattr(session_data, '_lock')
-        # SessionData uses RLock (reentrant lock), not simple Lock
-        from threading import RLock
-        assert isinstance(session_data._lock, type(RLock()))
+        # Registry lock is reentrant (register_symbol_data nests it)
+        from app.managers.data_manager.symbol_locks import ContentionLock
+        assert isinstance(session_data._lock, ContentionLock)
         
         # Test lock works
         with session_data._lock:
@@ -0,0 +1,205 @@
+"""Tests for cross-symbol batched indicator evaluation (CrossSymbolGraph).
+
+Indicators stepped for many symbols at once must match the batch
+calculator bar by bar for every symbol, including symbols that catch up
+several bars or whose series was rewritten.
+"""
+from collections import deque
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from app.indicators import (
+    IndicatorManager,
+    calculate_indicator,
+)
+from app.indicators.batched import (
+    BatchedIndicator,
+    CrossSymbolGraph,
+    create_batched_indicator,
+    supports_batching,
+)
+from app.managers.data_manager.session_data import SessionData, SymbolSessionData, BarIntervalData
+from app.monitoring.performance_metrics import PerformanceMetrics
+from app.threads.data_processor import DataProcessor
+
+from tests.test_indicator_streaming import (
+    STREAMING_CONFIGS,
+    assert_same_value,
+    create_random_bars,
+    make_config,
+)
+
+
+BATCHED_CONFIGS = [config for config in STREAMING_CONFIGS if supports_batching(config[0])]
+SYMBOLS = [f"SYM{i}" for i in range(4)]
+
+
+def assert_matches_batch(result, bars, spec):
+    expected = calculate_indicator(bars, make_config(*spec), "TEST")
+    assert result.valid == expected.valid, spec
+    assert result.timestamp == expected.timestamp
+    assert_same_value(result.value, expected.value)
+
+
+def test_batched_matches_batch_per_symbol():
+    """Every symbol's values equal batch at every bar, lagging symbol included."""
+    series = {symbol: create_random_bars(120, seed=i) for i, symbol in enumerate(SYMBOLS)}
+    graph = CrossSymbolGraph("1m")
+    streams = [
+        (symbol, spec, create_batched_indicator(make_config(*spec), graph, symbol))
+        for symbol in SYMBOLS for spec in BATCHED_CONFIGS
+    ]
+    assert all(stream is not None for _, _, stream in streams)
+
+    for n in range(1, 121):
+        # SYM3 only receives its bars every third timestamp (catch-up)
+        step = {symbol: bars[:n] for symbol, bars in series.items() if symbol != "SYM3" or n % 3 == 0}
+        assert sorted(graph.step(step)) == sorted(step)
+        for symbol, spec, stream in streams:
+            if symbol in step:
+                assert_matches_batch(graph.result(stream.signature, symbol), step[symbol], spec)
+
+
+def test_rewritten_series_replays_one_symbol():
+    bars = create_random_bars(60)
+    other = create_random_bars(60, seed=3)
+    graph = CrossSymbolGraph("1m")
+    rsi = create_batched_indicator(make_config("rsi", 14, {}), graph, "A")
+    create_batched_indicator(make_config("rsi", 14, {}), graph, "B")
+
+    graph.step({"A": bars[:30] + bars[31:], "B": other})
+    graph.step({"A": bars, "B": other})  # Gap filler inserted bar 30
+
+    assert_matches_batch(rsi.sync(bars), bars, ("rsi", 14, {}))
+    assert graph.bar_count("B") == len(other)
+
+
+def test_evaluate_vectorizes_over_slots():
+    series = {symbol: create_random_bars(50, seed=i) for i, symbol in enumerate(SYMBOLS)}
+    graph = CrossSymbolGraph("1m")
+    streams = {symbol: create_batched_indicator(make_config("bbands", 20, {}), graph, symbol) for symbol in SYMBOLS}
+    graph.step(series)
+
+    slots = np.array([streams[symbol].slot for symbol in SYMBOLS])
+    values, valid = graph.evaluate(streams["SYM0"].signature, slots)
+
+    assert all(valid)
+    for symbol, value in zip(SYMBOLS, values):
+        assert_same_value(value, calculate_indicator(series[symbol], make_config("bbands", 20, {}), "TEST").value)
+
+
+def test_released_slot_is_reused():
+    graph = CrossSymbolGraph("1m")
+    create_batched_indicator(make_config("sma", 5, {}), graph, "A")
+    slot = graph.slot("A")
+    graph.step({"A": create_random_bars(10)})
+
+    graph.release("A")
+    sma = create_batched_indicator(make_config("sma", 5, {}), graph, "B")
+
+    assert sma.slot == slot
+    assert sma.bar_count == 0
+    assert graph.symbols == ["B"]
+
+
+def test_unsupported_configs_return_none():
+    graph = CrossSymbolGraph("1m")
+    assert create_batched_indicator(make_config("high_low", 20, {}), graph, "A") is None
+    assert create_batched_indicator(make_config("sma", 0, {}), graph, "A") is None
+    assert graph.node_count == 0
+
+
+class TestManagerBatched:
+    """IndicatorManager batched mode."""
+
+    @pytest.fixture
+    def manager(self):
+        session_data = SessionData()
+        for symbol in SYMBOLS:
+            session_data.register_symbol_data(SymbolSessionData(symbol=symbol, base_interval="1m"))
+        return IndicatorManager(session_data, batched=True), session_data
+
+    def test_update_batch_matches_batch(self, manager):
+        manager, session_data = manager
+        specs = [("sma", 20, {}), ("macd", 0, {}), ("high_low", 20, {})]
+        for symbol in SYMBOLS:
+            manager.register_symbol_indicators(symbol, [make_config(*spec) for spec in specs])
+
+        indicators = {symbol: session_data.get_symbol_data(symbol, internal=True).indicators for symbol in SYMBOLS}
+        assert isinstance(indicators["SYM0"]["sma_20_1m"].stream, BatchedIndicator)
+        assert indicators["SYM0"]["high_low_20_1m"].stream is None
+
+        series = {symbol: create_random_bars(80, seed=i) for i, symbol in enumerate(SYMBOLS)}
+        live = {symbol: deque() for symbol in SYMBOLS}
+        for i in range(80):
+            for symbol in SYMBOLS:
+                live[symbol].append(series[symbol][i])
+            manager.update_indicators_batch("1m", live)
+
+        for symbol in SYMBOLS:
+            for spec in specs:
+                stored = indicators[symbol][make_config(*spec).make_key()]
+                expected = calculate_indicator(series[symbol], make_config(*spec), "TEST")
+                assert stored.valid == expected.valid
+                assert stored.last_updated == expected.timestamp
+                assert_same_value(stored.current_value, expected.value)
+
+    def test_warmup_uses_history_without_stepping(self, manager):
+        manager, session_data = manager
+        history = create_random_bars(60)
+        manager.register_symbol_indicators("SYM0", [make_config("ema", 12, {})], historical_bars={"1m": history})
+
+        ema = session_data.get_symbol_data("SYM0", internal=True).indicators["ema_12_1m"]
+        assert ema.current_value == pytest.approx(calculate_indicator(history, make_config("ema", 12, {}), "TEST").value)
+        assert ema.stream.bar_count == 0  # Session bars are folded in from the start
+
+    def test_remove_symbol_releases_slot(self, manager):
+        manager, session_data = manager
+        manager.register_symbol_indicators("SYM0", [make_config("sma", 20, {})])
+        manager.remove_symbol("SYM0")
+        assert manager._batched_graphs["1m"].symbols == []
+
+
+def test_data_processor_batched_matches_per_symbol():
+    """DataProcessor batched pass stores the same values as per-symbol updates."""
+    specs = [("rsi", 14, {}), ("bbands", 20, {}), ("donchian", 5, {}), ("high_low", 20, {})]
+
+    def run(batched):
+        session_data = SessionData()
+        for symbol in SYMBOLS:
+            symbol_data = SymbolSessionData(symbol=symbol, base_interval="1m")
+            symbol_data.bars["1m"] = BarIntervalData(derived=False, base=None, data=deque())
+            symbol_data.bars["5m"] = BarIntervalData(derived=True, base="1m", data=[])
+            session_data.register_symbol_data(symbol_data)
+
+        manager = IndicatorManager(session_data, batched=batched)
+        for symbol in SYMBOLS:
+            configs = [make_config(*spec) for spec in specs] + [make_config("donchian", 5, {})]
+            configs[-1].interval = "5m"
+            manager.register_symbol_indicators(symbol, configs)
+
+        system_manager = MagicMock()
+        system_manager.mode.value = "backtest"
+        processor = DataProcessor(session_data, system_manager, PerformanceMetrics(), indicator_manager=manager)
+        processor.set_coordinator_subscription(MagicMock())
+        series = {symbol: create_random_bars(90, seed=i) for i, symbol in enumerate(SYMBOLS)}
+        for i in range(90):
+            for symbol in SYMBOLS:
+                session_data.get_symbol_data(symbol, internal=True).bars["1m"].data.append(series[symbol][i])
+            processor._process_batch([(symbol, "1m", series[symbol][i].timestamp) for symbol in SYMBOLS])
+
+        return {
+            (symbol, key): (ind.valid, ind.last_updated, ind.current_value)
+            for symbol in SYMBOLS
+            for key, ind in session_data.get_symbol_data(symbol, internal=True).indicators.items()
+        }
+
+    expected = run(batched=False)
+    assert any(valid for valid, _, _ in expected.values())
+    actual = run(batched=True)
+    assert actual.keys() == expected.keys()
+    for key, (valid, timestamp, value) in expected.items():
+        assert actual[key][:2] == (valid, timestamp), key
+        assert_same_value(actual[key][2], value)
@@ -0,0 +1,124 @@
+"""Tests for shared primitive series (PrimitiveGraph).
+
+Graph-backed indicators sharing one graph must each match the batch
+calculator bar by bar, while every shared primitive is updated once per bar.
+"""
+from collections import deque
+from unittest.mock import patch
+
+from app.indicators import (
+    IndicatorManager,
+    PrimitiveGraph,
+    StreamingIndicator,
+    calculate_indicator,
+    create_graph_indicator,
+)
+from app.indicators.graph import EMANode, supports_graph
+from app.managers.data_manager.session_data import SessionData, SymbolSessionData
+
+from tests.test_indicator_streaming import (
+    STREAMING_CONFIGS,
+    assert_same_value,
+    create_random_bars,
+    make_config,
+)
+
+
+GRAPH_CONFIGS = [config for config in STREAMING_CONFIGS if supports_graph(config[0])]
+
+
+def test_shared_graph_matches_batch():
+    """All graph-backed indicators on one graph equal batch at every bar."""
+    bars = create_random_bars()
+    graph = PrimitiveGraph("1m")
+    indicators = [
+        (spec, create_graph_indicator(make_config(*spec), graph)) for spec in GRAPH_CONFIGS
+    ]
+    assert all(indicator is not None for _, indicator in indicators)
+
+    for n in range(1, len(bars) + 1):
+        for spec, indicator in indicators:
+            streamed = indicator.sync(bars[:n])
+            batch = calculate_indicator(bars[:n], make_config(*spec), "TEST")
+
+            assert streamed.valid == batch.valid, f"{spec[0]} bar {n}"
+            assert streamed.timestamp == batch.timestamp
+            assert_same_value(streamed.value, batch.value)
+
+
+def test_primitives_shared_and_updated_once_per_bar():
+    bars = create_random_bars(60)
+    graph = PrimitiveGraph("1m")
+    indicators = [
+        create_graph_indicator(make_config("ema", 12, {}), graph),
+        create_graph_indicator(make_config("ema", 26, {}), graph),
+        create_graph_indicator(make_config("macd", 0, {}), graph),
+    ]
+    # close, EMA(12), EMA(26), lagged EMA(26), MACD line, signal EMA
+    assert graph.node_count == 6
+
+    with patch.object(EMANode, "update", autospec=True, side_effect=EMANode.update) as update:
+        for n in range(1, len(bars) + 1):
+            for indicator in indicators:
+                indicator.sync(bars[:n])
+
+    assert update.call_count == 3 * len(bars)
+    assert graph.bar_count == len(bars)
+
+
+def test_late_indicator_replays_history():
+    """A node added after bars were folded in is brought up to date."""
+    bars = create_random_bars(80)
+    graph = PrimitiveGraph("1m")
+    create_graph_indicator(make_config("sma", 10, {}), graph).sync(bars[:50])
+
+    late = create_graph_indicator(make_config("bbands", 20, {}), graph)
+    result = late.sync(bars)
+
+    assert_same_value(result.value, calculate_indicator(bars, make_config("bbands", 20, {}), "TEST").value)
+    assert graph.bar_count == len(bars)
+
+
+def test_unsupported_configs_return_none():
+    graph = PrimitiveGraph("1m")
+    assert create_graph_indicator(make_config("high_low", 20, {}), graph) is None
+    assert create_graph_indicator(make_config("sma", 0, {}), graph) is None
+    assert create_graph_indicator(make_config("macd", 0, {"fast": 30, "slow": 10}), graph) is None
+    assert graph.node_count == 0
+
+
+def test_manager_shares_graph_per_interval():
+    session_data = SessionData()
+    session_data.register_symbol_data(SymbolSessionData(symbol="TEST", base_interval="1m"))
+    manager = IndicatorManager(session_data)
+    configs = [
+        make_config("ema", 12, {}, incremental=True),
+        make_config("macd", 0, {}, incremental=True),
+        make_config("keltner", 20, {"atr_period": 10}, incremental=True),
+        make_config("high_low", 20, {}, incremental=True),
+        make_config("sma", 20, {}),
+    ]
+    daily = make_config("atr", 14, {}, incremental=True)
+    daily.interval = "1d"
+    manager.register_symbol_indicators("TEST", configs + [daily])
+
+    indicators = session_data.get_symbol_data("TEST", internal=True).indicators
+    graph = indicators["ema_12_1m"].stream.graph
+    assert indicators["macd_1m"].stream.graph is graph
+    assert indicators["keltner_20_1m"].stream.graph is graph
+    assert indicators["atr_14_1d"].stream.graph is not graph
+    assert isinstance(indicators["high_low_20_1m"].stream, StreamingIndicator)
+    assert indicators["sma_20_1m"].stream is None
+
+    bars = create_random_bars(100)
+    series = deque()
+    for bar in bars:
+        series.append(bar)
+        manager.update_indicators("TEST", "1m", series)
+
+    for config in configs:
+        expected = calculate_indicator(bars, make_config(config.name, config.period, config.params), "TEST")
+        stored = indicators[config.make_key()]
+        assert stored.valid == expected.valid, config.make_key()
+        assert_same_value(stored.current_value, expected.value)
+    assert graph.bar_count == len(bars)
@@ -0,0 +1,167 @@
+"""Tests for bounded indicator value history (IndicatorHistory).
+
+Indicators configured with a history capacity keep their last N values,
+readable through get_indicator_history and exported as deltas by to_json.
+"""
+from collections import deque
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.indicators import (
+    IndicatorHistory,
+    IndicatorManager,
+    calculate_indicator,
+    get_indicator_history,
+)
+from app.managers.data_manager.session_data import SessionData, SymbolSessionData
+from app.models.indicator_config import SessionIndicatorConfig
+
+from tests.test_indicator_streaming import create_random_bars, make_config
+
+
+START = datetime(2025, 1, 2, 9, 30)
+
+
+def minutes(n):
+    return [START + timedelta(minutes=i) for i in range(n)]
+
+
+def history_config(name, period, params, capacity):
+    config = make_config(name, period, params)
+    config.history = capacity
+    return config
+
+
+def test_ring_buffer_keeps_newest_in_order():
+    history = IndicatorHistory(5)
+    for i, timestamp in enumerate(minutes(8)):
+        history.record(timestamp, None if i < 2 else float(i))
+
+    timestamps, values = history.last(3)
+    assert list(timestamps) == minutes(8)[5:]
+    assert values.tolist() == [5.0, 6.0, 7.0]
+
+    timestamps, values = history.last(10)
+    assert len(history) == 5 and len(values) == 5
+    assert list(timestamps) == minutes(8)[3:]
+
+
+def test_same_timestamp_replaces_newest():
+    history = IndicatorHistory(4)
+    stamps = minutes(2)
+    history.record(stamps[0], 1.0)
+    history.record(stamps[1], 2.0)
+    history.record(stamps[1], 2.5)
+
+    assert len(history) == 2
+    assert history.last(2)[1].tolist() == [1.0, 2.5]
+    assert history.changed_since(2) == 1
+
+
+def test_invalid_values_are_nan():
+    history = IndicatorHistory(3)
+    history.record(START, None)
+    history.record(None, 1.0)  # Nothing to attach the value to
+
+    assert len(history) == 1
+    assert np.isnan(history.last(1)[1][0])
+    assert history.to_list() == [[START.isoformat(), None]]
+
+
+def test_multi_value_fields():
+    history = IndicatorHistory(4)
+    stamps = minutes(3)
+    history.record(stamps[0], None)  # Warmup: fields not known yet
+    history.record(stamps[1], {"upper": 11.0, "middle": 10.0, "lower": 9.0})
+    history.record(stamps[2], {"upper": 12.0, "middle": 10.5, "lower": 9.0})
+
+    assert history.fields == ("upper", "middle", "lower")
+    assert history.last(2, field="upper")[1].tolist() == [11.0, 12.0]
+    assert history.last(3)[1].shape == (3, 3)
+    assert history.to_list(1) == [[stamps[2].isoformat(), {"upper": 12.0, "middle": 10.5, "lower": 9.0}]]
+    with pytest.raises(ValueError):
+        history.last(1, field="width")
+
+
+def test_last_until_skips_newer_entries():
+    history = IndicatorHistory(10)
+    stamps = minutes(6)
+    for i, timestamp in enumerate(stamps):
+        history.record(timestamp, float(i))
+
+    timestamps, values = history.last(2, until=stamps[3])
+    assert list(timestamps) == stamps[2:4]
+    assert values.tolist() == [2.0, 3.0]
+
+
+def test_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        IndicatorHistory(0)
+    with pytest.raises(ValueError):
+        SessionIndicatorConfig(name="rsi", period=14, interval="1m", type="momentum", history=-1).validate()
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_manager_records_every_update(batched):
+    session_data = SessionData()
+    session_data.register_symbol_data(SymbolSessionData(symbol="TEST", base_interval="1m"))
+    manager = IndicatorManager(session_data, batched=batched)
+    manager.register_symbol_indicators("TEST", [
+        history_config("rsi", 14, {}, 20),
+        history_config("bbands", 20, {}, 20),
+        make_config("sma", 20, {}),
+    ])
+
+    bars = create_random_bars(60)
+    series = deque()
+    for bar in bars:
+        series.append(bar)
+        if batched:
+            manager.update_indicators_batch("1m", {"TEST": series})
+        else:
+            manager.update_indicators("TEST", "1m", series)
+
+    timestamps, values = get_indicator_history(session_data, "TEST", "rsi_14_1m", 20)
+    assert list(timestamps) == [bar.timestamp for bar in bars[-20:]]
+    for n, value in zip(range(41, 61), values):
+        assert value == pytest.approx(calculate_indicator(bars[:n], make_config("rsi", 14, {}), "TEST").value)
+
+    _, upper = get_indicator_history(session_data, "TEST", "bbands_20_1m", 5, field="upper")
+    expected = [calculate_indicator(bars[:n], make_config("bbands", 20, {}), "TEST").value["upper"] for n in range(56, 61)]
+    assert upper.tolist() == pytest.approx(expected)
+
+    assert get_indicator_history(session_data, "TEST", "sma_20_1m", 5) is None
+    assert get_indicator_history(session_data, "TEST", "ema_9_1m", 5) is None
+
+
+def test_to_json_exports_history_delta():
+    session_data = SessionData()
+    session_data.register_symbol_data(SymbolSessionData(symbol="TEST", base_interval="1m"))
+    manager = IndicatorManager(session_data)
+    manager.register_symbol_indicators("TEST", [history_config("sma", 5, {}, 10)])
+    symbol_data = session_data.get_symbol_data("TEST", internal=True)
+
+    bars = create_random_bars(15)
+    series = deque()
+
+    def advance(count):
+        for _ in range(count):
+            series.append(bars[len(series)])
+            manager.update_indicators("TEST", "1m", series)
+
+    advance(12)
+    first = symbol_data.to_json(complete=False)["indicators"]["sma_5_1m"]
+    assert len(first["historical_values"]) == 10  # Everything kept
+    assert first["historical_values_count"] == 10
+
+    advance(3)
+    delta = symbol_data.to_json(complete=False)["indicators"]["sma_5_1m"]
+    assert [row[0] for row in delta["historical_values"]] == [bar.timestamp.isoformat() for bar in bars[12:]]
+    assert delta["historical_values"][-1][1] == pytest.approx(
+        calculate_indicator(bars, make_config("sma", 5, {}), "TEST").value
+    )
+
+    assert symbol_data.to_json(complete=False)["indicators"]["sma_5_1m"]["historical_values"] == []
+    assert len(symbol_data.to_json(complete=True)["indicators"]["sma_5_1m"]["historical_values"]) == 10
@@ -0,0 +1,166 @@
+"""Tests for lazy (on-read) indicator evaluation.
+
+Lazy indicators only note new bars; reading them folds every pending bar
+in at once and must give the same values as eager evaluation.
+"""
+from collections import deque
+from unittest.mock import patch
+
+import pytest
+
+from app.indicators import (
+    IndicatorConfig,
+    IndicatorManager,
+    IndicatorType,
+    StreamingIndicator,
+    calculate_indicator,
+    get_indicator,
+    get_indicator_value,
+)
+from app.indicators.manager import refresh_indicator
+from app.managers.data_manager.session_data import SessionData, SymbolSessionData
+from app.managers.data_manager.session_snapshot import SymbolSnapshot
+from app.models.indicator_config import HistoricalIndicatorConfig, SessionIndicatorConfig
+
+from tests.test_indicator_streaming import assert_same_value, create_random_bars, make_config
+
+
+LAZY_SPECS = [("ema", 12, {}), ("bbands", 20, {}), ("obv", 0, {}), ("vwap", 0, {})]
+
+
+def lazy_config(name, period, params):
+    config = make_config(name, period, params)
+    config.evaluation = "lazy"
+    return config
+
+
+@pytest.fixture
+def session():
+    session_data = SessionData()
+    session_data.register_symbol_data(SymbolSessionData(symbol="TEST", base_interval="1m"))
+    return session_data
+
+
+def feed(manager, bars, series=None, batched=False):
+    series = deque() if series is None else series
+    for bar in bars:
+        series.append(bar)
+        if batched:
+            manager.update_indicators_batch("1m", {"TEST": series})
+        else:
+            manager.update_indicators("TEST", "1m", series)
+    return series
+
+
+def assert_matches_batch(indicator, bars, spec):
+    expected = calculate_indicator(bars, make_config(*spec), "TEST")
+    assert indicator.valid == expected.valid, spec
+    assert indicator.last_updated == expected.timestamp
+    assert_same_value(indicator.current_value, expected.value)
+
+
+def test_lazy_indicators_not_calculated_until_read(session):
+    manager = IndicatorManager(session)
+    manager.register_symbol_indicators("TEST", [lazy_config(*spec) for spec in LAZY_SPECS])
+    bars = create_random_bars(80)
+
+    with patch.object(StreamingIndicator, "_update", autospec=True) as update:
+        feed(manager, bars)
+    assert update.call_count == 0
+
+    indicators = session.get_symbol_data("TEST", internal=True).indicators
+    assert indicators["ema_12_1m"].current_value is None
+    assert indicators["ema_12_1m"].pending is not None
+
+    for spec in LAZY_SPECS:
+        key = make_config(*spec).make_key()
+        assert_matches_batch(get_indicator(session, "TEST", key), bars, spec)
+        assert indicators[key].pending is None
+
+
+def test_catch_up_continues_incrementally(session):
+    manager = IndicatorManager(session)
+    manager.register_symbol_indicators("TEST", [lazy_config(*spec) for spec in LAZY_SPECS])
+    bars = create_random_bars(90)
+
+    series = feed(manager, bars[:40])
+    for spec in LAZY_SPECS:
+        assert_matches_batch(session.get_indicator("TEST", make_config(*spec).make_key()), bars[:40], spec)
+
+    feed(manager, bars[40:], series)
+    assert session.get_indicator_value("TEST", "ema_12_1m") == pytest.approx(
+        calculate_indicator(bars, make_config("ema", 12, {}), "TEST").value
+    )
+    assert get_indicator_value(session, "TEST", "bbands_20_1m", "upper") == pytest.approx(
+        calculate_indicator(bars, make_config("bbands", 20, {}), "TEST").value["upper"]
+    )
+
+
+def test_snapshot_evaluates_at_publication(session):
+    manager = IndicatorManager(session)
+    manager.register_symbol_indicators("TEST", [lazy_config("sma", 10, {})])
+    symbol_data = session.get_symbol_data("TEST", internal=True)
+    bars = create_random_bars(50)
+
+    series = feed(manager, bars[:30])
+    snapshot = SymbolSnapshot.capture(symbol_data, epoch=1)
+    feed(manager, bars[30:], series)
+
+    assert_matches_batch(get_indicator(session, "TEST", "sma_10_1m"), bars, ("sma", 10, {}))
+    # Older copy replays the shared stream, then the live one moves on again
+    assert_matches_batch(snapshot.get_indicator("sma_10_1m"), bars[:30], ("sma", 10, {}))
+    feed(manager, create_random_bars(60)[50:], series)
+    assert_matches_batch(refresh_indicator(symbol_data.indicators["sma_10_1m"]), list(series), ("sma", 10, {}))
+
+
+def test_lazy_mixed_with_eager_and_batched(session):
+    manager = IndicatorManager(session, batched=True)
+    manager.register_symbol_indicators("TEST", [
+        lazy_config("ema", 12, {}),
+        make_config("ema", 26, {}),
+        make_config("high_low", 20, {}),
+    ])
+    indicators = session.get_symbol_data("TEST", internal=True).indicators
+    assert type(indicators["ema_12_1m"].stream).__name__ != "BatchedIndicator"
+
+    bars = create_random_bars(70)
+    feed(manager, bars, batched=True)
+
+    assert indicators["ema_12_1m"].current_value is None  # Not read yet
+    assert_matches_batch(indicators["ema_26_1m"], bars, ("ema", 26, {}))
+    assert_matches_batch(indicators["high_low_20_1m"], bars, ("high_low", 20, {}))
+    assert_matches_batch(get_indicator(session, "TEST", "ema_12_1m"), bars, ("ema", 12, {}))
+
+
+def test_to_json_exports_current_value(session):
+    manager = IndicatorManager(session)
+    manager.register_symbol_indicators("TEST", [lazy_config("rsi", 14, {})])
+    bars = create_random_bars(40)
+    feed(manager, bars)
+
+    exported = session.get_symbol_data("TEST", internal=True).to_json()["indicators"]["rsi_14_1m"]
+    assert exported["value"] == pytest.approx(calculate_indicator(bars, make_config("rsi", 14, {}), "TEST").value)
+
+
+def test_evaluation_policy_validated():
+    config = SessionIndicatorConfig(name="sma", period=20, interval="1d", type="trend", evaluation="lazy")
+    config.validate()
+    config.evaluation = "sometimes"
+    with pytest.raises(ValueError):
+        config.validate()
+
+
+def test_lazy_history_rejected():
+    """History of a lazy indicator would get one entry per read, not per bar."""
+    with pytest.raises(ValueError):
+        IndicatorConfig(
+            name="sma", type=IndicatorType.TREND, period=5, interval="1m", history=50, evaluation="lazy"
+        )
+    config = SessionIndicatorConfig(name="sma", period=5, interval="1m", type="trend", evaluation="lazy")
+    config.validate()
+    config.history = 50
+    with pytest.raises(ValueError):
+        config.validate()
+    historical = HistoricalIndicatorConfig(name="atr", period=14, unit="days", history=50, evaluation="lazy")
+    with pytest.raises(ValueError):
+        historical.validate()
@@ -0,0 +1,255 @@
+"""Parity tests for streaming (incremental) indicators.
+
+Every registered indicator must have a streaming implementation whose
+output, bar by bar, matches the batch calculator run on the full series.
+"""
+import random
+from collections import deque
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+
+from app.models.trading import BarData
+from app.indicators import (
+    CrossSymbolGraph,
+    IndicatorConfig,
+    IndicatorType,
+    IndicatorManager,
+    PrimitiveGraph,
+    calculate_indicator,
+    create_batched_indicator,
+    create_graph_indicator,
+    create_streaming_indicator,
+    list_indicators,
+)
+from app.indicators.registry import INDICATOR_REGISTRY
+from app.indicators.streaming import RollingSum, RESUM_INTERVAL
+from app.managers.data_manager.session_data import SessionData, SymbolSessionData
+
+
+def create_random_bars(count: int = 160, seed: int = 7) -> List[BarData]:
+    """Random-walk bars with flat stretches (ties in highs/lows/closes)."""
+    rng = random.Random(seed)
+    bars = []
+    price = 100.0
+    base_time = datetime(2025, 1, 2, 9, 30)
+
+    for i in range(count):
+        if i % 17 in (3, 4):
+            change = 0.0  # Flat close-to-close
+        else:
+            change = round(rng.uniform(-1.5, 1.5), 2)
+        open_price = price
+        close = max(1.0, price + change)
+        high = max(open_price, close) + round(rng.uniform(0, 0.8), 2)
+        low = max(0.5, min(open_price, close) - round(rng.uniform(0, 0.8), 2))
+        volume = 0 if i % 23 == 5 else rng.randint(500, 5000)
+
+        bars.append(BarData(
+            timestamp=base_time + timedelta(minutes=i),
+            symbol="TEST",
+            open=open_price,
+            high=high,
+            low=low,
+            close=close,
+            volume=volume
+        ))
+        price = close + round(rng.uniform(-0.3, 0.3), 2)  # Gap to next open
+
+    return bars
+
+
+# One representative config per registered indicator
+STREAMING_CONFIGS = [
+    ("sma", 20, {}),
+    ("ema", 12, {}),
+    ("wma", 10, {}),
+    ("vwap", 0, {}),
+    ("dema", 10, {}),
+    ("tema", 8, {}),
+    ("hma", 16, {}),
+    ("twap", 0, {}),
+    ("rsi", 14, {}),
+    ("macd", 0, {}),
+    ("macd", 0, {"fast": 5, "slow": 13, "signal": 4}),
+    ("stochastic", 14, {"smooth": 3}),
+    ("cci", 20, {}),
+    ("roc", 10, {}),
+    ("mom", 10, {}),
+    ("williams_r", 14, {}),
+    ("ultimate_osc", 0, {}),
+    ("atr", 14, {}),
+    ("bbands", 20, {"num_std": 2.0}),
+    ("keltner", 20, {"atr_period": 10, "multiplier": 2.0}),
+    ("donchian", 20, {}),
+    ("stddev", 20, {}),
+    ("histvol", 20, {}),
+    ("obv", 0, {}),
+    ("pvt", 0, {}),
+    ("volume_sma", 20, {}),
+    ("volume_ratio", 0, {}),
+    ("pivot_points", 0, {}),
+    ("high_low", 20, {}),
+    ("swing_high", 3, {}),
+    ("swing_low", 3, {}),
+    ("avg_volume", 10, {}),
+    ("avg_range", 10, {}),
+    ("atr_daily", 14, {}),
+    ("gap_stats", 10, {}),
+    ("range_ratio", 10, {}),
+]
+
+
+def make_config(name, period, params, incremental=False):
+    return IndicatorConfig(
+        name=name,
+        type=IndicatorType.TREND,
+        period=period,
+        interval="1m",
+        params=dict(params),
+        incremental=incremental
+    )
+
+
+def assert_same_value(streamed, batch):
+    if isinstance(batch, dict):
+        assert streamed.keys() == batch.keys()
+        for key in batch:
+            assert streamed[key] == pytest.approx(batch[key], rel=1e-9, abs=1e-9), key
+    elif batch is None:
+        assert streamed is None
+    else:
+        assert streamed == pytest.approx(batch, rel=1e-9, abs=1e-9)
+
+
+def test_every_indicator_has_streaming_implementation():
+    """No registered indicator is batch-only."""
+    assert INDICATOR_REGISTRY.list_streaming() == list_indicators()
+    assert {name for name, _, _ in STREAMING_CONFIGS} == set(list_indicators())
+
+
+@pytest.mark.parametrize(
+    "name,period,params",
+    STREAMING_CONFIGS,
+    ids=[f"{n}-{p}-{i}" for i, (n, p, _) in enumerate(STREAMING_CONFIGS)]
+)
+def test_streaming_matches_batch(name, period, params):
+    """Bar-by-bar streaming equals batch recalculation at every bar."""
+    bars = create_random_bars()
+    config = make_config(name, period, params)
+    stream = create_streaming_indicator(config)
+    assert stream is not None
+
+    for n in range(1, len(bars) + 1):
+        streamed = stream.sync(bars[:n])
+        batch = calculate_indicator(bars[:n], make_config(name, period, params), "TEST")
+
+        assert streamed.valid == batch.valid, f"bar {n}"
+        assert streamed.timestamp == batch.timestamp
+        assert_same_value(streamed.value, batch.value)
+
+
+def test_sync_feeds_only_new_bars():
+    """Repeated sync on an unchanged series does not refold bars."""
+    bars = create_random_bars(40)
+    stream = create_streaming_indicator(make_config("sma", 5, {}))
+
+    stream.sync(bars)
+    assert stream.bar_count == 40
+    first = stream.sync(bars)
+    second = stream.sync(deque(bars))
+    assert first.value == second.value
+    assert stream.bar_count == 40
+
+
+def test_sync_rebuilds_when_series_rewritten():
+    """Inserted (gap-filled) or trimmed bars trigger a full replay."""
+    bars = create_random_bars(60)
+    config = make_config("rsi", 14, {})
+    stream = create_streaming_indicator(config)
+
+    # Missing bar 30, then gap filler inserts it
+    stream.sync(bars[:30] + bars[31:])
+    result = stream.sync(bars)
+    assert result.value == pytest.approx(calculate_indicator(bars, config, "TEST").value)
+
+    # Front-trimmed window
+    trimmed = bars[10:]
+    result = stream.sync(trimmed)
+    assert result.value == pytest.approx(calculate_indicator(trimmed, config, "TEST").value)
+
+
+def test_wilder_rsi_matches_batch():
+    """Wilder smoothing streams; the shared-series graphs leave it alone."""
+    bars = create_random_bars()
+    config = make_config("rsi", 14, {"smoothing": "wilder"})
+    stream = create_streaming_indicator(config)
+    assert create_graph_indicator(config, PrimitiveGraph("1m")) is None
+    assert create_batched_indicator(config, CrossSymbolGraph("1m"), "TEST") is None
+
+    for n in range(1, len(bars) + 1):
+        streamed = stream.sync(bars[:n])
+        batch = calculate_indicator(bars[:n], config, "TEST")
+        assert streamed.valid == batch.valid, f"bar {n}"
+        assert_same_value(streamed.value, batch.value)
+
+    simple = calculate_indicator(bars, make_config("rsi", 14, {}), "TEST")
+    assert streamed.value != pytest.approx(simple.value)
+    assert create_streaming_indicator(make_config("rsi", 14, {"smoothing": "ema"})) is None
+
+
+def test_unsupported_params_fall_back_to_batch():
+    """Configs the streaming classes cannot represent return None."""
+    assert create_streaming_indicator(make_config("hma", 1, {})) is None
+    assert create_streaming_indicator(make_config("sma", 0, {})) is None
+    assert create_streaming_indicator(
+        make_config("macd", 0, {"fast": 30, "slow": 10})
+    ) is None
+
+
+def test_rolling_sum_resums_to_limit_drift():
+    """Running sum is periodically recomputed from the window."""
+    window = RollingSum(3)
+    for i in range(window.size + RESUM_INTERVAL):
+        window.push(0.1 * (i % 7))
+    # Last push triggered the re-sum
+    assert window.total == sum(window.values)
+
+
+class TestIndicatorManagerStreaming:
+    """IndicatorManager uses streaming state when config.incremental is set."""
+
+    @pytest.fixture
+    def manager(self):
+        session_data = SessionData()
+        session_data.register_symbol_data(
+            SymbolSessionData(symbol="TEST", base_interval="1m")
+        )
+        return IndicatorManager(session_data), session_data
+
+    def test_incremental_matches_batch(self, manager):
+        manager, session_data = manager
+        configs = [
+            make_config("rsi", 14, {}, incremental=True),
+            make_config("bbands", 20, {}, incremental=False),
+        ]
+        manager.register_symbol_indicators("TEST", configs)
+
+        symbol_data = session_data.get_symbol_data("TEST", internal=True)
+        rsi = symbol_data.indicators["rsi_14_1m"]
+        bbands = symbol_data.indicators["bbands_20_1m"]
+        assert rsi.stream is not None
+        assert bbands.stream is None
+
+        bars = create_random_bars(80)
+        series = deque()
+        for bar in bars:
+            series.append(bar)
+            manager.update_indicators("TEST", "1m", series)
+
+        expected = calculate_indicator(bars, make_config("rsi", 14, {}), "TEST")
+        assert rsi.valid
+        assert rsi.current_value == pytest.approx(expected.value)
+        assert rsi.stream.bar_count == len(bars)
+        assert bbands.valid
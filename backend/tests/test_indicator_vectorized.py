@@ -0,0 +1,130 @@
+"""Parity tests for vectorized (whole-series) indicator kernels.
+
+Every kernel's output at bar i must match the batch calculator run on the
+first i + 1 bars, and warmup through IndicatorManager must store the same
+values either way.
+"""
+from collections import deque
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from app.indicators import (
+    IndicatorManager,
+    calculate_indicator,
+    calculate_indicator_series,
+    calculate_indicator_warmup,
+)
+from app.indicators.registry import INDICATOR_REGISTRY
+from app.indicators.utils import bar_arrays, ema_series, ewm
+from app.managers.data_manager.columnar_bars import ColumnarBarSeries
+from app.managers.data_manager.session_data import SessionData, SymbolSessionData
+
+from tests.test_indicator_streaming import (
+    STREAMING_CONFIGS,
+    assert_same_value,
+    create_random_bars,
+    make_config,
+)
+
+
+VECTORIZED_CONFIGS = [
+    config for config in STREAMING_CONFIGS
+    if INDICATOR_REGISTRY.get_vectorized(config[0]) is not None
+] + [
+    ("sma", 1, {}),
+    ("ema", 2, {}),
+    ("rsi", 0, {}),
+    ("rsi", 14, {"smoothing": "wilder"}),
+    ("hma", 1, {}),
+    ("stochastic", 5, {"smooth": 1}),
+]
+
+
+def value_at(series, i):
+    if isinstance(series, dict):
+        value = {field: float(values[i]) for field, values in series.items()}
+        return None if any(np.isnan(v) for v in value.values()) else value
+    return None if np.isnan(series[i]) else float(series[i])
+
+
+def test_core_indicators_are_vectorized():
+    for name in ("sma", "ema", "wma", "rsi", "atr", "bbands", "stochastic", "macd", "obv", "vwap"):
+        assert INDICATOR_REGISTRY.get_vectorized(name) is not None, name
+
+
+@pytest.mark.parametrize("name,period,params", VECTORIZED_CONFIGS)
+def test_vectorized_matches_batch(name, period, params):
+    bars = create_random_bars(120)
+    series = calculate_indicator_series(bars, make_config(name, period, params))
+
+    for i in range(len(bars)):
+        expected = calculate_indicator(bars[:i + 1], make_config(name, period, params), "TEST")
+        assert_same_value(value_at(series, i), expected.value)
+
+
+def test_ewm_blocks_match_recursion():
+    values = np.linspace(100.0, 110.0, 2000) + np.sin(np.arange(2000))
+    for alpha in (2.0 / 3.0, 2.0 / 21.0, 2.0 / 201.0):
+        expected, previous = [], 50.0
+        for value in values:
+            previous = alpha * value + (1 - alpha) * previous
+            expected.append(previous)
+        assert ewm(values, alpha, 50.0) == pytest.approx(expected, rel=1e-12)
+
+    assert np.isnan(ema_series(values[:5], 10)).all()
+
+
+def test_columnar_arrays_used_directly():
+    bars = create_random_bars(60)
+    series = ColumnarBarSeries(bars)
+
+    with patch.object(ColumnarBarSeries, "__iter__", side_effect=AssertionError("materialized bars")):
+        arrays = bar_arrays(series)
+
+    assert arrays["close"].tolist() == [b.close for b in bars]
+    result = calculate_indicator_warmup(series, make_config("sma", 20, {}), "TEST", arrays)
+    assert result.value == pytest.approx(calculate_indicator(bars, make_config("sma", 20, {}), "TEST").value)
+
+
+def test_warmup_falls_back_without_kernel():
+    bars = create_random_bars(40)
+    config = make_config("high_low", 20, {})
+
+    result = calculate_indicator_warmup(deque(bars), config, "TEST")
+
+    assert result == calculate_indicator(bars, make_config("high_low", 20, {}), "TEST")
+
+
+def test_warmup_invalid_until_enough_bars():
+    bars = create_random_bars(30)
+    result = calculate_indicator_warmup(bars, make_config("macd", 0, {}), "TEST")
+    assert not result.valid and result.value is None
+    assert result.timestamp == bars[-1].timestamp
+
+
+def test_manager_warmup_uses_kernels():
+    session_data = SessionData()
+    session_data.register_symbol_data(SymbolSessionData(symbol="TEST", base_interval="1m"))
+    manager = IndicatorManager(session_data)
+    # One config per key (the two MACD configs share "macd_1m")
+    specs = list({make_config(*spec).make_key(): spec for spec in STREAMING_CONFIGS}.values())
+    configs = [make_config(*spec) for spec in specs]
+    bars = create_random_bars(200)
+
+    with patch("app.indicators.manager.bar_arrays", wraps=bar_arrays) as extract:
+        manager.register_symbol_indicators("TEST", configs, historical_bars={"1m": bars})
+
+    assert extract.call_count == 1  # One extraction shared by the interval
+    indicators = session_data.get_symbol_data("TEST", internal=True).indicators
+    for name, period, params in specs:
+        config = make_config(name, period, params)
+        expected = calculate_indicator(bars, make_config(name, period, params), "TEST")
+        stored = indicators[config.make_key()]
+        assert stored.valid == expected.valid, config.make_key()
+        assert_same_value(stored.current_value, expected.value)
+
+    # VWAP keeps the cumulative state its next update builds on
+    vwap = indicators["vwap_1m"].config.params
+    assert vwap["_cum_vol"] == sum(b.volume for b in bars)
@@ -24,6 +24,7 @@ def mock_session_data():
         Mock(close=102.0, timestamp='2024-11-01 09:40:00'),
     ])
     mock.get_quality_metric.return_value = 100.0  # Changed to use correct SessionData method
+    mock.get_symbol_snapshot.return_value = None  # Nothing published yet
     return mock
 
 
@@ -0,0 +1,264 @@
+"""Unit tests for out-of-process strategies and the shared-memory mirror."""
+import pytest
+from collections import deque
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from app.indicators.base import IndicatorData
+from app.managers.data_manager.columnar_bars import ColumnarBarSeries
+from app.managers.data_manager.session_data import (
+    SessionData,
+    SymbolSessionData,
+    BarIntervalData,
+)
+from app.models.trading import BarData
+from app.strategies.base import BaseStrategy, StrategyContext, Signal, SignalAction
+from app.strategies.process import StrategyProcess
+from app.strategies.shared_memory import SharedSessionMirror, SharedSessionView
+from app.strategies.thread import StrategyThread
+from strategies.examples.simple_ma_cross import SimpleMaCrossStrategy
+
+
+START = datetime(2025, 1, 2, 9, 30)
+
+# Oscillating closes - several MA crossovers
+CLOSES = [100, 101, 103, 106, 104, 101, 98, 96, 97, 100, 104, 108, 107, 103, 99, 95, 96, 99, 103, 106]
+
+
+# Test Fixtures
+# =============================================================================
+
+def make_bar(i, interval="5m", close=None):
+    close = CLOSES[i % len(CLOSES)] if close is None else close
+    return BarData(
+        symbol="AAPL",
+        interval=interval,
+        timestamp=START + timedelta(minutes=5 * i),
+        open=close, high=close + 1, low=close - 1, close=close, volume=1000 + i
+    )
+
+
+def make_session_data():
+    session_data = SessionData()
+    symbol_data = SymbolSessionData(symbol="AAPL", base_interval="1m")
+    symbol_data.bars["1m"] = BarIntervalData(derived=False, base=None, data=deque(), quality=100.0)
+    symbol_data.bars["5m"] = BarIntervalData(derived=True, base="1m", data=[], quality=100.0)
+    session_data.register_symbol_data(symbol_data)
+    return session_data
+
+
+def bars_of(session_data, interval="5m"):
+    return session_data.get_symbol_data("AAPL", internal=True).bars[interval]
+
+
+def snapshot(bars):
+    return [(b.timestamp, b.open, b.high, b.low, b.close, b.volume) for b in bars]
+
+
+class IndicatorStrategy(BaseStrategy):
+    """Signals with the values it read through the context."""
+
+    def get_subscriptions(self):
+        return [("AAPL", "5m")]
+
+    def on_bars(self, symbol, interval):
+        bars = self.context.get_bars(symbol, interval)
+        return [Signal(
+            symbol=symbol,
+            action=SignalAction.HOLD,
+            metadata={
+                "count": len(bars),
+                "last_close": bars[-1].close,
+                "sma": self.context.get_indicator(symbol, "sma_3_5m"),
+                "upper": self.context.get_indicator(symbol, "bb_3_5m", "upper"),
+                "quality": self.context.get_bar_quality(symbol, interval),
+                "time": self.context.get_current_time(),
+            }
+        )]
+
+
+@pytest.fixture
+def mirror():
+    session_data = make_session_data()
+    mirror = SharedSessionMirror(session_data)
+    view = SharedSessionView()
+    yield session_data, mirror, view
+    view.close()
+    mirror.close()
+
+
+# Shared-Memory Mirror Tests
+# =============================================================================
+
+def test_mirror_matches_session_data(mirror):
+    session_data, mirror, view = mirror
+    bars_of(session_data).data.extend(make_bar(i) for i in range(5))
+
+    view.apply(mirror.sync(["AAPL"]))
+
+    assert snapshot(view.get_bars_ref("AAPL", "5m")) == snapshot(bars_of(session_data).data)
+    assert view.get_bars_ref("AAPL", "5m")[-1].interval == "5m"
+    assert view.get_bars_ref("AAPL", "1m") == []
+    assert view.get_bars_ref("MSFT", "5m") == []
+    assert view.get_quality_metric("AAPL", "5m") == 100.0
+
+
+def test_mirror_appends_grows_and_rewrites(mirror):
+    session_data, mirror, view = mirror
+    source = bars_of(session_data).data
+
+    source.extend(make_bar(i) for i in range(3))
+    view.apply(mirror.sync(["AAPL"]))
+    first_block = mirror._series[("AAPL", "5m")].block.name
+
+    # Incremental append (bar 4 missing), same block
+    source.extend(make_bar(i) for i in range(3, 10) if i != 4)
+    view.apply(mirror.sync(["AAPL"]))
+    assert mirror._series[("AAPL", "5m")].block.name == first_block
+    assert snapshot(view.get_bars_ref("AAPL", "5m")) == snapshot(source)
+
+    # Gap fill inserts bar 4 - the series is copied again
+    source.insert(4, make_bar(4, close=150.0))
+    view.apply(mirror.sync(["AAPL"]))
+    assert snapshot(view.get_bars_ref("AAPL", "5m")) == snapshot(source)
+    assert view.get_bars_ref("AAPL", "5m")[4].close == 150.0
+
+    # Outgrowing the block moves to a new one
+    source.extend(make_bar(i) for i in range(10, 2100))
+    view.apply(mirror.sync(["AAPL"]))
+    assert mirror._series[("AAPL", "5m")].block.name != first_block
+    assert snapshot(view.get_bars_ref("AAPL", "5m")[-5:]) == snapshot(source[-5:])
+    assert len(view.get_bars_ref("AAPL", "5m")) == 2100
+
+
+def test_mirror_columnar_source(mirror):
+    session_data, mirror, view = mirror
+    bars_of(session_data).data = ColumnarBarSeries(make_bar(i) for i in range(8))
+
+    view.apply(mirror.sync(["AAPL"]))
+
+    shared = view.get_bars_ref("AAPL", "5m")
+    assert snapshot(shared) == snapshot(bars_of(session_data).data)
+    assert shared.closes.tolist() == CLOSES[:8]
+    with pytest.raises(TypeError):
+        shared.append(make_bar(8))
+
+
+def test_mirror_indicator_values(mirror):
+    session_data, mirror, view = mirror
+    indicators = session_data.get_symbol_data("AAPL", internal=True).indicators
+    indicators["sma_3_5m"] = IndicatorData(
+        name="sma", type="session", interval="5m", current_value=101.5,
+        last_updated=START, valid=True
+    )
+    indicators["bb_3_5m"] = IndicatorData(
+        name="bb", type="session", interval="5m",
+        current_value={"upper": 105.0, "lower": 95.0}, last_updated=START, valid=True
+    )
+    indicators["ema_9_5m"] = IndicatorData(
+        name="ema", type="session", interval="5m", current_value=None,
+        last_updated=START, valid=False
+    )
+
+    view.apply(mirror.sync(["AAPL"]))
+    context = StrategyContext(session_data=view, time_manager=Mock(), system_manager=None, mode="backtest")
+
+    assert context.get_indicator("AAPL", "sma_3_5m") == 101.5
+    assert context.get_indicator("AAPL", "bb_3_5m", "lower") == 95.0
+    assert context.get_indicator("AAPL", "ema_9_5m") is None
+    assert context.get_indicator("AAPL", "missing") is None
+
+    # Values change in place, layout resent only when keys change
+    indicators["sma_3_5m"].current_value = 102.0
+    update = mirror.sync(["AAPL"])
+    assert "scalars" not in update
+    view.apply(update)
+    assert context.get_indicator("AAPL", "sma_3_5m") == 102.0
+
+
+# Worker Process Tests
+# =============================================================================
+
+def run_strategy(thread_class, strategy, session_data, bars=12):
+    def current_time():
+        bars = bars_of(session_data).data
+        return bars[-1].timestamp if bars else START
+
+    context = StrategyContext(
+        session_data=session_data,
+        time_manager=Mock(get_current_time=current_time),
+        system_manager=None,
+        mode="backtest"
+    )
+    thread = thread_class(strategy, context, "data-driven")
+    assert thread.strategy.setup(context)
+    try:
+        for i in range(bars):
+            bars_of(session_data).data.append(make_bar(i))
+            thread._process_batch([("AAPL", "5m", "bars")])
+            assert thread.get_subscription().is_ready()
+            thread.get_subscription().reset()
+    finally:
+        thread.strategy.teardown(context)
+    return thread
+
+
+def test_process_matches_thread():
+    config = {"symbols": ["AAPL"], "interval": "5m", "fast_period": 3, "slow_period": 6}
+
+    in_thread = run_strategy(StrategyThread, SimpleMaCrossStrategy("ma", config), make_session_data(), bars=len(CLOSES))
+    in_process = run_strategy(StrategyProcess, SimpleMaCrossStrategy("ma", config), make_session_data(), bars=len(CLOSES))
+
+    def records(thread):
+        return [(r.timestamp, r.signal.action, r.signal.metadata, r.price) for r in thread.get_signals()]
+
+    assert len(records(in_thread)) >= 2
+    assert records(in_process) == records(in_thread)
+    assert in_process.get_metrics()["notifications_processed"] == len(CLOSES)
+    assert not in_process.strategy.is_running()
+
+
+def test_process_reads_indicators_and_time():
+    session_data = make_session_data()
+    session_data.get_symbol_data("AAPL", internal=True).indicators["sma_3_5m"] = IndicatorData(
+        name="sma", type="session", interval="5m", current_value=99.0, last_updated=START, valid=True
+    )
+
+    thread = run_strategy(StrategyProcess, IndicatorStrategy("ind", {}), session_data, bars=3)
+
+    metadata = [record.signal.metadata for record in thread.get_signals()]
+    assert [m["count"] for m in metadata] == [1, 2, 3]
+    assert [m["last_close"] for m in metadata] == CLOSES[:3]
+    assert metadata[-1]["sma"] == 99.0 and metadata[-1]["upper"] is None
+    assert metadata[-1]["quality"] == 100.0
+    assert metadata[-1]["time"] == START + timedelta(minutes=10)
+
+
+def test_worker_errors_counted():
+    strategy = IndicatorStrategy("ind", {})
+    thread = run_strategy(StrategyProcess, strategy, make_session_data(), bars=0)
+
+    # Worker stopped: the batch fails but ready is still signaled
+    thread._process_batch([("AAPL", "5m", "bars")])
+    assert thread.get_subscription().is_ready()
+    assert thread.get_metrics()["errors"] == 1
+
+
+def test_manager_loads_process_strategy():
+    from app.models.strategy_config import StrategyConfig
+    from app.strategies.manager import StrategyManager
+
+    system_manager = Mock()
+    system_manager.mode.value = "backtest"
+    system_manager.session_config.backtest_config.speed_multiplier = 0
+    manager = StrategyManager(system_manager)
+
+    assert manager._load_strategy(StrategyConfig(
+        module="strategies.examples.simple_ma_cross",
+        config={"symbols": ["AAPL"], "interval": "5m"},
+        process=True
+    ))
+    thread = manager._strategy_threads[0]
+    assert isinstance(thread, StrategyProcess)
+    assert thread.strategy.get_subscriptions() == [("AAPL", "5m")]
+    assert not thread.strategy.is_running()
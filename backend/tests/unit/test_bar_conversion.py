@@ -0,0 +1,112 @@
+"""Unit Tests for Bulk Parquet -> Bar Conversion
+
+Verifies the column-wise conversion produces the same bars as the
+row-by-row (iterrows + validated BarData) path it replaces.
+"""
+import pytest
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+from pydantic import ValidationError
+
+from app.models.trading import BarData
+from app.managers.data_manager.bar_conversion import bars_from_frame, columnar_from_frame
+from app.managers.data_manager.columnar_bars import ColumnarBarSeries
+
+
+ET = ZoneInfo("America/New_York")
+
+
+def make_frame(count, tz=ET, symbol="AAPL"):
+    start = datetime(2025, 7, 1, 9, 30)
+    timestamps = pd.Series([start + timedelta(minutes=i) for i in range(count)])
+    if tz is not None:
+        timestamps = timestamps.dt.tz_localize(tz)
+    return pd.DataFrame({
+        "timestamp": timestamps,
+        "symbol": symbol,
+        "open": [100.0 + i for i in range(count)],
+        "high": [101.0 + i for i in range(count)],
+        "low": [99.0 + i for i in range(count)],
+        "close": [100.5 + i for i in range(count)],
+        "volume": [1000 + i for i in range(count)],  # int64 column, as written
+    })
+
+
+def row_by_row(df, interval):
+    return [
+        BarData(
+            symbol=row["symbol"],
+            timestamp=row["timestamp"],
+            interval=interval,
+            open=row["open"],
+            high=row["high"],
+            low=row["low"],
+            close=row["close"],
+            volume=row["volume"]
+        )
+        for _, row in df.iterrows()
+    ]
+
+
+def as_tuples(bars):
+    return [
+        (b.timestamp, b.symbol, b.interval, b.open, b.high, b.low, b.close, b.volume)
+        for b in bars
+    ]
+
+
+class TestBarsFromFrame:
+    """BarData list conversion."""
+
+    @pytest.mark.parametrize("tz", [ET, None])
+    def test_matches_row_by_row(self, tz):
+        df = make_frame(50, tz=tz)
+        bars = bars_from_frame(df, "1m")
+
+        assert as_tuples(bars) == as_tuples(row_by_row(df, "1m"))
+        assert type(bars[0].timestamp) is datetime
+        assert bars[0].timestamp.utcoffset() == (timedelta(hours=-4) if tz else None)
+        assert isinstance(bars[0].close, float)
+
+    def test_symbol_override_and_empty(self):
+        bars = bars_from_frame(make_frame(3).drop(columns="symbol"), "5m", symbol="MSFT")
+        assert {(b.symbol, b.interval) for b in bars} == {("MSFT", "5m")}
+        assert bars_from_frame(pd.DataFrame(), "1m") == []
+
+    def test_invalid_rows_still_raise(self):
+        df = make_frame(5)
+        df.loc[3, "low"] = 0.0
+        with pytest.raises(ValidationError):
+            bars_from_frame(df, "1m")
+
+
+class TestColumnarFromFrame:
+    """Parquet columns straight into ColumnarBarSeries."""
+
+    @pytest.mark.parametrize("tz", [ET, None])
+    def test_matches_bar_objects(self, tz):
+        df = make_frame(40, tz=tz)
+        series = columnar_from_frame(df, "1m", "AAPL")
+        expected = ColumnarBarSeries(row_by_row(df, "1m"))
+
+        assert isinstance(series, ColumnarBarSeries)
+        assert as_tuples(series) == as_tuples(expected)
+        assert series.timestamps.tolist() == expected.timestamps.tolist()
+
+        # Still appendable like any other series
+        series.append(row_by_row(make_frame(41, tz=tz), "1m")[-1])
+        assert len(series) == 41
+
+    def test_max_bars_keeps_latest(self):
+        df = make_frame(30)
+        series = columnar_from_frame(df, "1m", "AAPL", max_bars=8)
+        assert as_tuples(series) == as_tuples(row_by_row(df, "1m")[-8:])
+
+    def test_invalid_and_empty(self):
+        df = make_frame(5)
+        df.loc[0, "volume"] = -1
+        with pytest.raises(ValueError):
+            columnar_from_frame(df, "1m", "AAPL")
+        assert len(columnar_from_frame(pd.DataFrame(), "1m", "AAPL")) == 0
@@ -0,0 +1,151 @@
+"""Unit Tests for Timestamp Bar Queries
+
+Verifies range, since and last-N lookups return the same bars as a full
+filter for every container SessionData uses, and that deque lookups near
+the tail only touch a few bars.
+"""
+import pytest
+from collections import deque
+from datetime import date, datetime, timedelta
+
+from app.managers.data_manager.bar_queries import (
+    bars_between,
+    bars_since,
+    bisect_timestamp,
+    last_n_bars,
+)
+from app.managers.data_manager.columnar_bars import ColumnarBarSeries
+from app.managers.data_manager.session_data import (
+    SessionData,
+    SymbolSessionData,
+    BarIntervalData,
+    HistoricalBarIntervalData,
+)
+from app.managers.data_manager.session_snapshot import BarsView
+from app.models.trading import BarData
+
+
+START = datetime(2025, 1, 2, 9, 30)
+
+
+def make_bar(minute, day=START):
+    return BarData(
+        symbol="AAPL",
+        timestamp=day + timedelta(minutes=minute),
+        open=100.0, high=101.0, low=99.0, close=100.0 + minute, volume=1000
+    )
+
+
+# Duplicate timestamps (minute 5) exercise the bound sides
+MINUTES = [0, 1, 2, 3, 5, 5, 6, 8, 9, 12]
+BARS = [make_bar(m) for m in MINUTES]
+
+
+def containers():
+    return {
+        "deque": deque(BARS),
+        "list": list(BARS),
+        "columnar": ColumnarBarSeries(BARS),
+        "view": BarsView(BARS + [make_bar(99)], len(BARS)),
+    }
+
+
+def closes(bars):
+    return [bar.close for bar in bars]
+
+
+class CountingDeque(deque):
+    """deque that counts index reads."""
+
+    reads = 0
+
+    def __getitem__(self, index):
+        CountingDeque.reads += 1
+        return super().__getitem__(index)
+
+
+@pytest.mark.parametrize("kind", ["deque", "list", "columnar", "view"])
+class TestQueries:
+
+    @pytest.mark.parametrize("minute", [-1, 0, 4, 5, 7, 12, 13])
+    def test_since_matches_filter(self, kind, minute):
+        timestamp = START + timedelta(minutes=minute)
+        expected = [bar for bar in BARS if bar.timestamp >= timestamp]
+        assert closes(bars_since(containers()[kind], timestamp)) == closes(expected)
+
+    @pytest.mark.parametrize("first,last", [(0, 12), (2, 5), (5, 5), (4, 4), (6, 30), (-5, 1), (9, 3)])
+    def test_between_matches_filter(self, kind, first, last):
+        start = START + timedelta(minutes=first)
+        end = START + timedelta(minutes=last)
+        expected = [bar for bar in BARS if start <= bar.timestamp <= end]
+        assert closes(bars_between(containers()[kind], start, end)) == closes(expected)
+
+    def test_open_bounds(self, kind):
+        bars = containers()[kind]
+        assert closes(bars_between(bars)) == closes(BARS)
+        assert closes(bars_between(bars, end=START + timedelta(minutes=2))) == [100.0, 101.0, 102.0]
+
+    @pytest.mark.parametrize("n", [0, 1, 3, 10, 50])
+    def test_last_n(self, kind, n):
+        assert closes(last_n_bars(containers()[kind], n)) == closes(BARS[-n:] if n else [])
+
+
+class TestSearch:
+
+    def test_bisect_sides(self):
+        timestamp = START + timedelta(minutes=5)
+        assert bisect_timestamp(BARS, timestamp) == 4
+        assert bisect_timestamp(BARS, timestamp, right=True) == 6
+        assert bisect_timestamp([], timestamp) == 0
+
+    def test_tail_queries_touch_few_bars(self):
+        bars = CountingDeque(make_bar(m) for m in range(10000))
+        CountingDeque.reads = 0
+
+        recent = bars_since(bars, START + timedelta(minutes=9990))
+
+        assert len(recent) == 10
+        assert CountingDeque.reads < 20
+
+    def test_unsorted_columnar_falls_back_to_scan(self):
+        series = ColumnarBarSeries([make_bar(m) for m in (0, 5, 2, 8)])
+        result = bars_between(series, START + timedelta(minutes=2), START + timedelta(minutes=6))
+        assert closes(result) == [105.0, 102.0]
+
+
+class TestSessionDataRanges:
+
+    def make_session_data(self):
+        session_data = SessionData()
+        symbol_data = SymbolSessionData(symbol="AAPL", base_interval="1m")
+        symbol_data.bars["1m"] = BarIntervalData(derived=False, base=None, data=deque(BARS))
+        day1, day2 = datetime(2024, 12, 30, 9, 30), datetime(2024, 12, 31, 9, 30)
+        symbol_data.historical.bars["1m"] = HistoricalBarIntervalData(data_by_date={
+            day1.date(): [make_bar(m, day1) for m in range(3)],
+            day2.date(): [make_bar(m, day2) for m in range(3)],
+        })
+        session_data.register_symbol_data(symbol_data)
+        session_data.activate_session()
+        return session_data
+
+    def test_get_bars_range_spans_history(self):
+        session_data = self.make_session_data()
+
+        bars = session_data.get_bars(
+            "AAPL", "1m",
+            start=datetime(2024, 12, 31, 9, 31),
+            end=START + timedelta(minutes=2)
+        )
+
+        assert [bar.timestamp.date() for bar in bars] == [date(2024, 12, 31)] * 2 + [date(2025, 1, 2)] * 3
+        assert closes(bars) == [101.0, 102.0, 100.0, 101.0, 102.0]
+        assert len(session_data.get_bars("AAPL", "1m")) == 6 + len(BARS)
+
+    def test_symbol_queries(self):
+        session_data = self.make_session_data()
+        symbol_data = session_data.get_symbol_data("AAPL")
+
+        assert closes(session_data.get_last_n_bars("AAPL", 2)) == [109.0, 112.0]
+        assert closes(session_data.get_bars_since("AAPL", START + timedelta(minutes=8))) == [108.0, 109.0, 112.0]
+        assert closes(symbol_data.get_bars_between(START + timedelta(minutes=3), START + timedelta(minutes=5))) == \
+            [103.0, 105.0, 105.0]
@@ -0,0 +1,142 @@
+"""Unit Tests for Timestamp-Batched Notifications
+
+Verifies the coordinator hands all bars of one simulated timestamp to the
+DataProcessor as a single batch, and that a batch is processed in one pass
+with one analysis engine batch, one notification per strategy and a single
+ready signal.
+"""
+import queue
+import pytest
+from collections import deque
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from app.managers.data_manager.session_data import (
+    SessionData,
+    SymbolSessionData,
+    BarIntervalData,
+)
+from app.models.trading import BarData
+from app.monitoring.performance_metrics import PerformanceMetrics
+from app.strategies.manager import StrategyManager
+from app.threads.data_processor import DataProcessor
+from app.threads.session_coordinator import SessionCoordinator
+
+
+SYMBOLS = ["AAPL", "MSFT", "TSLA"]
+START = datetime(2025, 1, 2, 9, 30)
+
+
+def make_bars(symbol, count):
+    return [
+        BarData(
+            symbol=symbol,
+            timestamp=START + timedelta(minutes=i),
+            open=100.0, high=101.0, low=99.0, close=100.5, volume=1000
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def coordinator():
+    """Bare coordinator with just the state queue processing touches."""
+    coordinator = SessionCoordinator.__new__(SessionCoordinator)
+    coordinator._system_manager = MagicMock()
+    coordinator._system_manager.mode.value = "backtest"
+    coordinator._system_manager.session_config.backtest_config.speed_multiplier = 0
+    coordinator._system_manager.session_config.backtest_config.fused = False
+    coordinator.session_data = SessionData()
+    coordinator._bar_queues = {
+        ("AAPL", "1m"): deque(make_bars("AAPL", 2)),
+        ("MSFT", "1m"): deque(make_bars("MSFT", 1)),
+    }
+    coordinator._queue_heap = None
+    coordinator._symbol_check_counters = {"AAPL": 0, "MSFT": 0}
+    coordinator.indicator_manager = None
+    coordinator.data_processor = MagicMock()
+    coordinator.quality_manager = MagicMock()
+    return coordinator
+
+
+class TestCoordinatorBatches:
+    """One batch per simulated timestamp."""
+
+    def test_one_batch_per_timestamp(self, coordinator):
+        assert coordinator._process_queue_data_at_timestamp(START + timedelta(minutes=5)) == 3
+
+        batches = [c.args[0] for c in coordinator.data_processor.notify_batch_available.call_args_list]
+        assert batches == [
+            [("AAPL", "1m", START), ("MSFT", "1m", START)],
+            [("AAPL", "1m", START + timedelta(minutes=1))],
+        ]
+        coordinator.data_processor.notify_data_available.assert_not_called()
+        assert coordinator.quality_manager.notify_batch_available.call_count == 2
+
+
+class TestProcessorBatch:
+    """A batch is processed in one pass with one ready signal."""
+
+    @pytest.fixture
+    def processor(self):
+        session_data = SessionData()
+        for symbol in SYMBOLS:
+            symbol_data = SymbolSessionData(symbol=symbol, base_interval="1m")
+            symbol_data.bars["1m"] = BarIntervalData(derived=False, base=None, data=deque(make_bars(symbol, 5)))
+            symbol_data.bars["5m"] = BarIntervalData(derived=True, base="1m", data=[])
+            session_data.register_symbol_data(symbol_data)
+        session_data.activate_session()
+
+        system_manager = MagicMock()
+        system_manager.mode.value = "backtest"
+        system_manager.session_config.backtest_config.speed_multiplier = 0
+
+        strategy_manager = MagicMock()
+        strategy_manager.notify_strategies_batch.return_value = ["thread"]
+        processor = DataProcessor(
+            session_data, system_manager, PerformanceMetrics(), strategy_manager=strategy_manager
+        )
+        processor.set_coordinator_subscription(MagicMock())
+        processor.set_analysis_engine_queue(queue.Queue())
+        processor.set_analysis_subscription(MagicMock())
+        return processor
+
+    def test_single_pass(self, processor):
+        processor._process_batch([(symbol, "1m", START + timedelta(minutes=4)) for symbol in SYMBOLS])
+
+        processor._coordinator_subscription.signal_ready.assert_called_once()
+        assert processor._analysis_engine_queue.qsize() == 1
+        assert processor._analysis_engine_queue.get() == [(symbol, "5m", "bars") for symbol in SYMBOLS]
+        processor._analysis_subscription.wait_until_ready.assert_called_once()
+
+        strategy_manager = processor._strategy_manager
+        strategy_manager.notify_strategies_batch.assert_called_once_with([
+            (symbol, interval, "bars") for symbol in SYMBOLS for interval in ("1m", "5m")
+        ])
+        strategy_manager.wait_for_strategies.assert_called_once_with(timeout=None, threads=["thread"])
+        for symbol in SYMBOLS:
+            assert len(processor.session_data.get_bars_ref(symbol, "5m")) == 1
+
+    def test_nothing_to_wait_for(self, processor):
+        processor._strategy_manager.notify_strategies_batch.return_value = []
+        processor.session_data.get_symbol_data("AAPL", internal=True).bars.pop("5m")
+
+        processor._process_batch([("AAPL", "1m", START + timedelta(minutes=4))])
+
+        processor._analysis_subscription.wait_until_ready.assert_not_called()
+        processor._strategy_manager.wait_for_strategies.assert_not_called()
+        processor._coordinator_subscription.signal_ready.assert_called_once()
+
+
+def test_strategy_manager_groups_per_thread():
+    manager = StrategyManager(MagicMock())
+    first, second = MagicMock(), MagicMock()
+    manager._subscriptions = {("AAPL", "1m"): [first], ("MSFT", "1m"): [first, second]}
+
+    threads = manager.notify_strategies_batch([
+        ("AAPL", "1m", "bars"), ("MSFT", "1m", "bars"), ("TSLA", "1m", "bars")
+    ])
+
+    assert threads == [first, second]
+    first.notify_batch.assert_called_once_with([("AAPL", "1m", "bars"), ("MSFT", "1m", "bars")])
+    second.notify_batch.assert_called_once_with([("MSFT", "1m", "bars")])
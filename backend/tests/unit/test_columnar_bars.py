@@ -0,0 +1,192 @@
+"""Unit Tests for ColumnarBarSeries
+
+Verifies the NumPy-backed bar store behaves like the deque/list containers
+it replaces and that SessionData fast paths use it.
+"""
+import pytest
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from app.models.trading import BarData
+from app.managers.data_manager.columnar_bars import (
+    ColumnarBarSeries,
+    datetime_to_ns,
+    ns_to_datetime,
+)
+from app.managers.data_manager.session_data import (
+    SessionData,
+    SymbolSessionData,
+    BarIntervalData,
+)
+from app.threads.data_processor import DataProcessor
+
+
+def make_bars(count, symbol="AAPL", start=datetime(2025, 1, 2, 9, 30)):
+    return [
+        BarData(
+            symbol=symbol,
+            timestamp=start + timedelta(minutes=i),
+            open=100.0 + i,
+            high=101.0 + i,
+            low=99.0 + i,
+            close=100.5 + i,
+            volume=1000 + i
+        )
+        for i in range(count)
+    ]
+
+
+def as_tuples(bars):
+    return [
+        (b.timestamp, b.symbol, b.interval, b.open, b.high, b.low, b.close, b.volume)
+        for b in bars
+    ]
+
+
+class TestColumnarBarSeries:
+    """Sequence behaviour and column views."""
+
+    def test_round_trip(self):
+        bars = make_bars(10)
+        series = ColumnarBarSeries(bars)
+
+        assert len(series) == 10
+        assert as_tuples(series) == as_tuples(bars)
+        assert as_tuples([series[3]]) == as_tuples([bars[3]])
+        assert as_tuples(series[-4:]) == as_tuples(bars[-4:])
+        assert series[-1] is bars[-1]  # Tail object kept for hot path
+        assert as_tuples(reversed(series)) == as_tuples(reversed(bars))
+
+    def test_index_errors_and_empty(self):
+        series = ColumnarBarSeries()
+        assert not series
+        assert series[-5:] == []
+        with pytest.raises(IndexError):
+            series[0]
+
+    def test_grows_past_capacity(self):
+        bars = make_bars(50)
+        series = ColumnarBarSeries(bars, capacity=4)
+        assert as_tuples(series) == as_tuples(bars)
+        assert series.closes.tolist() == [b.close for b in bars]
+
+    def test_ring_buffer_keeps_last_bars(self):
+        bars = make_bars(25)
+        series = ColumnarBarSeries(max_bars=6)
+        window = deque(maxlen=6)
+        for bar in bars:
+            series.append(bar)
+            window.append(bar)
+            assert as_tuples(series) == as_tuples(window)
+        assert series.nbytes == 12 * 6 * 8  # Never grows beyond 2x max_bars
+
+    def test_views_are_zero_copy_and_read_only(self):
+        series = ColumnarBarSeries(make_bars(5))
+        closes = series.closes
+        assert closes.base is not None
+        with pytest.raises(ValueError):
+            closes[0] = 1.0
+
+        arrays = series.arrays()
+        assert arrays["timestamp"].dtype == np.int64
+        assert arrays["volume"].tolist() == [1000.0, 1001.0, 1002.0, 1003.0, 1004.0]
+
+    def test_tz_aware_timestamps(self):
+        tz = ZoneInfo("America/New_York")
+        bars = make_bars(3, start=datetime(2025, 7, 1, 9, 30, tzinfo=tz))
+        series = ColumnarBarSeries(bars)
+
+        assert [b.timestamp for b in series] == [b.timestamp for b in bars]
+        assert series[0].timestamp.utcoffset() == timedelta(hours=-4)
+        expected = int(bars[0].timestamp.astimezone(timezone.utc).timestamp()) * 10**9
+        assert series.timestamps[0] == expected
+
+    def test_rejects_mixed_series(self):
+        series = ColumnarBarSeries(make_bars(2))
+        with pytest.raises(ValueError):
+            series.append(make_bars(1, symbol="MSFT")[0])
+        aware = make_bars(1, start=datetime(2025, 1, 2, 9, 30, tzinfo=timezone.utc))[0]
+        with pytest.raises(ValueError):
+            series.append(aware)
+
+    def test_since(self):
+        bars = make_bars(30)
+        series = ColumnarBarSeries(bars)
+        ts = bars[12].timestamp + timedelta(seconds=30)
+        assert as_tuples(series.since(ts)) == as_tuples(bars[13:])
+        assert series.since(bars[-1].timestamp + timedelta(minutes=1)) == []
+
+    def test_ns_conversion_is_exact(self):
+        ts = datetime(2025, 3, 9, 2, 59, 59, 999999)
+        assert ns_to_datetime(datetime_to_ns(ts), None) == ts
+
+
+class TestSessionDataColumnar:
+    """SessionData accessors work unchanged on columnar series."""
+
+    @pytest.fixture
+    def session_data(self):
+        session_data = SessionData()
+        symbol_data = SymbolSessionData(symbol="AAPL", base_interval="1m")
+        symbol_data.bars["1m"] = BarIntervalData(
+            derived=False, base=None, data=ColumnarBarSeries(make_bars(40))
+        )
+        session_data.register_symbol_data(symbol_data)
+        return session_data
+
+    def test_accessors(self, session_data):
+        bars = make_bars(40)
+        assert as_tuples(session_data.get_last_n_bars("AAPL", 5, internal=True)) == \
+            as_tuples(bars[-5:])
+        assert as_tuples(
+            session_data.get_bars_since("AAPL", bars[35].timestamp, internal=True)
+        ) == as_tuples(bars[35:])
+        assert session_data.get_bar_count("AAPL", internal=True) == 40
+        assert as_tuples([session_data.get_latest_bar("AAPL", 1, internal=True)]) == \
+            as_tuples(bars[-1:])
+        assert isinstance(session_data.get_bars_ref("AAPL", internal=True), ColumnarBarSeries)
+
+        arrays = session_data.get_bar_arrays("AAPL", 1, internal=True)
+        assert arrays["close"][-1] == bars[-1].close
+
+    def test_bar_arrays_none_for_object_store(self):
+        session_data = SessionData()
+        symbol_data = SymbolSessionData(symbol="MSFT", base_interval="1m")
+        symbol_data.bars["1m"] = BarIntervalData(derived=False, base=None, data=deque())
+        session_data.register_symbol_data(symbol_data)
+        assert session_data.get_bar_arrays("MSFT", 1, internal=True) is None
+
+    def test_gap_fill_keeps_columnar(self, session_data):
+        symbol_data = session_data.get_symbol_data("AAPL", internal=True)
+        bars = make_bars(40)
+        symbol_data.bars["1m"].data.replace(bars[:10] + bars[11:])
+
+        session_data.add_bars_batch("AAPL", [bars[10]], insert_mode="gap_fill")
+
+        data = symbol_data.bars["1m"].data
+        assert isinstance(data, ColumnarBarSeries)
+        assert as_tuples(data) == as_tuples(bars)
+
+    def test_derived_bars_generated_into_columnar(self):
+        session_data = SessionData()
+        symbol_data = SymbolSessionData(symbol="AAPL", base_interval="1m")
+        symbol_data.bars["1m"] = BarIntervalData(derived=False, base=None, data=ColumnarBarSeries())
+        symbol_data.bars["5m"] = BarIntervalData(derived=True, base="1m", data=ColumnarBarSeries())
+        session_data.register_symbol_data(symbol_data)
+        processor = DataProcessor(
+            session_data=session_data,
+            system_manager=MagicMock(),
+            metrics=MagicMock()
+        )
+
+        for bar in make_bars(20):
+            symbol_data.bars["1m"].data.append(bar)
+            processor._generate_derived_bars("AAPL")
+
+        derived = symbol_data.bars["5m"].data
+        assert len(derived) == 4
+        assert derived.volumes.tolist() == [5010.0, 5035.0, 5060.0, 5085.0]
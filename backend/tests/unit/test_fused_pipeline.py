@@ -0,0 +1,239 @@
+"""Unit Tests for the Fused Backtest Pipeline
+
+Verifies DataProcessor.process_inline() runs derived bars, the analysis
+engine and strategies on the caller's thread with the same results as the
+threaded data-driven pipeline, and the config flag that enables it.
+"""
+import json
+import queue
+import pytest
+from collections import deque
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from app.managers.data_manager.session_data import (
+    SessionData,
+    SymbolSessionData,
+    BarIntervalData,
+)
+from app.models.session_config import BacktestConfig, SessionConfig
+from app.models.trading import BarData
+from app.monitoring.performance_metrics import PerformanceMetrics
+from app.strategies.base import BaseStrategy, Signal, SignalAction, StrategyContext
+from app.strategies.manager import StrategyManager
+from app.strategies.thread import StrategyThread
+from app.threads.analysis_engine import BaseStrategy as EngineStrategy
+from app.threads.analysis_engine import AnalysisEngine
+from app.threads.data_processor import DataProcessor
+from app.threads.session_coordinator import SessionCoordinator
+from app.threads.sync.stream_subscription import StreamSubscription
+
+
+def make_bars(count, start=datetime(2025, 1, 2, 9, 30)):
+    return [
+        BarData(
+            symbol="AAPL",
+            timestamp=start + timedelta(minutes=i),
+            open=100.0 + i, high=101.0 + i, low=99.0 + i, close=100.5 + i, volume=1000 + i
+        )
+        for i in range(count)
+    ]
+
+
+class RecordingEngineStrategy(EngineStrategy):
+    """AnalysisEngine strategy recording what it saw."""
+
+    def __init__(self, session_data, calls):
+        super().__init__("recording", session_data, {})
+        self.calls = calls
+
+    def on_bar(self, symbol, interval, bar):
+        return []
+
+    def on_bars(self, symbol, interval):
+        bars = self.session_data.get_bars_ref(symbol, interval)
+        self.calls.append((symbol, interval, len(bars), bars[-1].timestamp))
+        return []
+
+
+class RecordingStrategy(BaseStrategy):
+    """Strategy-framework strategy signalling on every 5m bar."""
+
+    def __init__(self, calls):
+        super().__init__("recording", {})
+        self.calls = calls
+
+    def get_subscriptions(self):
+        return [("AAPL", "5m")]
+
+    def on_bars(self, symbol, interval):
+        bars = self.context.get_bars(symbol, interval)
+        self.calls.append((symbol, interval, len(bars), bars[-1].timestamp))
+        return [Signal(symbol=symbol, action=SignalAction.BUY)]
+
+
+class Pipeline:
+    """DataProcessor + AnalysisEngine + one strategy thread over one symbol."""
+
+    def __init__(self):
+        self.session_data = SessionData()
+        self.symbol_data = SymbolSessionData(symbol="AAPL", base_interval="1m")
+        self.symbol_data.bars["1m"] = BarIntervalData(derived=False, base=None, data=deque())
+        self.symbol_data.bars["5m"] = BarIntervalData(derived=True, base="1m", data=[])
+        self.session_data.register_symbol_data(self.symbol_data)
+        self.session_data.activate_session()
+
+        system_manager = MagicMock()
+        system_manager.mode.value = "backtest"
+        system_manager.session_config.backtest_config.speed_multiplier = 0
+
+        self.engine_calls = []
+        self.engine = AnalysisEngine(self.session_data, system_manager, PerformanceMetrics())
+        self.engine.register_strategy(RecordingEngineStrategy(self.session_data, self.engine_calls))
+
+        self.strategy_calls = []
+        strategy = RecordingStrategy(self.strategy_calls)
+        strategy.context = StrategyContext(self.session_data, MagicMock(), system_manager, "backtest")
+        self.strategy_thread = StrategyThread(strategy, strategy.context, "data-driven")
+        self.strategy_manager = StrategyManager(system_manager)
+        self.strategy_manager._strategy_threads.append(self.strategy_thread)
+        self.strategy_manager._build_subscription_map()
+
+        self.processor = DataProcessor(
+            self.session_data, system_manager, PerformanceMetrics(), strategy_manager=self.strategy_manager
+        )
+        self.processor.set_analysis_engine(self.engine)
+
+        # Seed one 5m bar so the engine always has derived bars to read
+        for bar in make_bars(5):
+            self.symbol_data.bars["1m"].data.append(bar)
+        self.processor._generate_derived_bars("AAPL")
+
+    def wire_threads(self):
+        self.coordinator_subscription = StreamSubscription("clock-driven", "coordinator->data_processor")
+        analysis_subscription = StreamSubscription("data-driven", "analysis_engine->data_processor")
+        analysis_queue = queue.Queue()
+        self.processor.set_coordinator_subscription(self.coordinator_subscription)
+        self.processor.set_analysis_engine_queue(analysis_queue)
+        self.processor.set_analysis_subscription(analysis_subscription)
+        self.engine.set_notification_queue(analysis_queue)
+        self.engine.set_processor_subscription(analysis_subscription)
+        for thread in (self.processor, self.engine, self.strategy_thread):
+            thread.start()
+
+    def stop_threads(self):
+        for thread in (self.processor, self.engine, self.strategy_thread):
+            thread.stop()
+            thread.join(timeout=5)
+
+    def signals(self):
+        return [(r.interval, r.signal.action, r.price) for r in self.strategy_thread.get_signals()]
+
+
+class TestFusedPipeline:
+    """Inline processing matches the threaded data-driven pipeline."""
+
+    def test_matches_threaded_pipeline(self):
+        bars = make_bars(40)[5:]
+
+        threaded = Pipeline()
+        threaded.wire_threads()
+        try:
+            for bar in bars:
+                threaded.symbol_data.bars["1m"].data.append(bar)
+                threaded.processor.notify_data_available("AAPL", "1m", bar.timestamp)
+                assert threaded.coordinator_subscription.wait_until_ready(timeout=5)
+                threaded.coordinator_subscription.reset()
+        finally:
+            threaded.stop_threads()
+
+        fused = Pipeline()
+        for bar in bars:
+            fused.symbol_data.bars["1m"].data.append(bar)
+            fused.processor.process_inline("AAPL", "1m", bar.timestamp)
+
+        assert len(fused.engine_calls) == len(bars)
+        assert fused.engine_calls == threaded.engine_calls
+        assert len(fused.strategy_calls) == len(bars)
+        assert fused.strategy_calls == threaded.strategy_calls
+        assert fused.signals() == threaded.signals()
+        assert [b.timestamp for b in fused.symbol_data.bars["5m"].data] == \
+            [b.timestamp for b in threaded.symbol_data.bars["5m"].data]
+
+    def test_no_thread_handoffs(self):
+        pipeline = Pipeline()
+        pipeline.processor.set_analysis_engine_queue(MagicMock())
+        pipeline.processor.set_coordinator_subscription(MagicMock())
+
+        bar = make_bars(6)[5]
+        pipeline.symbol_data.bars["1m"].data.append(bar)
+        pipeline.processor.process_inline("AAPL", "1m", bar.timestamp)
+
+        pipeline.processor._analysis_engine_queue.put.assert_not_called()
+        pipeline.processor._coordinator_subscription.signal_ready.assert_not_called()
+        assert pipeline.strategy_thread.get_queue_size() == 0
+        assert not pipeline.strategy_thread.get_subscription().is_ready()
+        assert len(pipeline.engine_calls) == 1
+
+    def test_inactive_session_skips_analysis(self):
+        pipeline = Pipeline()
+        pipeline.session_data.deactivate_session()
+
+        bar = make_bars(6)[5]
+        pipeline.symbol_data.bars["1m"].data.append(bar)
+        pipeline.processor.process_inline("AAPL", "1m", bar.timestamp)
+
+        assert pipeline.engine_calls == [] and pipeline.strategy_calls == []
+
+
+class TestCoordinatorFused:
+    """Coordinator hands bars to the processor inline when fused."""
+
+    @pytest.fixture
+    def coordinator(self):
+        coordinator = SessionCoordinator.__new__(SessionCoordinator)
+        coordinator._system_manager = MagicMock()
+        coordinator._system_manager.mode.value = "backtest"
+        coordinator._system_manager.session_config.backtest_config.speed_multiplier = 0
+        coordinator._system_manager.session_config.backtest_config.fused = True
+        coordinator.session_data = SessionData()
+        coordinator._bar_queues = {("AAPL", "1m"): deque(make_bars(3))}
+        coordinator._queue_heap = None
+        coordinator._symbol_check_counters = {"AAPL": 0}
+        coordinator.indicator_manager = None
+        coordinator.data_processor = MagicMock()
+        coordinator.quality_manager = None
+        return coordinator
+
+    def test_bars_processed_inline(self, coordinator):
+        assert coordinator._process_queue_data_at_timestamp(datetime(2025, 1, 2, 10, 0)) == 3
+
+        assert coordinator.data_processor.process_batch_inline.call_count == 3
+        coordinator.data_processor.notify_batch_available.assert_not_called()
+
+    def test_only_data_driven(self, coordinator):
+        assert coordinator._is_fused_pipeline()
+        coordinator.session_config.backtest_config.speed_multiplier = 60
+        assert not coordinator._is_fused_pipeline()
+        coordinator.session_config.backtest_config.speed_multiplier = 0
+        coordinator._system_manager.mode.value = "live"
+        assert not coordinator._is_fused_pipeline()
+
+
+class TestFusedConfig:
+    """backtest_config.fused parsing and validation."""
+
+    def test_requires_data_driven(self):
+        config = BacktestConfig(start_date="2025-01-02", end_date="2025-01-03", speed_multiplier=60, fused=True)
+        with pytest.raises(ValueError, match="fused"):
+            config.validate()
+
+    def test_round_trip(self):
+        path = Path(__file__).parents[2] / "session_configs" / "example_session.json"
+        data = json.loads(path.read_text())
+        data["backtest_config"].update(speed_multiplier=0, fused=True)
+
+        config = SessionConfig.from_dict(data)
+        assert config.backtest_config.fused is True
+        assert config.to_dict()["backtest_config"]["fused"] is True
@@ -0,0 +1,149 @@
+"""Unit Tests for Rolling Historical Windows
+
+Verifies SessionCoordinator carries the trailing historical window across
+session teardown, evicts dates that fell out of it and reads only the new
+dates, ending with the same bars as a cold load.
+"""
+import pytest
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+
+from app.managers.data_manager.session_data import SessionData, HistoricalBarIntervalData
+from app.models.trading import BarData
+from app.threads.session_coordinator import SessionCoordinator
+
+
+TRADING_DAYS = [date(2025, 1, 2) + timedelta(days=i) for i in range(10)]
+
+
+def daily_bar(symbol, day):
+    return BarData(
+        symbol=symbol,
+        interval="1d",
+        timestamp=datetime(day.year, day.month, day.day),
+        open=100.0, high=101.0, low=99.0, close=100.0 + day.day, volume=1000 * day.day
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_database():
+    with patch("app.threads.session_coordinator.SessionLocal", MagicMock()):
+        yield
+
+
+@pytest.fixture
+def coordinator():
+    """Bare coordinator with just the state historical loading touches."""
+    coordinator = SessionCoordinator.__new__(SessionCoordinator)
+    coordinator._system_manager = Mock()
+    coordinator._system_manager.session_config.session_data_config.symbols = ["AAPL", "MSFT"]
+    coordinator.session_data = SessionData()
+    coordinator._historical_windows = {}
+    coordinator._historical_carry = {}
+
+    def start_date_for(end_date, trailing_days):
+        days = [day for day in TRADING_DAYS if day <= end_date]
+        return days[-trailing_days]
+
+    coordinator._get_start_date_for_trailing_days = start_date_for
+
+    coordinator.reads = []
+
+    def read_multi(symbols, interval, start, end):
+        coordinator.reads.append((tuple(symbols), start, end))
+        return {
+            symbol.upper(): [daily_bar(symbol.upper(), day) for day in TRADING_DAYS if start <= day <= end]
+            for symbol in symbols
+        }
+
+    coordinator._load_historical_bars_multi = read_multi
+    return coordinator
+
+
+def hist_config(trailing_days=3):
+    return SimpleNamespace(trailing_days=trailing_days, intervals=["1d"], apply_to="all")
+
+
+def load_day(coordinator, session_date, config=None):
+    """Teardown (carry windows) then load one session's historical data."""
+    coordinator._historical_carry = coordinator._historical_windows
+    coordinator._historical_windows = {}
+    coordinator.session_data.clear()
+    for symbol in coordinator.session_config.session_data_config.symbols:
+        coordinator.session_data.register_symbol(symbol)
+    coordinator._load_historical_data_config(config or hist_config(), session_date)
+    coordinator._historical_carry = {}
+
+
+def stored(coordinator, symbol):
+    data = coordinator.session_data.get_symbol_data(symbol, internal=True).historical.bars["1d"]
+    return {day: [bar.close for bar in bars] for day, bars in data.data_by_date.items()}
+
+
+class TestRollingWindow:
+    """Carried windows roll forward by one day."""
+
+    def test_only_new_day_read(self, coordinator):
+        load_day(coordinator, TRADING_DAYS[4])
+        assert coordinator.reads == [(("AAPL", "MSFT"), TRADING_DAYS[1], TRADING_DAYS[3])]
+
+        load_day(coordinator, TRADING_DAYS[5])
+        assert coordinator.reads[-1] == (("AAPL", "MSFT"), TRADING_DAYS[4], TRADING_DAYS[4])
+        assert sorted(stored(coordinator, "AAPL")) == TRADING_DAYS[2:5]
+
+    def test_rolled_matches_cold_load(self, coordinator):
+        for day in TRADING_DAYS[4:8]:
+            load_day(coordinator, day)
+        rolled = stored(coordinator, "MSFT")
+
+        coordinator._historical_windows = {}
+        load_day(coordinator, TRADING_DAYS[7])
+        assert coordinator.reads[-1][1:] == (TRADING_DAYS[4], TRADING_DAYS[6])
+        assert stored(coordinator, "MSFT") == rolled
+
+    def test_added_symbol_read_in_full(self, coordinator):
+        load_day(coordinator, TRADING_DAYS[4])
+        coordinator.session_config.session_data_config.symbols = ["AAPL", "MSFT", "TSLA"]
+
+        load_day(coordinator, TRADING_DAYS[5])
+        assert (("TSLA",), TRADING_DAYS[2], TRADING_DAYS[4]) in coordinator.reads
+        assert (("AAPL", "MSFT"), TRADING_DAYS[4], TRADING_DAYS[4]) in coordinator.reads
+
+    def test_removed_symbol_dropped(self, coordinator):
+        load_day(coordinator, TRADING_DAYS[4])
+        coordinator.session_config.session_data_config.symbols = ["AAPL"]
+
+        load_day(coordinator, TRADING_DAYS[5])
+        assert set(coordinator._historical_windows) == {("AAPL", "1d", 3)}
+
+    def test_longer_window_reloads(self, coordinator):
+        load_day(coordinator, TRADING_DAYS[4])
+
+        load_day(coordinator, TRADING_DAYS[5], hist_config(trailing_days=5))
+        assert coordinator.reads[-1] == (("AAPL", "MSFT"), TRADING_DAYS[0], TRADING_DAYS[4])
+
+
+class TestDailyStats:
+    """Per-day totals cached on the window."""
+
+    def test_field_total_and_eviction(self):
+        data = HistoricalBarIntervalData()
+        for day in TRADING_DAYS[:3]:
+            data.data_by_date[day] = [daily_bar("AAPL", day)]
+
+        assert data.field_total(TRADING_DAYS[0], "volume") == (2000, 1)
+        data.data_by_date[TRADING_DAYS[0]].append(daily_bar("AAPL", TRADING_DAYS[0]))
+        assert data.field_total(TRADING_DAYS[0], "volume") == (4000, 2)
+
+        assert data.evict_before(TRADING_DAYS[2]) == 2
+        assert list(data.data_by_date) == [TRADING_DAYS[2]]
+        assert list(data.day_stats) == []
+
+    def test_daily_average_over_rolled_window(self, coordinator):
+        for day in TRADING_DAYS[4:7]:
+            load_day(coordinator, day)
+
+        average = coordinator._calculate_daily_average("AAPL", "volume", 3)
+        assert average == 1000 * sum(day.day for day in TRADING_DAYS[3:6]) / 3
+        assert coordinator._calculate_daily_average("AAPL", "vwap", 3) == 0.0
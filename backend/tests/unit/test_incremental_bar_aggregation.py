@@ -0,0 +1,181 @@
+"""Unit Tests for Incremental Derived-Bar Aggregation
+
+Verifies IncrementalBarAggregator (and DataProcessor's use of it) produces
+exactly the same derived bars as BarAggregator in FIXED_CHUNK mode.
+"""
+import pytest
+from collections import deque
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+from app.models.trading import BarData
+from app.managers.data_manager.bar_aggregation import (
+    BarAggregator,
+    AggregationMode,
+    IncrementalBarAggregator,
+)
+from app.managers.data_manager.session_data import (
+    SessionData,
+    SymbolSessionData,
+    BarIntervalData,
+)
+from app.threads.data_processor import DataProcessor
+
+
+def make_bars(minutes, symbol="AAPL", start=datetime(2025, 1, 2, 9, 30)):
+    """Create 1m bars at the given minute offsets from start."""
+    bars = []
+    for m in minutes:
+        price = 100.0 + (m % 7) - (m % 3) * 0.5
+        bars.append(BarData(
+            symbol=symbol,
+            timestamp=start + timedelta(minutes=m),
+            open=price,
+            high=price + 1.0 + (m % 4) * 0.25,
+            low=price - 1.0 - (m % 5) * 0.2,
+            close=price + 0.3,
+            volume=1000 + m * 10
+        ))
+    return bars
+
+
+def batch_aggregate(bars, target):
+    """Reference output from the batch aggregator."""
+    aggregator = BarAggregator("1m", target, None, AggregationMode.FIXED_CHUNK)
+    return aggregator.aggregate(bars, require_complete=True, check_continuity=True)
+
+
+def incremental_aggregate(bars, target):
+    """Feed bars one at a time through the incremental aggregator."""
+    aggregator = IncrementalBarAggregator("1m", target)
+    result = []
+    for bar in bars:
+        derived = aggregator.add_bar(bar)
+        if derived is not None:
+            result.append(derived)
+    return result
+
+
+def as_tuples(bars):
+    return [(b.timestamp, b.open, b.high, b.low, b.close, b.volume) for b in bars]
+
+
+class TestIncrementalBarAggregatorParity:
+    """Incremental output must equal BarAggregator FIXED_CHUNK output."""
+
+    @pytest.mark.parametrize("target", ["5m", "15m", "30m", "60m"])
+    def test_full_session(self, target):
+        """Contiguous 390-bar session."""
+        bars = make_bars(range(390))
+        assert as_tuples(incremental_aggregate(bars, target)) == \
+            as_tuples(batch_aggregate(bars, target))
+
+    @pytest.mark.parametrize("target", ["5m", "15m"])
+    def test_with_gaps(self, target):
+        """Missing bars drop the affected windows only."""
+        minutes = [m for m in range(120) if m not in (7, 8, 33, 61, 62, 63, 100)]
+        bars = make_bars(minutes)
+        assert as_tuples(incremental_aggregate(bars, target)) == \
+            as_tuples(batch_aggregate(bars, target))
+
+    def test_unaligned_start(self):
+        """Session starting mid-window never emits the partial window."""
+        bars = make_bars(range(3, 40))
+        result = incremental_aggregate(bars, "5m")
+        assert as_tuples(result) == as_tuples(batch_aggregate(bars, "5m"))
+        assert result[0].timestamp == datetime(2025, 1, 2, 9, 35)
+
+    def test_emits_when_window_closes(self):
+        """Derived bar is emitted on the last bar of its window, exactly once."""
+        aggregator = IncrementalBarAggregator("1m", "5m")
+        bars = make_bars(range(5))
+
+        for bar in bars[:4]:
+            assert aggregator.add_bar(bar) is None
+
+        derived = aggregator.add_bar(bars[4])
+        assert derived is not None
+        assert derived.timestamp == bars[0].timestamp
+        assert derived.open == bars[0].open
+        assert derived.close == bars[4].close
+        assert derived.high == max(b.high for b in bars)
+        assert derived.low == min(b.low for b in bars)
+        assert derived.volume == sum(b.volume for b in bars)
+
+    def test_duplicate_breaks_window(self):
+        """A repeated timestamp makes the window discontinuous."""
+        bars = make_bars([0, 1, 2, 2, 3, 4])
+        assert incremental_aggregate(bars, "5m") == []
+
+    def test_rejects_calendar_target(self):
+        """Daily/weekly targets need CALENDAR aggregation."""
+        with pytest.raises(ValueError):
+            IncrementalBarAggregator("1m", "1d")
+
+
+class TestDataProcessorDerivedBars:
+    """DataProcessor generates derived bars incrementally."""
+
+    @pytest.fixture
+    def processor(self):
+        session_data = SessionData()
+        symbol_data = SymbolSessionData(symbol="AAPL", base_interval="1m")
+        symbol_data.bars["1m"] = BarIntervalData(derived=False, base=None, data=deque())
+        symbol_data.bars["5m"] = BarIntervalData(derived=True, base="1m", data=[])
+        symbol_data.bars["15m"] = BarIntervalData(derived=True, base="1m", data=[])
+        session_data.register_symbol_data(symbol_data)
+
+        processor = DataProcessor(
+            session_data=session_data,
+            system_manager=MagicMock(),
+            metrics=MagicMock()
+        )
+        return processor, symbol_data
+
+    def test_streaming_matches_batch(self, processor):
+        """Bar-by-bar processing yields the batch result."""
+        processor, symbol_data = processor
+        bars = make_bars([m for m in range(90) if m != 22])
+
+        for bar in bars:
+            symbol_data.bars["1m"].data.append(bar)
+            processor._generate_derived_bars("AAPL")
+
+        for target in ("5m", "15m"):
+            assert as_tuples(symbol_data.bars[target].data) == \
+                as_tuples(batch_aggregate(bars, target))
+        assert symbol_data.bars["5m"].updated is True
+
+    def test_gap_fill_insert_replays(self, processor):
+        """Out-of-order insertion into base bars is picked up by replay."""
+        processor, symbol_data = processor
+        all_bars = make_bars(range(20))
+        missing = all_bars[7]
+
+        for bar in all_bars:
+            if bar is missing:
+                continue
+            symbol_data.bars["1m"].data.append(bar)
+            processor._generate_derived_bars("AAPL")
+
+        assert [b.timestamp for b in symbol_data.bars["5m"].data] == [
+            all_bars[0].timestamp, all_bars[10].timestamp, all_bars[15].timestamp
+        ]
+
+        # Gap filler inserts the missing bar in sorted position
+        symbol_data.bars["1m"].data = deque(all_bars)
+        processor._generate_derived_bars("AAPL")
+
+        timestamps = sorted(b.timestamp for b in symbol_data.bars["5m"].data)
+        assert timestamps == [b.timestamp for b in batch_aggregate(all_bars, "5m")]
+
+    def test_teardown_resets_state(self, processor):
+        """New session after teardown starts from an empty cursor."""
+        processor, symbol_data = processor
+        for bar in make_bars(range(10)):
+            symbol_data.bars["1m"].data.append(bar)
+            processor._generate_derived_bars("AAPL")
+
+        processor.teardown()
+        assert processor._derived_cursors == {}
+        assert processor._derived_aggregators == {}
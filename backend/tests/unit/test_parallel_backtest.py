@@ -0,0 +1,188 @@
+"""Unit Tests for Parallel (Sharded) Backtests
+
+Covers trading-day sharding, PerformanceMetrics merging and the merge of
+per-shard results into one report. Worker processes themselves need a
+database and are exercised by running the backtest, not here.
+"""
+import pytest
+import threading
+from datetime import date, datetime, timedelta
+from unittest.mock import Mock, patch
+
+from app.monitoring.performance_metrics import PerformanceMetrics
+from app.managers.system_manager import reset_system_manager
+from app.managers.system_manager.api import SystemManager
+from app.managers.system_manager.parallel_backtest import (
+    BacktestShard,
+    ShardResult,
+    plan_backtest_shards,
+    merge_shard_results,
+    run_backtest_shard,
+)
+from app.threads.analysis_engine import Signal, SignalAction
+from app.threads.session_coordinator import SessionCoordinator
+
+
+def weekdays(start, count):
+    dates = []
+    current = start
+    while len(dates) < count:
+        if current.weekday() < 5:
+            dates.append(current)
+        current += timedelta(days=1)
+    return dates
+
+
+def make_signal(timestamp, symbol="AAPL"):
+    return Signal(
+        symbol=symbol,
+        action=SignalAction.BUY,
+        quantity=10,
+        price=100.0,
+        timestamp=timestamp,
+        strategy_name="test",
+        confidence=0.9,
+        interval="1m"
+    )
+
+
+def failing_coordinator():
+    """Coordinator thread whose loop fails loading its first session."""
+    coordinator = SessionCoordinator.__new__(SessionCoordinator)
+    threading.Thread.__init__(coordinator, name="SessionCoordinator", daemon=True)
+    coordinator._system_manager = None
+    coordinator._time_manager = Mock()
+    coordinator.metrics = PerformanceMetrics()
+    coordinator._stop_event = threading.Event()
+    coordinator._streams_validated = True
+    coordinator._session_count = 0
+    coordinator._error = None
+    coordinator._load_session_data = Mock(side_effect=RuntimeError("bar load failed"))
+    coordinator._cancel_queue_prefetch = Mock()
+    return coordinator
+
+
+def make_metrics(days, bars, durations):
+    metrics = PerformanceMetrics()
+    metrics.backtest_trading_days = days
+    metrics.increment_bars_processed(bars)
+    metrics.data_loading_initial = float(days)
+    for duration in durations:
+        metrics.analysis_engine.record(duration)
+    return metrics
+
+
+class TestPlanBacktestShards:
+    """Trading days split into contiguous, balanced shards."""
+
+    def test_even_contiguous_split(self):
+        dates = weekdays(date(2025, 1, 2), 252)
+        shards = plan_backtest_shards(dates, 8)
+
+        assert len(shards) == 8
+        assert [s.index for s in shards] == list(range(8))
+        assert sum(s.trading_days for s in shards) == 252
+        assert {s.trading_days for s in shards} == {31, 32}
+        assert shards[0].start_date == dates[0]
+        assert shards[-1].end_date == dates[-1]
+        for prev, nxt in zip(shards, shards[1:]):
+            assert prev.end_date < nxt.start_date
+
+    def test_more_shards_than_days(self):
+        dates = weekdays(date(2025, 1, 6), 3)
+        shards = plan_backtest_shards(dates, 16)
+        assert [(s.start_date, s.end_date) for s in shards] == [(d, d) for d in dates]
+
+    def test_empty_and_invalid(self):
+        assert plan_backtest_shards([], 4) == []
+        with pytest.raises(ValueError):
+            plan_backtest_shards(weekdays(date(2025, 1, 6), 3), 0)
+
+
+class TestMergeResults:
+    """Per-shard metrics and signals merge into one report."""
+
+    def test_metrics_merge(self):
+        merged = PerformanceMetrics()
+        merged.merge(make_metrics(3, 1000, [0.1, 0.3]))
+        merged.merge(make_metrics(2, 500, [0.05]))
+
+        stats = merged.analysis_engine.get_stats()
+        assert stats["count"] == 3
+        assert stats["min"] == 0.05
+        assert stats["max"] == 0.3
+        assert stats["avg"] == pytest.approx(0.15)
+        assert merged.get_bars_processed() == 1500
+        assert merged.backtest_trading_days == 5
+        assert merged.data_loading_initial == 3.0
+
+    def test_report_orders_shards_and_signals(self):
+        shard_a = BacktestShard(0, date(2025, 1, 2), date(2025, 1, 3), 2)
+        shard_b = BacktestShard(1, date(2025, 1, 6), date(2025, 1, 7), 2)
+        results = [
+            ShardResult(
+                shard=shard_b,
+                metrics=make_metrics(2, 780, [0.2]),
+                signals=[make_signal(datetime(2025, 1, 6, 10, 0))],
+                wall_time=4.0
+            ),
+            ShardResult(
+                shard=shard_a,
+                metrics=make_metrics(2, 780, [0.1]),
+                signals=[
+                    make_signal(datetime(2025, 1, 3, 9, 31)),
+                    make_signal(datetime(2025, 1, 2, 15, 0), symbol="MSFT"),
+                ],
+                wall_time=4.0
+            ),
+            ShardResult(shard=BacktestShard(2, date(2025, 1, 8), date(2025, 1, 8), 1), error="boom"),
+        ]
+
+        report = merge_shard_results(results, workers=3, wall_time=4.0)
+
+        assert [r.shard.index for r in report.shards] == [0, 1, 2]
+        assert [s.timestamp for s in report.signals] == [
+            datetime(2025, 1, 2, 15, 0),
+            datetime(2025, 1, 3, 9, 31),
+            datetime(2025, 1, 6, 10, 0),
+        ]
+        assert report.metrics.backtest_trading_days == 4
+        assert report.metrics.get_backtest_summary()["total_time"] == 4.0
+        assert [r.shard.index for r in report.failed_shards] == [2]
+        assert report.speedup == pytest.approx(2.0)
+        assert "FAILED (boom)" in report.format_report()
+
+
+class TestRunShard:
+    """Worker entry point never raises - failures come back as results."""
+
+    def test_missing_config_returns_error(self):
+        reset_system_manager()
+        try:
+            shard = BacktestShard(0, date(2025, 1, 2), date(2025, 1, 2), 1)
+            result = run_backtest_shard("does/not/exist.json", shard)
+        finally:
+            reset_system_manager()
+
+        assert not result.succeeded
+        assert "not found" in result.error
+        assert result.metrics is None
+
+    def test_coordinator_failure_fails_shard(self):
+        def start(system_mgr, *args, **kwargs):
+            system_mgr._coordinator = failing_coordinator()
+            system_mgr._coordinator.start()
+            return True
+
+        reset_system_manager()
+        try:
+            shard = BacktestShard(0, date(2025, 1, 2), date(2025, 1, 3), 2)
+            with patch.object(SystemManager, "start", autospec=True, side_effect=start):
+                result = run_backtest_shard("session_configs/example_session.json", shard)
+        finally:
+            reset_system_manager()
+
+        assert not result.succeeded
+        assert "bar load failed" in result.error
+        report = merge_shard_results([result], workers=1, wall_time=1.0)
+        assert report.failed_shards == [result]
@@ -0,0 +1,300 @@
+"""Unit Tests for Parameter Sweeps
+
+Covers grid expansion, building the side-by-side variant config, signal
+collection by strategy threads, AnalysisEngine variants and the
+per-variant results table. Running
+the sweep itself needs a database and is exercised end to end, not here.
+"""
+import math
+import pytest
+from collections import deque
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock, Mock
+
+from app.managers.data_manager.session_data import BarIntervalData, SessionData, SymbolSessionData
+from app.models.session_config import SessionConfig
+from app.models.trading import BarData
+from app.monitoring.performance_metrics import PerformanceMetrics
+from app.models.strategy_config import StrategyConfig
+from app.managers.system_manager.parallel_backtest import (
+    BacktestShard,
+    ShardResult,
+    merge_shard_results,
+)
+from app.managers.system_manager.parameter_sweep import (
+    ParameterSweepReport,
+    SweepVariant,
+    SweepVariantResult,
+    _require_sweepable,
+    analysis_engine_signal_records,
+    build_sweep_config,
+    expand_parameter_grid,
+    is_analysis_engine_strategy,
+    variant_strategy_configs,
+)
+from app.cli.system_commands import parse_sweep_value
+from app.strategies.base import Signal, SignalAction, SignalRecord
+from app.strategies.thread import StrategyThread
+from app.threads.analysis_engine import AnalysisEngine
+
+
+START = datetime(2025, 1, 2, 9, 30)
+
+
+def make_config(strategies):
+    return SessionConfig.from_dict({
+        "session_name": "Sweep Test",
+        "exchange_group": "US_EQUITY",
+        "asset_class": "EQUITY",
+        "mode": "backtest",
+        "backtest_config": {
+            "start_date": "2025-01-02",
+            "end_date": "2025-01-03",
+            "speed_multiplier": 0
+        },
+        "session_data_config": {
+            "symbols": ["AAPL"],
+            "streams": ["1m"],
+            "strategies": strategies
+        },
+        "trading_config": {
+            "max_buying_power": 100000.0,
+            "max_per_trade": 10000.0,
+            "max_per_symbol": 20000.0,
+            "max_open_positions": 5
+        },
+        "api_config": {"data_api": "alpaca", "trade_api": "alpaca"}
+    })
+
+
+def record(action, price, minutes, name="ma_v0", symbol="AAPL", quantity=None):
+    return SignalRecord(
+        strategy_name=name,
+        timestamp=START + timedelta(minutes=minutes),
+        interval="5m",
+        signal=Signal(symbol=symbol, action=action, quantity=quantity),
+        price=price
+    )
+
+
+class TestGridExpansion:
+    """Cartesian product of parameter values."""
+
+    def test_expand(self):
+        combos = expand_parameter_grid({"fast": [5, 10], "slow": [20, 30, 40]})
+        assert len(combos) == 6
+        assert combos[0] == {"fast": 5, "slow": 20}
+        assert combos[1] == {"fast": 5, "slow": 30}
+        assert combos[-1] == {"fast": 10, "slow": 40}
+
+    def test_invalid_grid(self):
+        with pytest.raises(ValueError):
+            expand_parameter_grid({})
+        with pytest.raises(ValueError):
+            expand_parameter_grid({"fast": []})
+
+    def test_cli_values(self):
+        assert [parse_sweep_value(v) for v in "10,0.5,true,5m".split(",")] == [10, 0.5, True, "5m"]
+
+
+class TestBuildSweepConfig:
+    """Target strategy replaced by one named instance per combination."""
+
+    def test_variants_replace_target(self):
+        config = make_config([
+            {"module": "strategies.examples.simple_ma_cross",
+             "config": {"symbols": ["AAPL"], "fast_period": 10, "slow_period": 20}},
+            {"module": "strategies.examples.other", "enabled": False},
+        ])
+
+        sweep_config, target, variants = build_sweep_config(
+            config, {"fast_period": [5, 8], "slow_period": [30]}
+        )
+        sweep_config.validate()
+
+        strategies = sweep_config.session_data_config.strategies
+        assert [s.instance_name for s in strategies] == [
+            "simple_ma_cross_v0", "simple_ma_cross_v1", "other"
+        ]
+        assert strategies[1].config == {"symbols": ["AAPL"], "fast_period": 8, "slow_period": 30}
+        assert [v.params for v in variants] == [
+            {"fast_period": 5, "slow_period": 30},
+            {"fast_period": 8, "slow_period": 30},
+        ]
+        # Base config untouched
+        assert len(config.session_data_config.strategies) == 2
+        assert target.config["fast_period"] == 10
+
+    def test_target_must_be_unique(self):
+        config = make_config([
+            {"module": "strategies.a", "config": {}},
+            {"module": "strategies.b", "config": {}},
+        ])
+        with pytest.raises(ValueError):
+            build_sweep_config(config, {"x": [1]})
+
+        _, target, _ = build_sweep_config(config, {"x": [1]}, strategy="strategies.b")
+        assert target.module == "strategies.b"
+
+    def test_analysis_engine_targets(self):
+        config = make_config([{"module": "strategies.examples.simple_ma_cross", "config": {}}])
+        for name in ("sma_crossover", "app.strategies.sma_crossover"):
+            sweep_config, target, variants = build_sweep_config(config, {"fast_period": [5, 8]}, strategy=name)
+            assert target.module == "app.strategies.sma_crossover"
+            assert is_analysis_engine_strategy(target)
+            # Variants run in the AnalysisEngine, not as StrategyManager strategies
+            assert [s.module for s in sweep_config.session_data_config.strategies] == [
+                "strategies.examples.simple_ma_cross"
+            ]
+            assert [(c.instance_name, c.config) for c in variant_strategy_configs(target, variants)] == [
+                ("sma_crossover_v0", {"fast_period": 5}),
+                ("sma_crossover_v1", {"fast_period": 8}),
+            ]
+
+        _require_sweepable("app.strategies.rsi_strategy")
+        _require_sweepable("strategies.examples.simple_ma_cross")
+        with pytest.raises(ValueError):
+            _require_sweepable("strategies.missing")
+
+    def test_analysis_engine_base_config_from_session(self):
+        config = make_config([
+            {"module": "strategies.examples.simple_ma_cross", "config": {}},
+            {"module": "app.strategies.rsi_strategy", "enabled": False, "config": {"intervals": ["1m"]}},
+        ])
+        sweep_config, target, variants = build_sweep_config(config, {"period": [7, 14]}, strategy="rsi_strategy")
+        sweep_config.validate()
+
+        assert [s.module for s in sweep_config.session_data_config.strategies] == [
+            "strategies.examples.simple_ma_cross"
+        ]
+        assert [c.config for c in variant_strategy_configs(target, variants)] == [
+            {"intervals": ["1m"], "period": 7},
+            {"intervals": ["1m"], "period": 14},
+        ]
+        assert all(c.enabled for c in variant_strategy_configs(target, variants))
+
+    def test_strategy_name_from_config(self):
+        config = make_config([{"module": "strategies.a", "name": "custom"}])
+        assert config.session_data_config.strategies[0].instance_name == "custom"
+        with pytest.raises(ValueError):
+            StrategyConfig(module="strategies.a", name="").validate()
+
+
+class TestSignalCollection:
+    """StrategyThread stamps signals with session time and price."""
+
+    def test_record_signals(self):
+        strategy = Mock()
+        strategy.name = "ma_v0"
+        context = Mock()
+        context.get_current_time.return_value = START
+        context.get_bars.return_value = [Mock(close=101.5)]
+
+        thread = StrategyThread(strategy=strategy, context=context, mode="data-driven")
+        thread._record_signals("AAPL", "5m", [
+            Signal(symbol="AAPL", action=SignalAction.BUY),
+            Signal(symbol="AAPL", action=SignalAction.SELL, price=99.0),
+        ])
+
+        records = thread.get_signals()
+        assert [(r.strategy_name, r.timestamp, r.price) for r in records] == [
+            ("ma_v0", START, 101.5),
+            ("ma_v0", START, 99.0),
+        ]
+
+
+class TestSweepResults:
+    """Per-variant P&L and the ranked results table."""
+
+    def test_long_only_pnl(self):
+        variant = SweepVariant(name="ma_v0", params={"fast": 5})
+        result = SweepVariantResult.from_signals(variant, [
+            record(SignalAction.BUY, 100.0, 0, quantity=10),
+            record(SignalAction.BUY, 102.0, 5),            # Already long - ignored
+            record(SignalAction.SELL, 103.0, 10),          # +30
+            record(SignalAction.SELL, 101.0, 15),          # Flat - ignored
+            record(SignalAction.BUY, 50.0, 20, symbol="MSFT"),
+            record(SignalAction.HOLD, 48.0, 25, symbol="MSFT"),  # Marked at 48: -2
+        ])
+
+        assert (result.signals, result.buys, result.sells) == (6, 3, 2)
+        assert result.round_trips == 2
+        assert result.net_pnl == pytest.approx(28.0)
+
+    def test_signals_merged_across_shards(self):
+        shard_a = BacktestShard(0, date(2025, 1, 2), date(2025, 1, 2), 1)
+        shard_b = BacktestShard(1, date(2025, 1, 3), date(2025, 1, 3), 1)
+        backtest = merge_shard_results([
+            ShardResult(shard=shard_b, strategy_signals={
+                "ma_v0": [record(SignalAction.SELL, 105.0, 24 * 60)],
+                "ma_v1": [],
+            }),
+            ShardResult(shard=shard_a, strategy_signals={
+                "ma_v0": [record(SignalAction.BUY, 100.0, 0)],
+                "ma_v1": [record(SignalAction.BUY, 100.0, 0, name="ma_v1"),
+                          record(SignalAction.SELL, 99.0, 30, name="ma_v1")],
+            }),
+        ], workers=2, wall_time=1.0)
+
+        variants = [SweepVariant("ma_v0", {"fast": 5}), SweepVariant("ma_v1", {"fast": 10})]
+        report = ParameterSweepReport(
+            strategy="strategies.ma",
+            results=[
+                SweepVariantResult.from_signals(v, backtest.strategy_signals[v.name])
+                for v in variants
+            ],
+            backtest=backtest
+        )
+
+        assert [r.net_pnl for r in report.results] == [5.0, -1.0]
+        assert [r.variant.name for r in report.ranked()] == ["ma_v0", "ma_v1"]
+        assert "ma_v1: pnl=-1.00" in report.format_report()
+
+
+class TestAnalysisEngineSweep:
+    """AnalysisEngine runs one strategy instance per variant."""
+
+    def test_sma_crossover_variants(self):
+        session_data = SessionData()
+        symbol_data = SymbolSessionData(symbol="AAPL", base_interval="1m")
+        symbol_data.bars["1m"] = BarIntervalData(derived=False, base=None, data=deque())
+        session_data.register_symbol_data(symbol_data)
+        session_data.activate_session()
+
+        system_manager = MagicMock()
+        system_manager.mode.value = "backtest"
+        system_manager.session_config.backtest_config.speed_multiplier = 0
+        engine = AnalysisEngine(session_data, system_manager, PerformanceMetrics())
+
+        config = make_config([
+            {"module": "app.strategies.sma_crossover", "enabled": False, "config": {"intervals": ["1m"]}},
+        ])
+        _, target, variants = build_sweep_config(
+            config, {"fast_period": [2, 3], "slow_period": [6, 10]}, strategy="sma_crossover"
+        )
+        engine.load_strategies(variant_strategy_configs(target, variants))
+        assert [s.name for s in engine._strategies] == [v.name for v in variants]
+        assert [(s.fast_period, s.slow_period) for s in engine._strategies] == [(2, 6), (2, 10), (3, 6), (3, 10)]
+
+        for i in range(120):
+            close = 100.0 + 5.0 * math.sin(i / 7.0) + 1.5 * math.sin(i / 2.3) + 0.05 * i
+            symbol_data.bars["1m"].data.append(BarData(
+                symbol="AAPL", timestamp=START + timedelta(minutes=i),
+                open=close, high=close + 0.5, low=close - 0.5, close=close, volume=1000
+            ))
+            engine.process_notification("AAPL", "1m", "bars")
+
+        signals = analysis_engine_signal_records(engine.get_signals())
+        results = [SweepVariantResult.from_signals(v, signals.get(v.name, [])) for v in variants]
+
+        assert all(result.signals > 0 for result in results)
+        assert len({(r.signals, round(r.net_pnl, 6)) for r in results}) == len(variants)
+        assert all(
+            record.signal.action in (SignalAction.BUY, SignalAction.SELL)
+            for records in signals.values() for record in records
+        )
+
+    def test_unknown_module_class(self):
+        engine = AnalysisEngine(SessionData(), MagicMock(), PerformanceMetrics())
+        with pytest.raises(ValueError):
+            engine.load_strategies([StrategyConfig(module="strategies.examples.simple_ma_cross")])
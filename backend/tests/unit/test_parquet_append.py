@@ -0,0 +1,127 @@
+"""Unit Tests for Append-Only Parquet Writes
+
+Verifies write_bars/write_quotes(append=True) add delta files instead of
+rewriting the day file, readers merge deltas (later rows win), and
+compaction folds deltas back into the canonical file.
+"""
+import pytest
+from datetime import date, datetime, timedelta
+from unittest.mock import Mock, patch
+from zoneinfo import ZoneInfo
+
+from app.managers.data_manager.parquet_storage import ParquetStorage
+
+
+ET = ZoneInfo("America/New_York")
+
+
+@pytest.fixture(autouse=True)
+def mock_system_manager():
+    """ParquetStorage asks SystemManager for the exchange timezone."""
+    mock_sys_mgr = Mock()
+    mock_sys_mgr.timezone = "America/New_York"
+    with patch('app.managers.system_manager.get_system_manager', return_value=mock_sys_mgr):
+        yield mock_sys_mgr
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return ParquetStorage(base_path=str(tmp_path), exchange_group="US_EQUITY")
+
+
+def minute_bars(first, count, close=100.5, day=date(2025, 7, 1)):
+    start = datetime(day.year, day.month, day.day, 9, 30, tzinfo=ET)
+    return [
+        {
+            "symbol": "AAPL",
+            "timestamp": start + timedelta(minutes=first + i),
+            "open": 100.0, "high": 101.0, "low": 99.0, "close": close, "volume": 1000,
+        }
+        for i in range(count)
+    ]
+
+
+class TestAppendWrites:
+    """Appends write deltas and never touch the canonical file."""
+
+    def test_append_writes_delta(self, storage):
+        _, (canonical,) = storage.write_bars(minute_bars(0, 100), "1m", "AAPL")
+        before = canonical.stat()
+
+        written, (delta,) = storage.write_bars(minute_bars(100, 5), "1m", "AAPL", append=True)
+
+        assert written == 5
+        assert delta.name == "01.parquet.delta-000001"
+        assert canonical.stat().st_mtime_ns == before.st_mtime_ns
+        assert canonical.stat().st_size == before.st_size
+
+        _, (second,) = storage.write_bars(minute_bars(105, 5), "1m", "AAPL", append=True)
+        assert second.name == "01.parquet.delta-000002"
+        assert len(storage.read_bars("1m", "AAPL")) == 110
+
+    def test_append_without_file_writes_canonical(self, storage):
+        _, (path,) = storage.write_bars(minute_bars(0, 10), "1m", "AAPL", append=True)
+        assert path.name == "01.parquet"
+
+    def test_read_dedups_later_rows_win(self, storage):
+        storage.write_bars(minute_bars(0, 10, close=100.5), "1m", "AAPL")
+        storage.write_bars(minute_bars(5, 10, close=100.9), "1m", "AAPL", append=True)
+
+        df = storage.read_bars("1m", "AAPL", start_date=datetime(2025, 7, 1), end_date=datetime(2025, 7, 1))
+        assert len(df) == 15
+        assert df["timestamp"].is_monotonic_increasing
+        assert df["close"].tolist() == [100.5] * 5 + [100.9] * 10
+
+    def test_overwrite_drops_pending_deltas(self, storage):
+        storage.write_bars(minute_bars(0, 10), "1m", "AAPL")
+        _, (delta,) = storage.write_bars(minute_bars(10, 10), "1m", "AAPL", append=True)
+
+        storage.write_bars(minute_bars(0, 3), "1m", "AAPL")
+        assert not delta.exists()
+        assert len(storage.read_bars("1m", "AAPL")) == 3
+        assert storage.count_bars("1m", "AAPL") == 3
+
+
+class TestCompaction:
+    """Deltas folded into the canonical file."""
+
+    def test_compact(self, storage):
+        _, (canonical,) = storage.write_bars(minute_bars(0, 10), "1m", "AAPL")
+        storage.write_bars(minute_bars(5, 10, close=100.9), "1m", "AAPL", append=True)
+        storage.write_bars(minute_bars(15, 5), "1m", "AAPL", append=True)
+        expected = storage.read_bars("1m", "AAPL")
+
+        assert storage.compact("5m") == 0
+        assert storage.compact("1m", "aapl") == 1
+        assert storage.get_delta_paths(canonical) == []
+        assert storage.read_bars("1m", "AAPL").equals(expected)
+        assert storage.count_bars("1m", "AAPL") == 20
+        assert storage.compact() == 0
+
+    def test_auto_compact_at_threshold(self, storage):
+        storage.max_delta_files = 3
+        _, (canonical,) = storage.write_bars(minute_bars(0, 10), "1m", "AAPL")
+
+        storage.write_bars(minute_bars(10, 1), "1m", "AAPL", append=True)
+        storage.write_bars(minute_bars(11, 1), "1m", "AAPL", append=True)
+        assert len(storage.get_delta_paths(canonical)) == 2
+
+        storage.write_bars(minute_bars(12, 1), "1m", "AAPL", append=True)
+        assert storage.get_delta_paths(canonical) == []
+        assert storage.count_bars("1m", "AAPL") == 13
+
+    def test_quotes(self, storage):
+        def quotes(first, count):
+            return [
+                {"symbol": "AAPL", "timestamp": datetime(2025, 7, 1, 10, 0, tzinfo=ET) + timedelta(seconds=first + i),
+                 "bid_price": 100.0, "ask_price": 100.1}
+                for i in range(count)
+            ]
+
+        storage.write_quotes(quotes(0, 20), "AAPL")
+        _, (delta,) = storage.write_quotes(quotes(20, 5), "AAPL", append=True)
+        assert ".delta-" in delta.name
+        assert len(storage.read_quotes("AAPL")) == 25
+
+        assert storage.compact("quotes") == 1
+        assert storage.count_bars("quotes", "AAPL") == 25
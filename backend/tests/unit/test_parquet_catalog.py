@@ -0,0 +1,133 @@
+"""Unit Tests for the Parquet Dataset Catalog
+
+Verifies catalog answers (symbols, intervals, date ranges, row counts)
+match the parquet tree, stay current through write_bars/write_quotes,
+pick up files written outside ParquetStorage and survive a rebuild.
+"""
+import pytest
+from datetime import date, datetime, timedelta
+from unittest.mock import Mock, patch
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+from app.managers.data_manager.parquet_storage import ParquetStorage
+from app.managers.data_manager.parquet_catalog import ParquetCatalog, read_file_stats
+
+
+ET = ZoneInfo("America/New_York")
+
+
+@pytest.fixture(autouse=True)
+def mock_system_manager():
+    """ParquetStorage asks SystemManager for the exchange timezone."""
+    mock_sys_mgr = Mock()
+    mock_sys_mgr.timezone = "America/New_York"
+    with patch('app.managers.system_manager.get_system_manager', return_value=mock_sys_mgr):
+        yield mock_sys_mgr
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return ParquetStorage(base_path=str(tmp_path), exchange_group="US_EQUITY")
+
+
+def minute_bars(symbol, day, count=390):
+    start = datetime(day.year, day.month, day.day, 9, 30, tzinfo=ET)
+    return [
+        {
+            "symbol": symbol,
+            "timestamp": start + timedelta(minutes=i),
+            "open": 100.0, "high": 101.0, "low": 99.0, "close": 100.5, "volume": 1000,
+        }
+        for i in range(count)
+    ]
+
+
+def daily_bars(symbol, start, days):
+    return [
+        {
+            "symbol": symbol,
+            "timestamp": datetime(start.year, start.month, start.day, tzinfo=ET) + timedelta(days=i),
+            "open": 100.0, "high": 101.0, "low": 99.0, "close": 100.5, "volume": 1000,
+        }
+        for i in range(days)
+    ]
+
+
+class TestCatalogQueries:
+    """Catalog answers match the data written."""
+
+    def test_write_then_query(self, storage):
+        storage.write_bars(minute_bars("AAPL", date(2025, 7, 1)), "1m", "AAPL")
+        storage.write_bars(minute_bars("AAPL", date(2025, 7, 2), 200), "1m", "AAPL")
+        storage.write_bars(minute_bars("MSFT", date(2025, 7, 2)), "1m", "MSFT")
+        storage.write_bars(daily_bars("AAPL", date(2025, 1, 1), 60), "1d", "AAPL")
+
+        assert storage.get_available_symbols("1m") == ["AAPL", "MSFT"]
+        assert storage.get_available_intervals("aapl") == ["1d", "1m"]
+
+        start, end = storage.get_date_range("1m", "AAPL")
+        assert start == pd.Timestamp(datetime(2025, 7, 1, 9, 30, tzinfo=ET))
+        assert end == pd.Timestamp(datetime(2025, 7, 2, 12, 49, tzinfo=ET))
+
+        assert storage.count_bars("1m", "AAPL", date(2025, 7, 1), date(2025, 7, 2)) == 590
+        assert storage.count_bars("1m", "AAPL", date(2025, 7, 2), date(2025, 7, 2)) == 200
+        assert storage.count_bars("1m", "AAPL", date(2025, 7, 3), date(2025, 7, 9)) == 0
+        # Yearly 1d file straddles the range: only in-range rows count
+        assert storage.count_bars("1d", "AAPL", date(2025, 2, 1), date(2025, 2, 28)) == 28
+        assert storage.count_bars("1d", "AAPL") == 60
+
+    def test_append_updates_counts(self, storage):
+        storage.write_bars(minute_bars("AAPL", date(2025, 7, 1), 100), "1m", "AAPL")
+        storage.write_bars(minute_bars("AAPL", date(2025, 7, 1), 300), "1m", "AAPL", append=True)
+        assert storage.count_bars("1m", "AAPL", date(2025, 7, 1), date(2025, 7, 1)) == 300
+
+    def test_quotes(self, storage):
+        quotes = [
+            {"symbol": "AAPL", "timestamp": datetime(2025, 7, 1, 10, 0, tzinfo=ET) + timedelta(seconds=i),
+             "bid_price": 100.0, "ask_price": 100.1}
+            for i in range(50)
+        ]
+        storage.write_quotes(quotes, "AAPL")
+        assert "quotes" in storage.get_available_intervals("AAPL")
+        assert storage.get_available_symbols("quotes") == ["AAPL"]
+        assert storage.count_bars("quotes", "AAPL", date(2025, 7, 1), date(2025, 7, 1)) == 50
+
+
+class TestCatalogMaintenance:
+    """Out-of-band files, invalidation and rebuild."""
+
+    def test_footer_stats(self, storage):
+        _, paths = storage.write_bars(minute_bars("AAPL", date(2025, 7, 1)), "1m", "AAPL")
+        stats = read_file_stats(paths[0])
+        assert stats["row_count"] == 390
+        assert stats["start_date"] == stats["end_date"] == "2025-07-01"
+        assert stats["tz"] == "America/New_York"
+
+    def test_uncataloged_symbol_is_scanned(self, storage, tmp_path):
+        storage.write_bars(minute_bars("AAPL", date(2025, 7, 1)), "1m", "AAPL")
+        assert storage.get_date_range("1m", "AAPL")[0] is not None  # Catalog built
+
+        # Written outside ParquetStorage (e.g. a test backdoor)
+        path = tmp_path / "US_EQUITY" / "bars" / "1m" / "TSLA" / "2025" / "07" / "01.parquet"
+        path.parent.mkdir(parents=True)
+        pd.DataFrame(minute_bars("TSLA", date(2025, 7, 1), 10)).to_parquet(path, index=False)
+
+        assert storage.count_bars("1m", "TSLA", date(2025, 7, 1), date(2025, 7, 1)) == 10
+
+    def test_invalidate_and_rebuild(self, storage, tmp_path):
+        _, paths = storage.write_bars(minute_bars("AAPL", date(2025, 7, 1)), "1m", "AAPL")
+        storage.write_bars(minute_bars("AAPL", date(2025, 7, 2)), "1m", "AAPL")
+        assert storage.count_bars("1m", "AAPL") == 780
+
+        paths[0].unlink()
+        storage.catalog.invalidate("1m", "AAPL")
+        assert storage.count_bars("1m", "AAPL") == 390
+
+        # Lost catalog: a fresh one rebuilds itself from footers
+        storage.catalog.db_path.unlink()
+        fresh = ParquetCatalog(tmp_path / "US_EQUITY")
+        assert fresh.get_symbols("1m") == ["AAPL"]
+        assert fresh.count_rows("1m", "AAPL") == 390
+        assert storage.rebuild_catalog() == 1
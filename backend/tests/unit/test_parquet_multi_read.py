@@ -0,0 +1,105 @@
+"""Unit Tests for Multi-Symbol Batched Parquet Reads
+
+Verifies read_bars_multi() returns the same rows as per-symbol read_bars()
+calls, in long or per-symbol form, and DataManager.get_bars_multi()
+converts them to BarData.
+"""
+import pytest
+from datetime import date, datetime, timedelta
+from unittest.mock import Mock, patch
+from zoneinfo import ZoneInfo
+
+import pyarrow as pa
+
+from app.managers.data_manager.parquet_storage import ParquetStorage
+
+
+ET = ZoneInfo("America/New_York")
+SYMBOLS = ["AAPL", "MSFT", "TSLA"]
+
+
+@pytest.fixture(autouse=True)
+def mock_system_manager():
+    """ParquetStorage asks SystemManager for the exchange timezone."""
+    mock_sys_mgr = Mock()
+    mock_sys_mgr.timezone = "America/New_York"
+    with patch('app.managers.system_manager.get_system_manager', return_value=mock_sys_mgr):
+        yield mock_sys_mgr
+
+
+@pytest.fixture
+def storage(tmp_path):
+    storage = ParquetStorage(base_path=str(tmp_path), exchange_group="US_EQUITY")
+    for offset, symbol in enumerate(SYMBOLS):
+        for day in (date(2025, 7, 1), date(2025, 7, 2)):
+            storage.write_bars(minute_bars(symbol, day, close=100.0 + offset), "1m", symbol)
+    return storage
+
+
+def minute_bars(symbol, day, close=100.5, first_hour=9):
+    start = datetime(day.year, day.month, day.day, first_hour, 0, tzinfo=ET)
+    return [
+        {
+            "symbol": symbol,
+            "timestamp": start + timedelta(minutes=i),
+            "open": close, "high": close + 1, "low": close - 1, "close": close, "volume": 1000,
+        }
+        for i in range(120)
+    ]
+
+
+class TestReadBarsMulti:
+    """Batched reads match per-symbol reads."""
+
+    def test_long_table(self, storage):
+        table = storage.read_bars_multi("1m", ["tsla", "AAPL", "MSFT", "NOPE"], date(2025, 7, 1), date(2025, 7, 2))
+
+        assert isinstance(table, pa.Table)
+        assert table.num_rows == 3 * 240
+        assert table.column("symbol").to_pylist() == ["AAPL"] * 240 + ["MSFT"] * 240 + ["TSLA"] * 240
+
+    def test_by_symbol_matches_read_bars(self, storage):
+        tables = storage.read_bars_multi("1m", SYMBOLS, date(2025, 7, 2), date(2025, 7, 2), by_symbol=True, max_workers=2)
+
+        assert sorted(tables) == SYMBOLS
+        for symbol in SYMBOLS:
+            expected = storage.read_bars("1m", symbol, date(2025, 7, 2), date(2025, 7, 2))
+            assert tables[symbol].to_pandas().equals(expected)
+
+    def test_all_dates_and_deltas(self, storage):
+        storage.write_bars(minute_bars("AAPL", date(2025, 7, 1), close=150.0)[:10], "1m", "AAPL", append=True)
+
+        tables = storage.read_bars_multi("1m", ["AAPL"], by_symbol=True)
+        closes = tables["AAPL"].column("close").to_pylist()
+        assert len(closes) == 240
+        assert closes[:11] == [150.0] * 10 + [100.0]
+
+    def test_regular_hours_only(self, storage):
+        window = (datetime(2025, 7, 1, 9, 30, tzinfo=ET), datetime(2025, 7, 1, 10, 0, tzinfo=ET))
+        with patch.object(storage, "_regular_hours_table", return_value={date(2025, 7, 1): window}):
+            tables = storage.read_bars_multi(
+                "1m", SYMBOLS, date(2025, 7, 1), date(2025, 7, 1),
+                regular_hours_only=True, by_symbol=True
+            )
+
+        timestamps = tables["MSFT"].column("timestamp").to_pylist()
+        assert len(timestamps) == 31
+        assert timestamps[0] == window[0] and timestamps[-1] == window[1]
+
+    def test_no_files(self, storage):
+        assert storage.read_bars_multi("1m", ["NOPE"], by_symbol=True) == {}
+        assert storage.read_bars_multi("5m", SYMBOLS).num_rows == 0
+
+
+def test_data_manager_get_bars_multi(storage):
+    from app.managers.data_manager.api import DataManager
+
+    with patch("app.managers.data_manager.api.parquet_storage", storage):
+        bars = DataManager.get_bars_multi(
+            Mock(), None, ["aapl", "NOPE"], datetime(2025, 7, 1), datetime(2025, 7, 1, 23, 59), "1m"
+        )
+
+    assert bars["NOPE"] == []
+    assert len(bars["AAPL"]) == 120
+    assert bars["AAPL"][0].symbol == "AAPL" and bars["AAPL"][0].interval == "1m"
+    assert bars["AAPL"][0].timestamp == datetime(2025, 7, 1, 9, 0, tzinfo=ET)
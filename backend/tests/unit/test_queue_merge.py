@@ -0,0 +1,128 @@
+"""Unit Tests for Backtest Queue Merging
+
+Verifies SessionCoordinator advances through its (symbol, interval) bar
+queues with a heap-based k-way merge: bars come out in global timestamp
+order, and the heap stays consistent when queues are loaded, removed or
+trimmed.
+"""
+import pytest
+from collections import defaultdict, deque
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from app.models.trading import BarData
+from app.managers.data_manager.session_data import SessionData
+from app.threads.session_coordinator import SessionCoordinator
+
+
+START = datetime(2025, 1, 2, 9, 30)
+
+
+def make_bars(symbol, minutes, interval="1m"):
+    return [
+        BarData(
+            symbol=symbol,
+            interval=interval,
+            timestamp=START + timedelta(minutes=m),
+            open=100.0,
+            high=101.0,
+            low=99.0,
+            close=100.5,
+            volume=1000
+        )
+        for m in minutes
+    ]
+
+
+@pytest.fixture
+def coordinator():
+    """Bare coordinator with just the state queue processing touches."""
+    coordinator = SessionCoordinator.__new__(SessionCoordinator)
+    coordinator._system_manager = Mock()
+    coordinator._system_manager.mode.value = "backtest"
+    coordinator._system_manager.session_config.backtest_config.speed_multiplier = 0
+    coordinator._system_manager.session_config.backtest_config.fused = False
+    coordinator.session_data = SessionData()
+    coordinator._bar_queues = {}
+    coordinator._queue_heap = None
+    coordinator._symbol_check_counters = defaultdict(int)
+    coordinator.indicator_manager = None
+    coordinator.data_processor = Mock()
+    coordinator.quality_manager = None
+    return coordinator
+
+
+def processed(coordinator):
+    """(symbol, timestamp) notifications sent to the data processor."""
+    return [
+        (symbol, timestamp)
+        for c in coordinator.data_processor.notify_batch_available.call_args_list
+        for symbol, _, timestamp in c.args[0]
+    ]
+
+
+class TestQueueMerge:
+    """k-way merge over backtest queues."""
+
+    def test_next_timestamp_is_min_head(self, coordinator):
+        coordinator._bar_queues[("AAPL", "1m")] = deque(make_bars("AAPL", [3, 4]))
+        coordinator._bar_queues[("MSFT", "1m")] = deque(make_bars("MSFT", [1, 5]))
+        coordinator._bar_queues[("TSLA", "1m")] = deque()
+
+        assert coordinator._get_next_queue_timestamp() == START + timedelta(minutes=1)
+
+    def test_empty_queues(self, coordinator):
+        assert coordinator._get_next_queue_timestamp() is None
+        coordinator._bar_queues[("AAPL", "1m")] = deque()
+        assert coordinator._get_next_queue_timestamp() is None
+
+    def test_bars_come_out_in_timestamp_order(self, coordinator):
+        coordinator._bar_queues[("AAPL", "1m")] = deque(make_bars("AAPL", [0, 2, 4, 6]))
+        coordinator._bar_queues[("MSFT", "1m")] = deque(make_bars("MSFT", [1, 2, 3]))
+
+        # Clock-driven style: one call covering several minutes
+        count = coordinator._process_queue_data_at_timestamp(START + timedelta(minutes=4))
+
+        assert count == 6
+        assert processed(coordinator) == [
+            ("AAPL", START),
+            ("MSFT", START + timedelta(minutes=1)),
+            ("AAPL", START + timedelta(minutes=2)),
+            ("MSFT", START + timedelta(minutes=2)),
+            ("MSFT", START + timedelta(minutes=3)),
+            ("AAPL", START + timedelta(minutes=4)),
+        ]
+        assert coordinator._get_next_queue_timestamp() == START + timedelta(minutes=6)
+        assert len(coordinator.session_data.get_bars_ref("AAPL", internal=True)) == 3
+
+    def test_data_driven_loop_drains_all_queues(self, coordinator):
+        coordinator._bar_queues[("AAPL", "1m")] = deque(make_bars("AAPL", range(0, 30, 2)))
+        coordinator._bar_queues[("MSFT", "1m")] = deque(make_bars("MSFT", range(0, 30, 3)))
+
+        total = 0
+        while (next_timestamp := coordinator._get_next_queue_timestamp()) is not None:
+            total += coordinator._process_queue_data_at_timestamp(next_timestamp)
+
+        assert total == 25
+        timestamps = [ts for _, ts in processed(coordinator)]
+        assert timestamps == sorted(timestamps)
+        assert coordinator._queue_heap == []
+
+    def test_heap_resyncs_after_queue_changes(self, coordinator):
+        coordinator._bar_queues[("AAPL", "1m")] = deque(make_bars("AAPL", [0, 1, 2]))
+        assert coordinator._get_next_queue_timestamp() == START
+
+        # Queue replaced directly (e.g. reload for a pending symbol)
+        coordinator._bar_queues[("AAPL", "1m")] = deque(make_bars("AAPL", [5]))
+        assert coordinator._get_next_queue_timestamp() == START + timedelta(minutes=5)
+
+        # Pre-market trim invalidates the heap
+        coordinator._bar_queues[("MSFT", "1m")] = deque(make_bars("MSFT", [1, 7]))
+        coordinator._invalidate_queue_heap()
+        assert coordinator._get_next_queue_timestamp() == START + timedelta(minutes=1)
+        assert coordinator._drop_pre_market_data(START + timedelta(minutes=6)) == 2
+        assert coordinator._get_next_queue_timestamp() == START + timedelta(minutes=7)
+
+        # Removed queue
+        del coordinator._bar_queues[("MSFT", "1m")]
+        assert coordinator._get_next_queue_timestamp() is None
@@ -0,0 +1,133 @@
+"""Unit Tests for Backtest Queue Prefetch
+
+Verifies SessionCoordinator reads the next trading day's queue bars in
+the background and hands them over when that day's queues load, with the
+same queues as a synchronous load even when the symbol set changed.
+"""
+import threading
+import pytest
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock, Mock, patch
+
+from app.models.trading import BarData
+from app.threads.session_coordinator import SessionCoordinator
+
+
+DAY_1 = date(2025, 1, 2)
+DAY_2 = date(2025, 1, 3)
+
+
+def make_bars(symbol, day, count=3):
+    start = datetime(day.year, day.month, day.day, 9, 30)
+    return [
+        BarData(
+            symbol=symbol,
+            interval="1m",
+            timestamp=start + timedelta(minutes=i),
+            open=100.0, high=101.0, low=99.0, close=100.5, volume=1000
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def no_database():
+    with patch("app.threads.session_coordinator.SessionLocal", MagicMock()):
+        yield
+
+
+@pytest.fixture
+def coordinator():
+    """Bare coordinator with just the state queue loading touches."""
+    coordinator = SessionCoordinator.__new__(SessionCoordinator)
+    coordinator._system_manager = Mock()
+    coordinator._system_manager.mode.value = "backtest"
+    coordinator._system_manager.session_config.session_data_config.symbols = ["AAPL", "MSFT"]
+    coordinator._bar_queues = {}
+    coordinator._queue_heap = None
+    coordinator._queue_prefetch = None
+    coordinator._prefetch_executor = None
+    coordinator._stop_event = threading.Event()
+    coordinator._symbol_check_counters = defaultdict(int)
+    coordinator._get_streamed_intervals_for_symbol = lambda symbol: ["1m"]
+
+    coordinator.read_threads = []
+
+    def get_bars_multi(session, symbols, start, end, interval, regular_hours_only):
+        coordinator.read_threads.append((threading.current_thread().name, tuple(symbols)))
+        return {symbol.upper(): make_bars(symbol.upper(), start.date()) for symbol in symbols}
+
+    coordinator._data_manager = Mock()
+    coordinator._data_manager.get_bars_multi.side_effect = get_bars_multi
+
+    coordinator.today = DAY_1
+    coordinator._time_manager = Mock()
+    coordinator._time_manager.get_current_time.side_effect = (
+        lambda: datetime.combine(coordinator.today, datetime.min.time()).replace(hour=12)
+    )
+    coordinator._time_manager.get_next_trading_date.return_value = DAY_2
+    coordinator._time_manager.backtest_end_date = date(2025, 1, 10)
+
+    yield coordinator
+    coordinator._cancel_queue_prefetch(shutdown=True)
+
+
+def queue_contents(coordinator):
+    return {key: list(queue) for key, queue in coordinator._bar_queues.items()}
+
+
+class TestQueuePrefetch:
+    """Next day's bars are read in the background and handed over."""
+
+    def test_prefetch_used_for_next_day(self, coordinator):
+        coordinator._start_queue_prefetch()
+        assert coordinator._queue_prefetch.session_date == DAY_2
+        coordinator._queue_prefetch.future.result()
+
+        coordinator.today = DAY_2
+        coordinator._load_backtest_queues()
+
+        assert coordinator._queue_prefetch is None
+        assert len(coordinator.read_threads) == 1
+        assert coordinator.read_threads[0][0].startswith("queue-prefetch")
+        assert [b.timestamp.date() for b in coordinator._bar_queues[("AAPL", "1m")]] == [DAY_2] * 3
+
+    def test_added_symbol_matches_synchronous_load(self, coordinator):
+        coordinator._start_queue_prefetch()
+        coordinator.session_config.session_data_config.symbols = ["AAPL", "MSFT", "TSLA"]
+
+        coordinator.today = DAY_2
+        coordinator._load_backtest_queues()
+        prefetched = queue_contents(coordinator)
+
+        # Only the symbol the prefetch did not cover is read synchronously
+        assert coordinator.read_threads[-1] == (threading.current_thread().name, ("TSLA",))
+
+        coordinator._bar_queues = {}
+        coordinator._load_backtest_queues()
+        assert queue_contents(coordinator) == prefetched
+
+    def test_other_date_not_consumed(self, coordinator):
+        coordinator._start_queue_prefetch()
+        prefetch = coordinator._queue_prefetch
+
+        # Mid-session load on the current day reads synchronously
+        coordinator._load_backtest_queues(symbols=["AAPL"])
+        assert coordinator._queue_prefetch is prefetch
+
+    def test_no_prefetch_past_backtest_end(self, coordinator):
+        coordinator._time_manager.backtest_end_date = DAY_1
+        coordinator._start_queue_prefetch()
+        assert coordinator._queue_prefetch is None
+
+    def test_failed_prefetch_falls_back(self, coordinator):
+        coordinator._start_queue_prefetch()
+        coordinator._queue_prefetch.future.result()
+        failed = Mock()
+        failed.result.side_effect = OSError("disk")
+        coordinator._queue_prefetch.future = failed
+
+        coordinator.today = DAY_2
+        coordinator._load_backtest_queues()
+        assert len(coordinator._bar_queues[("MSFT", "1m")]) == 3
@@ -0,0 +1,122 @@
+"""Unit Tests for Regular-Hours Filtering
+
+Verifies TimeManager's cached per-date session-hours table and the
+vectorized multi-day regular-hours mask in ParquetStorage.read_bars().
+"""
+import pytest
+from datetime import date, datetime, time, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+from zoneinfo import ZoneInfo
+
+from app.managers.time_manager.api import TimeManager
+from app.managers.time_manager.models import MarketHoursConfig
+from app.managers.data_manager.parquet_storage import ParquetStorage
+
+
+ET = ZoneInfo("America/New_York")
+
+# 2025-07-03 closes early, 2025-07-04 is closed, 07-05/06 is a weekend
+HOLIDAYS = [
+    SimpleNamespace(date=date(2025, 7, 3), is_closed=False, early_close_time=time(13, 0)),
+    SimpleNamespace(date=date(2025, 7, 4), is_closed=True, early_close_time=None),
+]
+
+
+@pytest.fixture
+def time_manager():
+    with patch.object(TimeManager, "_load_market_hours_from_database"):
+        manager = TimeManager(system_manager=Mock(exchange_group="US_EQUITY", asset_class="EQUITY"))
+    manager._market_configs[("US_EQUITY", "EQUITY")] = MarketHoursConfig(
+        exchange="US_EQUITY",
+        asset_class="EQUITY",
+        timezone="America/New_York",
+        regular_open=time(9, 30),
+        regular_close=time(16, 0),
+    )
+    return manager
+
+
+@pytest.fixture
+def holiday_query():
+    with patch("app.models.database.SessionLocal", MagicMock()), \
+         patch("app.managers.time_manager.api.TradingCalendarRepository.get_holidays_in_range",
+               return_value=HOLIDAYS) as query:
+        yield query
+
+
+@pytest.fixture
+def storage(tmp_path, time_manager, holiday_query):
+    mock_sys_mgr = Mock()
+    mock_sys_mgr.timezone = "America/New_York"
+    mock_sys_mgr.get_time_manager.return_value = time_manager
+    with patch('app.managers.system_manager.get_system_manager', return_value=mock_sys_mgr):
+        yield ParquetStorage(base_path=str(tmp_path), exchange_group="US_EQUITY")
+
+
+def all_day_bars(day):
+    """Every 30 minutes from 04:00 to 20:00."""
+    start = datetime(day.year, day.month, day.day, 4, 0, tzinfo=ET)
+    return [
+        {
+            "symbol": "AAPL",
+            "timestamp": start + timedelta(minutes=30 * i),
+            "open": 100.0, "high": 101.0, "low": 99.0, "close": 100.5, "volume": 1000,
+        }
+        for i in range(33)
+    ]
+
+
+class TestRegularHoursTable:
+    """Per-date (open, close) table built from the trading calendar."""
+
+    def test_table(self, time_manager, holiday_query):
+        table = time_manager.get_regular_hours_table(date(2025, 7, 2), date(2025, 7, 7))
+
+        assert sorted(table) == [date(2025, 7, 2), date(2025, 7, 3), date(2025, 7, 7)]
+        assert table[date(2025, 7, 2)] == (
+            datetime(2025, 7, 2, 9, 30, tzinfo=ET), datetime(2025, 7, 2, 16, 0, tzinfo=ET)
+        )
+        assert table[date(2025, 7, 3)][1] == datetime(2025, 7, 3, 13, 0, tzinfo=ET)
+
+    def test_cached_per_year(self, time_manager, holiday_query):
+        time_manager.get_regular_hours_table(date(2025, 1, 1), date(2025, 3, 1))
+        time_manager.get_regular_hours_table(date(2025, 7, 1), date(2025, 7, 31))
+        assert holiday_query.call_count == 1
+
+        time_manager.get_regular_hours_table(date(2024, 12, 1), date(2025, 1, 5))
+        assert holiday_query.call_count == 2
+
+        time_manager.invalidate_cache()
+        time_manager.get_regular_hours_table(date(2025, 7, 1), date(2025, 7, 31))
+        assert holiday_query.call_count == 3
+
+
+class TestReadBarsRegularHours:
+    """Each day is filtered by its own session."""
+
+    def test_multi_day_filter(self, storage, holiday_query):
+        days = [date(2025, 7, 2), date(2025, 7, 3), date(2025, 7, 4), date(2025, 7, 5), date(2025, 7, 7)]
+        for day in days:
+            storage.write_bars(all_day_bars(day), "1m", "AAPL")
+
+        df = storage.read_bars("1m", "AAPL", date(2025, 7, 2), date(2025, 7, 7), regular_hours_only=True)
+        by_day = df.groupby(df["timestamp"].dt.date)["timestamp"]
+
+        # 09:30..16:00 = 14 half hours, early close 09:30..13:00 = 8
+        assert by_day.size().to_dict() == {date(2025, 7, 2): 14, date(2025, 7, 3): 8, date(2025, 7, 7): 14}
+        assert by_day.max()[date(2025, 7, 3)].time() == time(13, 0)
+
+        # Multi-symbol read applies the same mask
+        table = storage.read_bars_multi("1m", ["AAPL"], date(2025, 7, 2), date(2025, 7, 7), regular_hours_only=True)
+        assert table.num_rows == len(df)
+
+        # Calendar consulted once for the year, not per read
+        assert holiday_query.call_count == 1
+        assert len(storage.read_bars("1m", "AAPL", regular_hours_only=False)) == 5 * 33
+
+    def test_calendar_unavailable_keeps_all(self, storage):
+        storage.write_bars(all_day_bars(date(2025, 7, 2)), "1m", "AAPL")
+        with patch.object(storage, "_regular_hours_table", return_value=None):
+            df = storage.read_bars("1m", "AAPL", date(2025, 7, 2), date(2025, 7, 2), regular_hours_only=True)
+        assert len(df) == 33
@@ -0,0 +1,219 @@
+"""Unit Tests for SessionData Snapshots
+
+Verifies published snapshots are immutable while writers keep appending,
+inserting and clearing bars, that readers and exporters use them without
+SessionData._lock, and that DataProcessor publishes once per batch.
+"""
+import threading
+import pytest
+from collections import deque
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, Mock
+
+from app.indicators.base import IndicatorData
+from app.managers.data_manager.columnar_bars import ColumnarBarSeries
+from app.managers.data_manager.session_data import (
+    SessionData,
+    SymbolSessionData,
+    BarIntervalData,
+)
+from app.models.trading import BarData
+from app.monitoring.performance_metrics import PerformanceMetrics
+from app.strategies.base import StrategyContext
+from app.threads.data_processor import DataProcessor
+
+
+START = datetime(2025, 1, 2, 9, 30)
+
+
+def make_bar(symbol, minute, interval="1m"):
+    price = 100.0 + minute
+    return BarData(
+        symbol=symbol,
+        interval=interval,
+        timestamp=START + timedelta(minutes=minute),
+        open=price, high=price + 1, low=price - 1, close=price, volume=1000
+    )
+
+
+def make_session_data(symbols=("AAPL", "MSFT"), minutes=3):
+    session_data = SessionData()
+    for symbol in symbols:
+        symbol_data = SymbolSessionData(symbol=symbol, base_interval="1m")
+        symbol_data.bars["1m"] = BarIntervalData(
+            derived=False, base=None, data=deque(make_bar(symbol, i) for i in range(minutes)), quality=100.0
+        )
+        symbol_data.bars["5m"] = BarIntervalData(derived=True, base="1m", data=[])
+        session_data.register_symbol_data(symbol_data)
+    return session_data
+
+
+def closes(bars):
+    return [bar.close for bar in bars]
+
+
+def live(session_data, symbol="AAPL", interval="1m"):
+    return session_data.get_symbol_data(symbol, internal=True).bars[interval]
+
+
+class TestPublication:
+    """Publishing versions and epochs."""
+
+    def test_nothing_published(self):
+        session_data = make_session_data()
+        assert session_data.snapshot().epoch == 0
+        assert session_data.get_symbol_snapshot("AAPL") is None
+
+    def test_snapshot_ignores_later_appends(self):
+        session_data = make_session_data()
+        snapshot = session_data.publish_snapshots(timestamp=START).get("aapl")
+
+        live(session_data).data.append(make_bar("AAPL", 3))
+
+        bars = snapshot.get_bars("1m")
+        assert len(bars) == 3
+        assert closes(bars) == [100.0, 101.0, 102.0]
+        assert bars[-1].close == 102.0 and closes(bars[1:]) == [101.0, 102.0]
+        assert closes(reversed(bars)) == [102.0, 101.0, 100.0]
+        with pytest.raises(IndexError):
+            bars[3]
+
+        assert len(session_data.publish_snapshots(["AAPL"]).get("AAPL").get_bars(1)) == 4
+
+    def test_unlisted_symbols_keep_their_version(self):
+        session_data = make_session_data()
+        first = session_data.publish_snapshots(timestamp=START)
+
+        second = session_data.publish_snapshots(["AAPL"], START + timedelta(minutes=1))
+
+        assert (first.epoch, second.epoch) == (1, 2)
+        assert second.timestamp == START + timedelta(minutes=1)
+        assert second.get("AAPL").epoch == 2
+        assert second.get("MSFT") is first.get("MSFT")
+
+    def test_removed_symbol_is_retracted(self):
+        session_data = make_session_data()
+        session_data.publish_snapshots()
+
+        session_data.remove_symbol("MSFT")
+
+        assert session_data.get_symbol_snapshot("MSFT") is None
+        assert session_data.get_symbol_snapshot("AAPL") is not None
+
+    def test_indicator_values_are_copied(self):
+        session_data = make_session_data()
+        indicators = session_data.get_symbol_data("AAPL", internal=True).indicators
+        indicators["sma_3_1m"] = IndicatorData(
+            name="sma", type="session", interval="1m", current_value=101.0, last_updated=START, valid=True
+        )
+        snapshot = session_data.publish_snapshots().get("AAPL")
+
+        indicators["sma_3_1m"].current_value = 105.0
+
+        assert snapshot.get_indicator_value("sma_3_1m") == 101.0
+        assert snapshot.get_indicator_value("missing") is None
+
+
+class TestHistoryRewrites:
+    """Writers that rewrite history leave published snapshots intact."""
+
+    def test_gap_fill(self):
+        session_data = make_session_data(minutes=0)
+        live(session_data).data.extend(make_bar("AAPL", i) for i in (0, 2))
+        snapshot = session_data.publish_snapshots().get("AAPL")
+
+        session_data.add_bars_batch("AAPL", [make_bar("AAPL", 1)], insert_mode="gap_fill")
+
+        assert closes(snapshot.get_bars("1m")) == [100.0, 102.0]
+        assert closes(live(session_data).data) == [100.0, 101.0, 102.0]
+
+    def test_session_reset_republishes(self):
+        session_data = make_session_data()
+        snapshot = session_data.publish_snapshots().get("AAPL")
+
+        session_data.reset_session()
+
+        assert closes(snapshot.get_bars("1m")) == [100.0, 101.0, 102.0]
+        assert len(session_data.get_symbol_snapshot("AAPL").get_bars("1m")) == 0
+        assert isinstance(live(session_data).data, deque)
+
+    def test_columnar_copy_on_write(self):
+        series = ColumnarBarSeries((make_bar("AAPL", i) for i in range(4)), max_bars=4)
+        frozen = series.snapshot()
+
+        # Ring compaction and clear move the live series to fresh arrays
+        series.extend(make_bar("AAPL", i) for i in range(4, 12))
+        assert closes(frozen) == [100.0, 101.0, 102.0, 103.0]
+        assert frozen.closes.tolist() == [100.0, 101.0, 102.0, 103.0]
+        assert closes(series) == [108.0, 109.0, 110.0, 111.0]
+
+        frozen = series.snapshot()
+        series.clear()
+        series.append(make_bar("AAPL", 20))
+        assert closes(frozen) == [108.0, 109.0, 110.0, 111.0]
+
+        with pytest.raises(TypeError):
+            frozen.append(make_bar("AAPL", 21))
+
+
+class TestReaders:
+    """Readers use the published snapshot, without the lock."""
+
+    def test_strategy_context_reads_snapshot(self):
+        session_data = make_session_data()
+        context = StrategyContext(session_data=session_data, time_manager=Mock(), system_manager=None, mode="backtest")
+        assert len(context.get_bars("AAPL", "1m")) == 3  # Live data until published
+
+        session_data.publish_snapshots()
+        live(session_data).data.append(make_bar("AAPL", 3))
+        live(session_data).quality = 50.0
+
+        assert len(context.get_bars("AAPL", "1m")) == 3
+        assert context.get_bar_quality("AAPL", "1m") == 100.0
+        assert context.get_bars("AAPL", "15m") == ()
+
+    def test_export_does_not_take_lock(self):
+        session_data = make_session_data()
+        session_data.publish_snapshots()
+        live(session_data).data.append(make_bar("AAPL", 3))
+
+        # A writer holds the lock for the whole export
+        locked, release = threading.Event(), threading.Event()
+
+        def writer():
+            with session_data._lock:
+                locked.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        locked.wait(5)
+        try:
+            result, _ = session_data.to_json(complete=False)
+        finally:
+            release.set()
+            thread.join()
+
+        bars = result["symbols"]["AAPL"]["bars"]["1m"]
+        assert (bars["count"], bars["total_count"]) == (3, 3)
+        assert bars["quality"] == 100.0
+
+        # Delta export continues from the exported snapshot
+        session_data.publish_snapshots()
+        result, _ = session_data.to_json(complete=False)
+        assert result["symbols"]["AAPL"]["bars"]["1m"]["count"] == 1
+
+    def test_processor_publishes_per_batch(self):
+        session_data = make_session_data()
+        system_manager = MagicMock()
+        system_manager.mode.value = "backtest"
+        system_manager.session_config.backtest_config.speed_multiplier = 0
+        processor = DataProcessor(session_data, system_manager, PerformanceMetrics())
+        processor.set_coordinator_subscription(MagicMock())
+
+        processor._process_batch([("AAPL", "1m", START + timedelta(minutes=2))])
+
+        snapshot = session_data.snapshot()
+        assert snapshot.epoch == 1
+        assert snapshot.timestamp == START + timedelta(minutes=2)
+        assert list(snapshot.symbols) == ["AAPL"]
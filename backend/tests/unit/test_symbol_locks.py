@@ -0,0 +1,142 @@
+"""Unit Tests for Per-Symbol SessionData Locks
+
+Verifies work on one symbol is not blocked by a lock held on another,
+that historical loads do their I/O without holding a lock, and that
+contention is counted.
+"""
+import threading
+import time
+from collections import deque
+from datetime import date, datetime
+from unittest.mock import patch
+
+from app.managers.data_manager.session_data import (
+    SessionData,
+    SymbolSessionData,
+    BarIntervalData,
+)
+from app.managers.data_manager.symbol_locks import ContentionLock
+from app.models.trading import BarData
+
+
+def make_session_data(symbols=("AAPL", "MSFT")):
+    session_data = SessionData()
+    for symbol in symbols:
+        symbol_data = SymbolSessionData(symbol=symbol, base_interval="1m")
+        symbol_data.bars["1m"] = BarIntervalData(derived=False, base=None, data=deque())
+        session_data.register_symbol_data(symbol_data)
+    return session_data
+
+
+def run_in_thread(target, timeout=2.0):
+    """Run target in a thread; True if it finished within timeout."""
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive()
+
+
+class HeldLock:
+    """Hold a lock in a background thread until released."""
+
+    def __init__(self, lock):
+        self._lock = lock
+        self._held = threading.Event()
+        self._release = threading.Event()
+        self._thread = threading.Thread(target=self._hold, daemon=True)
+
+    def _hold(self):
+        with self._lock:
+            self._held.set()
+            self._release.wait(5)
+
+    def __enter__(self):
+        self._thread.start()
+        self._held.wait(5)
+        return self
+
+    def __exit__(self, *args):
+        self._release.set()
+        self._thread.join(5)
+
+
+class TestContentionLock:
+
+    def test_counts_contention(self):
+        lock = ContentionLock("test")
+        with lock:
+            with lock:  # Reentrant, uncontended
+                pass
+        assert lock.stats() == {"acquisitions": 2, "contentions": 0}
+
+        waiter = threading.Thread(target=lambda: lock.acquire() and lock.release())
+        with HeldLock(lock):
+            assert not lock.acquire(blocking=False)
+            waiter.start()
+            time.sleep(0.1)  # Let the waiter block
+        waiter.join(5)
+
+        assert lock.stats() == {"acquisitions": 4, "contentions": 1}
+
+
+class TestStriping:
+
+    def test_other_symbols_not_blocked(self):
+        session_data = make_session_data()
+
+        blocked = threading.Thread(target=lambda: session_data.set_quality("AAPL", "1m", 80.0))
+        with HeldLock(session_data._symbol_lock("AAPL")):
+            assert run_in_thread(lambda: session_data.set_quality("MSFT", "1m", 90.0))
+            assert run_in_thread(lambda: session_data.get_bars_ref("MSFT", "1m"))
+            assert run_in_thread(lambda: session_data.get_latest_bars_multi(["MSFT"]))
+            blocked.start()
+            blocked.join(0.2)
+            assert blocked.is_alive()
+        blocked.join(5)
+
+        assert session_data.get_quality_metric("AAPL", "1m") == 80.0
+        assert session_data.get_quality_metric("MSFT", "1m") == 90.0
+        stats = session_data.get_lock_stats()
+        assert stats["symbols"]["symbols"]["AAPL"]["contentions"] == 1
+        assert stats["symbols"]["symbols"]["MSFT"]["contentions"] == 0
+        assert stats["symbols"]["contentions"] == 1
+
+    def test_registration_does_not_wait_for_symbol_locks(self):
+        session_data = make_session_data()
+
+        with HeldLock(session_data._symbol_lock("AAPL")):
+            assert run_in_thread(lambda: session_data.register_symbol("TSLA"))
+            assert run_in_thread(lambda: session_data.set_gaps("NVDA", "1m", []))
+
+        assert session_data.get_symbol_data("NVDA") is not None
+
+    def test_historical_load_io_runs_unlocked(self):
+        session_data = make_session_data()
+        bars = [BarData(
+            symbol="AAPL", timestamp=datetime(2025, 1, 2, 9, 30),
+            open=1.0, high=1.0, low=1.0, close=1.0, volume=1
+        )]
+        writes_during_io = []
+
+        def slow_query(*args):
+            # Same-symbol writes go through while parquet is being read
+            writes_during_io.append(run_in_thread(lambda: session_data.set_quality("AAPL", "1m", 50.0)))
+            return bars
+
+        with patch.object(session_data, "get_current_session_date", return_value=date(2025, 1, 3)), \
+                patch.object(session_data, "_query_historical_bars", side_effect=slow_query):
+            assert session_data.load_historical_bars("AAPL", 5, ["1m"], data_repository=object()) == 1
+
+        assert writes_during_io == [True]
+        assert session_data.get_historical_bars("AAPL", interval="1m", internal=True) == {date(2025, 1, 2): bars}
+
+    def test_export_includes_lock_stats(self):
+        session_data = make_session_data()
+        session_data.get_bars_ref("AAPL", "1m")
+
+        result, _ = session_data.to_json(complete=False)
+
+        assert result["_lock_stats"]["symbols"]["symbols"]["AAPL"]["acquisitions"] >= 1
+        assert set(result["_lock_stats"]["registry"]) == {"acquisitions", "contentions"}
+        session_data.reset_lock_stats()
+        assert session_data.get_lock_stats()["symbols"]["acquisitions"] == 0